@@ -1,9 +1,21 @@
-from importlib.metadata import version, PackageNotFoundError
-from QVideo.lib._camera import Camera
+from QVideo.lib._lazy import attach
+
+
+_EXPORTS = {'Camera': '.lib._camera'}
+
+_getattr, __dir__ = attach(__name__, _EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    if name == '__version__':
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            value = version('QVideo')
+        except PackageNotFoundError:  # bare source checkout
+            value = 'unknown'
+        globals()['__version__'] = value
+        return value
+    return _getattr(name)
 
-try:
-    __version__ = version('QVideo')
-except PackageNotFoundError:  # package not installed (e.g. bare source checkout)
-    __version__ = 'unknown'
 
 __all__ = ['Camera', '__version__']
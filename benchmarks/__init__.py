@@ -0,0 +1,41 @@
+'''Performance benchmarks for capture, filtering and recording.
+
+The benchmarks use :class:`~QVideo.cameras.Noise.QNoiseCamera` with
+a bank of pregenerated frames, so they need no camera hardware and
+produce comparable numbers from run to run.  Run them from a source checkout::
+
+    python -m QVideo.benchmarks -o results.json
+    python -m QVideo.benchmarks --quick --compare results.json
+
+Results are written as JSON together with the commit, Python, NumPy,
+OpenCV and Qt versions, so runs can be compared across commits.
+
+Suites
+------
+filters
+    Cost per frame of every :class:`~QVideo.lib.QVideoFilter.VideoFilter`
+    in :mod:`QVideo.filters` at several resolutions and pixel types.
+throughput
+    Frames per second from an unpaced camera through
+    :class:`~QVideo.lib.QVideoSource.QVideoSource` to a
+    :class:`~QVideo.lib.QVideoScreen.QVideoScreen` and a video writer.
+drops
+    Fraction of frames lost when the camera runs at a fixed frame rate.
+detection
+    Time per frame and accuracy of particle detection on frames from
+    :class:`~QVideo.cameras.Particles.QParticleCamera`, scored against
+    the camera's ground truth.
+imports
+    Cold import time of the package and of its commonly used parts,
+    each in a fresh interpreter, with the slowest modules.
+'''
+from .filters import available_filters, benchmark_filter, benchmark_filters
+from .pipeline import benchmark_throughput, benchmark_drops
+from .detection import locate_spots, score, benchmark_detection
+from .imports import import_time
+from .results import metadata, compare
+
+
+__all__ = '''available_filters benchmark_filter benchmark_filters
+benchmark_throughput benchmark_drops locate_spots score
+benchmark_detection import_time metadata compare'''.split()
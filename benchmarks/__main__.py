@@ -0,0 +1,166 @@
+'''Run the QVideo benchmarks from the command line.
+
+Usage::
+
+    python -m QVideo.benchmarks [--quick] [--suite NAME ...]
+                                [--filter NAME ...] [-o FILE]
+                                [--compare BASELINE]
+
+Prints a summary of each measurement and, with ``-o``, writes the
+results and run metadata as JSON.  With ``--compare``, the run is
+compared with a previous JSON file and the exit status is ``1`` if any
+measurement regressed by more than ``--threshold``.  Likewise with
+``--import-budget``, the exit status is ``1`` if a cold
+``import QVideo`` takes longer than the budget.
+'''
+from argparse import ArgumentParser
+from collections.abc import Sequence
+import json
+import sys
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+SUITES = ('filters', 'throughput', 'drops', 'detection', 'imports')
+
+
+def _parser() -> ArgumentParser:
+    parser = ArgumentParser(prog='python -m QVideo.benchmarks',
+                            description='QVideo performance benchmarks')
+    parser.add_argument('--suite', dest='suites', action='append',
+                        choices=SUITES,
+                        help='suite to run; may be repeated '
+                        '(default: all)')
+    parser.add_argument('--filter', dest='filters', action='append',
+                        metavar='NAME',
+                        help='filter to measure; may be repeated '
+                        '(default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help='640x480 uint8 only, with short runs')
+    parser.add_argument('--duration', type=float, default=2.,
+                        help='duration of each pipeline measurement [s] '
+                        '(default: %(default)s)')
+    parser.add_argument('--fps', type=float, action='append',
+                        help='target frame rate for the drops suite; '
+                        'may be repeated (default: 100 and 500)')
+    parser.add_argument('--import-budget', type=float, metavar='SECONDS',
+                        help='fail if "import QVideo" takes longer')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='write results as JSON')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare with the results in BASELINE')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative change reported as a regression '
+                        '(default: %(default)s)')
+    return parser
+
+
+def _summary(record: dict[str, object]) -> str:
+    if record['benchmark'] == 'imports':
+        lines = [f'{record["statement"]:<52}'
+                 f'{1e3 * record["seconds"]:9.1f} ms  '
+                 f'{record["modules"]} modules']
+        lines += [f'    {name:<48}{1e3 * own:9.1f} ms'
+                  for name, own, _ in record['slowest'][:5]]
+        return '\n'.join(lines)
+    if record['benchmark'] == 'detection':
+        scene = (f'{record["nparticles"]} '
+                 f'{"holograms" if record["hologram"] else "spots"}')
+        rms = 'n/a' if record['rms'] is None else f'{record["rms"]:.3f}'
+        return (f'{record["name"]:<24}{scene:<28}'
+                f'{1e3 * record["median"]:9.3f} ms  '
+                f'precision {record["precision"]:.3f}  '
+                f'recall {record["recall"]:.3f}  rms {rms} px')
+    size = (f'{record["width"]}x{record["height"]} {record["dtype"]} '
+            f'{"color" if record["color"] else "gray"}')
+    if record['benchmark'] == 'filter':
+        if record['error'] is not None:
+            return f'{record["name"]:<24}{size:<28}{record["error"]}'
+        return (f'{record["name"]:<24}{size:<28}'
+                f'{1e3 * record["median"]:9.3f} ms  '
+                f'{record["fps"]:9.1f} fps')
+    label = (record['benchmark'] if record['benchmark'] == 'throughput'
+             else f'drops @ {record["fps"]:g} fps')
+    return (f'{label:<24}{size:<28}'
+            f'capture {record["capture_fps"]:7.1f}  '
+            f'display {record["display_fps"]:6.1f}  '
+            f'write {record["write_fps"]:6.1f} fps  '
+            f'dropped {100 * record["drop_rate"]:5.1f}%')
+
+
+def main(argv: Sequence[str] | None = None) -> int:  # pragma: no cover
+    '''Run the selected benchmark suites.'''
+    from qtpy import QtWidgets
+    from QVideo.benchmarks import (benchmark_filters, benchmark_throughput,
+                                   benchmark_drops, benchmark_detection,
+                                   import_time, metadata, compare)
+    from QVideo.benchmarks.imports import STATEMENTS
+    from QVideo.benchmarks.filters import RESOLUTIONS, DTYPES
+    from QVideo.benchmarks.pipeline import default_writer
+
+    args = _parser().parse_args(argv)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    suites = args.suites or SUITES
+    resolutions = RESOLUTIONS[:1] if args.quick else RESOLUTIONS
+    dtypes = DTYPES[:1] if args.quick else DTYPES
+    duration = min(args.duration, 1.) if args.quick else args.duration
+    writer = default_writer()
+
+    results = []
+
+    def report(record: dict[str, object]) -> None:
+        results.append(record)
+        print(_summary(record), flush=True)
+
+    if 'filters' in suites:
+        for record in benchmark_filters(args.filters, resolutions, dtypes,
+                                        min_time=0.1 if args.quick else 0.25):
+            report(record)
+    if 'throughput' in suites:
+        for width, height in resolutions:
+            for target in (None, writer):
+                report(benchmark_throughput(width, height,
+                                            duration=duration,
+                                            writer=target))
+    if 'drops' in suites:
+        for fps in args.fps or (100., 500.):
+            report(benchmark_drops(fps, duration=duration, writer=writer))
+    if 'detection' in suites:
+        for nparticles in (20,) if args.quick else (20, 200):
+            report(benchmark_detection(nparticles=nparticles,
+                                       nframes=50 if args.quick else 200))
+    status = 0
+    if 'imports' in suites:
+        for statement in STATEMENTS:
+            record = import_time(statement)
+            report(record)
+            if (statement == 'import QVideo' and
+                    args.import_budget is not None and
+                    record['seconds'] > args.import_budget):
+                print(f'import QVideo exceeds budget of '
+                      f'{args.import_budget} s')
+                status = 1
+    app.processEvents()
+
+    run = dict(metadata=metadata(), results=results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(run, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        rows = compare(baseline, results, args.threshold)
+        for row in rows:
+            if row['status'] != 'same':
+                print(f'{row["status"]:<12}{" ".join(map(str, row["key"]))}: '
+                      f'{row["metric"]} {row["baseline"]:.4g} -> '
+                      f'{row["current"]:.4g} ({100 * row["change"]:+.1f}%)')
+        if any(row['status'] == 'regression' for row in rows):
+            return 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+'''Speed and accuracy of particle detection against ground truth.'''
+from collections.abc import Callable
+from time import perf_counter_ns
+from QVideo.lib.videotypes import Image
+import cv2
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['locate_spots', 'score', 'benchmark_detection']
+
+
+Detector = Callable[[Image], np.ndarray]
+
+
+def locate_spots(image: Image, threshold: float = 100.) -> np.ndarray:
+    '''Reference detector: centroids of connected bright regions.
+
+    Parameters
+    ----------
+    image : Image
+        Grayscale frame.
+    threshold : float
+        Gray level separating particles from the background.
+        Default: ``100``.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(x, y)`` positions of the detected particles [pixels].
+    '''
+    mask = np.uint8(image > threshold)
+    n, _, _, centroids = cv2.connectedComponentsWithStats(mask)
+    return centroids[1:n]
+
+
+def score(found: np.ndarray,
+          truth: np.ndarray,
+          tolerance: float = 2.) -> dict[str, object]:
+    '''Match detections to true positions.
+
+    Each true particle is paired with at most one detection, closest
+    pairs first; pairs farther apart than *tolerance* do not match.
+
+    Parameters
+    ----------
+    found : numpy.ndarray
+        Detected ``(x, y)`` positions.
+    truth : numpy.ndarray
+        True ``(x, y)`` positions.
+    tolerance : float
+        Largest distance at which a detection counts as correct
+        [pixels].  Default: ``2``.
+
+    Returns
+    -------
+    dict
+        Numbers of ``found``, ``true`` and ``matched`` particles,
+        ``precision`` and ``recall``, and the root-mean-square position
+        error ``rms`` of the matched pairs [pixels], or ``None`` if
+        nothing matched.
+    '''
+    found = np.reshape(found, (-1, 2))
+    truth = np.reshape(truth, (-1, 2))
+    errors = []
+    if len(found) and len(truth):
+        distance = np.hypot(*(found[:, None, :] - truth[None, :, :]).T).T
+        used_found, used_truth = set(), set()
+        for i, j in zip(*np.unravel_index(np.argsort(distance, axis=None),
+                                          distance.shape)):
+            if distance[i, j] > tolerance:
+                break
+            if i in used_found or j in used_truth:
+                continue
+            used_found.add(i)
+            used_truth.add(j)
+            errors.append(distance[i, j])
+    matched = len(errors)
+    return dict(found=len(found), true=len(truth), matched=matched,
+                precision=matched / len(found) if len(found) else 1.,
+                recall=matched / len(truth) if len(truth) else 1.,
+                rms=float(np.sqrt(np.mean(np.square(errors))))
+                if matched else None)
+
+
+def benchmark_detection(detector: Detector | None = None,
+                        name: str | None = None,
+                        nframes: int = 100,
+                        tolerance: float = 2.,
+                        **kwargs) -> dict[str, object]:
+    '''Measure detection speed and accuracy on a synthetic scene.
+
+    Frames come from an unpaced
+    :class:`~QVideo.cameras.Particles.QParticleCamera` and every
+    detection is scored against the camera's ground truth, so speed
+    and accuracy are measured on the same frames.
+
+    Parameters
+    ----------
+    detector : callable or None
+        Function of a frame that returns an array of ``(x, y)``
+        positions.  Default: :func:`locate_spots`.
+    name : str or None
+        Name recorded for the detector.  Default: the function name.
+    nframes : int
+        Number of frames to analyze.  Default: ``100``.
+    tolerance : float
+        Matching distance passed to :func:`score` [pixels].
+    **kwargs :
+        Forwarded to :class:`~QVideo.cameras.Particles.QParticleCamera`.
+
+    Returns
+    -------
+    dict
+        ``median`` and ``mean`` time per frame [s], ``fps`` from the
+        median, and the ``precision``, ``recall`` and ``rms`` error
+        averaged over frames.
+    '''
+    from QVideo.cameras.Particles import QParticleCamera
+    detector = detector or locate_spots
+    camera = QParticleCamera(fps=0, **kwargs)
+    times, scores = [], []
+    with camera:
+        for _ in range(nframes):
+            ok, frame = camera.read()
+            start = perf_counter_ns()
+            found = detector(frame)
+            times.append(perf_counter_ns() - start)
+            scores.append(score(found, camera.groundTruth(), tolerance))
+    times = np.array(times) * 1e-9
+    median = float(np.median(times))
+    rms = [s['rms'] for s in scores if s['rms'] is not None]
+    return dict(benchmark='detection',
+                name=name or getattr(detector, '__name__',
+                                     type(detector).__name__),
+                nparticles=camera.nparticles,
+                hologram=camera.hologram,
+                frames=nframes,
+                median=median,
+                mean=float(times.mean()),
+                fps=1. / median if median > 0 else None,
+                precision=float(np.mean([s['precision'] for s in scores])),
+                recall=float(np.mean([s['recall'] for s in scores])),
+                rms=float(np.mean(rms)) if rms else None)
@@ -0,0 +1,148 @@
+'''Per-filter cost at several frame formats.'''
+from collections.abc import Iterable, Sequence
+from time import perf_counter_ns
+from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.QVideoFilter import VideoFilter
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['available_filters', 'benchmark_filter', 'benchmark_filters']
+
+
+#: Frame sizes (width, height) used by default.
+RESOLUTIONS: tuple[tuple[int, int], ...] = ((640, 480),
+                                            (1280, 1024),
+                                            (2048, 2048))
+
+#: Pixel types used by default.
+DTYPES: tuple[str, ...] = ('uint8', 'uint16', 'float32')
+
+
+def available_filters() -> list[str]:
+    '''Names of the :class:`~QVideo.lib.QVideoFilter.VideoFilter`
+    classes exported by :mod:`QVideo.filters`.'''
+    import QVideo.filters as filters
+    return [name for name in filters.__all__
+            if issubclass(getattr(filters, name), VideoFilter)]
+
+
+def _frames(width: int, height: int, dtype: str,
+            color: bool, nframes: int = 4) -> np.ndarray:
+    '''Return a reproducible stack of random frames.'''
+    shape = (nframes, height, width) + ((3,) if color else ())
+    dtype = np.dtype(dtype)
+    rng = np.random.default_rng(0)
+    if dtype.kind == 'f':
+        return rng.random(shape, dtype=np.float32).astype(dtype)
+    high = min(np.iinfo(dtype).max, 4095) + 1
+    return rng.integers(0, high, shape, dtype=dtype)
+
+
+def benchmark_filter(name: str,
+                     frames: np.ndarray,
+                     min_time: float = 0.25,
+                     min_calls: int = 3,
+                     max_calls: int = 1000) -> dict[str, object]:
+    '''Measure the per-frame cost of one filter.
+
+    The filter is applied to *frames* in rotation until at least
+    *min_calls* calls and *min_time* seconds have elapsed.  For an
+    :class:`~QVideo.lib.AsyncVideoFilter.AsyncVideoFilter`, whose
+    ``__call__`` only hands the frame to a worker thread, the cost of
+    :meth:`~QVideo.lib.AsyncVideoFilter.AsyncVideoFilter.process` is
+    measured instead, including the conversion of frames whose pixel
+    type the filter does not accept.
+
+    Parameters
+    ----------
+    name : str
+        Name of a filter class in :mod:`QVideo.filters`.
+    frames : numpy.ndarray
+        Stack of input frames.
+
+    Returns
+    -------
+    dict
+        ``median``, ``p95`` and ``mean`` time per frame [s], ``fps``
+        derived from the median and the number of ``calls``.  If the
+        filter rejects the frame format, ``error`` holds the message.
+    '''
+    import QVideo.filters as filters
+    videoFilter = getattr(filters, name)()
+    if isinstance(videoFilter, AsyncVideoFilter):
+        def apply(frame):
+            return videoFilter.process(videoFilter.conform(frame))
+    else:
+        apply = videoFilter
+    result = dict(calls=0, median=None, p95=None, mean=None, fps=None,
+                  error=None)
+    times = []
+    try:
+        apply(frames[0])
+        budget = min_time * 1e9
+        elapsed = 0
+        while (len(times) < min_calls or elapsed < budget) and \
+                len(times) < max_calls:
+            frame = frames[len(times) % len(frames)]
+            start = perf_counter_ns()
+            apply(frame)
+            times.append(perf_counter_ns() - start)
+            elapsed += times[-1]
+    except Exception as ex:
+        result['error'] = f'{type(ex).__name__}: {ex}'.splitlines()[0]
+    finally:
+        videoFilter.shutdown()
+    if times and result['error'] is None:
+        times = np.array(times) * 1e-9
+        median = float(np.median(times))
+        result.update(calls=len(times),
+                      median=median,
+                      p95=float(np.percentile(times, 95)),
+                      mean=float(times.mean()),
+                      fps=1. / median if median > 0 else None)
+    return result
+
+
+def benchmark_filters(names: Iterable[str] | None = None,
+                      resolutions: Sequence[tuple[int, int]] = RESOLUTIONS,
+                      dtypes: Sequence[str] = DTYPES,
+                      colors: Sequence[bool] = (False, True),
+                      **kwargs) -> list[dict[str, object]]:
+    '''Benchmark filters for every combination of frame format.
+
+    Parameters
+    ----------
+    names : Iterable[str] or None
+        Filters to measure.  Default: :func:`available_filters`.
+    resolutions : Sequence[tuple[int, int]]
+        Frame sizes as ``(width, height)``.
+    dtypes : Sequence[str]
+        Pixel types.
+    colors : Sequence[bool]
+        Whether to measure grayscale and/or three-channel frames.
+    **kwargs :
+        Forwarded to :func:`benchmark_filter`.
+
+    Returns
+    -------
+    list[dict]
+        One record per filter and format.
+    '''
+    names = list(names or available_filters())
+    records = []
+    for width, height in resolutions:
+        for dtype in dtypes:
+            for color in colors:
+                frames = _frames(width, height, dtype, color)
+                for name in names:
+                    logger.info(f'{name} {width}x{height} {dtype} '
+                                f'{"color" if color else "gray"}')
+                    record = dict(benchmark='filter', name=name,
+                                  width=width, height=height,
+                                  dtype=dtype, color=color)
+                    record.update(benchmark_filter(name, frames, **kwargs))
+                    records.append(record)
+    return records
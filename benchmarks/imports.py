@@ -0,0 +1,89 @@
+'''Cold import time of the QVideo package.'''
+import subprocess
+import sys
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['STATEMENTS', 'import_time']
+
+
+#: Import statements measured by default.
+STATEMENTS: tuple[str, ...] = (
+    'import QVideo',
+    'from QVideo.lib import QCamera, QVideoSource',
+    'from QVideo.cameras.Noise import QNoiseCamera',
+    'from QVideo.lib import QVideoScreen',
+    'from QVideo.lib import QFilterRack',
+)
+
+_TIMER = '''import time
+_start = time.perf_counter()
+{statement}
+print(time.perf_counter() - _start)
+'''
+
+
+def _run(statement: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, '-c',
+                           _TIMER.format(statement=statement)],
+                          capture_output=True, text=True, check=True)
+
+
+def _breakdown(report: str) -> list[tuple[str, float, float]]:
+    '''Parse the output of ``python -X importtime``.
+
+    Returns
+    -------
+    list[tuple[str, float, float]]
+        Module name, self time and cumulative time [s] of every import.
+    '''
+    modules = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            own, cumulative = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        modules.append((fields[2].strip(), own / 1e6, cumulative / 1e6))
+    return modules
+
+
+def import_time(statement: str = 'import QVideo',
+                repeat: int = 3,
+                top: int = 10) -> dict[str, object]:
+    '''Measure the time to execute an import statement in a new process.
+
+    Each run starts a fresh interpreter so that nothing is cached in
+    :data:`sys.modules`.  The module breakdown comes from a separate
+    run with ``-X importtime``, whose own overhead would distort the
+    total.
+
+    Parameters
+    ----------
+    statement : str
+        Python import statement.  Default: ``'import QVideo'``.
+    repeat : int
+        Number of timed runs; the fastest is reported.  Default: ``3``.
+    top : int
+        Number of modules listed in ``slowest``.  Default: ``10``.
+
+    Returns
+    -------
+    dict
+        ``seconds`` for the statement, the number of ``modules``
+        imported, and the ``slowest`` modules as ``[name, self,
+        cumulative]`` [s], ordered by self time.
+    '''
+    seconds = min(float(_run(statement).stdout.split()[-1])
+                  for _ in range(max(1, repeat)))
+    modules = _breakdown(_run(statement, '-X', 'importtime').stderr)
+    slowest = sorted(modules, key=lambda m: m[1], reverse=True)[:top]
+    return dict(benchmark='imports',
+                statement=statement,
+                seconds=seconds,
+                modules=len(modules),
+                slowest=[list(m) for m in slowest])
@@ -0,0 +1,171 @@
+'''End-to-end throughput and drop rate of source → screen → writer.'''
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from qtpy import QtCore
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.cameras.Noise import QNoiseCamera
+import sys
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['default_writer', 'benchmark_throughput', 'benchmark_drops']
+
+
+def default_writer() -> str:
+    '''Preferred recording format: HDF5 if available, else AVI.'''
+    from QVideo.dvr import QDVRWidget
+    return '.h5' if '.h5' in QDVRWidget.Writer else '.avi'
+
+
+#: Pregenerated frames served in rotation by the benchmark camera.
+BANK = 8
+
+
+def _camera(width: int, height: int, dtype: str, color: bool,
+            fps: float) -> QNoiseCamera:
+    '''Return a noise camera that serves frames from its bank.'''
+    camera = QNoiseCamera(fps=fps, dtype=dtype, bank=BANK,
+                          bayer='RGGB' if color else None)
+    camera.set('width', width)
+    camera.set('height', height)
+    return camera
+
+
+class _Counter:
+    '''Thread-safe enough frame counter for direct connections.'''
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+def _run(camera: QNoiseCamera, duration: float,
+         writer: str | None) -> dict[str, object]:
+    '''Stream *camera* to a screen and a writer for *duration* seconds.
+
+    The screen and the writer each receive frames through their own
+    :class:`~QVideo.lib.QFrameMailbox.QFrameMailbox`, as a recording
+    application should, so that a slow consumer loses frames instead
+    of accumulating an unbounded backlog.
+    '''
+    from QVideo.dvr import QDVRWidget
+    from QVideo.lib.QVideoScreen import QVideoScreen
+
+    source = QVideoSource(camera)
+    captured = _Counter()
+    source.newFrame.connect(captured, QtCore.Qt.DirectConnection)
+    screen = QVideoScreen()
+    display = source.mailbox()
+    screen.source = display
+    displayed = _Counter()
+    screen.newFrame.connect(displayed)
+    screen.show()
+
+    with TemporaryDirectory() as directory:
+        recorder, video = None, None
+        if writer is not None:
+            filename = str(Path(directory) / f'benchmark{writer}')
+            video = QDVRWidget.Writer[writer](filename, fps=camera.fps or 30,
+                                              nframes=sys.maxsize)
+            recorder = source.mailbox(slots=8, info=True)
+            recorder.newFrameInfo.connect(video.writeInfo)
+
+        loop = QtCore.QEventLoop()
+        QtCore.QTimer.singleShot(int(1000 * duration), loop.quit)
+        start = perf_counter()
+        source.start()
+        loop.exec()
+        source.stop()
+        source.wait()
+        elapsed = perf_counter() - start
+
+        written = 0 if video is None else video.framenumber
+        overwritten = 0 if recorder is None else recorder.overwritten
+        if video is not None:
+            video.close()
+            recorder.close()
+    display.close()
+    screen.source = None
+    screen.close()
+    QtCore.QCoreApplication.processEvents()
+
+    frames = captured.count + source.dropped
+    return dict(elapsed=elapsed,
+                captured=captured.count,
+                displayed=displayed.count,
+                written=written,
+                capture_fps=captured.count / elapsed,
+                display_fps=displayed.count / elapsed,
+                write_fps=written / elapsed,
+                display_overwritten=display.overwritten,
+                writer_overwritten=overwritten,
+                dropped=source.dropped,
+                drop_rate=source.dropped / frames if frames else 0.)
+
+
+def benchmark_throughput(width: int = 640,
+                         height: int = 480,
+                         dtype: str = 'uint8',
+                         color: bool = False,
+                         duration: float = 2.,
+                         writer: str | None = None) -> dict[str, object]:
+    '''Measure maximum throughput with an unpaced camera.
+
+    Parameters
+    ----------
+    width, height : int
+        Frame size [pixels].
+    dtype : str
+        Pixel type, ``'uint8'`` or ``'uint16'``.
+    color : bool
+        Raw color frames with an RGGB Bayer mosaic, demosaiced for
+        display, if ``True``.
+    duration : float
+        Measurement time [s].  Default: ``2``.
+    writer : str or None
+        File extension selecting the writer from
+        :attr:`~QVideo.dvr.QDVRWidget.QDVRWidget.Writer`, or ``None``
+        for no recording.
+
+    Returns
+    -------
+    dict
+        Frames captured, displayed and written, their rates [fps] and
+        the frames each consumer missed.
+    '''
+    camera = _camera(width, height, dtype, color, fps=0.)
+    record = dict(benchmark='throughput', width=width, height=height,
+                  dtype=dtype, color=color, writer=writer)
+    record.update(_run(camera, duration, writer))
+    return record
+
+
+def benchmark_drops(fps: float,
+                    width: int = 640,
+                    height: int = 480,
+                    dtype: str = 'uint8',
+                    color: bool = False,
+                    duration: float = 2.,
+                    writer: str | None = None) -> dict[str, object]:
+    '''Measure the fraction of frames lost at a target frame rate.
+
+    The noise camera runs a free-running sensor clock at *fps*;
+    frames that the capture loop does not read in time are lost and
+    reported as ``dropped``.  Other parameters are as for
+    :func:`benchmark_throughput`.
+
+    Returns
+    -------
+    dict
+        As :func:`benchmark_throughput`, with the target ``fps``.
+    '''
+    camera = _camera(width, height, dtype, color, fps=fps)
+    record = dict(benchmark='drops', fps=fps, width=width, height=height,
+                  dtype=dtype, color=color, writer=writer)
+    record.update(_run(camera, duration, writer))
+    return record
@@ -0,0 +1,110 @@
+'''Run metadata and comparison of benchmark results.'''
+from datetime import datetime, timezone
+from pathlib import Path
+import platform
+import subprocess
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['metadata', 'compare', 'KEYS', 'METRICS']
+
+
+#: Fields that identify a measurement, by benchmark.
+KEYS: dict[str, tuple[str, ...]] = {
+    'filter': ('name', 'width', 'height', 'dtype', 'color'),
+    'throughput': ('width', 'height', 'dtype', 'color', 'writer'),
+    'drops': ('fps', 'width', 'height', 'dtype', 'color', 'writer'),
+    'detection': ('name', 'nparticles', 'hologram'),
+    'imports': ('statement',),
+}
+
+#: Headline metric of each benchmark and whether larger is better.
+METRICS: dict[str, tuple[str, bool]] = {
+    'filter': ('median', False),
+    'throughput': ('capture_fps', True),
+    'drops': ('drop_rate', False),
+    'detection': ('median', False),
+    'imports': ('seconds', False),
+}
+
+
+def _commit() -> str | None:
+    '''Return the current commit of the source tree, if known.'''
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'],
+                                cwd=Path(__file__).parent,
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def metadata() -> dict[str, object]:
+    '''Describe the software and machine that produced a run.'''
+    import numpy as np
+    import cv2
+    from qtpy import API_NAME, QT_VERSION
+    from QVideo import __version__
+    return dict(time=datetime.now(timezone.utc).isoformat(),
+                commit=_commit(),
+                qvideo=__version__,
+                python=platform.python_version(),
+                numpy=np.__version__,
+                opencv=cv2.__version__,
+                qt=f'{API_NAME} {QT_VERSION}',
+                machine=platform.machine(),
+                processor=platform.processor(),
+                system=platform.platform())
+
+
+def _key(record: dict[str, object]) -> tuple:
+    benchmark = record['benchmark']
+    return (benchmark,) + tuple(record.get(k) for k in KEYS[benchmark])
+
+
+def compare(baseline: list[dict[str, object]],
+            current: list[dict[str, object]],
+            threshold: float = 0.1) -> list[dict[str, object]]:
+    '''Compare the headline metric of matching measurements.
+
+    Parameters
+    ----------
+    baseline, current : list[dict]
+        ``results`` of two runs.
+    threshold : float
+        Relative change beyond which a measurement counts as a
+        regression or an improvement.  Default: ``0.1``.
+
+    Returns
+    -------
+    list[dict]
+        For each measurement present in both runs with a valid metric:
+        its ``key``, the ``metric`` name, ``baseline`` and ``current``
+        values, the relative ``change``, and ``status``, one of
+        ``'regression'``, ``'improvement'`` or ``'same'``.
+    '''
+    reference = {_key(record): record for record in baseline}
+    rows = []
+    for record in current:
+        key = _key(record)
+        if key not in reference:
+            continue
+        metric, larger = METRICS[record['benchmark']]
+        old, new = reference[key].get(metric), record.get(metric)
+        if old is None or new is None:
+            continue
+        if old == 0:
+            change = 0. if new == 0 else float('inf')
+        else:
+            change = new / old - 1.
+        better = change > threshold if larger else change < -threshold
+        worse = change < -threshold if larger else change > threshold
+        rows.append(dict(key=key, metric=metric, baseline=old, current=new,
+                         change=change,
+                         status=('improvement' if better else
+                                 'regression' if worse else 'same')))
+    return rows
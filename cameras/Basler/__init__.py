@@ -15,8 +15,14 @@ QBaslerSource
 QBaslerTree
     Parameter tree widget for :class:`QBaslerCamera` controls.
 '''
-from ._camera import QBaslerCamera, QBaslerSource
-from ._tree import QBaslerTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QBaslerCamera QBaslerSource QBaslerTree'.split()
+_EXPORTS = {
+    'QBaslerCamera': '._camera',
+    'QBaslerSource': '._camera',
+    'QBaslerTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
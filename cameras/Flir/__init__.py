@@ -21,8 +21,14 @@ QFlirSource
 QFlirTree
     Parameter tree widget for :class:`QFlirCamera` controls.
 '''
-from ._camera import QFlirCamera, QFlirSource
-from ._tree import QFlirTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QFlirCamera QFlirSource QFlirTree'.split()
+_EXPORTS = {
+    'QFlirCamera': '._camera',
+    'QFlirSource': '._camera',
+    'QFlirTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
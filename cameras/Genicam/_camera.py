@@ -1,8 +1,14 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
+from qtpy import QtCore
 from QVideo.lib import QCamera, QVideoSource
+from QVideo.lib.bayer import bayer_pattern
+from QVideo.lib.packing import (is_packed, unpacked_format, bit_depth,
+                                unpack)
 import numpy as np
 import os
+import re
 import logging
 from pathlib import Path
 
@@ -32,6 +38,46 @@ logger = logging.getLogger(__name__)
 __all__ = ['QGenicamCamera', 'QGenicamSource']
 
 
+def _integer(buffer: object, name: str) -> int | None:
+    '''Return integer buffer attribute *name*, or ``None`` if unavailable.'''
+    try:
+        value = getattr(buffer, name)
+    except Exception:
+        return None
+    return value if isinstance(value, int) else None
+
+
+def _window(start: int, length: int, base: int, extent: int,
+            offset_inc: int, size_min: int, size_inc: int) -> tuple[int, int]:
+    '''Return the hardware window along one axis that contains a region.
+
+    Parameters
+    ----------
+    start, length : int
+        Requested region along the axis.
+    base, extent : int
+        Smallest offset and largest size of the sensor along the axis.
+    offset_inc, size_min, size_inc : int
+        Alignment constraints of the offset and size features.
+
+    Returns
+    -------
+    tuple[int, int]
+        ``(offset, size)`` of the smallest aligned window that contains
+        the region, or the full axis if no aligned window does.
+    '''
+    offset_inc, size_inc = max(offset_inc, 1), max(size_inc, 1)
+    offset = base + (max(start - base, 0) // offset_inc) * offset_inc
+    need = max(start + length - offset, size_min)
+    size = size_min + -(-(need - size_min) // size_inc) * size_inc
+    size = min(size, extent)
+    if offset + size > base + extent:
+        offset = base + ((extent - size) // offset_inc) * offset_inc
+    if offset > start or offset + size < start + length:
+        return base, extent
+    return offset, size
+
+
 class QGenicamCamera(QCamera):
 
     '''Abstract base for GenICam-compliant cameras accessed via Harvesters.
@@ -45,6 +91,19 @@ class QGenicamCamera(QCamera):
     of the appropriate ``.cti`` file before instantiating.  Attempting to
     instantiate :class:`QGenicamCamera` directly raises :exc:`TypeError`.
 
+    Color cameras can deliver raw Bayer mosaics, which need one third
+    of the bandwidth of RGB frames.  Select a Bayer ``PixelFormat``
+    directly or set :attr:`raw`; frames are then two-dimensional and
+    :attr:`~QVideo.lib.QCamera.QCamera.bayer` reports the pattern
+    delivered with each frame, so that demosaicing can be left to the
+    display.
+
+    High-speed cameras often reach their maximum frame rate only when
+    10- and 12-bit pixels are transmitted in a packed format such as
+    ``Mono12p``.  Select one directly or set :attr:`packed`; packed
+    payloads are unpacked into ``uint16`` frames as they are copied
+    out of the acquisition buffer.
+
     Requires the ``genicam`` and ``harvesters`` packages
     (``pip install genicam harvesters``).
 
@@ -58,6 +117,13 @@ class QGenicamCamera(QCamera):
     ----------
     cameraID : int
         Index of the camera to open.  Default: ``0``.
+    raw : bool
+        If ``True``, switch to a raw Bayer pixel format on opening.
+        Default: ``False``: keep the pixel format configured in the
+        camera.
+    packed : bool
+        If ``True``, switch to a packed pixel format on opening.
+        Default: ``False``.
     *args :
         Forwarded to :class:`~QVideo.lib.QCamera`.
     **kwargs :
@@ -68,7 +134,11 @@ class QGenicamCamera(QCamera):
     _producer_filenames: tuple[str, ...] = ()
     _ALIASES = frozenset(('width', 'height', 'fps'))
 
-    def __init__(self, *args, cameraID: int = 0, **kwargs) -> None:
+    def __init__(self, *args,
+                 cameraID: int = 0,
+                 raw: bool = False,
+                 packed: bool = False,
+                 **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._cameraID = cameraID
         self._harvester: Harvester | None = None
@@ -76,6 +146,10 @@ class QGenicamCamera(QCamera):
         self._nodeMap: 'NodeMap | None' = None
         self._protected: set[str] = set()
         self.open()
+        if raw and self.isOpen():
+            self.raw = True
+        if packed and self.isOpen():
+            self.packed = True
 
     def _initialize(self) -> bool:
         '''Open the GenICam device and register available properties.
@@ -170,6 +244,35 @@ class QGenicamCamera(QCamera):
         tuple[bool, ndarray or None]
             ``(True, frame)`` on success, ``(False, None)`` on timeout.
         '''
+        return self._fetch()
+
+    def read_into(self, out: np.ndarray) -> QCamera.CameraData:
+        '''Read one frame into the preallocated buffer *out*.
+
+        The payload is copied, or unpacked, straight from the
+        acquisition buffer into *out*.  A new array is allocated
+        instead when *out* does not match the shape or dtype of the
+        delivered frame.
+
+        Parameters
+        ----------
+        out : ndarray
+            Contiguous buffer from a
+            :class:`~QVideo.lib.framepool.FramePool`.
+
+        Returns
+        -------
+        tuple[bool, ndarray or None]
+            ``(True, frame)`` on success, ``(False, None)`` on timeout.
+        '''
+        return self._fetch(out)
+
+    def _fetch(self, out: np.ndarray | None = None) -> QCamera.CameraData:
+        '''Fetch one buffer and copy its first component into a frame.
+
+        Packed payloads are delivered as raw bytes and are unpacked
+        rather than copied.
+        '''
         frame = None
         try:
             with self._device.fetch(timeout=1) as buffer:
@@ -177,18 +280,117 @@ class QGenicamCamera(QCamera):
                 if not components:
                     logger.warning('camera returned empty payload')
                     return False, None
+                self._frameMetadata = (_integer(buffer, 'timestamp_ns'),
+                                       _integer(buffer, 'frame_id'))
                 image = components[0]
+                pixelformat = getattr(image, 'data_format', None)
+                self._bayer = (bayer_pattern(pixelformat)
+                               if isinstance(pixelformat, str) else None)
                 height = image.height
                 width = image.width
                 channels = int(image.num_components_per_pixel)
-                frame = image.data.copy()
-            frame = frame.reshape(height, width, channels).squeeze()
+                shape = tuple(n for n in (height, width, channels) if n != 1)
+                data = image.data
+                if (isinstance(pixelformat, str) and
+                        is_packed(pixelformat) and data.dtype == np.uint8):
+                    frame = unpack(data, pixelformat, shape, out)
+                elif (out is not None and out.shape == shape and
+                        out.dtype == data.dtype and
+                        out.flags.c_contiguous):
+                    np.copyto(out.reshape(data.shape), data)
+                    frame = out
+                else:
+                    frame = data.copy().reshape(shape)
         except TimeoutException:
             logger.warning('camera acquisition timed out')
         except Exception as e:
             logger.warning(f'camera read failed: {e}')
         return frame is not None, frame
 
+    @property
+    def raw(self) -> bool:
+        '''Deliver raw Bayer mosaics instead of color frames.
+
+        Setting ``True`` selects the Bayer entry of ``PixelFormat``
+        with the bit depth of the current format, if there is one, and
+        otherwise the first Bayer entry.  Setting ``False`` selects an
+        RGB format in the same way.  Logs a warning and leaves the
+        format unchanged if the camera offers no suitable format.
+        '''
+        spec = self._properties.get('PixelFormat')
+        return (spec is not None and
+                bayer_pattern(str(spec['getter']())) is not None)
+
+    @raw.setter
+    def raw(self, raw: bool) -> None:
+        spec = self._pixelFormat()
+        if spec is None:
+            return
+        current = str(spec['getter']())
+        if (bayer_pattern(current) is not None) == bool(raw):
+            return
+        if raw:
+            choices = [f for f in spec['limits'] if bayer_pattern(f)]
+        else:
+            choices = [f for f in spec['limits']
+                       if f.startswith(('RGB', 'BGR'))]
+        if not choices:
+            kind = 'Bayer' if raw else 'RGB'
+            logger.warning(f'camera offers no {kind} pixel format')
+            return
+        depth = re.findall(r'\d+', current)[:1]
+        same = [f for f in choices if re.findall(r'\d+', f)[:1] == depth]
+        self.set('PixelFormat', (same or choices)[0])
+
+    @property
+    def packed(self) -> bool:
+        '''Transfer 10- and 12-bit pixels in a packed format.
+
+        Setting ``True`` selects the packed counterpart of the current
+        ``PixelFormat``, preferring PFNC packing (``Mono12p``) to
+        GigE Vision packing (``Mono12Packed``).  If the current format
+        has none, as for ``Mono8``, the deepest packed format of the
+        same family is selected.  Setting ``False`` selects the
+        unpacked counterpart of the current format.  Logs a warning
+        and leaves the format unchanged if the camera offers no
+        suitable format.
+        '''
+        spec = self._properties.get('PixelFormat')
+        return spec is not None and is_packed(str(spec['getter']()))
+
+    @packed.setter
+    def packed(self, packed: bool) -> None:
+        spec = self._pixelFormat()
+        if spec is None:
+            return
+        current = str(spec['getter']())
+        if is_packed(current) == bool(packed):
+            return
+        if packed:
+            formats = [f for f in spec['limits'] if is_packed(f)]
+            choices = [f for f in formats if unpacked_format(f) == current]
+            if not choices:
+                family = re.match(r'\D*', current).group()
+                choices = [f for f in formats
+                           if re.match(r'\D*', f).group() == family]
+            choices.sort(key=lambda f: (-bit_depth(f), not f.endswith('p')))
+        else:
+            choices = [f for f in spec['limits']
+                       if f == unpacked_format(current)]
+        if not choices:
+            kind = 'packed' if packed else 'unpacked'
+            logger.warning(f'camera offers no {kind} counterpart '
+                           f'of {current}')
+            return
+        self.set('PixelFormat', choices[0])
+
+    def _pixelFormat(self) -> dict[str, object] | None:
+        '''Return the registered PixelFormat property, if any.'''
+        spec = self._properties.get('PixelFormat')
+        if spec is None:
+            logger.warning('camera has no PixelFormat feature')
+        return spec
+
     @property
     def settings(self) -> QCamera.Settings:
         '''All registered property values, excluding standard-name aliases.
@@ -217,6 +419,138 @@ class QGenicamCamera(QCamera):
         if key.lower() in ('width', 'height'):
             self.shapeChanged.emit(self.shape)
 
+    _ROI_NODES = ('OffsetX', 'OffsetY', 'Width', 'Height')
+
+    def applyROI(self, x: int, y: int,
+                 w: int, h: int) -> tuple[int, int, int, int] | None:
+        '''Crop frames to a window of the sensor containing a region.
+
+        Sets ``OffsetX``, ``OffsetY``, ``Width`` and ``Height`` to the
+        smallest window that contains the region and satisfies the
+        increments of those features.  Acquisition is stopped once
+        around the change if it is running.  Returns ``None`` if the
+        camera does not offer all four features.
+        '''
+        nodes = self._roiNodes()
+        if nodes is None:
+            return None
+        ox, oy, width, height = nodes
+        with QtCore.QMutexLocker(self._mutex):
+            with self._stopped():
+                for offset, size, start, length in ((ox, width, x, w),
+                                                    (oy, height, y, h)):
+                    QGenicamCamera._set_feature(offset, offset.min)
+                    start, length = _window(int(start), int(length),
+                                            offset.min, size.max,
+                                            offset.inc, size.min, size.inc)
+                    QGenicamCamera._set_feature(size, length)
+                    QGenicamCamera._set_feature(offset, start)
+            window = (ox.value, oy.value, width.value, height.value)
+        self.shapeChanged.emit(self.shape)
+        return window
+
+    def resetROI(self) -> None:
+        '''Restore full-sensor frames after :meth:`applyROI`.'''
+        nodes = self._roiNodes()
+        if nodes is None:
+            return
+        ox, oy, width, height = nodes
+        with QtCore.QMutexLocker(self._mutex):
+            with self._stopped():
+                for offset, size in ((ox, width), (oy, height)):
+                    QGenicamCamera._set_feature(offset, offset.min)
+                    QGenicamCamera._set_feature(size, size.max)
+        self.shapeChanged.emit(self.shape)
+
+    _BINNING_NODES = {'mean': ('BinningHorizontal', 'BinningVertical'),
+                      'sum': ('BinningHorizontal', 'BinningVertical'),
+                      'decimate': ('DecimationHorizontal',
+                                   'DecimationVertical')}
+    _BINNING_MODES = {'mean': 'Average', 'sum': 'Sum'}
+
+    def applyBinning(self, factor: int, mode: str = 'mean') -> int | None:
+        '''Bin or decimate frames in the camera.
+
+        Uses ``BinningHorizontal`` and ``BinningVertical`` for the
+        ``'mean'`` and ``'sum'`` modes, selecting ``Average`` or ``Sum``
+        in ``BinningHorizontalMode`` and ``BinningVerticalMode`` when the
+        camera offers those features, and ``DecimationHorizontal`` and
+        ``DecimationVertical`` for ``'decimate'``.  The largest
+        supported divisor of *factor* is applied.  Frames that spanned
+        the full sensor before the change still do afterwards.  Returns
+        ``None`` if the camera cannot bin in *mode*.
+        '''
+        names = self._BINNING_NODES[mode]
+        if not all(self.has_node(name) for name in names):
+            logger.warning(f'camera does not support hardware {mode} binning')
+            return None
+        nodes = [self.node(name) for name in names]
+        modes = [self.node(f'{name}Mode') for name in names
+                 if mode in self._BINNING_MODES and
+                 self.has_node(f'{name}Mode')]
+        wanted = self._BINNING_MODES.get(mode)
+        if any(wanted not in [e.symbolic for e in node.entries]
+               for node in modes):
+            logger.warning(f'camera does not support {mode} binning')
+            return None
+        applied = max(n for n in range(1, int(factor) + 1)
+                      if factor % n == 0 and
+                      all(QGenicamCamera._settable(node, n)
+                          for node in nodes))
+        self._setBinning(nodes, applied, modes, wanted)
+        return applied
+
+    def resetBinning(self) -> None:
+        '''Restore unbinned frames after :meth:`applyBinning`.'''
+        names = [n for names in self._BINNING_NODES.values() for n in names]
+        nodes = [self.node(name) for name in dict.fromkeys(names)
+                 if self.has_node(name)]
+        if nodes:
+            self._setBinning(nodes, 1)
+
+    @staticmethod
+    def _settable(feature: IInteger, value: int) -> bool:
+        '''Return ``True`` if *feature* can take *value* exactly.'''
+        return (feature.min <= value <= feature.max and
+                (value - feature.min) % max(feature.inc, 1) == 0)
+
+    def _setBinning(self, nodes: list[IInteger], factor: int,
+                    modes: list[IEnumeration] = (),
+                    mode: str | None = None) -> None:
+        '''Set binning *nodes* to *factor* with acquisition stopped.'''
+        sizes = [self.node(name) for name in ('Width', 'Height')
+                 if self.has_node(name)]
+        with QtCore.QMutexLocker(self._mutex):
+            with self._stopped():
+                full = [size.value == size.max for size in sizes]
+                for node in modes:
+                    QGenicamCamera._set_feature(node, mode)
+                for node in nodes:
+                    QGenicamCamera._set_feature(node, factor)
+                for size, grow in zip(sizes, full):
+                    if grow:
+                        QGenicamCamera._set_feature(size, size.max)
+        self.shapeChanged.emit(self.shape)
+
+    def _roiNodes(self) -> list[IInteger] | None:
+        '''Return the offset and size nodes, or ``None`` if any is missing.'''
+        if not all(self.has_node(name) for name in self._ROI_NODES):
+            logger.warning('camera does not support a hardware ROI')
+            return None
+        return [self.node(name) for name in self._ROI_NODES]
+
+    @contextmanager
+    def _stopped(self) -> Iterator[None]:
+        '''Suspend acquisition, if it is running, for the enclosed block.'''
+        restart = self._device.is_acquiring()
+        if restart:
+            self._device.stop()
+        try:
+            yield
+        finally:
+            if restart:
+                self._device.start()
+
     @staticmethod
     def _findProducer(*filenames: str) -> 'str | None':
         '''Search GENICAM_GENTL64_PATH for a matching GenTL producer.
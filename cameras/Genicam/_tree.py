@@ -163,7 +163,11 @@ class QGenicamTree(QCameraTree):
                 key = param.name()
                 if key in self._scaleFactors:
                     value = value / self._scaleFactors[key]  # type: ignore
-                self.camera.set(key, value)
+                self._setCamera(key, value)
+        if not self._queued():
+            self._refresh()
+
+    def _refresh(self) -> None:
         self._ignoreSync = True
         for key, value in self.camera.settings.items():
             if key in self._scaleFactors:
@@ -171,6 +175,11 @@ class QGenicamTree(QCameraTree):
             self.set(key, value)
         self._ignoreSync = False
 
+    def _report(self, key: str, value: object) -> None:
+        if key in self._scaleFactors:
+            value = value * self._scaleFactors[key]  # type: ignore
+        super()._report(key, value)
+
     @property
     def controls(self) -> list[str] | None:
         return self._controls
@@ -14,8 +14,14 @@ QIDSSource
 QIDSTree
     Parameter tree widget for :class:`QIDSCamera` controls.
 '''
-from ._camera import QIDSCamera, QIDSSource
-from ._tree import QIDSTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QIDSCamera QIDSSource QIDSTree'.split()
+_EXPORTS = {
+    'QIDSCamera': '._camera',
+    'QIDSSource': '._camera',
+    'QIDSTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
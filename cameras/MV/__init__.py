@@ -20,8 +20,14 @@ QMVSource
 QMVTree
     Parameter tree widget for :class:`QMVCamera` controls.
 '''
-from ._camera import QMVCamera, QMVSource
-from ._tree import QMVTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QMVCamera QMVSource QMVTree'.split()
+_EXPORTS = {
+    'QMVCamera': '._camera',
+    'QMVSource': '._camera',
+    'QMVTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
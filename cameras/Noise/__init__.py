@@ -14,8 +14,14 @@ QNoiseSource
 QNoiseTree
     Parameter tree widget for :class:`QNoiseCamera` controls.
 '''
-from ._camera import QNoiseCamera, QNoiseSource
-from ._tree import QNoiseTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QNoiseCamera QNoiseSource QNoiseTree'.split()
+_EXPORTS = {
+    'QNoiseCamera': '._camera',
+    'QNoiseSource': '._camera',
+    'QNoiseTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
@@ -1,6 +1,7 @@
 from QVideo.lib import QCamera, QVideoSource
+from QVideo.lib.frameclock import FrameClock
+from QVideo.lib.bayer import PATTERNS
 import numpy as np
-import time
 import logging
 
 
@@ -18,6 +19,19 @@ class QNoiseCamera(QCamera):
     All properties are registered on construction; the camera opens
     automatically.
 
+    Frames are paced by a :class:`~QVideo.lib.frameclock.FrameClock`,
+    which holds the long-run frame rate at exactly :attr:`fps` and
+    reports a frame counter through
+    :meth:`~QVideo.lib.QCamera.QCamera.frameMetadata`.  A reader that
+    falls behind loses frames, as it would with real hardware.  Setting
+    ``fps`` to ``0`` disables pacing so that frames are delivered as
+    fast as they are read.
+
+    By default every frame is freshly generated.  For load testing at
+    high frame rates, *bank* frames can instead be generated once and
+    served in rotation, so that reading a frame costs no more than
+    copying it.
+
     Parameters
     ----------
     cameraID : int
@@ -26,43 +40,88 @@ class QNoiseCamera(QCamera):
         Minimum pixel value (inclusive). Default: ``48``.
     whitelevel : int
         Maximum pixel value (exclusive). Default: ``128``.
+    fps : float
+        Frame rate [frames per second].  ``0`` for unpaced frames.
+        Default: ``30``.
+    dtype : str or numpy.dtype
+        Pixel type, ``'uint8'`` or ``'uint16'``.  Black and white levels
+        are given on an 8-bit scale and shifted into the high byte of
+        ``uint16`` pixels.  Default: ``'uint8'``.
+    bayer : str or None
+        Color filter arrangement (``'RGGB'``, ``'BGGR'``, ``'GRBG'`` or
+        ``'GBRG'``) of a raw sensor.  Each site is scaled by the
+        response of its color so that demosaicing yields a tinted
+        image.  ``None`` for monochrome frames.  Default: ``None``.
+    bank : int
+        Number of pregenerated frames to serve in rotation.  ``0``
+        generates a new frame for each read.  Default: ``0``.
     *args :
         Forwarded to :class:`~QVideo.lib.QCamera`.
     **kwargs :
         Forwarded to :class:`~QVideo.lib.QCamera`.
     '''
 
+    #: Relative response of the red, green and blue sites of a raw sensor.
+    GAINS: dict[str, float] = dict(R=1., G=0.7, B=0.4)
+
     def __init__(self, *args,
                  cameraID: int = 0,
                  blacklevel: int = 48,
                  whitelevel: int = 128,
+                 fps: float = 30.,
+                 dtype: str | np.dtype = 'uint8',
+                 bayer: str | None = None,
+                 bank: int = 0,
                  **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        dtype = np.dtype(dtype)
+        if dtype not in (np.uint8, np.uint16):
+            raise ValueError(f'unsupported dtype {dtype}: '
+                             'use uint8 or uint16')
+        if bayer is not None and bayer.upper() not in PATTERNS:
+            raise ValueError(f'unknown Bayer pattern {bayer!r}')
         self._width = 640
         self._height = 480
-        self._fps = 30.
+        self._fps = max(0., float(fps))
         self._blacklevel = int(np.clip(blacklevel, 0, 254))
         self._whitelevel = int(np.clip(whitelevel, 1, 255))
+        self._dtype = dtype
+        self._bayer = None if bayer is None else bayer.upper()
+        self._nbank = max(0, int(bank))
+        self._clock = FrameClock(self._fps)
+        self._bank = None
 
         register = self.registerProperty
         register('width', setter=self._setWidth, ptype=int)
         register('height', setter=self._setHeight, ptype=int)
-        register('fps', ptype=float)
+        register('fps', setter=self._setFps, ptype=float)
         register('color', getter=lambda: False, setter=None, ptype=bool)
         register('blacklevel', setter=self._setBlacklevel, ptype=int)
         register('whitelevel', setter=self._setWhitelevel, ptype=int)
         self.open()
 
+    @property
+    def dtype(self) -> np.dtype:
+        '''Pixel type of the frames.'''
+        return self._dtype
+
     def _setWidth(self, value: int) -> None:
         '''Set frame width and emit :attr:`shapeChanged`.'''
         self._width = int(value)
+        self._bank = None
         self.shapeChanged.emit(self.shape)
 
     def _setHeight(self, value: int) -> None:
         '''Set frame height and emit :attr:`shapeChanged`.'''
         self._height = int(value)
+        self._bank = None
         self.shapeChanged.emit(self.shape)
 
+    def _setFps(self, value: float) -> None:
+        '''Set the frame rate; ``0`` disables pacing.'''
+        self._fps = max(0., float(value))
+        self._clock.fps = self._fps
+
     def _setBlacklevel(self, value: int) -> None:
         '''Set black level, clamped to [0, 254].
 
@@ -75,6 +134,7 @@ class QNoiseCamera(QCamera):
                 f'whitelevel {self._whitelevel}: ignoring')
             return
         self._blacklevel = value
+        self._bank = None
 
     def _setWhitelevel(self, value: int) -> None:
         '''Set white level, clamped to [1, 255].
@@ -88,9 +148,10 @@ class QNoiseCamera(QCamera):
                 f'blacklevel {self._blacklevel}: ignoring')
             return
         self._whitelevel = value
+        self._bank = None
 
     def _initialize(self) -> bool:
-        '''Seed the random number generator.
+        '''Seed the random number generator and restart the clock.
 
         Returns
         -------
@@ -98,28 +159,111 @@ class QNoiseCamera(QCamera):
             Always ``True``.
         '''
         self._rng = np.random.default_rng()
+        self._scratch = None
+        self._gainMap = None
+        self._bank = None
+        self._clock.reset()
         return True
 
     def _deinitialize(self) -> None:
-        '''Release the random number generator.'''
+        '''Release the random number generator and frame bank.'''
         self._rng = None
+        self._scratch = None
+        self._gainMap = None
+        self._bank = None
+
+    def _gains(self, shape: tuple[int, int]) -> np.ndarray:
+        '''Per-site response of the Bayer mosaic, cached per shape.'''
+        if self._gainMap is None or self._gainMap.shape != shape:
+            tile = np.array([self.GAINS[c] for c in self._bayer],
+                            np.float32).reshape(2, 2)
+            rows, cols = (shape[0] + 1) // 2, (shape[1] + 1) // 2
+            self._gainMap = np.tile(tile, (rows, cols))[:shape[0], :shape[1]]
+        return self._gainMap
+
+    def _generate(self, out: np.ndarray) -> None:
+        '''Fill *out* with noise between the black and white levels.
+
+        Noise is drawn into a reusable ``float32`` scratch array and
+        scaled in place, so no memory is allocated per frame.
+        '''
+        shape = out.shape[-2:]
+        if self._scratch is None or self._scratch.shape != shape:
+            self._scratch = np.empty(shape, np.float32)
+        scratch = self._scratch
+        scale = 256 if self._dtype == np.uint16 else 1
+        black, white = scale * self._blacklevel, scale * self._whitelevel
+        self._rng.random(dtype=np.float32, out=scratch)
+        if self._bayer is not None:
+            scratch *= self._gains(shape)
+        scratch *= white - black
+        scratch += black
+        np.minimum(scratch, white - 1, out=scratch)
+        np.copyto(out, scratch, casting='unsafe')
+
+    def _frame(self) -> np.ndarray | None:
+        '''Wait for the next frame and return it from the bank.
+
+        Returns ``None`` when frames are not banked; the caller then
+        generates the frame itself.
+        '''
+        if not self._nbank:
+            self._frameMetadata = self._clock.tick()
+            return None
+        shape = (self._height, self._width)
+        if self._bank is None or self._bank.shape[1:] != shape:
+            self._bank = np.empty((self._nbank, *shape), self._dtype)
+            for frame in self._bank:
+                self._generate(frame)
+        self._frameMetadata = self._clock.tick()
+        return self._bank[self._frameMetadata[1] % self._nbank]
 
     def read(self) -> QCamera.CameraData:
-        '''Generate and return a random noise frame.
+        '''Return the next noise frame.
 
         Returns
         -------
         tuple[bool, ndarray]
-            ``(True, frame)`` where ``frame`` is a grayscale uint8 array
-            of shape ``(height, width)``.
+            ``(True, frame)`` where ``frame`` is a grayscale array of
+            shape ``(height, width)`` and type :attr:`dtype`.
         '''
         if not self.isOpen():
             return False, None
-        time.sleep(1. / self._fps)
-        image = self._rng.integers(self._blacklevel, self._whitelevel,
-                                   (self._height, self._width), np.uint8)
+        frame = self._frame()
+        if frame is not None:
+            return True, frame.copy()
+        image = np.empty((self._height, self._width), self._dtype)
+        self._generate(image)
         return True, image
 
+    def read_into(self, out: np.ndarray) -> QCamera.CameraData:
+        '''Read the next noise frame into the preallocated buffer *out*.
+
+        Falls back to :meth:`read` when *out* does not match the current
+        frame geometry.
+
+        Parameters
+        ----------
+        out : ndarray
+            Buffer of shape ``(height, width)`` and type :attr:`dtype`.
+
+        Returns
+        -------
+        tuple[bool, ndarray]
+            ``(True, out)`` on success.
+        '''
+        if not self.isOpen():
+            return False, None
+        shape = (self._height, self._width)
+        if out.shape != shape or out.dtype != self._dtype:
+            return self.read()
+        frame = self._frame()
+        if frame is not None:
+            np.copyto(out, frame)
+        else:
+            self._generate(out)
+        return True, out
+
 
 class QNoiseSource(QVideoSource):
 
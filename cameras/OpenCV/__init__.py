@@ -19,9 +19,15 @@ QOpenCVTree
 QOpenCVDevices
     Utility class for probing connected OpenCV-accessible devices.
 '''
-from ._camera import QOpenCVCamera, QOpenCVSource
-from ._tree import QOpenCVTree
-from ._devices import QOpenCVDevices
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QOpenCVCamera QOpenCVSource QOpenCVTree QOpenCVDevices'.split()
+_EXPORTS = {
+    'QOpenCVCamera': '._camera',
+    'QOpenCVSource': '._camera',
+    'QOpenCVTree': '._tree',
+    'QOpenCVDevices': '._devices',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
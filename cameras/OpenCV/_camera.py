@@ -1,5 +1,6 @@
 from QVideo.lib import QCamera, QVideoSource
-from QVideo.cameras.OpenCV._devices import configure, probe_formats
+from QVideo.cameras.OpenCV._devices import (
+    configure, probe_formats, device_identity, cached_formats, cache_formats)
 import cv2
 import platform
 import logging
@@ -142,14 +143,20 @@ class QOpenCVCamera(QCamera):
         # Probe supported resolutions and their actual maximum frame rates on
         # the live device before configuring.  QtMultimedia nominal fps values
         # are unreliable; reading back what the driver accepts is accurate.
-        self._formats = probe_formats(self._device)
+        # Probing is slow, so a camera model that has been probed before is
+        # configured from the cache, which is checked against the device.
+        identity = device_identity(self._cameraID)
+        self._formats = cached_formats(identity)
+        if not (self._formats and self._configure()):
+            if self._formats:
+                logger.debug(f'Cached formats of {identity} are out of date')
+            self._formats = probe_formats(self._device)
+            self._configure()
+            cache_formats(identity, self._formats)
         self._formatLabels = {
             f'{w}×{h} @ {fps:.0f} Hz': (w, h, float(fps))
             for w, h, _min, fps in self._formats
         }
-        resolutions = [(w, h) for w, h, *_ in self._formats] or None
-        configure(self._device, self._configWidth, self._configHeight,
-                  self._configFps, resolutions=resolutions)
         for _ in range(5):
             if (ready := self._device.read()[0]):
                 break
@@ -178,6 +185,23 @@ class QOpenCVCamera(QCamera):
             self._device.release()
         return ready
 
+    def _configure(self) -> bool:
+        '''Apply the requested format using the known formats.
+
+        Returns
+        -------
+        bool
+            ``False`` if the device rejected an automatically selected
+            resolution, which means that the known formats are wrong.
+        '''
+        resolutions = [(w, h) for w, h, *_ in self._formats] or None
+        configure(self._device, self._configWidth, self._configHeight,
+                  self._configFps, resolutions=resolutions)
+        if resolutions is None or None not in (self._configWidth,
+                                               self._configHeight):
+            return True
+        return (self._getWidth(), self._getHeight()) in resolutions
+
     def _probeProperties(self) -> None:
         '''Register device properties that the camera actually supports.
 
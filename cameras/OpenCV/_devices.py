@@ -1,5 +1,17 @@
-'''Camera and format enumeration for OpenCV-backed cameras.'''
+'''Camera and format enumeration for OpenCV-backed cameras.
+
+Probing the formats of a camera sets each candidate resolution and
+frame rate on the device in turn, which takes seconds with V4L2.  The
+results are therefore cached on disk (see :mod:`QVideo.lib._cache`)
+under an identifier of the camera model and interface, so that a known
+camera opens without being probed.
+'''
+from pathlib import Path
+from QVideo.lib import _cache
 import platform
+import threading
+import time
+import logging
 import cv2
 
 try:
@@ -9,8 +21,11 @@ except (ImportError, AttributeError):
     _QMediaDevices = None
 
 
+logger = logging.getLogger(__name__)
+
 __all__ = ['QOpenCVDevices', 'COMMON_RESOLUTIONS',
-           'probe_resolutions', 'probe_formats', 'configure']
+           'probe_resolutions', 'probe_formats', 'configure',
+           'device_identity', 'cached_formats', 'cache_formats']
 
 
 COMMON_RESOLUTIONS: list[tuple[int, int]] = [
@@ -24,6 +39,14 @@ COMMON_RESOLUTIONS: list[tuple[int, int]] = [
     (3840, 2160),
 ]
 
+#: Age after which cached formats are discarded [s].
+FORMAT_TTL: float = 30 * 86400.
+
+_SYSFS = Path('/sys/class/video4linux')
+
+_refreshing: set[str] = set()
+_refreshLock = threading.Lock()
+
 
 def probe_resolutions(device: cv2.VideoCapture) -> list[tuple[int, int]]:
     '''Return resolutions accepted by an open OpenCV VideoCapture device.
@@ -175,6 +198,126 @@ def configure(device: cv2.VideoCapture,
     # already requested on the device, clamped to whatever the driver allows.
 
 
+def device_identity(cameraID: int) -> str | None:
+    '''Return an identifier for the model and interface of a camera.
+
+    On Linux the identifier is read from sysfs: ``usb:VID:PID:driver:N``
+    for USB cameras and ``v4l2:bus:driver:N`` for other buses, where
+    ``N`` distinguishes the video nodes of one device.  Identical
+    cameras share an identifier because they support the same formats.
+    Elsewhere the camera name reported by QtMultimedia is used.
+
+    Parameters
+    ----------
+    cameraID : int
+        OpenCV camera index.
+
+    Returns
+    -------
+    str or None
+        Identifier, or ``None`` if the camera cannot be identified.
+    '''
+    system = platform.system()
+    if system == 'Linux':
+        return _v4l2_identity(cameraID)
+    if _QMediaDevices is not None:
+        device = QOpenCVDevices._find_device(
+            cameraID, _QMediaDevices.videoInputs())
+        if device is not None:
+            return f'{system}:{device.description()}'
+    return None
+
+
+def _v4l2_identity(cameraID: int) -> str | None:
+    node = _SYSFS / f'video{cameraID}'
+    try:
+        device = (node / 'device').resolve(strict=True)
+        driver = (device / 'driver').resolve(strict=True).name
+    except OSError:
+        return None
+    try:
+        index = (node / 'index').read_text().strip()
+    except OSError:
+        index = '0'
+    for parent in (device, *device.parents):
+        try:
+            vendor = (parent / 'idVendor').read_text().strip()
+            product = (parent / 'idProduct').read_text().strip()
+        except OSError:
+            continue
+        return f'usb:{vendor}:{product}:{driver}:{index}'
+    return f'v4l2:{device.name}:{driver}:{index}'
+
+
+def _format_key(identity: str,
+                resolutions: list[tuple[int, int]] | None) -> str:
+    candidates = COMMON_RESOLUTIONS if resolutions is None else resolutions
+    return identity + ' ' + ','.join(f'{w}x{h}' for w, h in candidates)
+
+
+def _cached_entry(identity: str | None,
+                  resolutions: list[tuple[int, int]] | None) -> dict | None:
+    if identity is None:
+        return None
+    entry = _cache.load('opencv').get(_format_key(identity, resolutions))
+    try:
+        if 0. <= time.time() - entry['time'] < FORMAT_TTL:
+            return entry
+    except (KeyError, TypeError):
+        pass
+    return None
+
+
+def cached_formats(identity: str | None,
+                   resolutions: list[tuple[int, int]] | None = None,
+                   ) -> list[tuple[int, int, float, float]] | None:
+    '''Return formats cached by :func:`cache_formats`.
+
+    Parameters
+    ----------
+    identity : str or None
+        Camera identifier from :func:`device_identity`.
+    resolutions : list[tuple[int, int]] or None
+        Resolution candidates of the probe.  Default:
+        :data:`COMMON_RESOLUTIONS`.
+
+    Returns
+    -------
+    list[tuple[int, int, float, float]] or None
+        Formats in the form returned by :func:`probe_formats`, or
+        ``None`` if this camera has not been probed with these
+        candidates within :data:`FORMAT_TTL`.
+    '''
+    entry = _cached_entry(identity, resolutions)
+    if entry is None:
+        return None
+    return [tuple(f) for f in entry['formats']]
+
+
+def cache_formats(identity: str | None,
+                  formats: list[tuple[int, int, float, float]],
+                  resolutions: list[tuple[int, int]] | None = None) -> None:
+    '''Store the result of :func:`probe_formats` for a camera.
+
+    Nothing is stored for an unidentified camera or an empty result,
+    which usually means that the device could not be opened.
+
+    Parameters
+    ----------
+    identity : str or None
+        Camera identifier from :func:`device_identity`.
+    formats : list[tuple[int, int, float, float]]
+        Probed formats.
+    resolutions : list[tuple[int, int]] or None
+        Resolution candidates of the probe.  Default:
+        :data:`COMMON_RESOLUTIONS`.
+    '''
+    if identity is None or not formats:
+        return
+    entry = dict(time=time.time(), formats=[list(f) for f in formats])
+    _cache.update('opencv', {_format_key(identity, resolutions): entry})
+
+
 class QOpenCVDevices:
     '''Camera discovery and format enumeration for OpenCV cameras.
 
@@ -218,6 +361,11 @@ class QOpenCVDevices:
         Frame rates from QtMultimedia are **not** used because they reflect
         nominal/declared values that often differ from what the driver accepts.
 
+        Results are cached by :func:`device_identity`.  A known camera is
+        not opened: its cached formats are returned at once.  They are
+        checked when :class:`~QVideo.cameras.OpenCV.QOpenCVCamera` opens
+        the device, and can be probed again with :meth:`refresh`.
+
         Parameters
         ----------
         cameraID : int
@@ -237,7 +385,57 @@ class QOpenCVDevices:
                 qt_resolutions = [(w, h)
                                   for w, h, *_ in
                                   QOpenCVDevices._formats_from_device(device)]
-        return QOpenCVDevices._probe_formats(cameraID, qt_resolutions)
+        identity = device_identity(cameraID)
+        entry = _cached_entry(identity, qt_resolutions)
+        if entry is not None:
+            return [tuple(f) for f in entry['formats']]
+        formats = QOpenCVDevices._probe_formats(cameraID, qt_resolutions)
+        cache_formats(identity, formats, qt_resolutions)
+        return formats
+
+    @staticmethod
+    def refresh(cameraID: int = 0,
+                resolutions: list[tuple[int, int]] | None = None,
+                ) -> list[tuple[int, int, float, float]] | None:
+        '''Probe the formats of a camera again and update the cache.
+
+        Probing opens the device and sets each candidate format in turn,
+        so call this only while no one else has the camera open.  A
+        camera that is streaming cannot be probed; its cache entry is
+        left unchanged.
+
+        Parameters
+        ----------
+        cameraID : int
+            Camera index.
+        resolutions : list[tuple[int, int]] or None
+            Resolution candidates.  ``None`` uses
+            :data:`COMMON_RESOLUTIONS`.
+
+        Returns
+        -------
+        list[tuple[int, int, float, float]] or None
+            The probed formats, or ``None`` if the camera cannot be
+            identified, is being probed already, or could not be
+            opened.
+        '''
+        identity = device_identity(cameraID)
+        if identity is None:
+            return None
+        with _refreshLock:
+            if identity in _refreshing:
+                return None
+            _refreshing.add(identity)
+        try:
+            formats = QOpenCVDevices._probe_formats(cameraID, resolutions)
+        except Exception as ex:
+            logger.debug(f'Could not refresh formats of {identity}: {ex}')
+            formats = []
+        finally:
+            with _refreshLock:
+                _refreshing.discard(identity)
+        cache_formats(identity, formats, resolutions)
+        return formats or None
 
     @staticmethod
     def _find_device(cameraID: int, devices) -> object | None:
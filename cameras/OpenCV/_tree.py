@@ -123,14 +123,11 @@ class QOpenCVTree(QCameraTree):
                 other.append((param, change, value))
         if fmt_value is not None:
             w, h, fps = fmt_value
-            self.camera.set('width', w)
-            self.camera.set('height', h)
-            self.camera.set('fps', fps)
-            self._ignoreSync = True
-            for key, val in self.camera.settings.items():
-                if key != 'resolution':
-                    self.set(key, val)
-            self._ignoreSync = False
+            self._setCamera('width', w)
+            self._setCamera('height', h)
+            self._setCamera('fps', fps)
+            if not self._queued():
+                self._refresh()
         if other:
             super()._sync(root, other)
 
@@ -0,0 +1,28 @@
+'''Synthetic particle camera with ground truth.
+
+Provides a hardware-free camera backend that renders diffusing
+particles, as bright spots or as in-line holograms, and records the
+true position of every particle in every frame.  Use it to measure the
+speed and accuracy of particle detection and tracking on repeatable
+input.
+
+Classes
+-------
+QParticleCamera
+    Camera that renders diffusing particles with known positions.
+QParticleSource
+    Threaded video source backed by :class:`QParticleCamera`.
+QParticleTree
+    Parameter tree widget for :class:`QParticleCamera` controls.
+'''
+from QVideo.lib._lazy import attach
+
+
+_EXPORTS = {
+    'QParticleCamera': '._camera',
+    'QParticleSource': '._camera',
+    'QParticleTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
@@ -0,0 +1,366 @@
+from collections import deque
+from qtpy import QtCore
+from QVideo.lib import QCamera, QVideoSource
+from QVideo.lib.frameclock import FrameClock
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+__all__ = ['QParticleCamera', 'QParticleSource']
+
+
+class QParticleCamera(QCamera):
+
+    '''Camera that renders diffusing particles with known positions.
+
+    Each frame shows :attr:`nparticles` particles on a uniform
+    background with additive Gaussian noise.  A particle appears either
+    as a bright Gaussian spot or, with ``hologram`` set, as the
+    concentric interference rings of an in-line hologram.  Between
+    frames, particles take independent Gaussian steps and wrap around
+    the edges of the field of view so that the density stays constant.
+
+    Rendering is vectorized over particles: every particle is drawn
+    into a small window around its position and the windows are
+    accumulated in a single pass, so the cost grows with the number of
+    particles rather than with the frame size.
+
+    The positions used to render each frame are kept for the most
+    recent :attr:`HISTORY` frames and are available from
+    :meth:`groundTruth`, keyed by the frame counter that
+    :meth:`~QVideo.lib.QCamera.QCamera.frameMetadata` reports and
+    :class:`~QVideo.lib.frameinfo.FrameInfo` carries as
+    ``hardwareIndex``.  Frames are paced by a
+    :class:`~QVideo.lib.frameclock.FrameClock`; when the reader falls
+    behind, particles move by the accumulated steps of the frames it
+    missed.
+
+    The scene is reproducible: opening the camera reseeds the random
+    number generator with *seed*, and with ``fps = 0`` the sequence of
+    frames depends only on the number of reads.
+
+    Parameters
+    ----------
+    cameraID : int
+        Accepted for API consistency with other camera backends; ignored.
+    nparticles : int
+        Number of particles in the field of view.  Default: ``20``.
+    sigma : float
+        Size of a particle [pixels]: the standard deviation of a spot,
+        or the scale of the ring pattern of a hologram.  Default: ``3``.
+    hologram : bool
+        Render holographic rings instead of spots.  Default: ``False``.
+    diffusion : float
+        Root-mean-square step per frame along each axis [pixels].
+        Default: ``1``.
+    brightness : float
+        Peak amplitude of a particle [gray levels].  Default: ``120``.
+    noise : float
+        Standard deviation of the additive noise [gray levels].
+        Default: ``5``.
+    fps : float
+        Frame rate [frames per second].  ``0`` for unpaced frames.
+        Default: ``30``.
+    seed : int or None
+        Seed of the random number generator.  Default: ``0``.
+    *args :
+        Forwarded to :class:`~QVideo.lib.QCamera`.
+    **kwargs :
+        Forwarded to :class:`~QVideo.lib.QCamera`.
+    '''
+
+    #: Number of frames for which ground truth is retained.
+    HISTORY: int = 256
+
+    #: Gray level of the background.
+    BACKGROUND: float = 64.
+
+    def __init__(self, *args,
+                 cameraID: int = 0,
+                 nparticles: int = 20,
+                 sigma: float = 3.,
+                 hologram: bool = False,
+                 diffusion: float = 1.,
+                 brightness: float = 120.,
+                 noise: float = 5.,
+                 fps: float = 30.,
+                 seed: int | None = 0,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._width = 640
+        self._height = 480
+        self._fps = max(0., float(fps))
+        self._nparticles = max(0, int(nparticles))
+        self._sigma = max(0.5, float(sigma))
+        self._hologram = bool(hologram)
+        self._diffusion = max(0., float(diffusion))
+        self._brightness = float(brightness)
+        self._noise = max(0., float(noise))
+        self._seed = seed
+        self._clock = FrameClock(self._fps)
+        self._history = deque(maxlen=self.HISTORY)
+        self._historyMutex = QtCore.QMutex()
+        self._window = None
+
+        register = self.registerProperty
+        register('width', setter=self._setWidth, ptype=int)
+        register('height', setter=self._setHeight, ptype=int)
+        register('fps', setter=self._setFps, ptype=float)
+        register('color', getter=lambda: False, setter=None, ptype=bool)
+        register('nparticles', setter=self._setNparticles, ptype=int)
+        register('sigma', setter=self._setSigma, ptype=float)
+        register('hologram', setter=self._setHologram, ptype=bool)
+        register('diffusion', setter=self._setDiffusion, ptype=float)
+        register('brightness', ptype=float)
+        register('noise', setter=self._setNoise, ptype=float)
+        self.open()
+
+    def _setWidth(self, value: int) -> None:
+        '''Set frame width, redistribute particles and emit
+        :attr:`shapeChanged`.'''
+        self._width = int(value)
+        self._scatter()
+        self.shapeChanged.emit(self.shape)
+
+    def _setHeight(self, value: int) -> None:
+        '''Set frame height, redistribute particles and emit
+        :attr:`shapeChanged`.'''
+        self._height = int(value)
+        self._scatter()
+        self.shapeChanged.emit(self.shape)
+
+    def _setFps(self, value: float) -> None:
+        '''Set the frame rate; ``0`` disables pacing.'''
+        self._fps = max(0., float(value))
+        self._clock.fps = self._fps
+
+    def _setNparticles(self, value: int) -> None:
+        '''Set the number of particles, keeping existing positions.'''
+        value = max(0, int(value))
+        if self.isOpen():
+            extra = self._place(max(0, value - len(self._positions)))
+            self._positions = np.vstack([self._positions, extra])[:value]
+        self._nparticles = value
+
+    def _setSigma(self, value: float) -> None:
+        '''Set the particle size, no smaller than half a pixel.'''
+        self._sigma = max(0.5, float(value))
+        self._window = None
+
+    def _setHologram(self, value: bool) -> None:
+        '''Switch between spots and holograms.'''
+        self._hologram = bool(value)
+        self._window = None
+
+    def _setDiffusion(self, value: float) -> None:
+        '''Set the step size, clamped to be non-negative.'''
+        self._diffusion = max(0., float(value))
+
+    def _setNoise(self, value: float) -> None:
+        '''Set the noise level, clamped to be non-negative.'''
+        self._noise = max(0., float(value))
+
+    def _initialize(self) -> bool:
+        '''Seed the random number generator and place the particles.
+
+        Returns
+        -------
+        bool
+            Always ``True``.
+        '''
+        self._rng = np.random.default_rng(self._seed)
+        self._clock.reset()
+        with QtCore.QMutexLocker(self._historyMutex):
+            self._history.clear()
+        self._last = None
+        self._scratch = None
+        self._scatter()
+        return True
+
+    def _deinitialize(self) -> None:
+        '''Release the random number generator.'''
+        self._rng = None
+        self._scratch = None
+        self._field = None
+
+    def _place(self, n: int) -> np.ndarray:
+        '''Return *n* random positions ``(x, y)`` in the field of view.'''
+        return self._rng.random((n, 2)) * (self._width, self._height)
+
+    def _scatter(self) -> None:
+        '''Place all particles at random.'''
+        if getattr(self, '_rng', None) is not None:
+            self._positions = self._place(self._nparticles)
+
+    def _step(self, index: int) -> np.ndarray:
+        '''Advance the particles to frame *index* and return positions.'''
+        steps = 0 if self._last is None else index - self._last
+        self._last = index
+        if steps > 0 and self._diffusion > 0 and len(self._positions):
+            scale = self._diffusion * np.sqrt(steps)
+            self._positions += self._rng.normal(0., scale,
+                                                self._positions.shape)
+            self._positions %= (self._width, self._height)
+        return self._positions.copy()
+
+    def _offsets(self) -> tuple[np.ndarray, np.ndarray]:
+        '''Pixel offsets of the rendering window around a particle.'''
+        if self._window is None:
+            extent = 8. if self._hologram else 4.
+            half = int(np.ceil(extent * self._sigma))
+            dy, dx = np.mgrid[-half:half + 1, -half:half + 1]
+            self._window = dx.ravel(), dy.ravel()
+        return self._window
+
+    def _profile(self, r2: np.ndarray) -> np.ndarray:
+        '''Intensity of a particle at squared distance *r2*.'''
+        s2 = self._sigma ** 2
+        if self._hologram:
+            return (np.exp(-r2 / (18. * s2)) *
+                    np.cos(np.pi * r2 / (4. * s2)))
+        return np.exp(-r2 / (2. * s2))
+
+    def _noisy(self, out: np.ndarray) -> None:
+        '''Fill *out* with unit Gaussian noise.
+
+        Drawing fresh normal deviates for every pixel would dominate the
+        cost of a frame, so the noise is a precomputed field, cyclically
+        shifted by a random offset for each frame.
+        '''
+        h, w = out.shape
+        dy, dx = self._rng.integers(0, (h, w))
+        field = self._field
+        out[:h - dy, :w - dx] = field[dy:, dx:]
+        out[:h - dy, w - dx:] = field[dy:, :dx]
+        out[h - dy:, :w - dx] = field[:dy, dx:]
+        out[h - dy:, w - dx:] = field[:dy, :dx]
+
+    def _render(self, positions: np.ndarray, out: np.ndarray) -> None:
+        '''Render particles at *positions* into the uint8 buffer *out*.'''
+        h, w = out.shape
+        if self._scratch is None or self._scratch.shape != out.shape:
+            self._scratch = np.empty(out.shape, np.float32)
+            self._field = self._rng.standard_normal(out.shape, np.float32)
+        scratch = self._scratch
+        if self._noise > 0:
+            self._noisy(scratch)
+            scratch *= self._noise
+            scratch += self.BACKGROUND
+        else:
+            scratch.fill(self.BACKGROUND)
+        if len(positions):
+            dx, dy = self._offsets()
+            x, y = positions[:, :1], positions[:, 1:]
+            px = np.rint(x).astype(int) + dx
+            py = np.rint(y).astype(int) + dy
+            r2 = ((px - x) ** 2 + (py - y) ** 2).astype(np.float32)
+            values = self._brightness * self._profile(r2)
+            values *= (px >= 0) & (px < w) & (py >= 0) & (py < h)
+            pixels = np.clip(py, 0, h - 1) * w + np.clip(px, 0, w - 1)
+            scratch += np.bincount(pixels.ravel(), values.ravel(),
+                                   minlength=h * w).reshape(h, w)
+        np.clip(scratch, 0, 255, out=scratch)
+        np.copyto(out, scratch, casting='unsafe')
+
+    def _next(self, out: np.ndarray) -> None:
+        '''Wait for the next frame and render it into *out*.'''
+        self._frameMetadata = self._clock.tick()
+        index = self._frameMetadata[1]
+        positions = self._step(index)
+        self._render(positions, out)
+        with QtCore.QMutexLocker(self._historyMutex):
+            self._history.append((index, positions))
+
+    def groundTruth(self, index: int | None = None) -> np.ndarray | None:
+        '''Return the particle positions used to render a frame.
+
+        Parameters
+        ----------
+        index : int or None
+            Frame counter of the frame, as reported by
+            :meth:`~QVideo.lib.QCamera.QCamera.frameMetadata`.  ``None``
+            selects the most recent frame.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Array of shape ``(nparticles, 2)`` with the ``(x, y)``
+            position of each particle [pixels], measured from the
+            top-left corner of the frame, or ``None`` if the frame is
+            no longer in the history.
+        '''
+        with QtCore.QMutexLocker(self._historyMutex):
+            history = list(self._history)
+        for key, positions in reversed(history):
+            if index is None or key == index:
+                return positions
+            if key < index:
+                break
+        return None
+
+    def read(self) -> QCamera.CameraData:
+        '''Render and return the next frame.
+
+        Returns
+        -------
+        tuple[bool, ndarray]
+            ``(True, frame)`` where ``frame`` is a grayscale uint8 array
+            of shape ``(height, width)``.
+        '''
+        if not self.isOpen():
+            return False, None
+        image = np.empty((self._height, self._width), np.uint8)
+        self._next(image)
+        return True, image
+
+    def read_into(self, out: np.ndarray) -> QCamera.CameraData:
+        '''Render the next frame into the preallocated buffer *out*.
+
+        Falls back to :meth:`read` when *out* does not match the current
+        frame geometry.
+
+        Parameters
+        ----------
+        out : ndarray
+            uint8 buffer of shape ``(height, width)``.
+
+        Returns
+        -------
+        tuple[bool, ndarray]
+            ``(True, out)`` on success.
+        '''
+        if not self.isOpen():
+            return False, None
+        if out.shape != (self._height, self._width) or out.dtype != np.uint8:
+            return self.read()
+        self._next(out)
+        return True, out
+
+
+class QParticleSource(QVideoSource):
+
+    '''Threaded video source backed by :class:`QParticleCamera`.
+
+    Parameters
+    ----------
+    camera : QParticleCamera or None
+        Camera instance to wrap.  If ``None``, a new
+        :class:`QParticleCamera` is created from the remaining arguments.
+    *args :
+        Forwarded to :class:`QParticleCamera` when ``camera`` is ``None``.
+    **kwargs :
+        Forwarded to :class:`QParticleCamera` when ``camera`` is ``None``.
+    '''
+
+    def __init__(self, *args,
+                 camera: QParticleCamera | None = None,
+                 **kwargs) -> None:
+        camera = camera or QParticleCamera(*args, **kwargs)
+        super().__init__(camera)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    QParticleCamera.example()
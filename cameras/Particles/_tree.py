@@ -0,0 +1,44 @@
+from QVideo.lib import QCameraTree
+from QVideo.cameras.Particles._camera import QParticleCamera, QParticleSource
+
+
+__all__ = ['QParticleTree']
+
+
+class QParticleTree(QCameraTree):
+
+    '''Camera tree for a
+    :class:`~QVideo.cameras.Particles.QParticleCamera`.
+
+    Convenience subclass of :class:`~QVideo.lib.QCameraTree.QCameraTree`
+    that creates and opens a
+    :class:`~QVideo.cameras.Particles.QParticleSource` automatically.
+
+    Parameters
+    ----------
+    camera : QParticleCamera or None
+        Camera instance to use.  If ``None``, a new
+        :class:`~QVideo.cameras.Particles.QParticleCamera` is created.
+    cameraID : int
+        Accepted for API consistency with other camera trees; ignored when
+        *camera* is provided.
+    *args :
+        Positional arguments forwarded to
+        :class:`~QVideo.lib.QCameraTree.QCameraTree`.
+    **kwargs :
+        Keyword arguments forwarded to
+        :class:`~QVideo.lib.QCameraTree.QCameraTree`.
+    '''
+
+    def __init__(self, *args,
+                 camera: QParticleCamera | None = None,
+                 cameraID: int = 0,
+                 **kwargs) -> None:
+        source = QParticleSource(camera=camera)
+        super().__init__(source, *args, **kwargs)
+        if 'color' in self._parameters:
+            self._parameters['color'].setOpts(enabled=False)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    QParticleTree.example()
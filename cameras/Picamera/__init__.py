@@ -18,8 +18,14 @@ QPicameraSource
 QPicameraTree
     Parameter tree widget for :class:`QPicamera` controls.
 '''
-from ._camera import QPicamera, QPicameraSource
-from ._tree import QPicameraTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QPicamera QPicameraSource QPicameraTree'.split()
+_EXPORTS = {
+    'QPicamera': '._camera',
+    'QPicameraSource': '._camera',
+    'QPicameraTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
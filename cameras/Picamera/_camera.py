@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 from QVideo.lib import QCamera, QVideoSource
+import numpy as np
 import logging
 
 if TYPE_CHECKING:
@@ -448,23 +449,54 @@ class QPicamera(QCamera):
         tuple[bool, ndarray or None]
             ``(True, frame)`` on success, ``(False, None)`` on failure.
         '''
+        return self._capture()
+
+    def read_into(self, out: np.ndarray) -> QCamera.CameraData:
+        '''Read one frame into the preallocated buffer *out*.
+
+        Copies the request buffer directly into *out* instead of into
+        a new array.  A new array is allocated instead when *out* does
+        not match the delivered frame.
+
+        Parameters
+        ----------
+        out : ndarray
+            Buffer from a :class:`~QVideo.lib.framepool.FramePool`.
+
+        Returns
+        -------
+        tuple[bool, ndarray or None]
+            ``(True, frame)`` on success, ``(False, None)`` on failure.
+        '''
+        return self._capture(out)
+
+    def _capture(self, out: np.ndarray | None = None) -> QCamera.CameraData:
+        '''Capture one request and copy its main stream into a frame.'''
         if not self.isOpen():
             return False, None
         try:
             request = self._device.capture_request()
-            frame = request.make_array('main').copy()
-            if 'AfState' in self._controlValues:
-                req_meta = request.get_metadata()
-                if 'AfState' in req_meta:
-                    self._controlValues['AfState'] = int(req_meta['AfState'])
+            frame = request.make_array('main')
+            if self._gray:
+                # Extract Y plane from planar YUV420: strip U/V rows and
+                # any hardware stride padding beyond self.width.
+                frame = frame[:self.height, :self.width]
+            if (out is not None and out.shape == frame.shape and
+                    out.dtype == frame.dtype):
+                np.copyto(out, frame)
+                frame = out
+            else:
+                frame = frame.copy()
+            req_meta = request.get_metadata()
+            stamp = req_meta.get('SensorTimestamp')
+            self._frameMetadata = (None if stamp is None else int(stamp),
+                                   None)
+            if 'AfState' in self._controlValues and 'AfState' in req_meta:
+                self._controlValues['AfState'] = int(req_meta['AfState'])
             request.release()
         except Exception as ex:
             logger.warning(f'Frame read failed: {ex}')
             return False, None
-        if self._gray:
-            # Extract Y plane from planar YUV420: strip U/V rows and
-            # any hardware stride padding beyond self.width.
-            frame = frame[:self.height, :self.width]
         return True, frame
 
 
@@ -14,8 +14,14 @@ QVimbaXSource
 QVimbaXTree
     Parameter tree widget for :class:`QVimbaXCamera` controls.
 '''
-from ._camera import QVimbaXCamera, QVimbaXSource
-from ._tree import QVimbaXTree
+from QVideo.lib._lazy import attach
 
 
-__all__ = 'QVimbaXCamera QVimbaXSource QVimbaXTree'.split()
+_EXPORTS = {
+    'QVimbaXCamera': '._camera',
+    'QVimbaXSource': '._camera',
+    'QVimbaXTree': '._tree',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
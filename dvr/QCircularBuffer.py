@@ -8,6 +8,7 @@ import numpy as np
 import logging
 
 from QVideo.lib.videotypes import Image
+from QVideo.lib.frameinfo import FrameInfo
 from .QOpenCVWriter import QOpenCVWriter
 
 
@@ -50,6 +51,8 @@ class QCircularBuffer(QtCore.QObject):
     -----
     append(frame : numpy.ndarray) -> None
         Add *frame* to the buffer with the current wall-clock time.
+    appendInfo(frame : numpy.ndarray, info : FrameInfo) -> None
+        Add *frame* to the buffer with its capture time.
     '''
 
     def __init__(self,
@@ -133,10 +136,29 @@ class QCircularBuffer(QtCore.QObject):
         frame : numpy.ndarray
             Video frame to buffer.
         '''
+        self._store(time(), frame)
+
+    @QtCore.Slot(np.ndarray, object)
+    def appendInfo(self, frame: Image, info: FrameInfo) -> None:
+        '''Add *frame* to the buffer with its capture timestamp.
+
+        Connect to
+        :attr:`~QVideo.lib.QVideoSource.QVideoSource.newFrameInfo`.
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            Video frame to buffer.
+        info : FrameInfo
+            Capture metadata for *frame*.
+        '''
+        self._store(info.epoch(), frame)
+
+    def _store(self, timestamp: float, frame: Image) -> None:
         self._frameBytes = frame.nbytes
         if not self._warned:
             self._checkMemory()
-        self._buffer.append((time(), frame))
+        self._buffer.append((timestamp, frame))
 
     def save(self, filename: str) -> bool:
         '''Write buffered frames to *filename*.
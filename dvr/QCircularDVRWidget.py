@@ -140,14 +140,22 @@ class QCircularDVRWidget(QtWidgets.QWidget):
     @source.setter
     def source(self, source: QVideoSource | None) -> None:
         if self._source is not None:
-            self._source.newFrame.disconnect(self._buffer.append)
+            signal, slot = self._bufferConnection(self._source)
+            signal.disconnect(slot)
         self._source = source
         if source is not None:
             if source.fps:
                 self._buffer.fps = source.fps
-            source.newFrame.connect(self._buffer.append)
+            signal, slot = self._bufferConnection(source)
+            signal.connect(slot)
         self._saveButton.setEnabled(source is not None)
 
+    def _bufferConnection(self, source: QVideoSource) -> tuple:
+        '''Signal of *source* and buffer slot that receives its frames.'''
+        if isinstance(source, QVideoSource):
+            return source.newFrameInfo, self._buffer.appendInfo
+        return source.newFrame, self._buffer.append
+
     @property
     def buffer(self) -> QCircularBuffer:
         '''The underlying
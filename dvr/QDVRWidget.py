@@ -334,7 +334,8 @@ class QDVRWidget(QtWidgets.QFrame):
         self._thread = QtCore.QThread()
         self._writer.moveToThread(self._thread)
         self._thread.start()
-        self.source.newFrame.connect(self._writer.write)
+        signal, slot = self._recordingConnection()
+        signal.connect(slot)
         self.recording.emit(True)
 
     @QtCore.Slot()
@@ -383,13 +384,25 @@ class QDVRWidget(QtWidgets.QFrame):
             self._player.pause()
             self.framenumber = 0
 
+    def _recordingConnection(self) -> tuple:
+        '''Signal of :attr:`source` and writer slot used for recording.
+
+        A :class:`~QVideo.lib.QVideoSource.QVideoSource` delivers frames
+        with their capture metadata so that the writer can record
+        capture times.  Other sources deliver bare frames.
+        '''
+        if isinstance(self.source, QVideoSource):
+            return self.source.newFrameInfo, self._writer.writeInfo
+        return self.source.newFrame, self._writer.write
+
     @QtCore.Slot()
     def stop(self) -> None:
         '''Stop recording or playback.'''
         if self.isRecording():
             logger.debug('Stopping Recording')
             try:
-                self.source.newFrame.disconnect(self._writer.write)
+                signal, slot = self._recordingConnection()
+                signal.disconnect(slot)
                 self._writer.frameNumber.disconnect(self.setFrameNumber)
                 self._writer.finished.disconnect(self.stop)
             except (RuntimeError, TypeError):
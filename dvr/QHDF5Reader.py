@@ -1,6 +1,8 @@
 '''HDF5 video reader and threaded playback source.'''
 from qtpy import QtCore
 from QVideo.lib import QCamera, QVideoReader, QVideoSource
+from QVideo.lib.packing import unpacked_size, unpack
+import numpy as np
 from pathlib import Path
 try:
     import h5py
@@ -16,7 +18,11 @@ class QHDF5Reader(QVideoReader):
     '''Video reader for HDF5 files.
 
     Reads frames from an HDF5 file containing an ``images`` group of
-    timestamped datasets, as written by :class:`QHDF5Writer`.
+    timestamped datasets, as written by :class:`QHDF5Writer`.  The
+    Bayer pattern of recorded raw frames is reported by :attr:`bayer`,
+    so that playback is demosaiced for display like live video.
+    Frames stored in a packed pixel format are unpacked into
+    ``uint16`` frames as they are read.
 
     Parameters
     ----------
@@ -30,13 +36,16 @@ class QHDF5Reader(QVideoReader):
             self._images = self._file['images']
         except (OSError, KeyError):
             return False
+        bayer = self._file.attrs.get('Bayer')
+        self._bayer = None if bayer is None else str(bayer)
+        self._packed = 'PixelFormat' in self._file.attrs
         self._keys = sorted(self._images.keys(), key=float)
         self._length = len(self._keys)
         if not self._keys:
             return False
         self._framenumber = 0
         self._height, self._width = (
-            self._images[self._keys[0]][()].shape[0:2])
+            self._frame(self._keys[0]).shape[0:2])
         return True
 
     def _deinitialize(self) -> None:
@@ -54,10 +63,25 @@ class QHDF5Reader(QVideoReader):
         if self._framenumber >= len(self._keys):
             return False, None
         key = self._keys[self._framenumber]
-        frame = self._images[key][()]
+        frame = self._frame(key)
         self._framenumber += 1
         return True, frame
 
+    def _frame(self, key: str) -> np.ndarray:
+        '''Return the frame stored under *key*, unpacked if necessary.'''
+        dataset = self._images[key]
+        frame = dataset[()]
+        if not self._packed:
+            return frame
+        packing = dataset.attrs.get('PixelFormat')
+        if packing is None:
+            return frame
+        height, row = frame.shape
+        width = dataset.attrs.get('Width')
+        if width is None:
+            width = unpacked_size(row, packing)
+        return unpack(frame, packing, (height, int(width)))
+
     @QtCore.Slot(int)
     def seek(self, framenumber: int) -> None:
         '''Advance playback to specified frame number.'''
@@ -1,11 +1,13 @@
 '''HDF5 video writer with per-frame timestamps.'''
 from QVideo.lib import QVideoWriter
 from QVideo.lib.videotypes import Image
+from QVideo.lib.packing import is_packed, packed_size, pack
 try:
     import h5py
 except (ImportError, ModuleNotFoundError):
     h5py = None
 from time import time
+import numpy as np
 import logging
 
 
@@ -24,6 +26,28 @@ class QHDF5Writer(QVideoWriter):
     seconds since recording began.  A ``Timestamp`` attribute on the
     file records the absolute start time (UNIX epoch).
 
+    Frames are stored exactly as delivered, in their native pixel type.
+    Raw Bayer frames are recorded undemosaiced, and their pattern is
+    stored in a ``Bayer`` attribute on the file when frames arrive
+    through :meth:`~QVideo.lib.QVideoWriter.QVideoWriter.writeInfo`.
+
+    Cameras with 10- or 12-bit sensors deliver ``uint16`` frames whose
+    upper bits are always zero.  Setting *packing* stores such frames
+    in a packed pixel format instead, which cuts the size of the file
+    by up to 37%.  The format is recorded in a ``PixelFormat``
+    attribute on the file and on each packed frame, the width of each
+    packed frame in a ``Width`` attribute, and
+    :class:`~QVideo.dvr.QHDF5Reader.QHDF5Reader` unpacks the frames
+    on playback.  Frames that are not two-dimensional ``uint16``
+    arrays, or whose rows cannot be packed independently, are stored
+    unpacked.
+
+    Frames delivered through
+    :meth:`~QVideo.lib.QVideoWriter.QVideoWriter.writeInfo` are keyed
+    by their capture time.  Frames delivered through
+    :meth:`~QVideo.lib.QVideoWriter.QVideoWriter.write` are keyed by
+    the time at which they are written.
+
     The file is created on the first frame and closed explicitly by
     :meth:`close`.  If the file cannot be created, :meth:`open`
     returns ``False`` and no data are written.
@@ -32,17 +56,26 @@ class QHDF5Writer(QVideoWriter):
     ----------
     filename : str
         Path to the output HDF5 file.
+    packing : str or None
+        Packed pixel format for ``uint16`` frames, such as
+        ``'Mono12p'``; see :mod:`QVideo.lib.packing`.  Pixel values
+        must fit in the bit depth of the format.  Default: ``None``:
+        store frames as delivered.
     *args :
         Forwarded to :class:`~QVideo.lib.QVideoWriter`.
     **kwargs :
         Forwarded to :class:`~QVideo.lib.QVideoWriter`.
     '''
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, packing: str | None = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        if packing is not None and not is_packed(packing):
+            raise ValueError(f'{packing!r} is not a packed pixel format')
+        self.packing = packing
         self._file = None
         self._writer = None
         self._start = None
+        self._origin = None
 
     def open(self, frame: Image) -> bool:
         '''Open the HDF5 file for writing.
@@ -69,8 +102,16 @@ class QHDF5Writer(QVideoWriter):
         except OSError:
             logger.warning(f'Could not open {self.filename!r} for writing')
             return False
-        self._start = time()
+        if self.info is None:
+            self._start = time()
+        else:
+            self._origin = self.info.timestamp
+            self._start = self.info.epoch()
         self._file.attrs['Timestamp'] = self._start
+        if self.info is not None and self.info.bayer is not None:
+            self._file.attrs['Bayer'] = self.info.bayer
+        if self.packing is not None:
+            self._file.attrs['PixelFormat'] = self.packing
         self._writer = self._file.create_group('images')
         return True
 
@@ -80,8 +121,31 @@ class QHDF5Writer(QVideoWriter):
 
     def _write(self, frame: Image) -> None:
         '''Write *frame* as a dataset keyed by elapsed time in seconds.'''
-        now = time() - self._start
-        self._writer.create_dataset(f'{now:.9f}', data=frame)
+        if self.info is None or self._origin is None:
+            now = time() - self._start
+        else:
+            now = (self.info.timestamp - self._origin) * 1e-9
+        packed = self._pack(frame)
+        if packed is None:
+            self._writer.create_dataset(f'{now:.9f}', data=frame)
+        else:
+            dataset = self._writer.create_dataset(f'{now:.9f}', data=packed)
+            dataset.attrs['PixelFormat'] = self.packing
+            dataset.attrs['Width'] = frame.shape[1]
+
+    def _pack(self, frame: Image) -> np.ndarray | None:
+        '''Return *frame* packed row by row into :attr:`packing`.
+
+        Returns ``None`` if *frame* cannot be packed.
+        '''
+        if (self.packing is None or frame.ndim != 2 or
+                frame.dtype != np.uint16):
+            return None
+        height, width = frame.shape
+        row = packed_size(width, self.packing)
+        if row * height != packed_size(frame.size, self.packing):
+            return None
+        return pack(frame, self.packing).reshape(height, row)
 
     def close(self) -> None:
         '''Close the HDF5 file and reset internal state.'''
@@ -90,3 +154,4 @@ class QHDF5Writer(QVideoWriter):
         self._file = None
         self._writer = None
         self._start = None
+        self._origin = None
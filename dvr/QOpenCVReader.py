@@ -14,6 +14,9 @@ class QOpenCVReader(QVideoReader):
 
     Reads frames from a video file using OpenCV's ``VideoCapture``.
     Frames are converted from BGR (OpenCV native) to RGB on read.
+    16-bit grayscale files, such as those recorded by
+    :class:`~QVideo.dvr.QOpenCVWriter.QOpenCVWriter`, are read as
+    ``uint16`` frames without conversion.
 
     Parameters
     ----------
@@ -27,11 +30,17 @@ class QOpenCVReader(QVideoReader):
     LENGTH = cv2.CAP_PROP_FRAME_COUNT
     FPS = cv2.CAP_PROP_FPS
     _COLOR_BGR2RGB = cv2.COLOR_BGR2RGB
+    _GRAY16 = int.from_bytes(b'Y1\x00\x10', 'little')
 
     def _initialize(self) -> bool:
         self._reader = cv2.VideoCapture(self.filename)
         if not self._reader.isOpened():
             return False
+        pixelformat = self._reader.get(cv2.CAP_PROP_CODEC_PIXEL_FORMAT)
+        if int(pixelformat) == self._GRAY16:
+            self._reader.release()
+            self._reader = cv2.VideoCapture(
+                self.filename, cv2.CAP_FFMPEG, [cv2.CAP_PROP_CONVERT_RGB, 0])
         self._framenumber = 0
         return True
 
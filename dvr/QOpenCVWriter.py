@@ -1,8 +1,9 @@
 '''OpenCV-backed video file writer supporting AVI, MKV, and MP4.'''
 from QVideo.lib import QVideoWriter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, rescale
 from pathlib import Path
 import cv2
+import numpy as np
 import logging
 
 
@@ -25,6 +26,13 @@ class QOpenCVWriter(QVideoWriter):
     list for the extension is probed and the first one OpenCV accepts is
     used.  Specifying *codec* explicitly bypasses probing.
 
+    Grayscale ``uint16`` frames are recorded losslessly at 16 bits with
+    the codecs in :attr:`DEEP_CODECS`.  OpenCV video files store no
+    other deep format, so other frames are recorded at 8 bits, rescaled
+    from their full scale; a warning suggests
+    :class:`~QVideo.dvr.QHDF5Writer.QHDF5Writer`, which stores every
+    pixel type natively.
+
     If the shape of a subsequent frame differs from the first, recording
     stops immediately and :attr:`~QVideo.lib.QVideoWriter.finished` is
     emitted.
@@ -46,6 +54,8 @@ class QOpenCVWriter(QVideoWriter):
     ----------
     CODEC_MAP : dict[str, tuple[str, ...]]
         Maps file extensions to preference-ordered codec codes.
+    DEEP_CODECS : tuple[str, ...]
+        Codecs that can store 16-bit grayscale frames.
     '''
 
     CODEC_MAP: dict[str, tuple[str, ...]] = {
@@ -54,6 +64,8 @@ class QOpenCVWriter(QVideoWriter):
         '.mp4': ('avc1', 'mp4v'),
     }
 
+    DEEP_CODECS: tuple[str, ...] = ('FFV1',)
+
     def __init__(self, *args,
                  codec: str | None = None,
                  **kwargs) -> None:
@@ -65,6 +77,7 @@ class QOpenCVWriter(QVideoWriter):
             self._codecs = self.CODEC_MAP.get(suffix, ())
         self._writer = None
         self._shape = None
+        self._depth = cv2.CV_8U
 
     def open(self, frame: Image) -> bool:
         '''Open the video file using the first available codec.
@@ -86,7 +99,18 @@ class QOpenCVWriter(QVideoWriter):
             ``False`` otherwise.
         '''
         color = (frame.ndim == 3)
-        self._writer = self._getWriter(frame.shape, color)
+        self._writer = None
+        if frame.dtype == np.uint16 and not color:
+            self._writer = self._getWriter(frame.shape, color, cv2.CV_16U)
+        if self._writer is not None:
+            self._depth = cv2.CV_16U
+        else:
+            if frame.dtype != np.uint8:
+                logger.warning(
+                    f'Recording {frame.dtype} frames to {self.filename!r} '
+                    'at 8 bits; use HDF5 to keep the full bit depth')
+            self._depth = cv2.CV_8U
+            self._writer = self._getWriter(frame.shape, color)
         if self._writer is not None:
             self._shape = frame.shape
             return True
@@ -94,7 +118,8 @@ class QOpenCVWriter(QVideoWriter):
 
     def _getWriter(self,
                    shape: tuple[int, ...],
-                   color: bool) -> cv2.VideoWriter | None:
+                   color: bool,
+                   depth: int = cv2.CV_8U) -> cv2.VideoWriter | None:
         '''Probe codecs in preference order and return the first that opens.
 
         Parameters
@@ -103,6 +128,9 @@ class QOpenCVWriter(QVideoWriter):
             Frame shape ``(height, width)`` used to configure the writer.
         color : bool
             ``True`` for color frames, ``False`` for grayscale.
+        depth : int
+            ``cv2.CV_8U`` (default), or ``cv2.CV_16U`` to probe only
+            the :attr:`DEEP_CODECS` for 16-bit grayscale recording.
 
         Returns
         -------
@@ -110,16 +138,27 @@ class QOpenCVWriter(QVideoWriter):
             An open ``cv2.VideoWriter``, or ``None`` if no codec succeeded.
         '''
         h, w = shape[:2]
+        deep = (depth != cv2.CV_8U)
         for codec in self._codecs:
+            if deep and codec not in self.DEEP_CODECS:
+                continue
             fourcc = cv2.VideoWriter_fourcc(*codec)
-            writer = cv2.VideoWriter(
-                self.filename, fourcc, self.fps, (w, h), color)
+            if deep:
+                writer = cv2.VideoWriter(
+                    self.filename, cv2.CAP_FFMPEG, fourcc, self.fps, (w, h),
+                    [cv2.VIDEOWRITER_PROP_DEPTH, depth,
+                     cv2.VIDEOWRITER_PROP_IS_COLOR, int(color)])
+            else:
+                writer = cv2.VideoWriter(
+                    self.filename, fourcc, self.fps, (w, h), color)
             if writer.isOpened():
                 logger.debug(f'Opened {self.filename!r} with codec {codec!r}')
                 return writer
             writer.release()
             logger.debug(f'Codec {codec!r} not available')
-        logger.warning(f'No supported codec available for {self.filename!r}')
+        if not deep:
+            logger.warning(
+                f'No supported codec available for {self.filename!r}')
         return None
 
     def isOpen(self) -> bool:
@@ -134,6 +173,8 @@ class QOpenCVWriter(QVideoWriter):
                 f'expected {self._shape}: stopping recording')
             self.finished.emit()
             return
+        if self._depth == cv2.CV_8U:
+            frame = rescale(frame, np.uint8)
         if frame.ndim == 3:
             frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
         self._writer.write(frame)
@@ -144,3 +185,4 @@ class QOpenCVWriter(QVideoWriter):
             self._writer.release()
         self._writer = None
         self._shape = None
+        self._depth = cv2.CV_8U
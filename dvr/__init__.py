@@ -31,13 +31,23 @@ QHDF5Reader
 QHDF5Source
     Threaded playback source backed by :class:`QHDF5Reader`.
 '''
-from .QDVRWidget import QDVRWidget
-from .QCircularBuffer import QCircularBuffer
-from .QCircularDVRWidget import QCircularDVRWidget
-from .QOpenCVWriter import QOpenCVWriter
-from .QOpenCVReader import QOpenCVReader, QOpenCVSource
-from .QHDF5Writer import QHDF5Writer
-from .QHDF5Reader import QHDF5Reader, QHDF5Source
+from importlib.util import find_spec
+from QVideo.lib._lazy import attach
+
+
+_EXPORTS = {
+    'QDVRWidget': '.QDVRWidget',
+    'QCircularBuffer': '.QCircularBuffer',
+    'QCircularDVRWidget': '.QCircularDVRWidget',
+    'QOpenCVWriter': '.QOpenCVWriter',
+    'QOpenCVReader': '.QOpenCVReader',
+    'QOpenCVSource': '.QOpenCVReader',
+    'QHDF5Writer': '.QHDF5Writer',
+    'QHDF5Reader': '.QHDF5Reader',
+    'QHDF5Source': '.QHDF5Reader',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 __all__ = [
     'QDVRWidget',
@@ -47,8 +57,5 @@ __all__ = [
     'QOpenCVReader', 'QOpenCVSource',
 ]
 
-try:
-    import h5py as _h5py
+if find_spec('h5py') is not None:
     __all__ += ['QHDF5Writer', 'QHDF5Reader', 'QHDF5Source']
-except (ImportError, ModuleNotFoundError):
-    pass
@@ -1,50 +1,57 @@
-from .artistic import (PencilSketchFilter, QPencilSketchFilter,
-                       CartoonFilter, QCartoonFilter)
-from .darkframe import DarkFrameFilter, QDarkFrameFilter
-from .flatfield import FlatFieldFilter, QFlatFieldFilter
-from .median import Median
-from .momedian import MoMedian, QMoMedian
-from .momean import MoMean, QMoMean
-from .dejitter import DejitterFilter, QDejitterFilter
-from .normalize import Normalize, SmoothNormalize
-from .blob import BlobFilter, QBlobFilter
-from .circletransform import CircleTransformFilter, QCircleTransformFilter
-from .dog import DoGFilter, QDoGFilter
-from .exposure import ExposureFilter, QExposureFilter
-from .foreground import ForegroundEstimator, QForegroundEstimator
-from .gamma import GammaFilter, QGammaFilter
-from .smoothing import SmoothingFilter, QSmoothingFilter
-from .edge import EdgeFilter, QEdgeFilter
-from .sobel import SobelFilter, QSobelFilter
-from .laplacian import LaplacianFilter, QLaplacianFilter
-from .rgb import RGBFilter, QRGBFilter
-from .roi import ROIFilter, QROIFilter
-from .samplehold import SampleHold, QSampleHold
-from .threshold import ThresholdFilter, QThresholdFilter
-from .unsharp import UnsharpFilter, QUnsharpFilter
+from QVideo.lib._lazy import attach
 
-__all__ = '''
-PencilSketchFilter QPencilSketchFilter
-CartoonFilter QCartoonFilter
-DarkFrameFilter QDarkFrameFilter
-FlatFieldFilter QFlatFieldFilter
-Median MoMedian QMoMedian
-MoMean QMoMean
-DejitterFilter QDejitterFilter
-Normalize SmoothNormalize
-BlobFilter QBlobFilter
-CircleTransformFilter QCircleTransformFilter
-DoGFilter QDoGFilter
-ExposureFilter QExposureFilter
-ForegroundEstimator QForegroundEstimator
-GammaFilter QGammaFilter
-SmoothingFilter QSmoothingFilter
-EdgeFilter QEdgeFilter
-SobelFilter QSobelFilter
-LaplacianFilter QLaplacianFilter
-RGBFilter QRGBFilter
-ROIFilter QROIFilter
-SampleHold QSampleHold
-ThresholdFilter QThresholdFilter
-UnsharpFilter QUnsharpFilter
-'''.split()
+
+_EXPORTS = {
+    'PencilSketchFilter': '.artistic',
+    'QPencilSketchFilter': '.artistic',
+    'CartoonFilter': '.artistic',
+    'QCartoonFilter': '.artistic',
+    'BinningFilter': '.binning',
+    'QBinningFilter': '.binning',
+    'DarkFrameFilter': '.darkframe',
+    'QDarkFrameFilter': '.darkframe',
+    'FlatFieldFilter': '.flatfield',
+    'QFlatFieldFilter': '.flatfield',
+    'Median': '.median',
+    'MoMedian': '.momedian',
+    'QMoMedian': '.momedian',
+    'MoMean': '.momean',
+    'QMoMean': '.momean',
+    'DejitterFilter': '.dejitter',
+    'QDejitterFilter': '.dejitter',
+    'Normalize': '.normalize',
+    'SmoothNormalize': '.normalize',
+    'BlobFilter': '.blob',
+    'QBlobFilter': '.blob',
+    'CircleTransformFilter': '.circletransform',
+    'QCircleTransformFilter': '.circletransform',
+    'DoGFilter': '.dog',
+    'QDoGFilter': '.dog',
+    'ExposureFilter': '.exposure',
+    'QExposureFilter': '.exposure',
+    'ForegroundEstimator': '.foreground',
+    'QForegroundEstimator': '.foreground',
+    'GammaFilter': '.gamma',
+    'QGammaFilter': '.gamma',
+    'SmoothingFilter': '.smoothing',
+    'QSmoothingFilter': '.smoothing',
+    'EdgeFilter': '.edge',
+    'QEdgeFilter': '.edge',
+    'SobelFilter': '.sobel',
+    'QSobelFilter': '.sobel',
+    'LaplacianFilter': '.laplacian',
+    'QLaplacianFilter': '.laplacian',
+    'RGBFilter': '.rgb',
+    'QRGBFilter': '.rgb',
+    'ROIFilter': '.roi',
+    'QROIFilter': '.roi',
+    'SampleHold': '.samplehold',
+    'QSampleHold': '.samplehold',
+    'ThresholdFilter': '.threshold',
+    'QThresholdFilter': '.threshold',
+    'UnsharpFilter': '.unsharp',
+    'QUnsharpFilter': '.unsharp',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
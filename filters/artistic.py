@@ -1,9 +1,10 @@
 '''Artistic non-photorealistic filters and companion Qt widgets.'''
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
-from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.PooledVideoFilter import PooledVideoFilter
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter, FilterCode
 from QVideo.lib.videotypes import Image
+import numpy as np
 import cv2
 
 
@@ -15,7 +16,7 @@ def _ensure_bgr(image: Image) -> Image:
     return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR) if image.ndim == 2 else image
 
 
-class PencilSketchFilter(AsyncVideoFilter):
+class PencilSketchFilter(PooledVideoFilter):
 
     '''Pencil-drawing effect via OpenCV non-photorealistic rendering.
 
@@ -39,6 +40,8 @@ class PencilSketchFilter(AsyncVideoFilter):
         Default: ``False``.
     '''
 
+    dtypes = (np.uint8,)
+
     def __init__(self,
                  sigma_s: float = 60.,
                  sigma_r: float = 0.07,
@@ -97,7 +100,7 @@ class PencilSketchFilter(AsyncVideoFilter):
         )
 
 
-class CartoonFilter(AsyncVideoFilter):
+class CartoonFilter(PooledVideoFilter):
 
     '''Cartoon/painterly stylization via OpenCV non-photorealistic rendering.
 
@@ -116,6 +119,8 @@ class CartoonFilter(AsyncVideoFilter):
         Range 0–1.  Default: ``0.45``.
     '''
 
+    dtypes = (np.uint8,)
+
     def __init__(self,
                  sigma_s: float = 150.,
                  sigma_r: float = 0.45) -> None:
@@ -34,6 +34,8 @@ class BlobFilter(AsyncVideoFilter):
     pixels a black BGR frame is returned.
     '''
 
+    dtypes = (np.uint8,)
+
     def process(self, image: Image) -> Image:
         '''Label connected components and render each blob in a distinct hue.
 
@@ -3,7 +3,7 @@ from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
 from QVideo.lib.QVideoFilter import QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, full_scale, saturate
 import numpy as np
 from numpy.typing import NDArray
 from scipy.signal import savgol_filter
@@ -45,8 +45,8 @@ class CircleTransformFilter(AsyncVideoFilter):
     The OAT kernel :math:`K(\\mathbf{k}) = e^{-2i\\theta_k}/|\\mathbf{k}|`
     is cached by frame shape and recomputed only when the shape changes.
 
-    The output is normalised per-frame to ``[0, 255]`` and returned as
-    ``uint8``.  Peak brightness indicates likely ring centres.
+    The output is normalised per-frame to the full scale of the input
+    pixel type and returned in that type.  Peak brightness indicates likely ring centres.
 
     References
     ----------
@@ -94,7 +94,7 @@ class CircleTransformFilter(AsyncVideoFilter):
         return kernel
 
     def process(self, image: Image) -> Image:
-        '''Compute the OAT of *image* and return a uint8 heat map.
+        '''Compute the OAT of *image* and return a heat map.
 
         Called in the background thread.  Converts colour input to float
         grayscale, computes orientational order gradients via
@@ -104,13 +104,13 @@ class CircleTransformFilter(AsyncVideoFilter):
         Parameters
         ----------
         image : Image
-            Input frame (grayscale or colour uint8).
+            Input frame (grayscale or colour).
 
         Returns
         -------
         Image
-            OAT heat map, same spatial shape as *image*, dtype ``uint8``.
-            Bright peaks indicate ring centres.
+            OAT heat map, same spatial shape and pixel type as *image*,
+            normalized to full scale.  Bright peaks indicate ring centres.
         '''
         gray = image.mean(axis=2) if image.ndim == 3 else image.astype(float)
         psi = np.empty(gray.shape, dtype=complex)
@@ -123,8 +123,10 @@ class CircleTransformFilter(AsyncVideoFilter):
         c = psi.real ** 2 + psi.imag ** 2
         cmax = c.max()
         if cmax > np.finfo(float).eps:
-            c *= 255.0 / cmax
-        return np.round(c).clip(0, 255).astype(np.uint8)
+            c *= full_scale(image.dtype) / cmax
+        if image.dtype.kind == 'f':
+            return c.astype(image.dtype)
+        return saturate(np.round(c), image.dtype)
 
 
 class QCircleTransformFilter(QVideoFilter):
@@ -158,8 +160,7 @@ class QCircleTransformFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setWindow(self, window: int) -> None:
         self.filter.window = window
-        with QtCore.QSignalBlocker(self._spinbox):
-            self._spinbox.setValue(self.filter.window)
+        self._showAccepted(self._spinbox, 'window')
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -2,7 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 
 
@@ -25,7 +25,9 @@ class DarkFrameFilter(VideoFilter):
     Call :meth:`reset` to clear the stored reference.  Frames pass
     through unchanged until a new capture completes.
 
-    If the incoming frame shape changes after capture the reference is
+    The dark frame is stored in the pixel type of the captured frames,
+    and subtraction preserves that type.  If the incoming frame shape
+    or pixel type changes after capture the reference is
     incompatible; :meth:`get` returns the raw frame until a new
     capture is performed.
 
@@ -64,17 +66,19 @@ class DarkFrameFilter(VideoFilter):
         Resets the accumulator and counts down :attr:`nFrames` calls
         to :meth:`add`.  :attr:`captured` is emitted on completion.
         '''
-        self._accumulator = None
-        self._captureCount = self._nFrames
+        with self.locked():
+            self._accumulator = None
+            self._captureCount = self._nFrames
 
     def reset(self) -> None:
         '''Clear the stored dark frame and any ongoing capture.
 
         Frames pass through unchanged until a new capture completes.
         '''
-        self._dark = None
-        self._accumulator = None
-        self._captureCount = 0
+        with self.locked():
+            self._dark = None
+            self._accumulator = None
+            self._captureCount = 0
 
     def add(self, image: Image) -> None:
         '''Incorporate a new frame into the filter state.
@@ -95,9 +99,8 @@ class DarkFrameFilter(VideoFilter):
                 self._accumulator += image.astype(np.float32)
             self._captureCount -= 1
             if self._captureCount == 0:
-                self._dark = (
-                    self._accumulator / self._nFrames
-                ).astype(np.uint8)
+                self._dark = saturate(self._accumulator / self._nFrames,
+                                      image.dtype)
                 self._accumulator = None
                 self.captured.emit()
         self.data = image
@@ -106,9 +109,9 @@ class DarkFrameFilter(VideoFilter):
         '''Return the dark-subtracted frame.
 
         Returns ``None`` before the first :meth:`add`, the raw frame
-        if no dark reference is stored or if the frame shape does not
-        match the reference, and the clipped dark-subtracted frame
-        otherwise.
+        if no dark reference is stored or if the frame shape or type
+        does not match the reference, and the clipped dark-subtracted
+        frame otherwise.
 
         Returns
         -------
@@ -117,11 +120,11 @@ class DarkFrameFilter(VideoFilter):
         if self.data is None:
             return None
         if (self._dark is None
-                or self.data.shape != self._dark.shape):
+                or self.data.shape != self._dark.shape
+                or self.data.dtype != self._dark.dtype):
             return self.data
-        return np.clip(
-            self.data.astype(np.int16) - self._dark.astype(np.int16),
-            0, 255).astype(np.uint8)
+        difference = self.data.astype(np.float32) - self._dark
+        return saturate(np.maximum(difference, 0), self.data.dtype)
 
 
 class QDarkFrameFilter(QVideoFilter):
@@ -170,8 +173,7 @@ class QDarkFrameFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setNFrames(self, value: int) -> None:
         self.filter.nFrames = int(value)
-        with QtCore.QSignalBlocker(self._nFramesBox):
-            self._nFramesBox.setValue(self.filter.nFrames)
+        self._showAccepted(self._nFramesBox, 'nFrames')
 
     @QtCore.Slot(bool)
     def _capture(self, _checked: bool = False) -> None:
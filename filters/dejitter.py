@@ -96,7 +96,7 @@ class DejitterFilter(AsyncVideoFilter):
         Parameters
         ----------
         image : Image
-            Input frame (grayscale or BGR ``uint8``).
+            Input frame (grayscale or BGR).
 
         Returns
         -------
@@ -3,7 +3,8 @@ import logging
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.tiling import tiled, gaussian_radius
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 import cv2
 
@@ -19,8 +20,8 @@ class DoGFilter(VideoFilter):
     Subtracts a wide Gaussian blur from a narrow one, suppressing both
     slowly-varying background (*low_sigma*) and high-frequency noise
     (*high_sigma* sets the noise cutoff).  The result is displayed as the
-    absolute value scaled to ``uint8``, so both positive and negative
-    excursions appear bright.
+    absolute value in the pixel type of the input, so both positive and
+    negative excursions appear bright.
 
     DoG is the standard preprocessing step for particle tracking and
     fluorescence microscopy: it isolates features at the scale set by
@@ -85,29 +86,42 @@ class DoGFilter(VideoFilter):
         Returns
         -------
         Image or None
-            uint8 image of the absolute DoG response, or ``None`` if no
-            frame has been added.
+            Absolute DoG response with the pixel type of the input, or
+            ``None`` if no frame has been added.
         '''
         if self.data is None:
             return None
-        gray = (self.data.mean(axis=2).astype(np.float32)
-                if self.data.ndim == 3 else self.data.astype(np.float32))
+        return tiled(self.process, self.data, self.halo)
+
+    @property
+    def halo(self) -> int:
+        '''Radius of the wider Gaussian kernel [pixels].'''
+        return gaussian_radius(self._high_sigma)
+
+    def process(self, image: Image) -> Image:
+        '''Return the absolute DoG response of *image*.'''
+        gray = (image.mean(axis=2).astype(np.float32)
+                if image.ndim == 3 else image.astype(np.float32))
         lo = cv2.GaussianBlur(gray, (0, 0), self._low_sigma)
         hi = cv2.GaussianBlur(gray, (0, 0), self._high_sigma)
-        return cv2.convertScaleAbs(lo - hi)
+        if image.dtype == np.uint8:
+            return cv2.convertScaleAbs(lo - hi)
+        return saturate(np.abs(lo - hi), image.dtype)
 
     def to_code(self) -> 'FilterCode':
         from QVideo.lib.QVideoFilter import FilterCode
         return FilterCode(
             imports=frozenset({'import cv2', 'import numpy as np'}),
             lines=[
+                "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else np.inf",
+                '_dtype = image.dtype',
                 'if image.ndim == 3:',
                 '    image = image.mean(axis=2).astype(np.float32)',
                 'else:',
                 '    image = image.astype(np.float32)',
                 f'_lo = cv2.GaussianBlur(image, (0, 0), {self._low_sigma})',
                 f'_hi = cv2.GaussianBlur(image, (0, 0), {self._high_sigma})',
-                'image = cv2.convertScaleAbs(_lo - _hi)',
+                'image = np.clip(np.abs(_lo - _hi), 0, _fs).astype(_dtype)',
             ],
             comment=f'DoG bandpass, σ_low={self._low_sigma}, σ_high={self._high_sigma}',
         )
@@ -148,14 +162,12 @@ class QDoGFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setLowSigma(self, value: float) -> None:
         self.filter.low_sigma = value
-        with QtCore.QSignalBlocker(self._lowBox):
-            self._lowBox.setValue(self.filter.low_sigma)
+        self._showAccepted(self._lowBox, 'low_sigma')
 
     @QtCore.Slot(object)
     def _setHighSigma(self, value: float) -> None:
         self.filter.high_sigma = value
-        with QtCore.QSignalBlocker(self._highBox):
-            self._highBox.setValue(self.filter.high_sigma)
+        self._showAccepted(self._highBox, 'high_sigma')
 
 
 if __name__ == '__main__':  # pragma: no cover
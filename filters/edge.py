@@ -3,6 +3,7 @@ from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
 from QVideo.lib.videotypes import Image
+import numpy as np
 import cv2
 import logging
 
@@ -34,6 +35,8 @@ class EdgeFilter(VideoFilter):
     recommends a 2:1 or 3:1 high-to-low ratio for typical images.
     '''
 
+    dtypes = (np.uint8,)
+
     def __init__(self, low: int = 50, high: int = 150) -> None:
         super().__init__()
         self._low = 1
@@ -154,8 +157,7 @@ class QEdgeFilter(QVideoFilter):
             New lower threshold.
         '''
         self.filter.low = low
-        with QtCore.QSignalBlocker(self._lowSpinbox):
-            self._lowSpinbox.setValue(self.filter.low)
+        self._showAccepted(self._lowSpinbox, 'low')
 
     @QtCore.Slot(object)
     def _setHigh(self, high: int) -> None:
@@ -171,8 +173,7 @@ class QEdgeFilter(QVideoFilter):
             New upper threshold.
         '''
         self.filter.high = high
-        with QtCore.QSignalBlocker(self._highSpinbox):
-            self._highSpinbox.setValue(self.filter.high)
+        self._showAccepted(self._highSpinbox, 'high')
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -4,7 +4,7 @@ from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
 from QVideo.lib.QVideoFilter import QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, full_scale, rescale, saturate
 import numpy as np
 import cv2
 
@@ -12,6 +12,16 @@ __all__ = ['ExposureFilter', 'QExposureFilter']
 
 logger = logging.getLogger(__name__)
 
+# Exported code: full scale of the frame and conversion back to its type.
+_FULL_SCALE = [
+    "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else 1.",
+]
+_SATURATE = [
+    "if image.dtype.kind in 'ui':",
+    '    _f = np.clip(_f, 0, _fs)',
+    'image = _f.astype(image.dtype)',
+]
+
 
 class ExposureFilter(AsyncVideoFilter):
 
@@ -30,6 +40,12 @@ class ExposureFilter(AsyncVideoFilter):
     is applied to the L channel in LAB colour space so hue and saturation are
     preserved.
 
+    All three methods work on ``uint8``, ``uint16`` and ``float32``
+    frames and return the input pixel type.  Log and Sigmoid act on
+    intensities as a fraction of full scale, so the same settings give
+    the same tone curve whatever the bit depth.  CLAHE runs natively on
+    8- and 16-bit grayscale; other frames are equalized at 16 bits.
+
     Computation runs in a background thread via
     :class:`~QVideo.lib.AsyncVideoFilter.AsyncVideoFilter`, keeping the GUI
     responsive even for large frames.
@@ -39,7 +55,7 @@ class ExposureFilter(AsyncVideoFilter):
     method : str
         One of ``'Log'``, ``'Sigmoid'``, or ``'CLAHE'``.  Default: ``'Log'``.
     cutoff : float
-        Sigmoid midpoint [0, 255].  Default: ``128.0``.
+        Sigmoid midpoint on the 8-bit scale [0, 255].  Default: ``128.0``.
     gain : float
         Sigmoid steepness (≥ 0.1).  Default: ``10.0``.
     clip_limit : float
@@ -129,27 +145,37 @@ class ExposureFilter(AsyncVideoFilter):
         Parameters
         ----------
         image : Image
-            Input uint8 frame.
+            Input frame.
 
         Returns
         -------
         Image
-            Tone-mapped uint8 frame.
+            Tone-mapped frame with the pixel type of *image*.
         '''
+        fs = full_scale(image.dtype)
         if self._method == 'Log':
-            f = image.astype(np.float32)
-            return np.clip(
-                np.log1p(f) / np.log1p(255) * 255, 0, 255).astype(np.uint8)
+            f = image.astype(np.float32) * np.float32(255 / fs)
+            return saturate(np.log1p(f) * np.float32(fs / np.log1p(255)),
+                            image.dtype)
         if self._method == 'Sigmoid':
-            f = image.astype(np.float32)
-            return np.clip(
-                255 / (1 + np.exp(-self._gain * (f / 255 - self._cutoff / 255))),
-                0, 255).astype(np.uint8)
+            f = image.astype(np.float32) / np.float32(fs)
+            return saturate(
+                fs / (1 + np.exp(-self._gain * (f - self._cutoff / 255))),
+                image.dtype)
         if image.ndim == 3:
-            lab = cv2.cvtColor(image, cv2.COLOR_RGB2LAB)
-            lab[:, :, 0] = self._clahe.apply(lab[:, :, 0])
-            return cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
-        return self._clahe.apply(image)
+            if image.dtype == np.uint8:
+                lab = cv2.cvtColor(image, cv2.COLOR_RGB2LAB)
+                lab[:, :, 0] = self._clahe.apply(lab[:, :, 0])
+                return cv2.cvtColor(lab, cv2.COLOR_LAB2RGB)
+            # Floating-point LAB has L in [0, 100]; equalize it at 16 bits.
+            lab = cv2.cvtColor(rescale(image, np.float32), cv2.COLOR_RGB2LAB)
+            lightness = saturate(lab[:, :, 0] * 655.35, np.uint16)
+            lab[:, :, 0] = self._clahe.apply(lightness) / 655.35
+            return rescale(cv2.cvtColor(lab, cv2.COLOR_LAB2RGB), image.dtype)
+        if image.dtype in (np.uint8, np.uint16):
+            return self._clahe.apply(image)
+        return rescale(self._clahe.apply(rescale(image, np.uint16)),
+                       image.dtype)
 
     def to_code(self) -> 'FilterCode':
         from QVideo.lib.QVideoFilter import FilterCode
@@ -157,9 +183,10 @@ class ExposureFilter(AsyncVideoFilter):
             return FilterCode(
                 imports=frozenset({'import numpy as np'}),
                 lines=[
-                    '_f = image.astype(np.float32)',
-                    'image = np.clip('
-                    'np.log1p(_f) / np.log1p(255) * 255, 0, 255).astype(np.uint8)',
+                    *_FULL_SCALE,
+                    '_f = np.log1p(image.astype(np.float32) * (255 / _fs))',
+                    '_f *= _fs / np.log1p(255)',
+                    *_SATURATE,
                 ],
                 comment='log exposure correction',
             )
@@ -168,16 +195,17 @@ class ExposureFilter(AsyncVideoFilter):
             return FilterCode(
                 imports=frozenset({'import numpy as np'}),
                 lines=[
-                    '_f = image.astype(np.float32)',
-                    f'image = np.clip('
-                    f'255 / (1 + np.exp(-{self._gain} * (_f / 255 - {c:.6f}))), '
-                    f'0, 255).astype(np.uint8)',
+                    *_FULL_SCALE,
+                    '_f = image.astype(np.float32) / _fs',
+                    f'_f = _fs / (1 + np.exp(-{self._gain} * (_f - {c:.6f})))',
+                    *_SATURATE,
                 ],
                 comment=(f'sigmoid exposure, cutoff={self._cutoff}, '
                          f'gain={self._gain}'),
             )
         return FilterCode(
             imports=frozenset({'import cv2'}),
+            # uint8 frames; see process() for other pixel types.
             lines=[
                 f'_clahe = cv2.createCLAHE('
                 f'clipLimit={self._clip_limit}, '
@@ -2,7 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 
 
@@ -30,7 +30,8 @@ class FlatFieldFilter(VideoFilter):
     unchanged until a reference is captured.
 
     Pixels where the normalized flat field is zero are passed through
-    without correction.
+    without correction.  The corrected frame has the pixel type of the
+    input frame.
 
     If the incoming frame shape does not match the stored reference
     :meth:`get` returns the raw frame until a new capture is
@@ -73,17 +74,19 @@ class FlatFieldFilter(VideoFilter):
         Resets the accumulator and counts down :attr:`nFrames` calls
         to :meth:`add`.  :attr:`captured` is emitted on completion.
         '''
-        self._accumulator = None
-        self._captureCount = self._nFrames
+        with self.locked():
+            self._accumulator = None
+            self._captureCount = self._nFrames
 
     def reset(self) -> None:
         '''Clear the stored flat field reference and any ongoing capture.
 
         Frames pass through unchanged until a new capture completes.
         '''
-        self._flat = None
-        self._accumulator = None
-        self._captureCount = 0
+        with self.locked():
+            self._flat = None
+            self._accumulator = None
+            self._captureCount = 0
 
     def add(self, image: Image) -> None:
         '''Incorporate a new frame into the filter state.
@@ -134,7 +137,7 @@ class FlatFieldFilter(VideoFilter):
             self._flat > 0,
             self.data.astype(np.float32) / safe,
             self.data.astype(np.float32))
-        return np.clip(corrected, 0, 255).astype(np.uint8)
+        return saturate(corrected, self.data.dtype)
 
 
 class QFlatFieldFilter(QVideoFilter):
@@ -183,8 +186,7 @@ class QFlatFieldFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setNFrames(self, value: int) -> None:
         self.filter.nFrames = int(value)
-        with QtCore.QSignalBlocker(self._nFramesBox):
-            self._nFramesBox.setValue(self.filter.nFrames)
+        self._showAccepted(self._nFramesBox, 'nFrames')
 
     @QtCore.Slot(bool)
     def _capture(self, _checked: bool = False) -> None:
@@ -3,7 +3,7 @@ from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
 from QVideo.lib.QVideoFilter import QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, full_scale, saturate
 import cv2
 import numpy as np
 
@@ -20,10 +20,14 @@ class ForegroundEstimator(AsyncVideoFilter):
     background.  For a multiplicative image model ``I = B × F`` this
     recovers the foreground modulation ``F ≈ I / B``.
 
-    The output is scaled by *mean* and cast to ``uint8`` so that a
-    pixel carrying no foreground modulation (``I ≈ B``) maps to *mean*.
-    Pixels brighter than the background map above *mean*; darker pixels
-    map below.
+    The output is scaled by *mean* and cast to the input pixel type so
+    that a pixel carrying no foreground modulation (``I ≈ B``) maps to
+    *mean*.  Pixels brighter than the background map above *mean*;
+    darker pixels map below.
+
+    The MOG2 model works on the 8-bit intensity scale: 16-bit and
+    floating-point frames are modelled as ``float32`` scaled to that
+    range, so *varThreshold* means the same for every pixel type.
 
     Parameters
     ----------
@@ -36,8 +40,10 @@ class ForegroundEstimator(AsyncVideoFilter):
         foreground in the MOG2 model.  Smaller values make the
         classifier more sensitive.  Default: ``16.0``.
     mean : float
-        Output scale factor.  A pixel where ``frame == background``
-        maps to this value in the output.  Default: ``128.0``.
+        Output scale factor on the 8-bit scale.  A pixel where
+        ``frame == background`` maps to this value, or to the same
+        fraction of full scale for floating-point frames.
+        Default: ``128.0``.
 
     Notes
     -----
@@ -102,20 +108,25 @@ class ForegroundEstimator(AsyncVideoFilter):
         Parameters
         ----------
         image : Image
-            Input frame (grayscale or BGR ``uint8``).
+            Input frame (grayscale or BGR).
 
         Returns
         -------
         Image
-            Foreground-enhanced frame scaled to ``uint8``.
+            Foreground-enhanced frame with the pixel type of *image*.
         '''
+        dtype = image.dtype
+        fs = full_scale(dtype)
+        if dtype != np.uint8:
+            image = image.astype(np.float32) * np.float32(255. / fs)
         bgs = self._bgs
         bgs.apply(image)
         bg = bgs.getBackgroundImage()
         bg_f = bg.astype(np.float32)
         result = np.zeros(image.shape, dtype=np.float32)
         np.divide(image, bg_f, out=result, where=(bg_f > 0))
-        return np.clip(self._mean * result, 0, 255).astype(np.uint8)
+        result *= self._mean * fs / 255.
+        return saturate(result, dtype)
 
 
 class QForegroundEstimator(QVideoFilter):
@@ -155,8 +166,7 @@ class QForegroundEstimator(QVideoFilter):
     @QtCore.Slot(object)
     def _setHistory(self, value: int) -> None:
         self.filter.history = value
-        with QtCore.QSignalBlocker(self._historyBox):
-            self._historyBox.setValue(self.filter.history)
+        self._showAccepted(self._historyBox, 'history')
 
     @QtCore.Slot(object)
     def _setThreshold(self, value: float) -> None:
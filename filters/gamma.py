@@ -23,9 +23,12 @@ class GammaFilter(VideoFilter):
     to every pixel.  *γ* < 1 brightens the image (lifts shadows); *γ* > 1
     darkens it (deepens shadows); *γ* = 1 is the identity.
 
-    The transform is implemented as a 256-entry look-up table built once
-    when :attr:`gamma` changes, so per-frame cost is a single table lookup
-    regardless of image size.  The same LUT is applied to every channel,
+    For ``uint8`` frames the transform is implemented as a 256-entry
+    look-up table built once when :attr:`gamma` changes, so per-frame
+    cost is a single table lookup regardless of image size.  ``uint16``
+    frames use a 65536-entry table that is built on first use, and
+    ``float32`` frames, whose full scale is 1, are raised to the power
+    directly.  The same transform is applied to every channel,
     preserving color balance.
 
     Parameters
@@ -49,6 +52,14 @@ class GammaFilter(VideoFilter):
         table = np.arange(256, dtype=np.float32) / 255.0
         self._lut = np.clip(
             np.power(table, self._gamma) * 255.0, 0, 255).astype(np.uint8)
+        self._lut16: np.ndarray | None = None
+
+    def _wideLut(self) -> np.ndarray:
+        if self._lut16 is None:
+            table = np.arange(65536, dtype=np.float64) / 65535.
+            self._lut16 = np.clip(np.power(table, self._gamma) * 65535.,
+                                  0, 65535).astype(np.uint16)
+        return self._lut16
 
     def get(self) -> Image | None:
         '''Return the gamma-corrected frame.
@@ -56,19 +67,26 @@ class GammaFilter(VideoFilter):
         Returns
         -------
         Image or None
-            Corrected uint8 image, or ``None`` if no frame has been added.
+            Corrected image with the pixel type of the input, or
+            ``None`` if no frame has been added.
         '''
         if self.data is None:
             return None
-        return cv2.LUT(self.data, self._lut)
+        if self.data.dtype == np.uint8:
+            return cv2.LUT(self.data, self._lut)
+        if self.data.dtype == np.uint16:
+            return self._wideLut()[self.data]
+        return np.power(np.maximum(self.data, 0), self._gamma,
+                        dtype=np.float32)
 
     def to_code(self) -> 'FilterCode':
         from QVideo.lib.QVideoFilter import FilterCode
         return FilterCode(
             imports=frozenset({'import numpy as np'}),
             lines=[
-                f'image = np.clip(np.power(image.astype(np.float32) / 255.0,'
-                f' {self._gamma}) * 255.0, 0, 255).astype(np.uint8)',
+                "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else 1.",
+                f'_f = np.power(image.astype(np.float32) / _fs, {self._gamma})',
+                'image = np.clip(_f * _fs, 0, _fs).astype(image.dtype)',
             ],
             comment=f'gamma correction, γ={self._gamma}',
         )
@@ -2,7 +2,8 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.tiling import tiled, gaussian_radius
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 import cv2
 
@@ -15,8 +16,8 @@ class LaplacianFilter(VideoFilter):
 
     Converts each frame to grayscale, optionally applies a Gaussian blur
     to reduce noise sensitivity, then computes the discrete Laplacian.
-    The absolute value is returned as a uint8 image; edges appear bright
-    at intensity transitions.
+    The absolute value is returned in the pixel type of the input frame;
+    edges appear bright at intensity transitions.
 
     Setting *sigma* > 0 implements the Laplacian-of-Gaussian (LoG)
     operator.
@@ -61,14 +62,16 @@ class LaplacianFilter(VideoFilter):
         from QVideo.lib.QVideoFilter import FilterCode
         lines = [
             'if image.ndim == 3:',
-            '    image = image.mean(axis=2).astype(np.uint8)',
+            '    image = image.mean(axis=2).astype(image.dtype)',
+            "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else np.inf",
         ]
         imports = frozenset({'import cv2', 'import numpy as np'})
         if self._sigma > 0:
             lines.append(f'image = cv2.GaussianBlur(image, (0, 0), {self._sigma})')
-        lines.append(
-            f'image = cv2.convertScaleAbs(cv2.Laplacian(image, cv2.CV_32F, ksize={self._ksize}))'
-        )
+        lines += [
+            f'_g = np.abs(cv2.Laplacian(image, cv2.CV_32F, ksize={self._ksize}))',
+            'image = np.clip(_g, 0, _fs).astype(image.dtype)',
+        ]
         suffix = f', σ={self._sigma}' if self._sigma > 0 else ''
         return FilterCode(
             imports=imports,
@@ -82,16 +85,32 @@ class LaplacianFilter(VideoFilter):
         Returns
         -------
         Image or None
-            uint8 edge map, or ``None`` if no frame has been added.
+            Edge map with the pixel type of the input, or ``None`` if
+            no frame has been added.
         '''
         if self.data is None:
             return None
-        gray = (self.data.mean(axis=2).astype(np.uint8)
-                if self.data.ndim == 3 else self.data)
+        return tiled(self.process, self.data, self.halo)
+
+    @property
+    def halo(self) -> int:
+        '''Combined radius of the pre-blur and Laplacian kernels [pixels].'''
+        halo = max(1, self._ksize // 2)
+        if self._sigma > 0:
+            halo += gaussian_radius(self._sigma)
+        return halo
+
+    def process(self, image: Image) -> Image:
+        '''Return the Laplacian edge map of *image*.'''
+        dtype = image.dtype
+        gray = (image.mean(axis=2).astype(dtype)
+                if image.ndim == 3 else image)
         if self._sigma > 0:
             gray = cv2.GaussianBlur(gray, (0, 0), self._sigma)
         result = cv2.Laplacian(gray, cv2.CV_32F, ksize=self._ksize)
-        return cv2.convertScaleAbs(result)
+        if dtype == np.uint8:
+            return cv2.convertScaleAbs(result)
+        return saturate(np.abs(result), dtype)
 
 
 class QLaplacianFilter(QVideoFilter):
@@ -129,8 +148,7 @@ class QLaplacianFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setKsize(self, value: int) -> None:
         self.filter.ksize = value
-        with QtCore.QSignalBlocker(self._ksizeBox):
-            self._ksizeBox.setValue(self.filter.ksize)
+        self._showAccepted(self._ksizeBox, 'ksize')
 
     @QtCore.Slot(object)
     def _setSigma(self, value: float) -> None:
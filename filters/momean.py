@@ -2,7 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 import cv2
 
@@ -75,11 +75,12 @@ class MoMean(VideoFilter):
         Returns
         -------
         Image or None
-            uint8 estimate, or ``None`` if no frames have been added.
+            Estimate in the pixel type of the input frames, or ``None``
+            if no frames have been added.
         '''
         if self._acc is None:
             return None
-        return np.clip(self._acc, 0, 255).astype(np.uint8)
+        return saturate(self._acc, self.data.dtype)
 
 
 class QMoMean(QVideoFilter):
@@ -1,7 +1,7 @@
 '''Background-normalization filters built on median background estimation.'''
 from QVideo.filters.median import Median
 from QVideo.filters.momedian import MoMedian
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, full_scale, saturate
 import numpy as np
 
 
@@ -23,11 +23,12 @@ class _NormalizeMixin:
         Positional arguments forwarded to the median base class.
     scale : bool
         If ``True`` the normalized result is multiplied by *mean* and
-        cast to ``uint8``.  If ``False`` the raw floating-point ratio
-        is returned.  Default: ``True``.
+        cast to the pixel type of the input frame.  If ``False`` the
+        raw ``float32`` ratio is returned.  Default: ``True``.
     mean : float
-        Target mean value used when *scale* is ``True``.
-        Default: ``100.0``.
+        Target mean value used when *scale* is ``True``, on the 8-bit
+        scale: 16-bit and floating-point frames are scaled to the same
+        fraction of their full scale.  Default: ``100.0``.
     darkcount : int
         Constant offset subtracted from each frame before processing,
         representing the camera dark-count level.  Default: ``0``.
@@ -77,7 +78,8 @@ class _NormalizeMixin:
         Divides the stored foreground by the current median background
         estimate.  Pixels where the background is zero are set to zero.
         If *scale* is ``True`` the result is multiplied by *mean* and
-        returned as ``uint8``.
+        returned in the pixel type of the input frame; otherwise the
+        ``float32`` ratio is returned.
 
         Returns
         -------
@@ -94,9 +96,11 @@ class _NormalizeMixin:
         bg = super().get()
         result = np.zeros_like(self._fg, dtype=np.float32)
         np.divide(self._fg, bg, out=result, where=(bg != 0))
-        if self.scale:
-            result = self.mean * result
-        return result.astype(np.uint8)
+        if not self.scale:
+            return result
+        dtype = self._fg.dtype
+        result *= self.mean * full_scale(dtype) / 255.
+        return saturate(result, dtype)
 
 
 class Normalize(_NormalizeMixin, Median):
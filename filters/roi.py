@@ -2,6 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
 from pyqtgraph import SpinBox
+from QVideo.lib.frameinfo import FrameInfo
 from QVideo.lib.videotypes import Image
 
 
@@ -18,6 +19,13 @@ class ROIFilter(VideoFilter):
     That check costs a single tuple comparison per frame; the clamp
     itself runs only on shape changes.
 
+    The ROI is always given in sensor coordinates.  When the camera
+    already crops a frame to a hardware window containing the ROI,
+    only the remainder is cropped here.  The window of each frame is
+    read from the :class:`~QVideo.lib.frameinfo.FrameInfo` attached to
+    it, so frames still in flight when the window moves are cropped
+    correctly.  Frames without a window are full sensor frames.
+
     Parameters
     ----------
     x : int
@@ -40,6 +48,13 @@ class ROIFilter(VideoFilter):
         self.y = y
         self.w = w
         self.h = h
+        self._origin = None
+
+    @staticmethod
+    def _window(image: Image) -> tuple[int, int, int, int] | None:
+        '''Return the hardware window that *image* covers, if any.'''
+        info = FrameInfo.of(image)
+        return None if info is None else info.window
 
     def _clamp(self, shape: tuple) -> None:
         rows, cols = shape[:2]
@@ -49,8 +64,13 @@ class ROIFilter(VideoFilter):
         self._h = min(self._h, rows - self._y)
 
     def add(self, image: Image) -> None:
-        if self.data is None or image.shape[:2] != self.data.shape[:2]:
-            self._clamp(image.shape)
+        window = self._window(image)
+        if window is not None:
+            self._origin = window[:2]
+        else:
+            self._origin = None
+            if self.data is None or image.shape[:2] != self.data.shape[:2]:
+                self._clamp(image.shape)
         super().add(image)
 
     def to_code(self) -> 'FilterCode':
@@ -77,8 +97,11 @@ class ROIFilter(VideoFilter):
         '''
         if self.data is None:
             raise RuntimeError('get() called before add()')
-        return self.data[int(self.y):int(self.y + self.h),
-                         int(self.x):int(self.x + self.w)]
+        x, y = self.x, self.y
+        if self._origin is not None:
+            x = max(0, x - self._origin[0])
+            y = max(0, y - self._origin[1])
+        return self.data[y:y + self.h, x:x + self.w]
 
     @property
     def x(self) -> int:
@@ -162,25 +185,25 @@ class QROIFilter(QVideoFilter):
     def _setX(self, x: int) -> None:
         '''Set the ROI x position.'''
         self.filter.x = x
-        self._xSpinbox.setValue(self.filter.x)
+        self._showAccepted(self._xSpinbox, 'x')
 
     @QtCore.Slot(object)
     def _setY(self, y: int) -> None:
         '''Set the ROI y position.'''
         self.filter.y = y
-        self._ySpinbox.setValue(self.filter.y)
+        self._showAccepted(self._ySpinbox, 'y')
 
     @QtCore.Slot(object)
     def _setW(self, w: int) -> None:
         '''Set the ROI width.'''
         self.filter.w = w
-        self._wSpinbox.setValue(self.filter.w)
+        self._showAccepted(self._wSpinbox, 'w')
 
     @QtCore.Slot(object)
     def _setH(self, h: int) -> None:
         '''Set the ROI height.'''
         self.filter.h = h
-        self._hSpinbox.setValue(self.filter.h)
+        self._showAccepted(self._hSpinbox, 'h')
 
 
 if __name__ == '__main__':  # pragma: no cover
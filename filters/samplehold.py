@@ -3,8 +3,7 @@ from qtpy import QtCore, QtWidgets
 from QVideo.filters.median import Median
 from QVideo.filters.normalize import Normalize
 from QVideo.lib.QVideoFilter import QVideoFilter
-from QVideo.lib.videotypes import Image
-import numpy as np
+from QVideo.lib.videotypes import Image, saturate
 
 
 __all__ = ['SampleHold', 'QSampleHold']
@@ -67,7 +66,7 @@ class SampleHold(Normalize):
         if self._count > 0:
             if self._fg is None:
                 return None
-            return np.clip(self._fg + self.darkcount, 0, 255).astype(np.uint8)
+            return saturate(self._fg + self.darkcount, self._fg.dtype)
         return super().get()
 
     def add(self, image: Image) -> None:
@@ -152,8 +151,9 @@ class QSampleHold(QVideoFilter):
             Accumulation order (1, 2, or 3).
         '''
         if checked:
-            self.filter.order = order
-            self.filter.reset()
+            with self.filter.locked():
+                self.filter.order = order
+                self.filter.reset()
 
     @QtCore.Slot(bool)
     def reset(self, _checked: bool = False) -> None:
@@ -1,15 +1,18 @@
 '''Smoothing filter with selectable method and companion Qt widget.'''
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
-from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.PooledVideoFilter import PooledVideoFilter
 from QVideo.lib.QVideoFilter import QVideoFilter
+from QVideo.lib.tiling import tiled
 from QVideo.lib.videotypes import Image
+from scipy.ndimage import median_filter
+import numpy as np
 import cv2
 
 
 __all__ = ['SmoothingFilter', 'QSmoothingFilter']
 
-class SmoothingFilter(AsyncVideoFilter):
+class SmoothingFilter(PooledVideoFilter):
 
     '''Smoothing filter supporting box, Gaussian, and median blur.
 
@@ -31,6 +34,11 @@ class SmoothingFilter(AsyncVideoFilter):
 
     For Gaussian blur, ``sigma`` is set to 0, which instructs OpenCV
     to derive it from the kernel size.
+
+    ``medianBlur`` handles 16-bit and floating-point frames only for
+    widths of 3 and 5.  Wider median filters of those frames are
+    computed with :func:`scipy.ndimage.median_filter`, which is
+    considerably slower but preserves the pixel type.
     '''
 
     METHODS = ('box', 'gaussian', 'median')
@@ -82,20 +90,32 @@ class SmoothingFilter(AsyncVideoFilter):
             comment=f'Gaussian smoothing, k={k}',
         )
 
+    @property
+    def halo(self) -> int:
+        '''Radius of the smoothing kernel [pixels].'''
+        return self._width // 2
+
     def process(self, image: Image) -> Image:
         '''Return the smoothed frame.
 
-        Called in the background thread.
+        Called in the background thread.  Large frames are smoothed in
+        concurrent tiles.
 
         Returns
         -------
         Image
             Smoothed version of *image*.
         '''
+        return tiled(self._smooth, image, self.halo)
+
+    def _smooth(self, image: Image) -> Image:
         if self._method == 'box':
             return cv2.blur(image, (self._width, self._width))
         if self._method == 'median':
-            return cv2.medianBlur(image, self._width)
+            if image.dtype == np.uint8 or self._width <= 5:
+                return cv2.medianBlur(image, self._width)
+            size = (self._width, self._width, 1)[:image.ndim]
+            return median_filter(image, size=size)
         return cv2.GaussianBlur(image, (self._width, self._width), 0)
 
 
@@ -139,8 +159,7 @@ class QSmoothingFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setWidth(self, width: int) -> None:
         self.filter.width = width
-        with QtCore.QSignalBlocker(self._spinbox):
-            self._spinbox.setValue(self.filter.width)
+        self._showAccepted(self._spinbox, 'width')
 
 
 if __name__ == '__main__':  # pragma: no cover
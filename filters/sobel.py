@@ -2,7 +2,8 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.tiling import tiled
+from QVideo.lib.videotypes import Image, saturate
 import numpy as np
 import cv2
 
@@ -14,11 +15,13 @@ class SobelFilter(VideoFilter):
     '''Sobel edge detector with horizontal, vertical, and magnitude modes.
 
     Converts each frame to grayscale, then applies the Sobel operator.
+    The edge map has the pixel type of the input frame.
 
-    - **Horizontal**: first-order x-derivative (∂/∂x), converted to uint8.
-    - **Vertical**: first-order y-derivative (∂/∂y), converted to uint8.
-    - **Magnitude**: Euclidean magnitude of the (∂/∂x, ∂/∂y) gradient,
-      clipped to [0, 255].
+    - **Horizontal**: absolute first-order x-derivative (∂/∂x).
+    - **Vertical**: absolute first-order y-derivative (∂/∂y).
+    - **Magnitude**: Euclidean magnitude of the (∂/∂x, ∂/∂y) gradient.
+
+    Integer results are clipped to the range of the pixel type.
 
     Parameters
     ----------
@@ -64,7 +67,8 @@ class SobelFilter(VideoFilter):
         from QVideo.lib.QVideoFilter import FilterCode
         _GRAY = [
             'if image.ndim == 3:',
-            '    image = image.mean(axis=2).astype(np.uint8)',
+            '    image = image.mean(axis=2).astype(image.dtype)',
+            "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else np.inf",
         ]
         imports = frozenset({'import cv2', 'import numpy as np'})
         k = self._ksize
@@ -72,7 +76,8 @@ class SobelFilter(VideoFilter):
             return FilterCode(
                 imports=imports,
                 lines=_GRAY + [
-                    f'image = cv2.convertScaleAbs(cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize={k}))',
+                    f'_g = np.abs(cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize={k}))',
+                    'image = np.clip(_g, 0, _fs).astype(image.dtype)',
                 ],
                 comment=f'Sobel horizontal, k={k}',
             )
@@ -80,7 +85,8 @@ class SobelFilter(VideoFilter):
             return FilterCode(
                 imports=imports,
                 lines=_GRAY + [
-                    f'image = cv2.convertScaleAbs(cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize={k}))',
+                    f'_g = np.abs(cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize={k}))',
+                    'image = np.clip(_g, 0, _fs).astype(image.dtype)',
                 ],
                 comment=f'Sobel vertical, k={k}',
             )
@@ -89,7 +95,7 @@ class SobelFilter(VideoFilter):
             lines=_GRAY + [
                 f'_gx = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize={k})',
                 f'_gy = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize={k})',
-                'image = np.clip(np.hypot(_gx, _gy), 0, 255).astype(np.uint8)',
+                'image = np.clip(np.hypot(_gx, _gy), 0, _fs).astype(image.dtype)',
             ],
             comment=f'Sobel magnitude, k={k}',
         )
@@ -100,21 +106,34 @@ class SobelFilter(VideoFilter):
         Returns
         -------
         Image or None
-            uint8 edge map, or ``None`` if no frame has been added.
+            Edge map with the pixel type of the input, or ``None`` if
+            no frame has been added.
         '''
         if self.data is None:
             return None
-        gray = (self.data.mean(axis=2).astype(np.uint8)
-                if self.data.ndim == 3 else self.data)
+        return tiled(self.process, self.data, self.halo)
+
+    @property
+    def halo(self) -> int:
+        '''Radius of the Sobel kernel [pixels].'''
+        return max(1, self._ksize // 2)
+
+    def process(self, image: Image) -> Image:
+        '''Return the Sobel edge map of *image*.'''
+        dtype = image.dtype
+        gray = (image.mean(axis=2).astype(dtype)
+                if image.ndim == 3 else image)
+        if self._direction == 'Magnitude':
+            gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=self._ksize)
+            gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=self._ksize)
+            return saturate(np.hypot(gx, gy), dtype)
         if self._direction == 'Horizontal':
             result = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=self._ksize)
-            return cv2.convertScaleAbs(result)
-        if self._direction == 'Vertical':
+        else:
             result = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=self._ksize)
+        if dtype == np.uint8:
             return cv2.convertScaleAbs(result)
-        gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=self._ksize)
-        gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=self._ksize)
-        return np.clip(np.hypot(gx, gy), 0, 255).astype(np.uint8)
+        return saturate(np.abs(result), dtype)
 
 
 class QSobelFilter(QVideoFilter):
@@ -157,8 +176,7 @@ class QSobelFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setKsize(self, value: int) -> None:
         self.filter.ksize = value
-        with QtCore.QSignalBlocker(self._ksizeBox):
-            self._ksizeBox.setValue(self.filter.ksize)
+        self._showAccepted(self._ksizeBox, 'ksize')
 
 
 if __name__ == '__main__':  # pragma: no cover
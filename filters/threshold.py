@@ -2,7 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, full_scale, rescale
 import numpy as np
 import cv2
 
@@ -23,7 +23,12 @@ class ThresholdFilter(VideoFilter):
     - **Adaptive Gaussian**: threshold at each pixel is the
       Gaussian-weighted mean of the neighbourhood minus *C*.
 
-    Colour input is converted to grayscale before thresholding.
+    Colour input is converted to grayscale before thresholding.  The
+    binary result has the pixel type of the input, with foreground
+    pixels at full scale.  *threshold* and *C* are on the 8-bit scale
+    and are scaled to 16-bit and floating-point frames.  Adaptive
+    thresholds are computed at 8 bits, as are Otsu thresholds of
+    floating-point frames.
 
     Parameters
     ----------
@@ -95,14 +100,23 @@ class ThresholdFilter(VideoFilter):
         from QVideo.lib.QVideoFilter import FilterCode
         _GRAY = [
             'if image.ndim == 3:',
-            '    image = image.mean(axis=2).astype(np.uint8)',
+            '    image = image.mean(axis=2).astype(image.dtype)',
+            "_fs = np.iinfo(image.dtype).max if image.dtype.kind in 'ui' else 1.",
+        ]
+        _BYTE = [
+            '_dtype = image.dtype',
+            'image = np.rint(image * (255 / _fs)).astype(np.uint8)',
+        ]
+        _RESTORE = [
+            'image = (image * (_fs / 255)).astype(_dtype)',
         ]
         imports = frozenset({'import cv2', 'import numpy as np'})
         if self._method == 'Global':
             return FilterCode(
                 imports=imports,
                 lines=_GRAY + [
-                    f'_, image = cv2.threshold(image, {self._threshold}, 255, cv2.THRESH_BINARY)',
+                    f'_, image = cv2.threshold(image, {self._threshold} * _fs / 255, _fs, '
+                    'cv2.THRESH_BINARY)',
                 ],
                 comment=f'global threshold, level={self._threshold}',
             )
@@ -110,25 +124,25 @@ class ThresholdFilter(VideoFilter):
             return FilterCode(
                 imports=imports,
                 lines=_GRAY + [
-                    'image = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]',
+                    'image = cv2.threshold(image, 0, _fs, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]',
                 ],
                 comment='Otsu threshold',
             )
         if self._method == 'Adaptive Mean':
             return FilterCode(
                 imports=imports,
-                lines=_GRAY + [
+                lines=_GRAY + _BYTE + [
                     f'image = cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_MEAN_C, '
                     f'cv2.THRESH_BINARY, {self._block_size}, {self._C})',
-                ],
+                ] + _RESTORE,
                 comment=f'adaptive mean threshold, block={self._block_size}, C={self._C}',
             )
         return FilterCode(
             imports=imports,
-            lines=_GRAY + [
+            lines=_GRAY + _BYTE + [
                 f'image = cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, '
                 f'cv2.THRESH_BINARY, {self._block_size}, {self._C})',
-            ],
+            ] + _RESTORE,
             comment=f'adaptive Gaussian threshold, block={self._block_size}, C={self._C}',
         )
 
@@ -138,27 +152,34 @@ class ThresholdFilter(VideoFilter):
         Returns
         -------
         Image or None
-            Binary uint8 image, or ``None`` if no frame has been added.
+            Binary image with the pixel type of the input, or ``None``
+            if no frame has been added.
         '''
         if self.data is None:
             return None
-        gray = (self.data.mean(axis=2).astype(np.uint8)
+        dtype = self.data.dtype
+        gray = (self.data.mean(axis=2).astype(dtype)
                 if self.data.ndim == 3 else self.data)
+        fs = full_scale(dtype)
         if self._method == 'Global':
             _, result = cv2.threshold(
-                gray, self._threshold, 255, cv2.THRESH_BINARY)
-        elif self._method == 'Otsu':
+                gray, self._threshold * fs / 255, fs, cv2.THRESH_BINARY)
+            return result
+        if self._method == 'Otsu':
+            if dtype == np.float32:
+                gray = rescale(gray, np.uint8)
             _, result = cv2.threshold(
-                gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        elif self._method == 'Adaptive Mean':
-            result = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
-                cv2.THRESH_BINARY, self._block_size, self._C)
+                gray, 0, full_scale(gray.dtype),
+                cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            return rescale(result, dtype)
+        if self._method == 'Adaptive Mean':
+            method = cv2.ADAPTIVE_THRESH_MEAN_C
         else:
-            result = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY, self._block_size, self._C)
-        return result
+            method = cv2.ADAPTIVE_THRESH_GAUSSIAN_C
+        result = cv2.adaptiveThreshold(
+            rescale(gray, np.uint8), 255, method,
+            cv2.THRESH_BINARY, self._block_size, self._C)
+        return rescale(result, dtype)
 
 
 class QThresholdFilter(QVideoFilter):
@@ -221,14 +242,12 @@ class QThresholdFilter(QVideoFilter):
     @QtCore.Slot(object)
     def _setLevel(self, value: int) -> None:
         self.filter.threshold = value
-        with QtCore.QSignalBlocker(self._levelBox):
-            self._levelBox.setValue(self.filter.threshold)
+        self._showAccepted(self._levelBox, 'threshold')
 
     @QtCore.Slot(object)
     def _setBlockSize(self, value: int) -> None:
         self.filter.block_size = value
-        with QtCore.QSignalBlocker(self._blockBox):
-            self._blockBox.setValue(self.filter.block_size)
+        self._showAccepted(self._blockBox, 'block_size')
 
     @QtCore.Slot(object)
     def _setC(self, value: int) -> None:
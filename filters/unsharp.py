@@ -2,6 +2,7 @@
 from qtpy import QtCore, QtWidgets
 from pyqtgraph import SpinBox
 from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
+from QVideo.lib.tiling import tiled, gaussian_radius
 from QVideo.lib.videotypes import Image
 import cv2
 
@@ -21,8 +22,9 @@ class UnsharpFilter(VideoFilter):
                       - \\alpha\\,\\text{blur}(\\text{image},\\,\\sigma)
 
     where *σ* (*radius*) sets the blur width and *α* (*amount*) controls
-    sharpening strength.  ``cv2.addWeighted`` is used so the result is
-    clipped to ``[0, 255]`` and returned as ``uint8``.
+    sharpening strength.  ``cv2.addWeighted`` is used so the result
+    keeps the pixel type of the input, saturating at the limits of
+    integer types.
 
     Parameters
     ----------
@@ -66,12 +68,21 @@ class UnsharpFilter(VideoFilter):
         Returns
         -------
         Image or None
-            uint8 sharpened image, or ``None`` if no frame has been added.
+            Sharpened image, or ``None`` if no frame has been added.
         '''
         if self.data is None:
             return None
-        blurred = cv2.GaussianBlur(self.data, (0, 0), self._radius)
-        return cv2.addWeighted(self.data, 1 + self._amount,
+        return tiled(self.process, self.data, self.halo)
+
+    @property
+    def halo(self) -> int:
+        '''Radius of the Gaussian kernel [pixels].'''
+        return gaussian_radius(self._radius)
+
+    def process(self, image: Image) -> Image:
+        '''Return the sharpened version of *image*.'''
+        blurred = cv2.GaussianBlur(image, (0, 0), self._radius)
+        return cv2.addWeighted(image, 1 + self._amount,
                                blurred, -self._amount, 0)
 
     def to_code(self) -> 'FilterCode':
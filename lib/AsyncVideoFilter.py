@@ -78,15 +78,19 @@ class AsyncVideoFilter(VideoFilter):
         super().__init__()
         self._ready = True
         self._result: Image | None = None
+        self._start()
+        self.destroyed.connect(self._cleanup)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._cleanup)
+
+    def _start(self) -> None:
+        '''Start the background thread.'''
         self._worker = _AsyncWorker(weakref.ref(self))
         self._thread = QtCore.QThread()
         self._worker.moveToThread(self._thread)
         self._submit.connect(self._worker.run)
         self._thread.start()
-        self.destroyed.connect(self._cleanup)
-        app = QtCore.QCoreApplication.instance()
-        if app is not None:
-            app.aboutToQuit.connect(self._cleanup)
 
     def process(self, image: Image) -> Image:
         '''Perform the heavy computation on *image*.
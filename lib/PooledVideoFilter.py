@@ -0,0 +1,192 @@
+'''Async VideoFilter base that spreads frames over a pool of threads.'''
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from qtpy import QtCore
+from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.tiling import mark_pool_worker
+from QVideo.lib.videotypes import Image
+
+
+__all__ = ['PooledVideoFilter']
+
+logger = logging.getLogger(__name__)
+
+
+class PooledVideoFilter(AsyncVideoFilter):
+
+    '''AsyncVideoFilter that processes several frames concurrently.
+
+    :class:`~QVideo.lib.AsyncVideoFilter.AsyncVideoFilter` has a single
+    worker, so a filter that takes 40 ms per frame can never exceed
+    25 frames per second.  This variant hands successive frames to a
+    pool of :attr:`workers` threads.  OpenCV and NumPy release the GIL
+    while they work, so the frame rate scales with the number of
+    workers up to the number of cores.
+
+    Results are returned in the order in which their frames were
+    added, so the output never steps back in time even when a later
+    frame finishes first.  Two policies govern what happens when the
+    workers are busy:
+
+    ``'drop'``
+        Frames that arrive while every worker is busy are discarded,
+        and :meth:`get` returns the most recent result.  Latency stays
+        at one processing time.
+    ``'queue'``
+        Every frame is processed, and successive calls to :meth:`get`
+        step through the results one at a time, so that none is
+        skipped.  When :attr:`backlog` frames await their results,
+        :meth:`add` first waits for the oldest to finish.
+
+    :attr:`staleness` and :attr:`age` report how far the frame
+    returned by :meth:`get` lags the newest input.
+
+    With more than one worker, filters that call
+    :func:`~QVideo.lib.tiling.tiled` process each frame whole, since
+    the pool already keeps the cores busy.
+
+    :meth:`process` runs concurrently in several threads, so this base
+    is suited only to filters that keep no state between frames.  As
+    for :class:`~QVideo.lib.AsyncVideoFilter.AsyncVideoFilter`,
+    :meth:`process` may read instance attributes but must not write
+    to them.
+
+    Parameters
+    ----------
+    workers : int or None
+        Number of worker threads.  ``None`` (default) uses one per
+        core, up to 8.
+    policy : str
+        ``'drop'`` (default) or ``'queue'``.
+    '''
+
+    POLICIES = ('drop', 'queue')
+
+    def __init__(self,
+                 workers: int | None = None,
+                 policy: str = 'drop') -> None:
+        if workers is None:
+            workers = min(8, os.cpu_count() or 1)
+        self._workers = max(1, int(workers))
+        self.policy = policy
+        self._pending: deque[tuple[int, float, Future]] = deque()
+        self._count = 0
+        self._staleness = 0
+        self._age = 0.
+        self.dropped = 0
+        super().__init__()
+
+    def _start(self) -> None:
+        initializer = mark_pool_worker if self._workers > 1 else None
+        self._pool = ThreadPoolExecutor(self._workers,
+                                        thread_name_prefix='QVideo-pool',
+                                        initializer=initializer)
+
+    @property
+    def workers(self) -> int:
+        '''Number of worker threads.
+
+        Changing the number waits for the frames in flight and starts
+        a new pool.
+        '''
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int) -> None:
+        workers = max(1, int(workers))
+        if workers == self._workers:
+            return
+        self._cleanup()
+        self._pending.clear()
+        self._workers = workers
+        self._start()
+
+    @property
+    def policy(self) -> str:
+        '''What to do with frames that arrive while the workers are busy.
+
+        ``'drop'`` or ``'queue'``.
+        '''
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: str) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f'policy must be one of {self.POLICIES}')
+        self._policy = policy
+
+    @property
+    def backlog(self) -> int:
+        '''Frames that may await their results under ``'queue'``.'''
+        return 2 * self._workers
+
+    @property
+    def staleness(self) -> int:
+        '''Frames added after the one returned by the last :meth:`get`.'''
+        return self._staleness
+
+    @property
+    def age(self) -> float:
+        '''Seconds from adding to returning the last :meth:`get` result.'''
+        return self._age
+
+    def add(self, image: Image) -> None:
+        '''Submit *image* to the pool.
+
+        Under the ``'drop'`` policy the frame is discarded, and counted
+        in :attr:`dropped`, if every worker is busy.  Under the
+        ``'queue'`` policy this waits for the oldest frame to finish
+        if :attr:`backlog` frames await their results.
+
+        Parameters
+        ----------
+        image : Image
+            Input frame.
+        '''
+        self.data = image
+        if self._policy == 'drop':
+            busy = sum(not future.done() for *_, future in self._pending)
+            if busy >= self._workers:
+                self.dropped += 1
+                return
+        elif len(self._pending) >= self.backlog:
+            self._pending[0][2].exception()
+        future = self._pool.submit(self.process, image)
+        self._pending.append((self._count, perf_counter(), future))
+        self._count += 1
+
+    def get(self) -> Image | None:
+        '''Return the next processed frame in order.
+
+        Under the ``'drop'`` policy, returns the result of the most
+        recent frame whose predecessors have all finished.  Under the
+        ``'queue'`` policy, returns the result of the oldest frame not
+        yet returned, if it has finished.  Otherwise returns the
+        previous result, or the raw input frame before the first
+        result is ready.
+
+        Returns
+        -------
+        Image or None
+            Processed frame, raw input frame, or ``None`` if
+            :meth:`add` has never been called.
+        '''
+        while self._pending and self._pending[0][2].done():
+            sequence, added, future = self._pending.popleft()
+            error = future.exception()
+            if error is not None:
+                logger.warning(f'{type(self).__name__} failed: {error}')
+                continue
+            self._result = future.result()
+            self._staleness = self._count - 1 - sequence
+            self._age = perf_counter() - added
+            if self._policy == 'queue':
+                break
+        return super().get()
+
+    @QtCore.Slot()
+    def _cleanup(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
@@ -1,6 +1,8 @@
 '''Abstract base class for all QVideo camera backends.'''
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import Future
+from itertools import count
 from types import TracebackType
 from qtpy import QtCore
 from QVideo.lib.videotypes import Image
@@ -31,13 +33,13 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
     system, and context-manager support.
 
     Subclasses implement :meth:`_initialize`, :meth:`_deinitialize`, and
-    :meth:`read`, then call :meth:`registerProperty` and
-    :meth:`registerMethod` to expose their adjustable parameters and
-    executable actions.  Properties may be registered at any time —
-    including inside :meth:`_initialize` — which allows cameras whose
-    feature sets are only known after connecting to hardware (e.g.
-    GenICam devices) to discover and publish their parameters at
-    run-time.
+    :meth:`read` (and optionally :meth:`read_into`), then call
+    :meth:`registerProperty` and :meth:`registerMethod` to expose their
+    adjustable parameters and executable actions.  Properties may be
+    registered at any time — including inside :meth:`_initialize` —
+    which allows cameras whose feature sets are only known after
+    connecting to hardware (e.g. GenICam devices) to discover and
+    publish their parameters at run-time.
 
     Registered properties are accessible both through the explicit
     :meth:`get` / :meth:`set` API and as ordinary Python attributes —
@@ -57,6 +59,9 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
         Emitted by subclasses when the image dimensions change.
     propertyValue(str, object)
         Emitted by :meth:`get` with the property name and current value.
+    commandFinished(str, object)
+        Emitted by :meth:`applyPending` for each queued command with
+        the property or method name and the result.
 
     Type Aliases
     ------------
@@ -64,18 +69,31 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
         Common type for scalar camera property values.
     Settings : dict[str, PropertyValue]
         Mapping of property name to value, as returned by :meth:`settings`.
-    Image : NDArray[np.uint8]
-        A single camera frame.
+    Image : NDArray[np.uint8] | NDArray[np.uint16] | NDArray[np.float32]
+        A single camera frame in the camera's native pixel type.
     CameraData : tuple[bool, Image | None]
         Return type of :meth:`read`.
 
     Notes
     -----
     ``QCamera`` holds a single non-recursive :attr:`mutex`.  :meth:`set`,
-    :meth:`get`, :meth:`execute`, and :meth:`saferead` all acquire it,
-    so subclass :meth:`read` implementations must not call back into
-    any of those methods or a deadlock will result.  Pause and resume
+    :meth:`get`, :meth:`execute`, :meth:`saferead`, and
+    :meth:`saferead_into` all acquire it, so subclass :meth:`read`
+    implementations must not call back into any of those methods or a
+    deadlock will result.  Pause and resume
     control is the responsibility of the enclosing :class:`QVideoSource`.
+
+    Because :meth:`saferead` holds the mutex for the whole frame
+    transfer, a direct call to :meth:`set` from the GUI thread can block
+    until the current frame arrives.  :meth:`queueSet`, :meth:`queueGet`
+    and :meth:`queueExecute` never block: while :attr:`queueing` is
+    enabled they record the command and return a
+    :class:`~concurrent.futures.Future`, and the capture loop applies
+    queued commands between frames by calling :meth:`applyPending`.
+    Repeated writes to the same property are coalesced so that only the
+    latest value is applied.  When :attr:`queueing` is disabled, which
+    is the case unless a :class:`QVideoSource` is running, queued
+    commands are applied immediately.
     '''
 
     PropertyValue = bool | int | float | str
@@ -86,6 +104,9 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
     shapeChanged = QtCore.Signal(QtCore.QSize)
     #: Emitted by :meth:`get` with the property name and current value.
     propertyValue = QtCore.Signal(str, object)
+    #: Emitted by :meth:`applyPending` with the name and result of
+    #: each queued command.
+    commandFinished = QtCore.Signal(str, object)
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -94,6 +115,16 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
         self._methods: dict[str, Callable[[], object]] = {}
         self._isOpen = False
         self._modelName: str | None = None
+        self._bayer: str | None = None
+        self._frameMetadata: tuple[int | None, int | None] = (None, None)
+        self._queueMutex = QtCore.QMutex()
+        self._queue: dict[tuple[str, object], tuple] = {}
+        self._queueing = False
+        self._serial = count()
+        self._roiRequest: tuple[int, int, int, int] | None = None
+        self._hardwareWindow: tuple[int, int, int, int] | None = None
+        self._binningRequest: tuple[int, str] | None = None
+        self._hardwareBinning = 1
 
     def __enter__(self) -> 'QCamera':
         return self.open()
@@ -343,6 +374,145 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
             else:
                 logger.error(f'Unknown method: {key}')
 
+    # ------------------------------------------------------------------
+    # Queued property / method access
+    # ------------------------------------------------------------------
+
+    @property
+    def queueing(self) -> bool:
+        '''Whether queued commands wait for :meth:`applyPending`.
+
+        Enabled by :class:`QVideoSource` while its capture loop is
+        running.  Disabling queueing does not discard commands that
+        are already queued; call :meth:`applyPending` to apply them.
+        '''
+        return self._queueing
+
+    @queueing.setter
+    def queueing(self, queueing: bool) -> None:
+        with QtCore.QMutexLocker(self._queueMutex):
+            self._queueing = bool(queueing)
+
+    def queueSet(self, key: str, value: PropertyValue) -> Future:
+        '''Request a property change without waiting for the camera.
+
+        A pending request for the same property is replaced, and its
+        future completes together with this one.
+
+        Parameters
+        ----------
+        key : str
+            Property name.
+        value : PropertyValue
+            New value to assign.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the property value read back after the change.
+        '''
+        return self._enqueue(('set', key), (key, value), coalesce=True)
+
+    def queueGet(self, key: str) -> Future:
+        '''Request a property value without waiting for the camera.
+
+        Parameters
+        ----------
+        key : str
+            Property name.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the result of :meth:`get`.
+        '''
+        return self._enqueue(('get', key), (key,), coalesce=True)
+
+    def queueExecute(self, key: str) -> Future:
+        '''Request a registered method call without waiting for the camera.
+
+        Method calls are not coalesced: each request is executed.
+
+        Parameters
+        ----------
+        key : str
+            Method name.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to ``None`` once the method has been called.
+        '''
+        return self._enqueue(('execute', next(self._serial)), (key,),
+                             coalesce=False)
+
+    def _enqueue(self, slot: tuple[str, object], args: tuple,
+                 coalesce: bool) -> Future:
+        future = Future()
+        with QtCore.QMutexLocker(self._queueMutex):
+            if self._queueing:
+                futures = [future]
+                if coalesce and slot in self._queue:
+                    futures = self._queue.pop(slot)[1] + futures
+                self._queue[slot] = (args, futures)
+                return future
+        self._apply(slot[0], args, [future])
+        return future
+
+    def hasPending(self) -> bool:
+        '''Return ``True`` if queued commands are waiting.'''
+        with QtCore.QMutexLocker(self._queueMutex):
+            return bool(self._queue)
+
+    def applyPending(self) -> int:
+        '''Apply queued commands in the order they were requested.
+
+        Called by the capture loop of :class:`QVideoSource` between
+        frames, so the camera mutex is free.  Each command is applied
+        through :meth:`set`, :meth:`get`, :meth:`execute`,
+        :meth:`applyROI` or :meth:`applyBinning`, so subclass overrides
+        of those methods are honoured.
+
+        Returns
+        -------
+        int
+            Number of commands applied.
+        '''
+        if not self._queue:
+            return 0
+        with QtCore.QMutexLocker(self._queueMutex):
+            queue, self._queue = self._queue, {}
+        for (kind, _), (args, futures) in queue.items():
+            self._apply(kind, args, futures)
+        return len(queue)
+
+    def _apply(self, kind: str, args: tuple, futures: list[Future]) -> None:
+        '''Run one command and resolve the futures waiting for it.'''
+        futures = [f for f in futures if f.set_running_or_notify_cancel()]
+        if not futures:
+            return
+        key = args[0]
+        try:
+            if kind == 'set':
+                self.set(*args)
+                result = self.get(key)
+            elif kind == 'get':
+                result = self.get(key)
+            elif kind == 'roi':
+                result = self._applyRequestedROI()
+            elif kind == 'binning':
+                result = self._applyRequestedBinning()
+            else:
+                result = self.execute(key)
+        except Exception as ex:
+            logger.warning(f'{kind} {key!r} failed: {ex}')
+            for future in futures:
+                future.set_exception(ex)
+            return
+        for future in futures:
+            future.set_result(result)
+        self.commandFinished.emit(key, result)
+
     # ------------------------------------------------------------------
     # Frame acquisition
     # ------------------------------------------------------------------
@@ -377,6 +547,216 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
         with QtCore.QMutexLocker(self._mutex):
             return self.read()
 
+    def read_into(self, out: Image) -> CameraData:
+        '''Read one frame into the preallocated buffer *out*.
+
+        Backends that can fill a recycled buffer override this method
+        so that :class:`~QVideo.lib.QVideoSource.QVideoSource` can serve
+        frames from its :class:`~QVideo.lib.framepool.FramePool` instead
+        of allocating a new array for every frame.  The default
+        implementation ignores *out* and returns :meth:`read`.
+
+        Parameters
+        ----------
+        out : Image
+            Buffer with the shape and dtype of the previous frame.
+
+        Returns
+        -------
+        tuple[bool, Image or None]
+            ``(True, out)`` when the frame was written into *out*.
+            Implementations return a newly allocated frame instead
+            when *out* does not match the current frame geometry, and
+            ``(False, None)`` on failure.
+
+        Notes
+        -----
+        The same locking rules apply as for :meth:`read`.
+        '''
+        return self.read()
+
+    def saferead_into(self, out: Image) -> CameraData:
+        '''Read one frame into *out* under the camera mutex.
+
+        Parameters
+        ----------
+        out : Image
+            Buffer to fill.
+
+        Returns
+        -------
+        tuple[bool, Image or None]
+            Result of :meth:`read_into`.
+        '''
+        with QtCore.QMutexLocker(self._mutex):
+            return self.read_into(out)
+
+    def frameMetadata(self) -> tuple[int | None, int | None]:
+        '''Hardware metadata for the most recently read frame.
+
+        Backends whose hardware reports per-frame timestamps or frame
+        counters store them in ``_frameMetadata`` from :meth:`read` /
+        :meth:`read_into`.  :class:`~QVideo.lib.QVideoSource.QVideoSource`
+        copies the values into the
+        :class:`~QVideo.lib.frameinfo.FrameInfo` of each frame.
+
+        Returns
+        -------
+        tuple[int or None, int or None]
+            ``(timestamp, index)``: the hardware timestamp [ns] and
+            frame counter, with ``None`` for values the backend does
+            not provide.
+        '''
+        return self._frameMetadata
+
+    # ------------------------------------------------------------------
+    # Hardware region of interest and binning
+    # ------------------------------------------------------------------
+
+    def applyROI(self, x: int, y: int,
+                 w: int, h: int) -> tuple[int, int, int, int] | None:
+        '''Crop frames in hardware to a window containing a region.
+
+        Backends whose sensors can read out a subwindow override this
+        method.  Hardware windows usually obey increment and alignment
+        constraints, so the window may be larger than the requested
+        region; the caller crops the remainder in software.
+
+        Parameters
+        ----------
+        x, y : int
+            Top-left corner of the region in full-sensor coordinates.
+        w, h : int
+            Width and height of the region [pixels].
+
+        Returns
+        -------
+        tuple[int, int, int, int] or None
+            ``(x, y, w, h)`` of the window that subsequent frames
+            cover, or ``None`` if the camera cannot crop in hardware.
+        '''
+        return None
+
+    def resetROI(self) -> None:
+        '''Restore full-sensor frames after :meth:`applyROI`.'''
+        pass
+
+    @property
+    def window(self) -> tuple[int, int, int, int] | None:
+        '''Hardware window ``(x, y, w, h)`` of the frames being read.
+
+        Set when a request made with :meth:`queueROI` is applied, and
+        copied into the :class:`~QVideo.lib.frameinfo.FrameInfo` of
+        each frame.  ``None`` for full-sensor frames.
+        '''
+        return self._hardwareWindow
+
+    def queueROI(self, region: tuple[int, int, int, int] | None) -> Future:
+        '''Request a hardware window without waiting for the camera.
+
+        The request is applied with :meth:`applyROI`, or with
+        :meth:`resetROI` if *region* is ``None``, by the capture loop
+        between frames, like the commands of :meth:`queueSet`.  A
+        pending request is replaced by a newer one.
+
+        Parameters
+        ----------
+        region : tuple[int, int, int, int] or None
+            ``(x, y, w, h)`` in full-sensor coordinates, or ``None`` to
+            restore full-sensor frames.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the new :attr:`window`.
+        '''
+        with QtCore.QMutexLocker(self._queueMutex):
+            self._roiRequest = None if region is None else tuple(region)
+        return self._enqueue(('roi', None), ('roi',), coalesce=True)
+
+    def _applyRequestedROI(self) -> tuple[int, int, int, int] | None:
+        '''Apply the latest :meth:`queueROI` request.'''
+        with QtCore.QMutexLocker(self._queueMutex):
+            region = self._roiRequest
+        if region is not None:
+            self._hardwareWindow = self.applyROI(*region)
+        elif self._hardwareWindow is not None:
+            self.resetROI()
+            self._hardwareWindow = None
+        return self._hardwareWindow
+
+    def applyBinning(self, factor: int, mode: str = 'mean') -> int | None:
+        '''Combine blocks of pixels in hardware.
+
+        Backends whose sensors can bin or decimate override this
+        method.  Hardware usually supports only a few factors, so the
+        camera may apply a divisor of *factor*; the caller applies the
+        remaining factor in software.
+
+        Parameters
+        ----------
+        factor : int
+            Width and height of the blocks [pixels].
+        mode : str
+            ``'mean'``, ``'sum'`` or ``'decimate'``, as for
+            :class:`~QVideo.filters.binning.BinningFilter`.
+
+        Returns
+        -------
+        int or None
+            Factor applied by the camera, or ``None`` if the camera
+            cannot bin in this mode.
+        '''
+        return None
+
+    def resetBinning(self) -> None:
+        '''Restore unbinned frames after :meth:`applyBinning`.'''
+        pass
+
+    @property
+    def binning(self) -> int:
+        '''Binning factor applied by the camera to the frames being read.
+
+        Set when a request made with :meth:`queueBinning` is applied,
+        and copied into the :class:`~QVideo.lib.frameinfo.FrameInfo` of
+        each frame.  ``1`` for unbinned frames.
+        '''
+        return self._hardwareBinning
+
+    def queueBinning(self, request: tuple[int, str] | None) -> Future:
+        '''Request hardware binning without waiting for the camera.
+
+        The request is applied with :meth:`applyBinning`, or with
+        :meth:`resetBinning` if *request* is ``None``, by the capture
+        loop between frames, like the commands of :meth:`queueSet`.  A
+        pending request is replaced by a newer one.
+
+        Parameters
+        ----------
+        request : tuple[int, str] or None
+            ``(factor, mode)`` as for :meth:`applyBinning`, or ``None``
+            to restore unbinned frames.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the new :attr:`binning`.
+        '''
+        with QtCore.QMutexLocker(self._queueMutex):
+            self._binningRequest = None if request is None else tuple(request)
+        return self._enqueue(('binning', None), ('binning',), coalesce=True)
+
+    def _applyRequestedBinning(self) -> int:
+        '''Apply the latest :meth:`queueBinning` request.'''
+        with QtCore.QMutexLocker(self._queueMutex):
+            request = self._binningRequest
+        if request is not None:
+            self._hardwareBinning = self.applyBinning(*request) or 1
+        elif self._hardwareBinning != 1:
+            self.resetBinning()
+            self._hardwareBinning = 1
+        return self._hardwareBinning
+
     # ------------------------------------------------------------------
     # Derived properties
     # ------------------------------------------------------------------
@@ -398,6 +778,19 @@ class QCamera(QtCore.QObject, metaclass=QCameraMeta):
         '''
         return self._modelName
 
+    @property
+    def bayer(self) -> str | None:
+        '''Bayer pattern of raw frames, or ``None``.
+
+        Set by subclasses that deliver undemosaiced sensor data, to one
+        of :data:`~QVideo.lib.bayer.PATTERNS`.  Raw frames are
+        two-dimensional; consumers that need color, such as
+        :class:`~QVideo.lib.QVideoScreen.QVideoScreen`, interpolate
+        them with :func:`~QVideo.lib.bayer.demosaic`.  ``None`` for
+        frames that are monochrome or already in color.
+        '''
+        return self._bayer
+
     @property
     def shape(self) -> QtCore.QSize:
         '''Image dimensions as ``QSize(width, height)``.
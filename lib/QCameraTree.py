@@ -29,6 +29,12 @@ class QCameraTree(ParameterTree):
     Changes made in the tree are pushed to the camera; camera-side
     changes are reflected back into the tree.
 
+    While the video source is running, changes are submitted with
+    :meth:`~QVideo.lib.QCamera.QCamera.queueSet` and applied by the
+    capture thread between frames, so editing a parameter never blocks
+    the GUI on camera I/O.  Each parameter is updated with the value
+    that the capture thread reads back once its change has been applied.
+
     Parameters
     ----------
     source : QCamera or QVideoSource
@@ -112,6 +118,7 @@ class QCameraTree(ParameterTree):
 
     def _connectSignals(self) -> None:
         self._tree.sigTreeStateChanged.connect(self._sync)
+        self.camera.commandFinished.connect(self._commandFinished)
         QtCore.QCoreApplication.instance().aboutToQuit.connect(self.stop)
 
     def _setupUi(self) -> None:
@@ -134,12 +141,39 @@ class QCameraTree(ParameterTree):
             if (change == 'value'):
                 key = param.name()
                 logger.debug(f'Syncing {key}: {change}: {value}')
-                self.camera.set(key, value)
+                self._setCamera(key, value)
+        if not self._queued():
+            self._refresh()
+
+    def _queued(self) -> bool:
+        '''Return ``True`` if camera changes go through the command queue.'''
+        return self.source.isRunning()
+
+    def _setCamera(self, key: str, value: QCamera.PropertyValue) -> None:
+        '''Push one change to the camera without blocking on a frame read.'''
+        if self._queued():
+            self.camera.queueSet(key, value)
+        else:
+            self.camera.set(key, value)
+
+    def _refresh(self) -> None:
+        '''Update every parameter from the camera's current settings.'''
         self._ignoreSync = True
         for key, value in self.camera.settings.items():
             self.set(key, value)
         self._ignoreSync = False
 
+    @QtCore.Slot(str, object)
+    def _commandFinished(self, key: str, value: object) -> None:
+        if key in self._parameters and value is not None:
+            self._report(key, value)
+
+    def _report(self, key: str, value: QCamera.PropertyValue) -> None:
+        '''Show a value reported by the camera without pushing it back.'''
+        self._ignoreSync = True
+        self.set(key, value)
+        self._ignoreSync = False
+
     @QtCore.Slot(str, object)
     def set(self, key: str, value: QCamera.PropertyValue) -> None:
         '''Set a camera property and update the tree.
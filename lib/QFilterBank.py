@@ -1,9 +1,11 @@
 '''Composable pipeline of VideoFilter stages between a source and a display.'''
 import logging
+import threading
 from collections.abc import Iterator
 
 from qtpy import QtWidgets
 from QVideo.lib.QVideoFilter import QVideoFilter
+from QVideo.lib.instrumentation import profiler
 from QVideo.lib.videotypes import Image
 import QVideo.filters as videofilters
 
@@ -22,6 +24,13 @@ class QFilterBank(QtWidgets.QGroupBox):
     :meth:`deregister`, and may also be looked up by name from the
     :mod:`QVideo.filters` package using :meth:`registerByName`.
 
+    The bank may be called from a worker thread, as it is by a
+    :class:`~QVideo.lib.QVideoScreen.QVideoScreen` in
+    :attr:`~QVideo.lib.QVideoScreen.QVideoScreen.threaded` mode.  It
+    holds :attr:`lock` while it processes a frame or changes its list
+    of filters, and shares the lock with the filters it holds, so that
+    their parameters change only between frames.
+
     Parameters
     ----------
     parent : QtWidgets.QWidget or None
@@ -31,11 +40,17 @@ class QFilterBank(QtWidgets.QGroupBox):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__('Display Filters', parent)
         self._filters: list[QVideoFilter] = []
+        self._lock = threading.RLock()
         self._setupUi()
 
     def _setupUi(self) -> None:
         self._layout = QtWidgets.QVBoxLayout(self)
 
+    @property
+    def lock(self) -> threading.RLock:
+        '''Lock held while a frame is processed.'''
+        return self._lock
+
     def __iter__(self) -> Iterator[QVideoFilter]:
         return iter(self._filters)
 
@@ -57,9 +72,12 @@ class QFilterBank(QtWidgets.QGroupBox):
         Image or None
             Frame after all enabled filters have been applied.
         '''
-        for video_filter in self:
-            image = video_filter(image)
-        return image
+        with self._lock:
+            if profiler.enabled:
+                return profiler.apply(self, image)
+            for video_filter in self:
+                image = video_filter(image)
+            return image
 
     def register(self, video_filter: QVideoFilter) -> None:
         '''Add a filter to the end of the pipeline.
@@ -77,7 +95,9 @@ class QFilterBank(QtWidgets.QGroupBox):
         if not isinstance(video_filter, QVideoFilter):
             raise TypeError('expected QVideoFilter, '
                             f'got {type(video_filter).__name__}')
-        self._filters.append(video_filter)
+        with self._lock:
+            self._filters.append(video_filter)
+        video_filter.filter.lock = self._lock
         self._layout.addWidget(video_filter)
 
     def deregister(self, video_filter: QVideoFilter) -> None:
@@ -93,7 +113,9 @@ class QFilterBank(QtWidgets.QGroupBox):
         ValueError
             If *video_filter* is not currently registered.
         '''
-        self._filters.remove(video_filter)
+        with self._lock:
+            self._filters.remove(video_filter)
+        video_filter.filter.lock = None
         self._layout.removeWidget(video_filter)
         video_filter.setParent(None)
 
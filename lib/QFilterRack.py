@@ -1,8 +1,16 @@
 '''Dynamic, reorderable pipeline of QVideoFilter widgets.'''
+import threading
+import time
 from collections.abc import Iterator
 from qtpy import QtCore, QtWidgets, QtGui
-from QVideo.lib.QVideoFilter import QVideoFilter
+from QVideo.lib.QCamera import QCamera
+from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
+from QVideo.lib._fusion import compile_stages
+from QVideo.lib._stages import StagePipeline
+from QVideo.lib.instrumentation import profiler
 from QVideo.lib.videotypes import Image
+from QVideo.filters.roi import ROIFilter
+from QVideo.filters.binning import BinningFilter
 import QVideo.filters as videofilters
 import pyqtgraph as pg
 
@@ -193,6 +201,44 @@ class QFilterRack(QtWidgets.QWidget):
     ``QFilterRack`` is designed for interactive use where the pipeline
     should be discoverable and adjustable at runtime.
 
+    When :attr:`hardwareROI` is enabled and the first enabled filter is
+    an :class:`~QVideo.filters.roi.ROIFilter`, the crop is pushed down
+    to :attr:`camera` with :meth:`~QVideo.lib.QCamera.QCamera.queueROI`
+    so that the sensor reads out only a window around the region.  The
+    filter then crops the remainder of that window in software, using
+    the window recorded in each frame's
+    :class:`~QVideo.lib.frameinfo.FrameInfo`.  A region that is still
+    being dragged is pushed only once it has been steady for
+    :attr:`ROI_DELAY` seconds, and the camera applies it between frames.
+    Likewise, when :attr:`hardwareBinning` is enabled and the first
+    enabled filter is a :class:`~QVideo.filters.binning.BinningFilter`,
+    the camera is asked to bin with
+    :meth:`~QVideo.lib.QCamera.QCamera.queueBinning`, and the filter
+    applies whatever factor the frame's
+    :class:`~QVideo.lib.frameinfo.FrameInfo` shows the camera did not.
+
+    When :attr:`fused` is ``True`` (the default), runs of consecutive
+    stateless filters are compiled into single generated functions
+    that bypass the per-filter dispatch (see :mod:`QVideo.lib._fusion`).
+    Results are identical to calling each filter in turn.  The pipeline
+    is recompiled whenever filters are added, removed, reordered,
+    enabled, disabled or replaced; filter parameters are read live.  The
+    generated source is available as :attr:`fusedSource`.
+
+    Like :class:`~QVideo.lib.QFilterBank.QFilterBank`, the rack may be
+    called from a worker thread.  It holds :attr:`lock` while it
+    processes a frame or rearranges its slots, and shares the lock with
+    its filters so that their parameters change only between frames.
+
+    When :attr:`pipelined` is ``True``, each stage runs in its own
+    thread and the stages are connected by queues of :attr:`queueSize`
+    frames (see :mod:`QVideo.lib._stages`).  Throughput then
+    approaches that of the slowest stage rather than the sum of all
+    stages.  Every stage still sees every frame in order, so stateful
+    filters behave as before, but each call returns the latest frame
+    to have left the pipeline rather than the result for the frame
+    passed in.  :attr:`queueDepths` shows where frames are waiting.
+
     Parameters
     ----------
     parent : QtWidgets.QWidget or None
@@ -208,7 +254,28 @@ class QFilterRack(QtWidgets.QWidget):
         super().__init__(parent)
         self._editable = editable
         self._filter_refs: list[QVideoFilter] = []
+        self._camera: QCamera | None = None
+        self._hardwareROI = False
+        self._roi: ROIFilter | None = None
+        self._pushed: tuple[int, int, int, int] | None = None
+        self._request: tuple | None = None
+        self._since = 0.
+        self._hardwareBinning = False
+        self._binning: BinningFilter | None = None
+        self._binned: tuple[int, str] | None = None
+        self._fused = True
+        self._layout: tuple | None = None
+        self._stages: list = []
+        self._source = ''
+        self._lock = threading.RLock()
+        self._pipelined = False
+        self._queueSize = 2
+        self._pipeline: StagePipeline | None = None
+        self._retired: StagePipeline | None = None
         self._setupUi()
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stopPipeline)
 
     def _setupUi(self) -> None:
         outer = QtWidgets.QVBoxLayout(self)
@@ -258,9 +325,179 @@ class QFilterRack(QtWidgets.QWidget):
         Image or None
             Frame after all enabled filters have been applied.
         '''
-        for slot in self._iterSlots():
-            image = slot._widget(image)
-        return image
+        with self._lock:
+            if self._hardwareROI:
+                self._syncROI()
+            if self._hardwareBinning:
+                self._syncBinning()
+            if self._pipelined and not profiler.enabled:
+                return self._submit(image)
+            self._stopPipeline()
+            self._joinRetired()
+            if profiler.enabled:
+                return profiler.apply(self, image)
+            if not self._fused:
+                for slot in self._iterSlots():
+                    image = slot._widget(image)
+                return image
+            for stage in self._compiled():
+                image = stage(image)
+            return image
+
+    def _compiled(self) -> list:
+        '''Return the fused stages, recompiling if the layout changed.'''
+        layout = tuple((w, w.filter, w.isChecked()) for w in self)
+        if layout != self._layout:
+            self._stages, self._source = compile_stages(self.filters)
+            self._layout = layout
+        return self._stages
+
+    def _submit(self, image: Image) -> Image | None:
+        '''Submit *image* to the stage threads and return their output.
+
+        Returns *image* itself until the first frame leaves the
+        pipeline.  Which filters are enabled is read here, in the
+        calling thread, so that the stage threads never touch the
+        widgets.
+        '''
+        if self._fused:
+            stages = [self._threadable(s) for s in self._compiled()]
+        else:
+            stages = [self._threadable(w) for w in self if w.isChecked()]
+        if not stages:
+            self._stopPipeline()
+            return image
+        pipeline = self._pipeline
+        if (pipeline is None or
+                [stage.function for stage in pipeline.stages] != stages):
+            self._stopPipeline()
+            self._joinRetired()
+            pipeline = self._startPipeline(stages)
+        pipeline.submit(image)
+        result = pipeline.result()
+        return image if result is None else result
+
+    @staticmethod
+    def _threadable(stage: object) -> object:
+        '''Return the callable that a stage thread runs for *stage*.
+
+        Enabled widgets that apply their filter in the standard way
+        are replaced by the filter itself.
+        '''
+        if (isinstance(stage, QVideoFilter) and
+                type(stage).__call__ is QVideoFilter.__call__):
+            return stage.filter
+        return stage
+
+    @staticmethod
+    def _stageFilters(stage: object) -> tuple:
+        '''Return the filters applied by *stage*.'''
+        filters = getattr(stage, 'filters', None)
+        if filters:
+            return filters
+        return (stage,) if isinstance(stage, VideoFilter) else (stage.filter,)
+
+    def _startPipeline(self, stages: list) -> StagePipeline:
+        '''Start a thread for each of *stages*.'''
+        groups = [self._stageFilters(stage) for stage in stages]
+        names = ['+'.join(type(f).__name__ for f in group)
+                 for group in groups]
+        self._pipeline = StagePipeline(stages, names, self._queueSize)
+        for stage, group in zip(self._pipeline.stages, groups):
+            for vfilter in group:
+                vfilter.lock = stage.lock
+        return self._pipeline
+
+    @QtCore.Slot()
+    def _stopPipeline(self) -> None:
+        '''Stop the stage threads and give the filters back the rack lock.
+
+        The threads finish the frames they hold in the background, so
+        that the rack lock is never held while they are joined.
+        :meth:`_joinRetired` waits for them before the filters are
+        used by another thread.
+        '''
+        with self._lock:
+            pipeline, self._pipeline = self._pipeline, None
+            if pipeline is None:
+                return
+            pipeline.close(wait=False)
+            self._retired = pipeline
+            for widget in self:
+                widget.filter.lock = self._lock
+
+    def _joinRetired(self) -> None:
+        '''Wait for the threads of the last stopped pipeline to finish.'''
+        retired, self._retired = self._retired, None
+        if retired is not None:
+            retired.join()
+
+    @property
+    def pipelined(self) -> bool:
+        '''bool: whether each stage runs in its own thread.
+
+        Default: ``False``.
+        '''
+        return self._pipelined
+
+    @pipelined.setter
+    def pipelined(self, value: bool) -> None:
+        self._pipelined = bool(value)
+        if not self._pipelined:
+            self._stopPipeline()
+
+    @property
+    def queueSize(self) -> int:
+        '''int: capacity of the queue in front of each stage [frames].
+
+        Frames arriving when the first queue is full are dropped.
+        Takes effect when the pipeline next starts.  Default: ``2``.
+        '''
+        return self._queueSize
+
+    @queueSize.setter
+    def queueSize(self, value: int) -> None:
+        self._queueSize = max(1, int(value))
+        self._stopPipeline()
+
+    @property
+    def queueDepths(self) -> list[tuple[str, int]]:
+        '''Frames waiting in front of each stage of the pipeline.
+
+        Lists the filters in each stage, joined by ``'+'`` for fused
+        stages, and the number of frames in its queue.  A stage whose
+        queue stays full is the bottleneck.  Empty unless
+        :attr:`pipelined` is ``True`` and frames have been processed.
+        '''
+        pipeline = self._pipeline
+        return [] if pipeline is None else pipeline.depths()
+
+    @property
+    def lock(self) -> threading.RLock:
+        '''Lock held while a frame is processed.'''
+        return self._lock
+
+    @property
+    def fused(self) -> bool:
+        '''bool: whether runs of stateless filters run as one function.
+
+        Default: ``True``.
+        '''
+        return self._fused
+
+    @fused.setter
+    def fused(self, value: bool) -> None:
+        self._fused = bool(value)
+
+    @property
+    def fusedSource(self) -> str:
+        '''Source of the functions generated for the current pipeline.
+
+        Intended for debugging.  Each fused function lists its stages
+        in comments; stages that are called directly are noted.
+        '''
+        self._compiled()
+        return self._source
 
     def __iter__(self) -> Iterator[QVideoFilter]:
         return (slot._widget for slot in self._iterSlots())
@@ -270,6 +507,101 @@ class QFilterRack(QtWidgets.QWidget):
         '''Read-only list of registered filter widgets in pipeline order.'''
         return [slot._widget for slot in self._iterSlots()]
 
+    @property
+    def camera(self) -> QCamera | None:
+        '''Camera that receives the leading ROI when :attr:`hardwareROI` is set.'''
+        return self._camera
+
+    @camera.setter
+    def camera(self, camera: QCamera | None) -> None:
+        if camera is not self._camera:
+            self._releaseROI()
+            self._releaseBinning()
+        self._camera = camera
+
+    @property
+    def hardwareROI(self) -> bool:
+        '''bool: whether the leading ROI filter crops in the camera.
+
+        Default: ``False``.  Disabling restores full-sensor frames.
+        '''
+        return self._hardwareROI
+
+    @hardwareROI.setter
+    def hardwareROI(self, value: bool) -> None:
+        self._hardwareROI = bool(value)
+        if not self._hardwareROI:
+            self._releaseROI()
+
+    @property
+    def hardwareBinning(self) -> bool:
+        '''bool: whether the leading binning filter bins in the camera.
+
+        Default: ``False``.  Disabling restores unbinned frames.
+        '''
+        return self._hardwareBinning
+
+    @hardwareBinning.setter
+    def hardwareBinning(self, value: bool) -> None:
+        self._hardwareBinning = bool(value)
+        if not self._hardwareBinning:
+            self._releaseBinning()
+
+    def _leading(self, kind: type) -> object | None:
+        '''Return the filter of the first enabled stage if it is a *kind*.'''
+        widget = next((w for w in self if w.isChecked()), None)
+        if widget is not None and isinstance(widget.filter, kind):
+            return widget.filter
+        return None
+
+    def _syncROI(self) -> None:
+        '''Queue the leading ROI for the camera once it stops changing.'''
+        roi = self._leading(ROIFilter)
+        if roi is None or self._camera is None:
+            self._releaseROI()
+            return
+        request = (roi.x, roi.y, roi.w, roi.h)
+        if roi is self._roi and request == self._pushed:
+            self._request = None
+            return
+        now = time.monotonic()
+        if (roi, request) != self._request:
+            self._request, self._since = (roi, request), now
+        if now - self._since < self.ROI_DELAY:
+            return
+        self._roi, self._pushed = roi, request
+        self._request = None
+        self._camera.queueROI(request)
+
+    def _releaseROI(self) -> None:
+        '''Restore full-sensor frames if an ROI was pushed to the camera.'''
+        self._request = None
+        if self._roi is None:
+            return
+        self._roi = self._pushed = None
+        if self._camera is not None:
+            self._camera.queueROI(None)
+
+    def _syncBinning(self) -> None:
+        '''Queue the leading binning stage for the camera when it changes.'''
+        binning = self._leading(BinningFilter)
+        if binning is None or self._camera is None:
+            self._releaseBinning()
+            return
+        request = (binning.factor, binning.mode)
+        if binning is self._binning and request == self._binned:
+            return
+        self._binning, self._binned = binning, request
+        self._camera.queueBinning(request)
+
+    def _releaseBinning(self) -> None:
+        '''Restore unbinned frames if binning was pushed to the camera.'''
+        if self._binning is None:
+            return
+        self._binning = self._binned = None
+        if self._camera is not None:
+            self._camera.queueBinning(None)
+
     @property
     def editable(self) -> bool:
         '''bool: whether the user can add, remove, or reorder filters.'''
@@ -300,12 +632,14 @@ class QFilterRack(QtWidgets.QWidget):
             raise TypeError(f'expected QVideoFilter, '
                             f'got {type(video_filter).__name__}')
         self._filter_refs.append(video_filter)
+        video_filter.filter.lock = self._lock
         slot = _FilterSlot(video_filter, self)
         slot.removeRequested.connect(self._removeSlot)
         slot.dropRequested.connect(self._moveSlot)
         slot.hoverRequested.connect(self._hoverSlot)
         slot.setEditable(self._editable)
-        self._slots.addWidget(slot)
+        with self._lock:
+            self._slots.addWidget(slot)
         self.adjustSize()
 
     @classmethod
@@ -418,9 +752,13 @@ class QFilterRack(QtWidgets.QWidget):
                 fh.write(self.exportPipeline())
 
     def _removeSlot(self, slot: '_FilterSlot') -> None:
+        self._stopPipeline()
+        self._joinRetired()
         slot._widget.filter.shutdown()
         self._filter_refs.remove(slot._widget)
-        self._slots.removeWidget(slot)
+        with self._lock:
+            self._slots.removeWidget(slot)
+        slot._widget.filter.lock = None
         slot.deleteLater()
         self.adjustSize()
 
@@ -447,8 +785,9 @@ class QFilterRack(QtWidgets.QWidget):
         if target is None or target is slot:
             return
         target_index = self._slots.indexOf(target)
-        self._slots.removeWidget(slot)
-        self._slots.insertWidget(target_index, slot)
+        with self._lock:
+            self._slots.removeWidget(slot)
+            self._slots.insertWidget(target_index, slot)
 
     def _addFilterDialog(self) -> None:
         registry = self._registry()
@@ -0,0 +1,239 @@
+'''Latest-frame mailbox that decouples slow consumers from a video source.'''
+from qtpy import QtCore
+from collections import deque
+from QVideo.lib.videotypes import Image
+from QVideo.lib.frameinfo import FrameInfo
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['QFrameMailbox']
+
+
+class QFrameMailbox(QtCore.QObject):
+
+    '''Bounded mailbox between a video source and one consumer.
+
+    A :class:`~QVideo.lib.QVideoSource.QVideoSource` emits
+    :attr:`newFrame` for every frame.  Connected across threads, each
+    emission becomes a queued event in the consumer's event loop, so a
+    consumer that cannot keep up accumulates an unbounded backlog of
+    frames: latency grows and memory balloons.
+
+    A mailbox receives frames directly in the capture thread and keeps
+    only the newest *slots* of them.  When a frame arrives and the
+    mailbox is full, the oldest frame is discarded and counted in
+    :attr:`overwritten`.  Delivery to the consumer is coalesced: at most
+    one delivery event is pending in the consumer's event loop at any
+    time, and it re-emits whatever the mailbox holds when it runs.
+
+    The mailbox mirrors the ``shape``, ``shapeChanged``, ``fps`` and
+    ``newFrame`` interface of its source, so it can be used wherever a
+    source is expected.  Delivery is therefore selectable per consumer::
+
+        source = QVideoSource(camera)
+        screen.source = source.mailbox()   # display sees the latest frame
+        dvr.source = source                # recorder sees every frame
+
+    Parameters
+    ----------
+    source : QVideoSource
+        Object with a ``newFrame`` signal and ``shape``,
+        ``shapeChanged`` and ``fps`` members.
+    slots : int
+        Number of frames the mailbox can hold.  Values less than 1 are
+        clamped to 1.  Default: ``1``.
+    parent : QObject | None
+        Parent object.  The mailbox delivers frames in the thread that
+        it lives in, normally the thread of its consumer.
+    info : bool
+        If ``True``, receive frames from the source's ``newFrameInfo``
+        signal and deliver their capture metadata through
+        :attr:`newFrameInfo`.  Default: ``False``.
+
+    Signals
+    -------
+    newFrame(Image)
+        Emitted in the mailbox's thread for each frame held by the
+        mailbox, oldest first.
+    newFrameInfo(Image, FrameInfo)
+        Emitted after :attr:`newFrame` when the mailbox was created
+        with ``info=True``.
+
+    Properties
+    ----------
+    source : QVideoSource
+        The source feeding the mailbox.
+    slots : int
+        Capacity of the mailbox.
+    shape : QSize
+        Shape of the source frames.
+    fps : float
+        Frame rate of the source [frames per second].
+    overwritten : int
+        Number of frames discarded before they were delivered.
+    delivered : int
+        Number of frames delivered through :attr:`newFrame`.
+
+    Methods
+    -------
+    post(frame) -> None
+        Store a frame.  Thread-safe.
+    postInfo(frame, info) -> None
+        Store a frame with its capture metadata.  Thread-safe.
+    take() -> list[Image]
+        Remove and return the frames currently held.
+    takeInfo() -> list[tuple[Image, FrameInfo]]
+        Remove and return the frames currently held with their metadata.
+    reset() -> None
+        Clear the mailbox and its counters.
+    close() -> None
+        Disconnect the mailbox from its source.
+    '''
+
+    #: Emitted in the mailbox's thread for each frame it delivers.
+    newFrame = QtCore.Signal(np.ndarray)
+    #: Emitted after :attr:`newFrame` with the frame's capture metadata.
+    newFrameInfo = QtCore.Signal(np.ndarray, object)
+
+    _posted = QtCore.Signal()
+
+    def __init__(self, source, slots: int = 1,
+                 parent: QtCore.QObject | None = None,
+                 info: bool = False) -> None:
+        super().__init__(parent)
+        self._mutex = QtCore.QMutex()
+        self._frames = deque(maxlen=max(1, int(slots)))
+        self._scheduled = False
+        self._overwritten = 0
+        self._delivered = 0
+        self._posted.connect(self._deliver, QtCore.Qt.QueuedConnection)
+        self._source = source
+        self.shapeChanged = source.shapeChanged
+        self._connection = ((source.newFrameInfo, self.postInfo) if info else
+                            (source.newFrame, self.post))
+        signal, slot = self._connection
+        signal.connect(slot, QtCore.Qt.DirectConnection)
+
+    @property
+    def source(self):
+        '''The source feeding the mailbox.'''
+        return self._source
+
+    @property
+    def slots(self) -> int:
+        '''Capacity of the mailbox.'''
+        return self._frames.maxlen
+
+    @property
+    def shape(self) -> QtCore.QSize:
+        '''Shape of the source frames as ``QSize(width, height)``.'''
+        return self._source.shape
+
+    @property
+    def fps(self) -> float:
+        '''Frame rate of the source [frames per second].'''
+        return self._source.fps
+
+    @property
+    def bayer(self) -> str | None:
+        '''Bayer pattern of raw frames from the source, or ``None``.
+
+        ``None`` also for sources, such as a
+        :class:`~QVideo.lib.QVideoScreen.QVideoScreen`, that emit
+        frames ready for display.
+        '''
+        return getattr(self._source, 'bayer', None)
+
+    @property
+    def overwritten(self) -> int:
+        '''Number of frames discarded before they were delivered.'''
+        return self._overwritten
+
+    @property
+    def delivered(self) -> int:
+        '''Number of frames delivered through :attr:`newFrame`.'''
+        return self._delivered
+
+    @QtCore.Slot(np.ndarray)
+    def post(self, frame: Image) -> None:
+        '''Store a frame, discarding the oldest if the mailbox is full.
+
+        Safe to call from any thread.  Schedules a delivery in the
+        mailbox's thread unless one is already pending.
+
+        Parameters
+        ----------
+        frame : Image
+            Video frame.
+        '''
+        self.postInfo(frame, None)
+
+    @QtCore.Slot(np.ndarray, object)
+    def postInfo(self, frame: Image, info: FrameInfo | None) -> None:
+        '''Store a frame with its capture metadata.
+
+        Behaves like :meth:`post`.
+
+        Parameters
+        ----------
+        frame : Image
+            Video frame.
+        info : FrameInfo or None
+            Capture metadata for *frame*.
+        '''
+        with QtCore.QMutexLocker(self._mutex):
+            if len(self._frames) == self._frames.maxlen:
+                self._overwritten += 1
+            self._frames.append((frame, info))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._posted.emit()
+
+    def take(self) -> list[Image]:
+        '''Remove and return the frames currently held, oldest first.
+
+        Consumers that poll rather than listen to :attr:`newFrame` can
+        call this from any thread.
+        '''
+        return [frame for frame, _ in self.takeInfo()]
+
+    def takeInfo(self) -> list[tuple[Image, FrameInfo | None]]:
+        '''Remove and return the held frames with their metadata.
+
+        Metadata is ``None`` for frames stored with :meth:`post`.
+        '''
+        with QtCore.QMutexLocker(self._mutex):
+            items = list(self._frames)
+            self._frames.clear()
+            self._scheduled = False
+        return items
+
+    @QtCore.Slot()
+    def _deliver(self) -> None:
+        for frame, info in self.takeInfo():
+            self._delivered += 1
+            self.newFrame.emit(frame)
+            if info is not None:
+                self.newFrameInfo.emit(frame, info)
+
+    @QtCore.Slot()
+    def reset(self) -> None:
+        '''Discard held frames and zero the counters.'''
+        with QtCore.QMutexLocker(self._mutex):
+            self._frames.clear()
+            self._overwritten = 0
+        self._delivered = 0
+
+    @QtCore.Slot()
+    def close(self) -> None:
+        '''Disconnect the mailbox from its source and discard held frames.'''
+        signal, slot = self._connection
+        try:
+            signal.disconnect(slot)
+        except (TypeError, RuntimeError):
+            pass
+        self.reset()
@@ -1,6 +1,7 @@
 '''Live pixel-intensity histogram widget.'''
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from QVideo.lib.videotypes import full_scale
 import pyqtgraph as pg
 
 if TYPE_CHECKING:
@@ -19,8 +20,9 @@ class QHistogramWidget(pg.HistogramLUTWidget):
     :class:`~pyqtgraph.ImageItem`\'s ``sigImageChanged`` signal.
     The draggable level handles let the user set the minimum and
     maximum intensity values mapped to the display range; those
-    levels are fed back to the connected
-    :class:`~pyqtgraph.ImageItem` immediately.
+    levels become the :attr:`~QVideo.lib.QVideoScreen.QVideoScreen.levels`
+    of the connected screen immediately.  The handles start at the
+    screen's levels, or at the full range of the displayed pixel type.
 
     Parameters
     ----------
@@ -54,6 +56,16 @@ class QHistogramWidget(pg.HistogramLUTWidget):
 
     @screen.setter
     def screen(self, screen: 'QVideoScreen') -> None:
+        if self._screen is not None:
+            self.item.sigLevelsChanged.disconnect(self._setScreenLevels)
         self._screen = screen
         self.setImageItem(screen.image)
-        self.setLevels(0, 255)
+        levels = screen.levels
+        if levels is None:
+            image = screen.image.image
+            levels = (0, 255 if image is None else full_scale(image.dtype))
+        self.setLevels(*levels)
+        self.item.sigLevelsChanged.connect(self._setScreenLevels)
+
+    def _setScreenLevels(self, _item: object) -> None:
+        self._screen.levels = tuple(self.getLevels())
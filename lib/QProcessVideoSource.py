@@ -0,0 +1,353 @@
+'''Video source that runs a camera in a child process.'''
+from qtpy import QtCore
+from functools import partial
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from QVideo.lib.QCamera import QCamera
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.videotypes import Image
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['QProcessCamera', 'QProcessVideoSource']
+
+
+_META = (bool, int, float, str, list, tuple, type(None))
+
+
+def _describe(camera: QCamera) -> dict[str, object]:
+    '''Summarize the properties and methods of *camera* for the parent.'''
+    properties = {}
+    for name, spec in camera._properties.items():
+        meta = {key: value for key, value in spec.items()
+                if key not in ('getter', 'setter', 'ptype') and
+                isinstance(value, _META)}
+        properties[name] = dict(ptype=spec['ptype'],
+                                readonly=spec['setter'] is None,
+                                meta=meta)
+    return dict(name=camera.name,
+                model_name=camera.model_name,
+                properties=properties,
+                methods=camera.methods)
+
+
+def _ring(memory: SharedMemory, slots: int,
+          shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    '''Return an array view of *slots* frames in shared *memory*.'''
+    return np.ndarray((slots, *shape), dtype=dtype, buffer=memory.buf)
+
+
+def _command(camera: QCamera, request: tuple) -> tuple[str, object]:
+    '''Apply one proxied ``set``, ``get`` or ``execute`` request.'''
+    kind, key, *args = request
+    try:
+        if kind == 'set':
+            camera.set(key, *args)
+            return 'ok', None
+        if kind == 'get':
+            return 'ok', camera.get(key)
+        camera.execute(key)
+        return 'ok', None
+    except Exception as ex:
+        return 'error', f'{kind} {key!r} failed: {ex}'
+
+
+def _serve(cameraClass: type[QCamera], args: tuple, kwargs: dict,
+           control, frames, free, stop, slots: int) -> None:
+    '''Child-process main loop: capture frames into the shared ring.
+
+    Frames are written into consecutive slots of a shared-memory ring
+    and announced on *frames*.  The *free* semaphore counts slots that
+    the parent has finished copying, so the child never overwrites a
+    frame that has not been delivered.  Requests on *control* are
+    answered between frames.  A new ring is announced whenever the
+    frame shape or dtype changes.
+    '''
+    try:
+        camera = cameraClass(*args, **kwargs)
+    except Exception as ex:
+        frames.send(('error', str(ex)))
+        return
+    if not camera.isOpen():
+        frames.send(('error', 'initialization failed'))
+        return
+    frames.send(('ready', _describe(camera)))
+    memory, view, fmt, index = None, None, None, 0
+    try:
+        while not stop.is_set():
+            while control.poll():
+                control.send(_command(camera, control.recv()))
+            if not free.acquire(timeout=0.05):
+                continue
+            ok, frame = camera.saferead()
+            if not ok:
+                free.release()
+                continue
+            if (frame.shape, frame.dtype) != fmt:
+                fmt = (frame.shape, frame.dtype)
+                old, view = memory, None
+                memory = SharedMemory(create=True,
+                                      size=max(1, slots * frame.nbytes))
+                view = _ring(memory, slots, *fmt)
+                frames.send(('ring', memory.name, frame.shape,
+                             frame.dtype.str, slots))
+                if old is not None:
+                    old.close()
+                    old.unlink()
+            np.copyto(view[index], frame)
+            frames.send(('frame', index, camera.frameMetadata(),
+                         camera.bayer))
+            index = (index + 1) % slots
+    except (BrokenPipeError, EOFError, OSError):
+        pass
+    finally:
+        view = None
+        camera.close()
+        if memory is not None:
+            memory.close()
+            memory.unlink()
+
+
+class QProcessCamera(QCamera):
+
+    '''Proxy for a camera that runs in a child process.
+
+    The camera class is instantiated in a child process started with
+    the ``spawn`` method, so that capture does not compete with the
+    GUI, filters and analysis workers for the parent's GIL.  Frames
+    are passed through a ring of *slots* frames in
+    :mod:`multiprocessing.shared_memory` and copied out by
+    :meth:`read` or :meth:`read_into`.  The properties and methods of
+    the remote camera are registered on the proxy and forwarded over
+    a pipe, so :meth:`~QVideo.lib.QCamera.QCamera.set`,
+    :meth:`~QVideo.lib.QCamera.QCamera.get`,
+    :meth:`~QVideo.lib.QCamera.QCamera.execute` and
+    :class:`~QVideo.lib.QCameraTree.QCameraTree` work unchanged.
+
+    Parameters
+    ----------
+    camera : type[QCamera]
+        Camera class to run in the child process.  It must be
+        importable by the child, i.e. defined at module level.
+    *args :
+        Positional arguments for the camera constructor.
+    slots : int
+        Number of frames in the shared-memory ring.  Default: ``4``.
+    timeout : float
+        Time to wait for the child process to start or to answer a
+        property request [s].  Default: ``10``.
+    **kwargs :
+        Keyword arguments for the camera constructor.  Arguments must
+        be picklable.
+
+    Notes
+    -----
+    The child stops capturing when every slot holds a frame that the
+    parent has not yet read, so a paused source does not consume CPU
+    in the child.
+    '''
+
+    def __init__(self, camera: type[QCamera], *args,
+                 slots: int = 4,
+                 timeout: float = 10.,
+                 **kwargs) -> None:
+        super().__init__()
+        self._cameraClass = camera
+        self._args = args
+        self._kwargs = kwargs
+        self._slots = max(1, int(slots))
+        self._timeout = float(timeout)
+        self._controlMutex = QtCore.QMutex()
+        self._process = None
+        self._memory = None
+        self._view = None
+        self._format = None
+        self.open()
+
+    @property
+    def slots(self) -> int:
+        '''Number of frames in the shared-memory ring.'''
+        return self._slots
+
+    @property
+    def process(self):
+        '''The child :class:`multiprocessing.Process`, or ``None``.'''
+        return self._process
+
+    def _initialize(self) -> bool:
+        context = get_context('spawn')
+        self._control, control = context.Pipe()
+        self._frames, frames = context.Pipe(duplex=False)
+        self._free = context.Semaphore(self._slots)
+        self._stop = context.Event()
+        self._process = context.Process(
+            target=_serve,
+            args=(self._cameraClass, self._args, self._kwargs,
+                  control, frames, self._free, self._stop, self._slots),
+            name=f'{self._cameraClass.__name__}Process',
+            daemon=True)
+        self._process.start()
+        control.close()
+        frames.close()
+        message = None
+        if self._frames.poll(self._timeout):
+            message = self._receive()
+        if message is None or message[0] != 'ready':
+            error = 'no response' if message is None else message[1]
+            logger.warning(f'Could not start {self._cameraClass.__name__}: '
+                           f'{error}')
+            self._shutdown()
+            return False
+        self._register(message[1])
+        return True
+
+    def _register(self, description: dict[str, object]) -> None:
+        '''Register proxies for the remote properties and methods.'''
+        self._modelName = description['model_name'] or description['name']
+        for name, spec in description['properties'].items():
+            getter = partial(self._request, 'get', name)
+            setter = (None if spec['readonly'] else
+                      partial(self._request, 'set', name))
+            self.registerProperty(name, getter, setter,
+                                  ptype=spec['ptype'], **spec['meta'])
+        for name in description['methods']:
+            self.registerMethod(name, partial(self._request, 'execute', name))
+
+    def _deinitialize(self) -> None:
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        '''Stop the child process and release the ring.'''
+        self._stop.set()
+        self._process.join(self._timeout)
+        if self._process.is_alive():
+            logger.warning('Terminating unresponsive camera process')
+            self._process.terminate()
+            self._process.join()
+        self._detach()
+        self._control.close()
+        self._frames.close()
+
+    def _receive(self) -> tuple | None:
+        try:
+            return self._frames.recv()
+        except (EOFError, OSError):
+            return None
+
+    def _request(self, *request) -> QCamera.PropertyValue | None:
+        '''Send a request to the child and return its answer.'''
+        with QtCore.QMutexLocker(self._controlMutex):
+            if not (self._process and self._process.is_alive()):
+                return None
+            try:
+                self._control.send(request)
+                if not self._control.poll(self._timeout):
+                    logger.warning(f'No response to {request[0]} '
+                                   f'{request[1]!r}')
+                    return None
+                status, value = self._control.recv()
+            except (EOFError, OSError) as ex:
+                logger.warning(f'Camera process is not responding: {ex}')
+                return None
+        if status == 'error':
+            logger.warning(value)
+            return None
+        return value
+
+    def _attach(self, name: str, shape: tuple[int, ...],
+                dtype: str, slots: int) -> None:
+        '''Map the ring announced by the child.'''
+        self._detach()
+        self._memory = SharedMemory(name=name)
+        self._view = _ring(self._memory, slots, shape, np.dtype(dtype))
+        if shape[:2] != self._format:
+            self._format = shape[:2]
+            self.shapeChanged.emit(QtCore.QSize(shape[1], shape[0]))
+
+    def _detach(self) -> None:
+        self._view = None
+        if self._memory is not None:
+            self._memory.close()
+            if not (self._process and self._process.is_alive()):
+                # A child that died cannot unlink the ring itself
+                try:
+                    self._memory.unlink()
+                except FileNotFoundError:
+                    pass
+            self._memory = None
+
+    def _lost(self) -> None:
+        '''Close the camera after its process has exited.'''
+        self._process.join(self._timeout)
+        logger.warning(f'{self._cameraClass.__name__} process exited '
+                       f'with code {self._process.exitcode}')
+        self.close()
+
+    def read(self) -> QCamera.CameraData:
+        '''Copy the next frame out of the ring into a new array.'''
+        return self._next(None)
+
+    def read_into(self, out: Image) -> QCamera.CameraData:
+        '''Copy the next frame out of the ring into *out*.'''
+        return self._next(out)
+
+    def _next(self, out: Image | None) -> QCamera.CameraData:
+        while self.isOpen() and self._frames.poll(1.):
+            message = self._receive()
+            if message is None:
+                self._lost()
+                break
+            if message[0] not in ('ring', 'frame'):
+                break
+            if message[0] == 'ring':
+                self._attach(*message[1:])
+                continue
+            _, index, self._frameMetadata, self._bayer = message
+            frame = self._view[index]
+            if (out is not None and out.shape == frame.shape and
+                    out.dtype == frame.dtype):
+                np.copyto(out, frame)
+                frame = out
+            else:
+                frame = frame.copy()
+            self._free.release()
+            return True, frame
+        if self.isOpen() and not self._process.is_alive():
+            self._lost()
+        return False, None
+
+
+class QProcessVideoSource(QVideoSource):
+
+    '''Threaded video source for a camera running in a child process.
+
+    Has the same interface as
+    :class:`~QVideo.lib.QVideoSource.QVideoSource`, so it can be
+    connected to :class:`~QVideo.lib.QVideoScreen.QVideoScreen`,
+    :class:`~QVideo.dvr.QDVRWidget.QDVRWidget` and
+    :class:`~QVideo.lib.QCameraTree.QCameraTree` unchanged.
+
+    Parameters
+    ----------
+    camera : type[QCamera] or QProcessCamera
+        Camera class to run in a child process, or an existing
+        :class:`QProcessCamera`.
+    *args :
+        Forwarded to :class:`QProcessCamera`.
+    **kwargs :
+        Forwarded to :class:`QProcessCamera`.
+
+    Examples
+    --------
+    >>> from QVideo.cameras.Noise import QNoiseCamera
+    >>> source = QProcessVideoSource(QNoiseCamera, fps=60).start()
+    '''
+
+    def __init__(self, camera: type[QCamera] | QProcessCamera,
+                 *args, **kwargs) -> None:
+        if not isinstance(camera, QProcessCamera):
+            camera = QProcessCamera(camera, *args, **kwargs)
+        super().__init__(camera)
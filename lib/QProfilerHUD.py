@@ -0,0 +1,83 @@
+'''On-screen display of per-stage latency statistics.'''
+from qtpy import QtCore, QtGui
+from QVideo.lib.instrumentation import Profiler, profiler
+import pyqtgraph as pg
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['QProfilerHUD']
+
+
+class QProfilerHUD(pg.TextItem):
+
+    '''Heads-up display of :meth:`Profiler.report` over a video view.
+
+    A text item that ignores the view's scaling, so it stays legible at
+    any zoom.  The table is refreshed from a timer rather than on every
+    frame, so the display itself adds no per-frame cost.  Usually
+    created by setting
+    :attr:`~QVideo.lib.QVideoScreen.QVideoScreen.profiling`.
+
+    Parameters
+    ----------
+    source : Profiler
+        Profiler to display.  Default: the shared
+        :data:`~QVideo.lib.instrumentation.profiler`.
+    interval : int
+        Refresh interval [ms].  Default: ``500``.
+
+    Slots
+    -----
+    start() -> None
+        Begin periodic refreshes.
+    stop() -> None
+        Stop periodic refreshes.
+    refresh() -> None
+        Update the displayed table now.
+    '''
+
+    def __init__(self,
+                 source: Profiler = profiler,
+                 interval: int = 500) -> None:
+        super().__init__(anchor=(0, 0), color=(255, 255, 0),
+                         fill=pg.mkBrush(0, 0, 0, 160))
+        self._profiler = source
+        font = QtGui.QFontDatabase.systemFont(
+            QtGui.QFontDatabase.SystemFont.FixedFont)
+        self.setFont(font)
+        self.setZValue(100)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(int(interval))
+        self._timer.timeout.connect(self.refresh)
+
+    @property
+    def interval(self) -> int:
+        '''Refresh interval [ms].'''
+        return self._timer.interval()
+
+    @interval.setter
+    def interval(self, interval: int) -> None:
+        self._timer.setInterval(int(interval))
+
+    @QtCore.Slot()
+    def start(self) -> None:
+        '''Refresh the display now and then every :attr:`interval` ms.'''
+        self.refresh()
+        self._timer.start()
+
+    @QtCore.Slot()
+    def stop(self) -> None:
+        '''Stop refreshing the display.'''
+        self._timer.stop()
+
+    @QtCore.Slot()
+    def refresh(self) -> None:
+        '''Update the displayed table from the profiler.'''
+        if not self._profiler.enabled:
+            self.setText('profiling disabled')
+        elif not self._profiler.stages():
+            self.setText('waiting for frames')
+        else:
+            self.setText(self._profiler.report())
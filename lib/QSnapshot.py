@@ -1,6 +1,6 @@
 '''Still-frame capture from a live video stream.'''
 from qtpy import QtCore, QtGui, QtWidgets
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, DTYPES, rescale
 from pathlib import Path
 import numpy as np
 import datetime
@@ -105,15 +105,23 @@ class QSnapshot(QtCore.QObject):
         Parameters
         ----------
         frame : Image
-            Frame to save.  Must be uint8.
+            Frame to save.  Grayscale ``uint16`` frames are saved at
+            16 bits, which PNG and TIFF preserve; other frames are
+            saved at 8 bits.
         filename : str
             Destination path.  The file format is inferred from the extension.
         '''
-        if frame.dtype != np.uint8:
-            logger.warning(f'_save: unsupported dtype {frame.dtype}; '
-                           'expected uint8')
+        if frame.dtype not in DTYPES:
+            logger.warning(f'_save: unsupported dtype {frame.dtype}')
             return
-        frame = np.ascontiguousarray(frame)
+        if frame.dtype == np.uint16 and frame.ndim == 2:
+            frame = np.ascontiguousarray(frame)
+            h, w = frame.shape
+            img = QtGui.QImage(frame.tobytes(), w, h, 2 * w,
+                               _Fmt.Format_Grayscale16)
+            self._write(img, filename)
+            return
+        frame = np.ascontiguousarray(rescale(frame, np.uint8))
         if frame.ndim == 2:
             h, w = frame.shape
             img = QtGui.QImage(frame.tobytes(), w, h, w,
@@ -129,6 +137,9 @@ class QSnapshot(QtCore.QObject):
         else:
             logger.warning(f'_save: unsupported frame shape {frame.shape}')
             return
+        self._write(img, filename)
+
+    def _write(self, img: QtGui.QImage, filename: str) -> None:
         if not img.save(filename):
             logger.warning(f'_save: failed to save {filename!r}')
         else:
@@ -1,14 +1,20 @@
 '''Base classes for image-processing filters in the QVideo filter pipeline.'''
 from __future__ import annotations
 import dataclasses
+import threading
+from contextlib import AbstractContextManager, nullcontext
 from qtpy import QtCore, QtWidgets
-from QVideo.lib.videotypes import Image
+from QVideo.lib.videotypes import Image, DTYPES, rescale
 import pyqtgraph as pg
 
 
 __all__ = ['FilterCode', 'VideoFilter', 'QVideoFilter']
 
 
+#: Guards the deferred assignments of every :class:`VideoFilter`.
+_deferredLock = threading.Lock()
+
+
 @dataclasses.dataclass
 class FilterCode:
     '''Code fragment emitted by a filter's :meth:`~VideoFilter.to_code` method.
@@ -31,6 +37,10 @@ class FilterCode:
     comment: str = ''
 
 
+#: Attributes that are always assigned immediately.
+_IMMEDIATE = frozenset({'lock', '_lock', '_deferred'})
+
+
 class VideoFilter(QtCore.QObject):
 
     '''Base class for video filters.
@@ -42,12 +52,117 @@ class VideoFilter(QtCore.QObject):
 
     The :meth:`__call__` operator chains :meth:`add` and :meth:`get`
     so that filters can be used as plain callables.
+
+    A pipeline that may run in a worker thread shares its :attr:`lock`
+    with its filters and holds it while it processes a frame.  An
+    attribute assigned while another thread holds the lock does not
+    wait for it: the assignment is recorded and applied by
+    :meth:`applyPending` when the filter next receives a frame, so
+    parameter changes made from the GUI thread never block it and
+    still take effect between frames.  Until then the attribute keeps
+    its old value, and :meth:`isPending` reports the assignment to the
+    thread that made it.  Methods that must change several attributes
+    without a frame in between, or read back a value that a property
+    has validated, should run inside :meth:`locked`, which does wait
+    for the lock.
+
+    Class Attributes
+    ----------------
+    dtypes : tuple
+        Pixel types that the filter processes natively, preferred type
+        first.  Frames of any other type are converted to the preferred
+        type by :meth:`conform` before they reach :meth:`add`.  The
+        default accepts every type in
+        :data:`~QVideo.lib.videotypes.DTYPES`, so that 16-bit and
+        floating-point frames pass through without conversion; filters
+        built on 8-bit-only algorithms declare ``(np.uint8,)``.
     '''
 
+    dtypes: tuple[type, ...] = DTYPES
+
+    _lock: threading.RLock | None = None
+    _deferred: dict[str, tuple[object, int]] | None = None
+
     def __init__(self) -> None:
         super().__init__()
         self.data: Image | None = None
 
+    def __setattr__(self, name: str, value: object) -> None:
+        lock = self._lock
+        if lock is None or name in _IMMEDIATE:
+            object.__setattr__(self, name, value)
+        elif lock.acquire(blocking=False):
+            try:
+                if self._deferred:
+                    self.applyPending()
+                object.__setattr__(self, name, value)
+            finally:
+                lock.release()
+        else:
+            with _deferredLock:
+                if self._deferred is None:
+                    self._deferred = {}
+                self._deferred[name] = (value, threading.get_ident())
+
+    def applyPending(self) -> None:
+        '''Apply assignments deferred while a frame was processed.
+
+        Called with each frame before :meth:`add`, and by pipelines
+        that call :meth:`add` directly.  Properties run their setters
+        here, in the order in which they were first assigned.
+        '''
+        if not self._deferred:
+            return
+        with _deferredLock:
+            deferred, self._deferred = self._deferred, None
+        for name, (value, _) in deferred.items():
+            object.__setattr__(self, name, value)
+
+    def isPending(self, name: str) -> bool:
+        '''Return ``True`` if this thread's assignment to *name* waits.
+
+        Widgets use this to keep showing the value they assigned
+        rather than reading back the old one.
+        '''
+        entry = (self._deferred or {}).get(name)
+        return entry is not None and entry[1] == threading.get_ident()
+
+    @property
+    def lock(self) -> threading.RLock | None:
+        '''Lock held by the pipeline while it processes a frame.
+
+        ``None`` (default) for filters that are not part of a pipeline.
+        '''
+        return self._lock
+
+    @lock.setter
+    def lock(self, lock: threading.RLock | None) -> None:
+        self._lock = lock
+        self.applyPending()
+
+    @property
+    def halo(self) -> int | None:
+        '''Radius of the window that determines each output pixel [pixels].
+
+        Spatially local filters report the radius of their kernel so
+        that :func:`~QVideo.lib.tiling.tiled` can process large frames
+        in concurrent tiles.  ``None`` (default) for filters whose
+        output pixels may depend on the whole frame.
+        '''
+        return None
+
+    def locked(self) -> AbstractContextManager:
+        '''Return a context that holds :attr:`lock`, if there is one.
+
+        Waits for a frame in progress to finish.  Use to apply
+        several changes together::
+
+            with video_filter.locked():
+                video_filter.order = 2
+                video_filter.reset()
+        '''
+        return nullcontext() if self._lock is None else self._lock
+
     def __call__(self, data: Image) -> Image | None:
         '''Apply the filter to *data* and return the result.
 
@@ -61,9 +176,32 @@ class VideoFilter(QtCore.QObject):
         Image or None
             Filtered frame, or ``None`` if no result is available yet.
         '''
-        self.add(data)
+        if self._deferred:
+            self.applyPending()
+        self.add(self.conform(data))
         return self.get()
 
+    def conform(self, data: Image) -> Image:
+        '''Return *data* in a pixel type that this filter accepts.
+
+        Frames whose type is listed in :attr:`dtypes` are returned
+        unchanged.  Others are rescaled to the preferred type, so that
+        full scale in maps to full scale out.
+
+        Parameters
+        ----------
+        data : Image
+            Input frame.
+
+        Returns
+        -------
+        Image
+            *data*, converted if necessary.
+        '''
+        if data.dtype in self.dtypes:
+            return data
+        return rescale(data, self.dtypes[0])
+
     def add(self, data: Image) -> None:
         '''Incorporate a new frame into the filter state.
 
@@ -172,6 +310,7 @@ class QVideoFilter(QtWidgets.QGroupBox):
         if not isinstance(videoFilter, VideoFilter):
             raise TypeError(
                 f'expected VideoFilter, got {type(videoFilter).__name__}')
+        videoFilter.lock = self._filter.lock
         self._filter = videoFilter
 
     def __call__(self, image: Image) -> Image | None:
@@ -208,6 +347,17 @@ class QVideoFilter(QtWidgets.QGroupBox):
         connect their own signals.
         '''
 
+    def _showAccepted(self, box: QtWidgets.QWidget, name: str) -> None:
+        '''Show in *box* the value that the filter accepted for *name*.
+
+        Leaves *box* showing the value it holds while the assignment
+        waits for the frame in progress.
+        '''
+        if self.filter.isPending(name):
+            return
+        with QtCore.QSignalBlocker(box):
+            box.setValue(getattr(self.filter, name))
+
     @classmethod
     def example(cls: type['QVideoFilter']) -> None:  # pragma: no cover
         '''Demonstrate the filter widget.
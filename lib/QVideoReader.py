@@ -62,6 +62,7 @@ class QVideoReader(QtCore.QObject, metaclass=QVideoReaderMeta):
         super().__init__()
         self.filename = filename
         self._isopen = False
+        self._bayer: str | None = None
         self.open()
 
     def __enter__(self) -> 'QVideoReader':
@@ -181,6 +182,15 @@ class QVideoReader(QtCore.QObject, metaclass=QVideoReaderMeta):
         '''Frame dimensions as ``QSize(width, height)``.'''
         return QtCore.QSize(int(self.width), int(self.height))
 
+    @property
+    def bayer(self) -> str | None:
+        '''Bayer pattern of recorded raw frames, or ``None``.
+
+        See :attr:`~QVideo.lib.QCamera.QCamera.bayer`.  Set by
+        subclasses whose file format records the pattern.
+        '''
+        return self._bayer
+
     @QtCore.Slot(int)
     @abstractmethod
     def seek(self, framenumber: int) -> None:
@@ -1,8 +1,13 @@
 '''Live video display widget with mouse-aware graphical overlay support.'''
+import weakref
+from functools import partial
 from qtpy import QtCore, QtGui, QtWidgets
 from QVideo.lib.QVideoSource import QVideoSource
 from QVideo.lib.QFilterBank import QFilterBank
-from QVideo.lib.videotypes import Image
+from QVideo.lib.QProfilerHUD import QProfilerHUD
+from QVideo.lib.instrumentation import profiler
+from QVideo.lib.videotypes import Image, full_scale
+from QVideo.lib.bayer import demosaic
 import numpy as np
 import pyqtgraph as pg
 from pyqtgraph import GraphicsLayoutWidget, ImageItem
@@ -14,6 +19,64 @@ logger = logging.getLogger(__name__)
 __all__ = ['QVideoScreen']
 
 
+def _stopThread(thread: QtCore.QThread) -> None:
+    '''Stop *thread* and wait for it to finish.'''
+    thread.quit()
+    thread.wait()
+
+
+class _FilterWorker(QtCore.QObject):
+    '''Prepares frames for display in a background thread.
+
+    Holds one frame awaiting processing and one finished frame
+    awaiting display.  A newer frame replaces an older one in either
+    place, so neither the worker nor the GUI ever falls behind the
+    source.  Holds a weak reference to the screen for the reason
+    explained in :class:`~QVideo.lib.AsyncVideoFilter._AsyncWorker`.
+    '''
+
+    #: Emitted when a finished frame is ready to :meth:`take`.
+    finished = QtCore.Signal()
+
+    _posted = QtCore.Signal()
+
+    def __init__(self, screen: 'weakref.ref[QVideoScreen]') -> None:
+        super().__init__()
+        self._ref = screen
+        self._mutex = QtCore.QMutex()
+        self._frame: Image | None = None
+        self._result: tuple[Image, int] | None = None
+        self._posted.connect(self._run, QtCore.Qt.QueuedConnection)
+
+    def post(self, frame: Image) -> None:
+        '''Replace the frame awaiting processing.  Thread-safe.'''
+        with QtCore.QMutexLocker(self._mutex):
+            idle = self._frame is None
+            self._frame = frame
+        if idle:
+            self._posted.emit()
+
+    def take(self) -> tuple[Image, int] | None:
+        '''Remove and return the finished frame and its display scale.'''
+        with QtCore.QMutexLocker(self._mutex):
+            result, self._result = self._result, None
+        return result
+
+    @QtCore.Slot()
+    def _run(self) -> None:
+        with QtCore.QMutexLocker(self._mutex):
+            frame, self._frame = self._frame, None
+        screen = self._ref()
+        if frame is None or screen is None:
+            return
+        result = screen._process(frame)
+        with QtCore.QMutexLocker(self._mutex):
+            idle = self._result is None
+            self._result = result
+        if idle:
+            self.finished.emit()
+
+
 class QVideoScreen(GraphicsLayoutWidget):
 
     '''Video display widget.
@@ -22,6 +85,12 @@ class QVideoScreen(GraphicsLayoutWidget):
     with optional frame-rate throttling and image filtering via
     :class:`~QVideo.lib.QFilterBank`.
 
+    Raw Bayer frames from sources that report a
+    :attr:`~QVideo.lib.QVideoSource.QVideoSource.bayer` pattern are
+    demosaiced here, before filtering, so that recorders connected to
+    the source store the raw mosaic and only displayed frames are
+    interpolated.
+
     Inherits from :class:`pyqtgraph.GraphicsLayoutWidget`.
 
     Parameters
@@ -51,12 +120,28 @@ class QVideoScreen(GraphicsLayoutWidget):
         :attr:`newFrame` carries the filtered video frame.  When ``True``,
         it carries the rendered ViewBox scene (video + overlays) as an
         ``(H, W, 4)`` RGBA uint8 array.
+    profiling : bool
+        Display per-stage latency statistics over the video.
     colormap : str | None
         Colormap name for false-color display of grayscale frames.
         Accepts any matplotlib colormap name (e.g. ``'inferno'``,
         ``'viridis'``) or a pyqtgraph built-in name.
         Set to ``None`` (default) to display in grayscale.
         Has no effect on color (3-channel) frames.
+    levels : tuple[float, float] | None
+        Pixel values displayed as black and white.  ``None`` (default)
+        spans the full range of each frame's pixel type: ``0``–``255``
+        for ``uint8``, ``0``–``65535`` for ``uint16`` and ``0``–``1``
+        for ``float32``.  See also :meth:`autoLevels`.
+    halfResolution : bool
+        Demosaic raw Bayer frames at half resolution, which is much
+        faster than full interpolation.  The half-size image still
+        fills the view, so overlays keep sensor coordinates.
+        Default: ``False``.
+    threaded : bool
+        Demosaic and filter frames in a background thread, so that slow
+        filters do not stall painting and user interaction.
+        Default: ``False``.
 
     Signals
     -------
@@ -75,12 +160,18 @@ class QVideoScreen(GraphicsLayoutWidget):
         super().__init__(*args, size=size, **kwargs)
         self.framerate = framerate
         self._colormap: str | None = None
+        self._levels: tuple[float, float] | None = None
+        self._halfResolution = False
+        self._scale = 1
+        self._worker: _FilterWorker | None = None
+        self._thread: QtCore.QThread | None = None
         self._ready = True
         self._pending: Image | None = None
         self._overlays: list[object] = []
         self._composite = False
         self._videoShape: QtCore.QSize | None = None
         self._source: QVideoSource | None = None
+        self._hud: QProfilerHUD | None = None
         self._timer = QtCore.QTimer(self)
         self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._setready)
@@ -158,6 +249,149 @@ class QVideoScreen(GraphicsLayoutWidget):
             cm = pg.colormap.get(name)
         self.image.setColorMap(cm)
 
+    @property
+    def levels(self) -> tuple[float, float] | None:
+        '''Pixel values displayed as black and white.
+
+        ``None`` maps the full range of the pixel type of each frame
+        onto the display, so that 16-bit and floating-point frames
+        appear with the same brightness as 8-bit frames.  pyqtgraph
+        maps integer frames through a look-up table, so level mapping
+        costs little even for 16-bit frames.
+        '''
+        return self._levels
+
+    @levels.setter
+    def levels(self, levels: tuple[float, float] | None) -> None:
+        if levels is not None:
+            low, high = map(float, levels)
+            if not high > low:
+                raise ValueError(f'levels must increase, got {levels}')
+            levels = (low, high)
+        self._levels = levels
+        if self.image.image is not None:
+            self.image.setLevels(self._displayLevels(self.image.image))
+
+    def autoLevels(self, low: float = 0.1, high: float = 99.9) -> None:
+        '''Set :attr:`levels` from the range of the displayed frame.
+
+        The levels are computed once and then held fixed, so that the
+        brightness of the display does not fluctuate from frame to frame.
+        Set :attr:`levels` to ``None`` to restore full-range display.
+
+        Parameters
+        ----------
+        low : float
+            Percentile of the pixel values displayed as black.
+            Default: ``0.1``.
+        high : float
+            Percentile of the pixel values displayed as white.
+            Default: ``99.9``.
+        '''
+        image = self.image.image
+        if image is None:
+            return
+        vmin, vmax = np.percentile(image, (low, high))
+        if vmax > vmin:
+            self.levels = (vmin, vmax)
+
+    @property
+    def halfResolution(self) -> bool:
+        '''Demosaic raw Bayer frames at half resolution.'''
+        return self._halfResolution
+
+    @halfResolution.setter
+    def halfResolution(self, half: bool) -> None:
+        self._halfResolution = bool(half)
+
+    @property
+    def threaded(self) -> bool:
+        '''Prepare frames for display in a background thread.
+
+        When ``True``, demosaicing and :attr:`filter` run in a
+        dedicated worker thread and the GUI thread only displays the
+        finished frames.  The worker processes the most recent frame
+        that has arrived and the display shows the most recent frame
+        that the worker has finished, so slow filters lower the display
+        rate without adding latency.  Filter banks and racks hold their
+        lock while they process a frame, so parameter changes made
+        through the filter widgets take effect between frames.  The
+        worker stops when the screen is destroyed.
+        '''
+        return self._thread is not None
+
+    @threaded.setter
+    def threaded(self, threaded: bool) -> None:
+        if bool(threaded) == self.threaded:
+            return
+        if threaded:
+            self._worker = _FilterWorker(weakref.ref(self))
+            self._worker.finished.connect(self._deliver)
+            self._thread = QtCore.QThread()
+            self._worker.moveToThread(self._thread)
+            self._thread.start()
+            # Bound to the thread rather than to the screen, whose
+            # wrapper may already be gone when destroyed is emitted.
+            self._destroyed = self.destroyed.connect(
+                partial(_stopThread, self._thread))
+            app = QtCore.QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._stopWorker)
+        else:
+            self._stopWorker()
+
+    @QtCore.Slot()
+    def _stopWorker(self) -> None:
+        if self._thread is None:
+            return
+        _stopThread(self._thread)
+        self.destroyed.disconnect(self._destroyed)
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.disconnect(self._stopWorker)
+        self._worker.finished.disconnect(self._deliver)
+        self._worker = None
+        self._thread = None
+
+    def _demosaic(self, image: Image) -> tuple[Image, int]:
+        '''Interpolate color if *image* is a raw Bayer mosaic.
+
+        Returns the frame and the factor by which it must be scaled to
+        fill the view.
+        '''
+        bayer = getattr(self._source, 'bayer', None)
+        if bayer is None or image.ndim != 2:
+            return image, 1
+        image = demosaic(image, bayer, self._halfResolution)
+        return image, 2 if self._halfResolution else 1
+
+    def _process(self, image: Image) -> tuple[Image, int]:
+        '''Demosaic and filter *image*, returning it with its scale.'''
+        image, scale = self._demosaic(image)
+        return self.filter(image), scale
+
+    def _setScale(self, scale: int) -> None:
+        if scale != self._scale:
+            self._scale = scale
+            self.image.setTransform(QtGui.QTransform.fromScale(scale, scale))
+
+    def _displayLevels(self, image: Image) -> tuple[float, float] | None:
+        if self._levels is not None:
+            return self._levels
+        if image.dtype == np.uint8:
+            return None
+        return (0., full_scale(image.dtype))
+
+    def _show(self, image: Image) -> None:
+        levels = self._displayLevels(image)
+        if levels is None:
+            # uint8 frames index the display directly without scaling.
+            if self.image.levels is not None:
+                self.image.setLevels(None, update=False)
+            self.image.setImage(image, autoLevels=False)
+        else:
+            self.image.setImage(image, autoLevels=False, levels=levels)
+
     def _setready(self) -> None:
         self._ready = True
         if self._pending is not None:
@@ -167,13 +401,16 @@ class QVideoScreen(GraphicsLayoutWidget):
     def setImage(self, image: Image) -> None:
         '''Display a new video frame and emit :attr:`newFrame`.
 
-        Passes the frame through :attr:`filter` before display.  If the
+        Demosaics raw Bayer frames and passes the frame through
+        :attr:`filter` before display.  If the
         throttle interval has not yet elapsed, the frame is buffered as the
         most recent pending frame; when the interval expires the buffered
         frame is displayed immediately so no extra latency accumulates.
 
         :attr:`newFrame` is emitted with the filtered frame, or with the
         rendered composite scene when :attr:`composite` is ``True``.
+        In :attr:`threaded` mode the frame is handed to the worker
+        thread, and is displayed and emitted when the worker is done.
 
         Parameters
         ----------
@@ -181,16 +418,36 @@ class QVideoScreen(GraphicsLayoutWidget):
             The frame to display.
         '''
         if self._ready:
-            filtered = self.filter(image)
-            self.image.setImage(filtered, autoLevels=False)
-            self.newFrame.emit(
-                self._renderComposite() if self._composite else filtered)
+            if profiler.enabled:
+                profiler.since('screen.delivery', image)
+            if self._worker is None:
+                self._display(*self._process(image))
+            else:
+                self._worker.post(image)
             self._ready = False
             self._pending = None
             self._timer.start(self._interval)
         else:
             self._pending = image
 
+    @QtCore.Slot()
+    def _deliver(self) -> None:
+        '''Display the frame finished by the worker thread.'''
+        if self._worker is None:
+            return
+        result = self._worker.take()
+        if result is not None:
+            self._display(*result)
+
+    def _display(self, image: Image, scale: int) -> None:
+        self._setScale(scale)
+        if profiler.enabled:
+            profiler.timed('screen.setImage', self._show, image)
+        else:
+            self._show(image)
+        self.newFrame.emit(
+            self._renderComposite() if self._composite else image)
+
     @property
     def fps(self) -> float | None:
         '''Effective display frame rate [frames per second].
@@ -208,6 +465,32 @@ class QVideoScreen(GraphicsLayoutWidget):
             return self._source.fps
         return None
 
+    @property
+    def profiling(self) -> bool:
+        '''Show per-stage latency statistics over the video.
+
+        Setting this to ``True`` enables the shared
+        :data:`~QVideo.lib.instrumentation.profiler` and displays a
+        :class:`~QVideo.lib.QProfilerHUD.QProfilerHUD` in the top-left
+        corner of the screen.  Setting it to ``False`` removes the
+        display but leaves the profiler running.
+        '''
+        return self._hud is not None
+
+    @profiling.setter
+    def profiling(self, value: bool) -> None:
+        if bool(value) == self.profiling:
+            return
+        if value:
+            profiler.enabled = True
+            self._hud = QProfilerHUD()
+            self.view.addItem(self._hud)
+            self._hud.start()
+        else:
+            self._hud.stop()
+            self.view.removeItem(self._hud)
+            self._hud = None
+
     @property
     def composite(self) -> bool:
         '''Emit the rendered scene via :attr:`newFrame` instead of the raw frame.'''
@@ -357,6 +640,8 @@ class QVideoScreen(GraphicsLayoutWidget):
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         '''Update the ViewBox range to match the video after the viewport is resized.'''
         super().resizeEvent(event)
+        if self.closed:
+            return
         shape = getattr(self, '_videoShape', None)
         if shape is not None:
             self.view.setRange(
@@ -2,8 +2,13 @@
 from qtpy import QtCore
 from QVideo.lib.QCamera import QCamera
 from QVideo.lib.QVideoReader import QVideoReader
+from QVideo.lib.framepool import FramePool
+from QVideo.lib.QFrameMailbox import QFrameMailbox
+from QVideo.lib.frameinfo import FrameInfo
+from QVideo.lib.instrumentation import profiler
 from QVideo.lib.videotypes import Image
 from typing import TypeAlias
+from time import perf_counter_ns
 import numpy as np
 import logging
 
@@ -24,11 +29,17 @@ class QVideoSource(QtCore.QThread):
     ----------
     source : QCamera | QVideoReader
         The video source to read frames from.
+    poolsize : int
+        Maximum number of recycled frame buffers.  ``0`` disables
+        buffer pooling.  Default: ``8``.
 
     Signals
     -------
     newFrame(Image)
         Emitted when a new video frame is available.
+    newFrameInfo(Image, FrameInfo)
+        Emitted after :attr:`newFrame` with the same frame and its
+        capture metadata.
 
     Properties
     ----------
@@ -38,6 +49,12 @@ class QVideoSource(QtCore.QThread):
         Frame rate of the video source [frames per second].
     shape : QSize
         The shape of the video frames (width, height).
+    pool : FramePool
+        Recycled frame buffers used with cameras that implement
+        :meth:`~QVideo.lib.QCamera.QCamera.read_into`.
+    dropped : int
+        Number of frames reported lost by the camera since the
+        source was started.
 
     Methods
     -------
@@ -53,6 +70,8 @@ class QVideoSource(QtCore.QThread):
         Resume video readout after pause().
     isPaused() -> bool
         Check if video readout is paused.
+    mailbox(slots) -> QFrameMailbox
+        Latest-frame delivery for a slow consumer.
     example(*args) -> None
         Demonstrate basic operation of a threaded video source.
 
@@ -63,12 +82,38 @@ class QVideoSource(QtCore.QThread):
     State variables ``_running`` and ``_paused`` are protected by
     :attr:`mutex`; :attr:`waitcondition` is used to block the capture
     loop while paused and to wake it on :meth:`resume` or :meth:`stop`.
+
+    When the source is a :class:`~QVideo.lib.QCamera.QCamera` that
+    overrides :meth:`~QVideo.lib.QCamera.QCamera.read_into`, frames are
+    read into buffers drawn from :attr:`pool` rather than freshly
+    allocated.  The pool is configured from the shape and dtype of the
+    frames the camera actually delivers, and a buffer is reused only
+    after every consumer of :attr:`newFrame` has released it.
+
+    Property changes requested through
+    :meth:`~QVideo.lib.QCamera.QCamera.queueSet` are applied by the
+    capture loop between frames, so the requesting thread never waits
+    for a frame transfer to complete.
+
+    Each frame is stamped with :func:`time.perf_counter_ns` in the
+    capture thread as soon as it has been read.  Consumers that need
+    accurate capture times, such as video writers, should connect to
+    :attr:`newFrameInfo` instead of timing frames on arrival.
+    Hardware timestamps and frame counters are included for cameras
+    that report them through
+    :meth:`~QVideo.lib.QCamera.QCamera.frameMetadata`; gaps in the
+    hardware frame counter are reported as dropped frames.  The
+    record of each camera frame is also attached to the frame with
+    :meth:`~QVideo.lib.frameinfo.FrameInfo.attach`, so that consumers
+    connected to :attr:`newFrame` can look it up.
     '''
 
     #: Emitted when a new video frame is available.
     newFrame = QtCore.Signal(np.ndarray)
+    #: Emitted after :attr:`newFrame` with the frame and its FrameInfo.
+    newFrameInfo = QtCore.Signal(np.ndarray, object)
 
-    def __init__(self, source: VideoSourceType) -> None:
+    def __init__(self, source: VideoSourceType, poolsize: int = 8) -> None:
         '''Initialise the video source thread.
 
         Parameters
@@ -77,14 +122,20 @@ class QVideoSource(QtCore.QThread):
             The video source to read frames from.  It is moved to this
             thread so that its context manager (open/close) runs in the
             capture thread.
+        poolsize : int
+            Maximum number of recycled frame buffers.  Default: ``8``.
         '''
         super().__init__()
+        self.pool = FramePool(poolsize)
         self.source = source
         self.source.moveToThread(self)
         self.mutex = QtCore.QMutex()
         self.waitcondition = QtCore.QWaitCondition()
         self._paused = False
         self._running = True
+        self._index = 0
+        self._hardwareIndex = None
+        self._dropped = 0
 
     @property
     def source(self) -> VideoSourceType:
@@ -110,31 +161,150 @@ class QVideoSource(QtCore.QThread):
         '''Shape of the video frames as ``QSize(width, height)``.'''
         return self.source.shape
 
+    @property
+    def bayer(self) -> str | None:
+        '''Bayer pattern of raw frames from the source, or ``None``.'''
+        return self.source.bayer
+
+    @property
+    def dropped(self) -> int:
+        '''Number of frames reported lost since the source started.'''
+        return self._dropped
+
     def run(self) -> None:
         '''Capture loop: open the source, read frames, emit :attr:`newFrame`.
 
         Opens the source via its context manager, then loops calling
         :meth:`~QCamera.saferead` and emitting :attr:`newFrame` for each
-        successful frame.  The loop blocks when :meth:`pause` is called and
-        resumes when :meth:`resume` or :meth:`stop` is called.
+        successful frame, followed by :attr:`newFrameInfo`.  The loop
+        blocks when :meth:`pause` is called and resumes when
+        :meth:`resume` or :meth:`stop` is called.  It ends when
+        :meth:`stop` is called or a camera source closes.
 
         This method is invoked automatically by :meth:`start` in a new
         thread and should not be called directly in production code.
         '''
         logger.debug('streaming started')
+        pooled = self._pooled()
+        camera = isinstance(self.source, QCamera)
+        self._index = 0
+        self._hardwareIndex = None
+        self._dropped = 0
         with self.source:
+            self._queueCommands(camera, True)
             while True:
                 with QtCore.QMutexLocker(self.mutex):
                     if self._paused:
+                        self._queueCommands(camera, False)
                         self.waitcondition.wait(self.mutex)
                         self._paused = False
+                        self._queueCommands(camera, True)
                     if not self._running:
                         break
-                ok, frame = self.source.saferead()
+                if camera:
+                    if not self.source.isOpen():
+                        logger.warning('camera closed: streaming stopped')
+                        break
+                    self.source.applyPending()
+                if profiler.enabled:
+                    self._profiledFrame(pooled, camera)
+                    continue
+                ok, frame = self._read() if pooled else self.source.saferead()
                 if ok:
+                    info = self._frameInfo(perf_counter_ns(), camera)
+                    if camera:
+                        info.attach(frame)
                     self.newFrame.emit(frame)
+                    self.newFrameInfo.emit(frame, info)
+            self._queueCommands(camera, False)
+        self.pool.clear()
         logger.debug('streaming finished')
 
+    def _profiledFrame(self, pooled: bool, camera: bool) -> None:
+        '''Read and emit one frame, recording stage timings.
+
+        Equivalent to one iteration of the capture loop, with the
+        ``camera.read`` and ``source.emit`` stages recorded by
+        :data:`~QVideo.lib.instrumentation.profiler`.
+        '''
+        start = perf_counter_ns()
+        ok, frame = self._read() if pooled else self.source.saferead()
+        timestamp = perf_counter_ns()
+        profiler.record('camera.read', timestamp - start)
+        if not ok:
+            return
+        info = self._frameInfo(timestamp, camera)
+        if camera:
+            info.attach(frame)
+        profiler.stamp(frame, timestamp)
+        self.newFrame.emit(frame)
+        self.newFrameInfo.emit(frame, info)
+        profiler.record('source.emit', perf_counter_ns() - timestamp)
+
+    def _queueCommands(self, camera: bool, queueing: bool) -> None:
+        '''Route queued camera commands through the capture loop.
+
+        While the loop is reading frames, commands submitted with
+        :meth:`~QVideo.lib.QCamera.QCamera.queueSet` and friends are
+        applied between frames.  While it is paused or stopping they
+        are applied immediately, so that no request waits on a loop
+        that is not running.
+        '''
+        if not camera:
+            return
+        self.source.queueing = queueing
+        if not queueing:
+            self.source.applyPending()
+
+    def _frameInfo(self, timestamp: int, camera: bool) -> FrameInfo:
+        '''Build the metadata record for the frame just read.
+
+        Parameters
+        ----------
+        timestamp : int
+            Capture time from :func:`time.perf_counter_ns` [ns].
+        camera : bool
+            ``True`` if the source is a
+            :class:`~QVideo.lib.QCamera.QCamera` that may report
+            hardware metadata.
+        '''
+        stamp, index = (self.source.frameMetadata() if camera else
+                        (None, None))
+        dropped = 0
+        if index is not None and self._hardwareIndex is not None:
+            dropped = max(0, index - self._hardwareIndex - 1)
+            self._dropped += dropped
+        self._hardwareIndex = index
+        window = self.source.window if camera else None
+        binning = self.source.binning if camera else 1
+        info = FrameInfo(self._index, timestamp, stamp, index, dropped,
+                         self.source.bayer, window, binning)
+        self._index += 1
+        return info
+
+    def _pooled(self) -> bool:
+        '''Return ``True`` if frames should be read into pooled buffers.'''
+        return (self.pool.size > 0 and
+                isinstance(self.source, QCamera) and
+                type(self.source).read_into is not QCamera.read_into)
+
+    def _read(self) -> QCamera.CameraData:
+        '''Read one frame, into a recycled buffer when one is free.
+
+        Falls back to :meth:`~QVideo.lib.QCamera.QCamera.saferead` while
+        the pool is unconfigured or exhausted.  The pool follows the
+        format of the frames the camera returns, so a change of shape
+        or dtype is picked up on the next frame.
+        '''
+        buffer = self.pool.acquire()
+        if buffer is None:
+            ok, frame = self.source.saferead()
+        else:
+            ok, frame = self.source.saferead_into(buffer)
+        if ok and frame is not buffer:
+            self.pool.configure(frame.shape, frame.dtype)
+        return ok, frame
+
     @QtCore.Slot()
     def start(self) -> 'QVideoSource':
         '''Start the capture thread.
@@ -192,6 +362,32 @@ class QVideoSource(QtCore.QThread):
         '''Return ``True`` if the capture loop is currently paused.'''
         return self._paused
 
+    def mailbox(self, slots: int = 1, info: bool = False) -> QFrameMailbox:
+        '''Return a mailbox that delivers only the newest frames.
+
+        :attr:`newFrame` delivers every frame to every consumer.  A
+        consumer that is slower than the camera should connect to a
+        mailbox instead, which keeps at most *slots* undelivered
+        frames and counts the rest as
+        :attr:`~QVideo.lib.QFrameMailbox.QFrameMailbox.overwritten`.
+        Each consumer needs its own mailbox.
+
+        Parameters
+        ----------
+        slots : int
+            Number of frames the mailbox can hold.  Default: ``1``.
+        info : bool
+            If ``True``, the mailbox also delivers the capture metadata
+            of each frame through its ``newFrameInfo`` signal.
+            Default: ``False``.
+
+        Returns
+        -------
+        QFrameMailbox
+            Mailbox living in the calling thread.
+        '''
+        return QFrameMailbox(self, slots, info=info)
+
     @classmethod
     def example(cls: type['QVideoSource'], *args) -> None:  # pragma: no cover
         '''Demonstrate basic operation of a threaded video source.'''
@@ -2,6 +2,8 @@
 from abc import (ABCMeta, abstractmethod)
 from qtpy import QtCore
 from QVideo.lib.videotypes import Image
+from QVideo.lib.frameinfo import FrameInfo
+from QVideo.lib.instrumentation import profiler
 import numpy as np
 import logging
 
@@ -48,6 +50,8 @@ class QVideoWriter(QtCore.QObject, metaclass=QVideoWriterMeta):
     -----
     write(frame: Image) -> None
         Write a video frame to the file.
+    writeInfo(frame: Image, info: FrameInfo) -> None
+        Write a video frame together with its capture metadata.
     close() -> None
         Close the video file.
 
@@ -61,6 +65,11 @@ class QVideoWriter(QtCore.QObject, metaclass=QVideoWriterMeta):
         The number of frames to skip between writes.
     nframes : int
         The maximum number of frames to write.
+    info : FrameInfo or None
+        Capture metadata of the frame being written, when frames are
+        delivered through :meth:`writeInfo`.  Subclasses may use it in
+        :meth:`open` and :meth:`_write` instead of timing frames on
+        arrival.
 
     Abstract Methods
     ----------------
@@ -92,6 +101,7 @@ class QVideoWriter(QtCore.QObject, metaclass=QVideoWriterMeta):
         self.nskip = nskip
         self.target = nframes
         self.blank = False
+        self.info = None
 
     @abstractmethod
     def open(self, frame: Image) -> bool:
@@ -137,10 +147,33 @@ class QVideoWriter(QtCore.QObject, metaclass=QVideoWriterMeta):
             self.finished.emit()
             return
         if self.framenumber % self.nskip == 0:
-            self._write(np.zeros_like(frame) if self.blank else frame)
+            frame = np.zeros_like(frame) if self.blank else frame
+            if profiler.enabled:
+                profiler.timed('writer.write', self._write, frame)
+            else:
+                self._write(frame)
             self.framenumber += 1
             self.frameNumber.emit(self.framenumber)
 
+    @QtCore.Slot(np.ndarray, object)
+    def writeInfo(self, frame: Image, info: FrameInfo) -> None:
+        '''Write a video frame with its capture metadata.
+
+        Connect to
+        :attr:`~QVideo.lib.QVideoSource.QVideoSource.newFrameInfo`.
+        Makes *info* available as :attr:`info` and then behaves like
+        :meth:`write`.
+
+        Parameters
+        ----------
+        frame : Image
+            Video frame to write.
+        info : FrameInfo
+            Capture metadata for *frame*.
+        '''
+        self.info = info
+        self.write(frame)
+
     @abstractmethod
     def _write(self, frame: Image) -> None:
         pass
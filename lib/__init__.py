@@ -1,7 +1,9 @@
 '''Core abstractions for the QVideo camera framework.
 
 Provides the base classes, threading infrastructure, and UI widgets
-that all camera backends build upon.
+that all camera backends build upon.  Each name is imported on first
+use, so ``from QVideo.lib import QCamera`` does not load the widgets
+or the filters.
 
 Classes
 -------
@@ -12,6 +14,10 @@ QVideoSource
 QCameraTree
     :class:`~pyqtgraph.parametertree.ParameterTree` widget auto-built
     from a camera's registered properties.
+QProcessVideoSource
+    :class:`QVideoSource` for a camera running in a child process.
+QFrameMailbox
+    Latest-frame delivery from a :class:`QVideoSource` to a slow consumer.
 QVideoScreen
     Widget that displays frames emitted by a :class:`QVideoSource`.
 VideoFilter
@@ -24,6 +30,8 @@ QFilterRack
     Dynamic, user-reorderable pipeline of :class:`QVideoFilter` widgets.
 AsyncVideoFilter
     :class:`VideoFilter` base that runs heavy computation in a background thread.
+PooledVideoFilter
+    :class:`AsyncVideoFilter` that processes frames in a pool of threads.
 QVideoReader
     Abstract base class for video file readers.
 QVideoWriter
@@ -34,29 +42,48 @@ QSnapshot
     Hotkey-triggered still-frame capture from any ``newFrame`` signal.
 QListCameras
     Widget listing available camera backends.
+FrameInfo
+    Capture metadata emitted with each frame by :class:`QVideoSource`.
+FrameClock
+    Drift-free frame pacing for synthetic camera backends.
+Profiler
+    Per-stage latency histograms; the shared instance is ``profiler``.
+QProfilerHUD
+    On-screen display of :class:`Profiler` statistics.
 '''
-from .videotypes import Image
-from .clickable import clickable
-from .QCamera import QCamera
-from .QVideoSource import QVideoSource
-from .QCameraTree import QCameraTree
-from .QVideoScreen import QVideoScreen
-from .QFilterBank import QFilterBank
-from .QFilterRack import QFilterRack
-from .QVideoFilter import VideoFilter, QVideoFilter
-from .AsyncVideoFilter import AsyncVideoFilter
-from .QVideoReader import QVideoReader
-from .QVideoWriter import QVideoWriter
-from ._camera import Camera
-from .chooser import choose_camera
-from .QListCameras import QListCameras
-from .QFPSMeter import QFPSMeter
-from .QHistogramWidget import QHistogramWidget
-from .QUniformityWidget import QUniformityWidget
-from .QSnapshot import QSnapshot
+from ._lazy import attach
 
-__all__ = '''Image
-clickable Camera choose_camera QListCameras
-QCamera QVideoSource QCameraTree QFilterBank QFilterRack
-QVideoReader QVideoWriter QVideoScreen
-QFPSMeter QHistogramWidget QUniformityWidget QSnapshot VideoFilter QVideoFilter AsyncVideoFilter'''.split()
+
+_EXPORTS = {
+    'Image': '.videotypes',
+    'FrameInfo': '.frameinfo',
+    'FrameClock': '.frameclock',
+    'Profiler': '.instrumentation',
+    'profiler': '.instrumentation',
+    'clickable': '.clickable',
+    'QCamera': '.QCamera',
+    'QVideoSource': '.QVideoSource',
+    'QFrameMailbox': '.QFrameMailbox',
+    'QProcessVideoSource': '.QProcessVideoSource',
+    'QCameraTree': '.QCameraTree',
+    'QVideoScreen': '.QVideoScreen',
+    'QFilterBank': '.QFilterBank',
+    'QFilterRack': '.QFilterRack',
+    'VideoFilter': '.QVideoFilter',
+    'QVideoFilter': '.QVideoFilter',
+    'AsyncVideoFilter': '.AsyncVideoFilter',
+    'PooledVideoFilter': '.PooledVideoFilter',
+    'QVideoReader': '.QVideoReader',
+    'QVideoWriter': '.QVideoWriter',
+    'Camera': '._camera',
+    'choose_camera': '.chooser',
+    'QListCameras': '.QListCameras',
+    'QFPSMeter': '.QFPSMeter',
+    'QHistogramWidget': '.QHistogramWidget',
+    'QUniformityWidget': '.QUniformityWidget',
+    'QSnapshot': '.QSnapshot',
+    'QProfilerHUD': '.QProfilerHUD',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
@@ -0,0 +1,82 @@
+'''Persistent cache for the results of slow hardware probes.
+
+Each cache is a small JSON document in the user's cache directory:
+``~/.cache/QVideo`` (or ``$XDG_CACHE_HOME/QVideo``) on Linux and macOS,
+``%LOCALAPPDATA%\\QVideo`` on Windows.  The ``QVIDEO_CACHE_DIR``
+environment variable names another directory, or disables caching
+altogether when set to an empty string.
+
+Callers store whatever JSON-serializable entries they need, usually
+with a timestamp so that they can expire them.  A missing, unreadable
+or corrupt cache reads as empty, and failures to write are logged and
+otherwise ignored: the cache only ever saves time.
+'''
+from pathlib import Path
+import json
+import logging
+import os
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['cache_file', 'load', 'update']
+
+
+_lock = threading.Lock()
+
+
+def cache_file(name: str) -> Path | None:
+    '''Return the path of the cache *name*, or None if caching is disabled.
+
+    Parameters
+    ----------
+    name : str
+        Name of the cache, e.g. ``'cameras'``.
+    '''
+    root = os.environ.get('QVIDEO_CACHE_DIR')
+    if root is None:
+        if os.name == 'nt':
+            base = (os.environ.get('LOCALAPPDATA') or
+                    Path.home() / 'AppData' / 'Local')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        root = Path(base) / 'QVideo'
+    elif not root:
+        return None
+    return Path(root) / f'{name}.json'
+
+
+def load(name: str) -> dict:
+    '''Return the entries of the cache *name*; empty if there are none.'''
+    path = cache_file(name)
+    if path is None:
+        return {}
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def update(name: str, entries: dict) -> None:
+    '''Add *entries* to the cache *name*, replacing those with the same keys.
+
+    The cache is rewritten atomically, so concurrent readers never see
+    a partial file.
+    '''
+    path = cache_file(name)
+    if path is None or not entries:
+        return
+    with _lock:
+        merged = load(name)
+        merged.update(entries)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(merged, f, indent=1, sort_keys=True)
+            os.replace(tmp, path)
+        except OSError as ex:
+            logger.debug(f'Could not write cache {path}: {ex}')
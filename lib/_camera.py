@@ -5,10 +5,20 @@ returns the first available camera backend.  The result is usable
 immediately (``camera.read()``, property access) and is also awaitable —
 ``await Camera()`` in Jupyter probes all backends, prints which cameras
 were found, and opens the first working one.
+
+Backends are probed concurrently, each within its own timeout, and the
+outcome of every probe is cached on disk for :data:`_CACHE_TTL`
+seconds (see :mod:`QVideo.lib._cache`), so that later sessions open a
+known camera without waiting for absent hardware to time out.
 '''
+from concurrent import futures
+from QVideo.lib import _cache
 import contextlib
 import importlib
 import logging
+import threading
+import time
+from collections.abc import AsyncIterator
 from typing import NamedTuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -35,26 +45,54 @@ _BACKENDS: dict[str, _BackendEntry] = {
     'picamera': _BackendEntry('QVideo.cameras.Picamera', 'QPicamera',       'QPicameraTree', 'Picamera'),
     'opencv':   _BackendEntry('QVideo.cameras.OpenCV',   'QOpenCVCamera',   'QOpenCVTree',   'OpenCV'),
     'noise':    _BackendEntry('QVideo.cameras.Noise',    'QNoiseCamera',    'QNoiseTree',    'Noise'),
+    'particles': _BackendEntry('QVideo.cameras.Particles', 'QParticleCamera', 'QParticleTree', 'Particles'),
 }
 
 _DISCOVERY_ORDER = [
     'basler', 'flir', 'ids', 'mv', 'vimbax', 'picamera', 'opencv', 'noise']
 
+#: Time allowed for each backend to open a camera while probing [s].
+#: GenTL producers enumerate their transport layers before they report
+#: a missing device, so the GenICam backends get the longest.
+_PROBE_TIMEOUT: dict[str, float] = {
+    'basler': 15., 'flir': 15., 'ids': 15., 'mv': 15., 'vimbax': 15.,
+    'picamera': 10., 'opencv': 10., 'noise': 5., 'particles': 5.}
+
+#: Lifetime of a cached probe result [s].
+_CACHE_TTL = 3600.
+
+Candidate = tuple[str, int]
+
 
 def _probe(key: str) -> bool:
-    '''Return True if the backend module can be imported.'''
+    '''Return True if the backend's camera class can be imported.
+
+    Backend packages load their modules on first use, so the camera
+    class is resolved to import the vendor SDK that it depends on.
+    '''
+    entry = _BACKENDS[key]
     try:
-        importlib.import_module(_BACKENDS[key].module)
+        module = importlib.import_module(entry.module)
+        getattr(module, entry.camera_cls)
         return True
     except (ImportError, ModuleNotFoundError):
         return False
 
 
+_qapp = None
+
+
 def _ensure_qapp() -> None:
-    '''Create a QApplication if none exists (required before any QCamera).'''
+    '''Create a QApplication if none exists (required before any QCamera).
+
+    The application is kept alive for the rest of the session: if it
+    were collected, the next camera, possibly opened in a probe thread,
+    would have to create another.
+    '''
+    global _qapp
     from qtpy.QtWidgets import QApplication
     if QApplication.instance() is None:
-        QApplication([])
+        _qapp = QApplication([])
 
 
 def _open(key: str, camera_id: int = 0):
@@ -70,7 +108,7 @@ def _open(key: str, camera_id: int = 0):
         return None
 
 
-def _discover(model: str | None, camera_id: int = 0) -> list[tuple[str, int]]:
+def _discover(model: str | None, camera_id: int = 0) -> list[Candidate]:
     '''Return (backend_key, camera_id) pairs for importable backends.'''
     if model is not None:
         key = model.lower()
@@ -95,20 +133,113 @@ def _quiet():
         root.setLevel(saved)
 
 
-def _working_candidates(
-        candidates: list[tuple[str, int]]) -> list[tuple[str, int]]:
-    '''Return only the candidates whose cameras open successfully.'''
-    working = []
-    with _quiet():
-        for key, camera_id in candidates:
-            cam = _open(key, camera_id)
-            if cam is not None and cam.isOpen():
-                cam.close()
-                working.append((key, camera_id))
-    return working
+def _cache_key(candidate: Candidate) -> str:
+    key, camera_id = candidate
+    return f'{key}:{camera_id}'
+
+
+def _load_cache() -> dict[str, dict]:
+    '''Return the cached probe results; empty if there are none.'''
+    return _cache.load('cameras')
+
+
+def _cached(entries: dict[str, dict], candidate: Candidate) -> bool | None:
+    '''Return the cached result for *candidate*; None if unknown or stale.'''
+    try:
+        entry = entries[_cache_key(candidate)]
+        if 0. <= time.time() - entry['time'] < _CACHE_TTL:
+            return bool(entry['ok'])
+    except (KeyError, TypeError):
+        pass
+    return None
+
+
+def _store(results: dict[Candidate, bool]) -> None:
+    '''Record probe results in the cache.'''
+    now = time.time()
+    _cache.update('cameras', {_cache_key(c): dict(ok=bool(ok), time=now)
+                              for c, ok in results.items()})
 
 
-def _jupyter_report(working: list[tuple[str, int]]) -> None:
+def _check(key: str, camera_id: int) -> bool:
+    '''Return True if the camera opens.  The camera is closed again.'''
+    cam = _open(key, camera_id)
+    if cam is None or not cam.isOpen():
+        return False
+    cam.close()
+    return True
+
+
+def _probe_cameras(candidates: list[Candidate],
+                   first: bool = False) -> dict[Candidate, bool | None]:
+    '''Try to open all *candidates* at once.
+
+    Each candidate is opened and closed in a worker thread.  A probe
+    that outlasts its entry in :data:`_PROBE_TIMEOUT` is abandoned and
+    reported as ``None``: its thread finishes in the background.
+
+    With *first*, returns as soon as a candidate opens and every
+    candidate before it has failed or timed out.  The probes of later
+    candidates are left to finish in the background, or are cancelled
+    if they have not started, and are omitted from the results.
+
+    Returns
+    -------
+    dict
+        Outcome of the probe for each candidate.
+    '''
+    _ensure_qapp()
+    pool = futures.ThreadPoolExecutor(max_workers=len(candidates),
+                                      thread_name_prefix='QVideo-probe')
+    start = time.monotonic()
+    results, late = {}, []
+    with _quiet():
+        pending = {c: pool.submit(_check, *c) for c in candidates}
+        for candidate, future in pending.items():
+            timeout = _PROBE_TIMEOUT.get(candidate[0], 5.)
+            try:
+                remaining = max(0., start + timeout - time.monotonic())
+                results[candidate] = future.result(timeout=remaining)
+            except futures.TimeoutError:
+                results[candidate] = None
+                late.append(candidate)
+            except Exception:
+                results[candidate] = False
+            if first and results[candidate]:
+                break
+    pool.shutdown(wait=False, cancel_futures=True)
+    for key, _ in late:
+        logger.warning(f'{_BACKENDS[key].label} did not respond within '
+                       f'{_PROBE_TIMEOUT.get(key, 5.):g} s')
+    return results
+
+
+def _working_candidates(candidates: list[Candidate],
+                        refresh: bool = False,
+                        first: bool = False) -> list[Candidate]:
+    '''Return only the candidates whose cameras open successfully.
+
+    Unexpired cached results are reused unless *refresh* is set; the
+    remaining candidates are probed concurrently and the results are
+    cached.  Probes that time out are not cached.  With *first*, the
+    candidates after the first one known to work are not considered,
+    and probing stops as soon as that candidate is known.
+    '''
+    entries = {} if refresh else _load_cache()
+    known = {}
+    for candidate in candidates:
+        known[candidate] = _cached(entries, candidate)
+        if first and known[candidate]:
+            break
+    unknown = [c for c, ok in known.items() if ok is None]
+    if unknown:
+        probed = _probe_cameras(unknown, first)
+        _store({c: ok for c, ok in probed.items() if ok is not None})
+        known.update(probed)
+    return [c for c, ok in known.items() if ok]
+
+
+def _jupyter_report(working: list[Candidate]) -> None:
     '''Print available cameras and which one was selected.'''
     labels = [_BACKENDS[k].label for k, _ in working]
     if len(labels) == 1:
@@ -119,7 +250,7 @@ def _jupyter_report(working: list[tuple[str, int]]) -> None:
         print(f'Using {labels[0]}. To select a different one: {opts}')
 
 
-async def _jupyter_chooser(working: list[tuple[str, int]]) -> tuple[str, int]:
+async def _jupyter_chooser(working: list[Candidate]) -> Candidate:
     '''Show an ipywidgets Dropdown chooser; return selected (key, camera_id).
 
     Falls back to :func:`_jupyter_report` for a single camera.
@@ -156,6 +287,73 @@ async def _jupyter_chooser(working: list[tuple[str, int]]) -> tuple[str, int]:
     return await future
 
 
+def _thumbnail(frame: 'Image', width: int | None) -> 'Image':
+    '''Return *frame* as 8-bit BGR, downscaled to at most *width*.'''
+    import cv2
+    from QVideo.lib.videotypes import rescale
+    import numpy as np
+    frame = rescale(frame, np.uint8)
+    if width is not None and frame.shape[1] > width:
+        height = max(1, round(frame.shape[0] * width / frame.shape[1]))
+        frame = cv2.resize(frame, (int(width), height),
+                           interpolation=cv2.INTER_AREA)
+    if frame.ndim == 3 and frame.shape[2] == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+    return frame
+
+
+def _jpeg(thumbnail: 'Image', quality: int) -> bytes:
+    '''Return *thumbnail* encoded as JPEG.'''
+    import cv2
+    _, buf = cv2.imencode('.jpg', thumbnail,
+                          [cv2.IMWRITE_JPEG_QUALITY, int(quality)])
+    return bytes(buf)
+
+
+def _render(frame: 'Image', width: int | None, quality: int,
+            previous: 'Image | None') -> tuple['Image', bytes | None]:
+    '''Return the thumbnail of *frame* and its JPEG encoding.
+
+    The encoding is ``None`` if the thumbnail is identical to
+    *previous*, so that unchanged frames are not sent again.
+    '''
+    import numpy as np
+    thumbnail = _thumbnail(frame, width)
+    if previous is not None and np.array_equal(thumbnail, previous):
+        return previous, None
+    return thumbnail, _jpeg(thumbnail, quality)
+
+
+class _Quality:
+    '''JPEG quality and pacing of a live feed.
+
+    Keeps the time spent encoding and transmitting each frame under
+    half of the frame interval by lowering the JPEG quality, and raises
+    the quality again when there is time to spare.  When even the
+    lowest quality takes too long, the feed slows down instead.
+    '''
+
+    LOWEST, HIGHEST, STEP = 40, 90, 5
+
+    def __init__(self, interval: float, value: int = 80) -> None:
+        self.interval = interval
+        self.value = value
+
+    def update(self, cost: float) -> float:
+        '''Adapt to the *cost* of the last frame [s].
+
+        Returns
+        -------
+        float
+            Time to wait before the next frame [s].
+        '''
+        if cost > self.interval / 2:
+            self.value = max(self.LOWEST, self.value - self.STEP)
+        elif cost < self.interval / 4:
+            self.value = min(self.HIGHEST, self.value + self.STEP)
+        return max(0., cost - self.interval / 2)
+
+
 class _LiveView:
     '''Handle for a running :meth:`_CameraProxy.live_view` feed.
 
@@ -179,8 +377,10 @@ class _CameraProxy:
     prints which cameras were found, and opens the first working one.
     '''
 
-    def __init__(self, candidates: list[tuple[str, int]]) -> None:
+    def __init__(self, candidates: list[Candidate],
+                 refresh: bool = False) -> None:
         object.__setattr__(self, '_candidates', candidates)
+        object.__setattr__(self, '_refresh', refresh)
         object.__setattr__(self, '_selected_key', None)
         object.__setattr__(self, '_camera', None)
         object.__setattr__(self, '_live_view', None)
@@ -189,14 +389,21 @@ class _CameraProxy:
         if object.__getattribute__(self, '_camera') is not None:
             return
         candidates = object.__getattribute__(self, '_candidates')
+        refresh = object.__getattribute__(self, '_refresh')
         hardware = [k for k, _ in candidates if k != 'noise']
-        with _quiet():
-            for key, camera_id in candidates:
-                cam = _open(key, camera_id)
-                if cam is not None and cam.isOpen():
-                    object.__setattr__(self, '_camera', cam)
-                    object.__setattr__(self, '_selected_key', key)
-                    break
+        remaining = list(candidates)
+        while remaining:
+            if len(remaining) > 1:
+                working = _working_candidates(remaining, refresh, first=True)
+            else:
+                working = remaining
+            if not working:
+                break
+            remaining = remaining[remaining.index(working[-1]) + 1:]
+            with _quiet():
+                cam = self._open_first(working)
+            if cam is not None:
+                break
         if object.__getattribute__(self, '_camera') is None:
             raise RuntimeError('No camera could be opened')
         selected = object.__getattribute__(self, '_selected_key')
@@ -204,6 +411,18 @@ class _CameraProxy:
             logger.warning(
                 'No camera hardware detected; using simulated camera')
 
+    def _open_first(self, working: list[Candidate]):
+        '''Open the first of *working* that succeeds and record outcomes.'''
+        for key, camera_id in working:
+            cam = _open(key, camera_id)
+            ok = cam is not None and cam.isOpen()
+            _store({(key, camera_id): ok})
+            if ok:
+                object.__setattr__(self, '_camera', cam)
+                object.__setattr__(self, '_selected_key', key)
+                return cam
+        return None
+
     def read(self) -> 'Image':
         '''Read one frame and return it as a numpy array.'''
         self._ensure_open()
@@ -213,6 +432,84 @@ class _CameraProxy:
             raise RuntimeError('Camera read failed')
         return frame
 
+    async def frames(self, max_fps: float | None = None,
+                     maxsize: int = 2) -> AsyncIterator['Image']:
+        '''Stream frames without blocking the ``asyncio`` event loop.
+
+        Frames are read in a background thread and handed to the loop
+        through a bounded queue.  When the consumer falls behind, the
+        oldest queued frame is dropped, so that iteration always
+        yields recent frames.  The capture thread stops when iteration
+        ends, for example at ``break``.
+
+        Parameters
+        ----------
+        max_fps : float or None
+            Upper limit on the rate at which frames are read [Hz].
+            ``None`` reads as fast as the camera delivers.
+        maxsize : int
+            Number of frames queued for the consumer.  Default: ``2``.
+
+        Yields
+        ------
+        Image
+            Camera frames, oldest first.
+
+        Raises
+        ------
+        RuntimeError
+            If the camera fails to deliver a frame.
+
+        Examples
+        --------
+        ::
+
+            camera = await Camera()
+            async for frame in camera.frames(max_fps=10):
+                print(frame.mean())
+        '''
+        import asyncio
+
+        self._ensure_open()
+        camera = object.__getattribute__(self, '_camera')
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(max(1, int(maxsize)))
+        stop = threading.Event()
+
+        def _put(item) -> None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(item)
+
+        def _capture() -> None:
+            interval = 1. / max_fps if max_fps else 0.
+            due = time.monotonic()
+            while not stop.is_set():
+                ok, frame = camera.saferead()
+                if not ok or frame is None:
+                    frame = RuntimeError('Camera read failed')
+                try:
+                    loop.call_soon_threadsafe(_put, frame)
+                except RuntimeError:
+                    return
+                if isinstance(frame, Exception):
+                    return
+                if interval:
+                    due = max(due + interval, time.monotonic())
+                    stop.wait(due - time.monotonic())
+
+        thread = threading.Thread(target=_capture, daemon=True,
+                                  name='QVideo-frames')
+        thread.start()
+        try:
+            while True:
+                frame = await queue.get()
+                if isinstance(frame, Exception):
+                    raise frame
+                yield frame
+        finally:
+            stop.set()
+
     def __getattr__(self, name: str):
         self._ensure_open()
         return getattr(object.__getattribute__(self, '_camera'), name)
@@ -226,17 +523,29 @@ class _CameraProxy:
         label = _BACKENDS[key].label if key else 'uninitialized'
         return f'<Camera: {label}>'
 
-    def live_view(self, fps: float = 30.0) -> '_LiveView':
+    def live_view(self, fps: float = 30.0,
+                  width: int | None = 640) -> '_LiveView':
         '''Display a live video feed in a Jupyter cell.
 
-        Encodes each frame as JPEG and streams it into an
+        Encodes frames as JPEG and streams them into an
         :mod:`ipywidgets` ``Image`` widget via an ``asyncio`` background
         loop.  No matplotlib backend switching required.
 
+        The feed never blocks the notebook: frames are read by
+        :meth:`frames` in a background thread, and are downscaled and
+        encoded in an executor.  Frames identical to the previous one
+        are not sent again.  JPEG quality and update rate adapt to the
+        time taken to encode and transmit each frame, so that the feed
+        uses at most about half of the event loop's time.
+
         Parameters
         ----------
         fps : float
             Target display update rate in frames per second (default 30).
+        width : int or None
+            Display width [pixels].  Wider frames are downscaled to
+            this width before they are encoded.  ``None`` sends frames
+            at full resolution.  Default: ``640``.
 
         Returns
         -------
@@ -283,33 +592,36 @@ class _CameraProxy:
             ) from ex
 
         import asyncio
-        import cv2
 
         self._ensure_open()
-        frame = self.read()
-
-        def _encode(f):
-            if f.ndim == 3 and f.shape[2] == 3:
-                f = cv2.cvtColor(f, cv2.COLOR_RGB2BGR)
-            _, buf = cv2.imencode('.jpg', f)
-            return bytes(buf)
-
+        quality = _Quality(1. / fps)
+        thumbnail = _thumbnail(self.read(), width)
         widget = widgets.Image(
-            value=_encode(frame),
+            value=_jpeg(thumbnail, quality.value),
             format='jpeg',
-            width=frame.shape[1],
-            height=frame.shape[0],
+            width=thumbnail.shape[1],
+            height=thumbnail.shape[0],
         )
         display(widget)
 
         async def _loop():
-            interval = 1.0 / fps
-            while True:
+            loop = asyncio.get_running_loop()
+            previous = thumbnail
+            async with contextlib.aclosing(
+                    self.frames(max_fps=fps, maxsize=1)) as frames:
                 try:
-                    widget.value = _encode(self.read())
+                    async for frame in frames:
+                        start = loop.time()
+                        previous, data = await loop.run_in_executor(
+                            None, _render, frame, width, quality.value,
+                            previous)
+                        if data is None:
+                            continue
+                        widget.value = data
+                        cost = loop.time() - start
+                        await asyncio.sleep(quality.update(cost))
                 except Exception:
-                    break
-                await asyncio.sleep(interval)
+                    logger.exception('Live view stopped')
 
         lv = _LiveView(asyncio.ensure_future(_loop()))
         object.__setattr__(self, '_live_view', lv)
@@ -381,7 +693,9 @@ class _CameraProxy:
             try:
                 from IPython import get_ipython
                 if get_ipython() is not None:
-                    working = _working_candidates(candidates)
+                    working = _working_candidates(
+                        candidates,
+                        object.__getattribute__(self, '_refresh'))
                     if working:
                         if len(working) > 1:
                             try:
@@ -399,7 +713,9 @@ class _CameraProxy:
         return self
 
 
-def Camera(model: str | None = None, cameraID: int = 0) -> _CameraProxy:
+def Camera(model: str | None = None,
+           cameraID: int = 0,
+           refresh: bool = False) -> _CameraProxy:
     '''Discover and return a camera backend.
 
     Parameters
@@ -410,6 +726,10 @@ def Camera(model: str | None = None, cameraID: int = 0) -> _CameraProxy:
         backends are probed in priority order.
     cameraID : int
         Device index passed to the backend (default 0).
+    refresh : bool
+        Probe every backend again instead of trusting the results
+        cached by earlier sessions, for example after a camera has
+        been connected.  Default: ``False``.
 
     Returns
     -------
@@ -449,4 +769,4 @@ def Camera(model: str | None = None, cameraID: int = 0) -> _CameraProxy:
             'No camera available'
             + (f' for model {model!r}' if model else '')
         )
-    return _CameraProxy(candidates)
+    return _CameraProxy(candidates, refresh)
@@ -0,0 +1,113 @@
+'''Fuse runs of stateless filters into generated functions.
+
+:class:`~QVideo.lib.QFilterRack.QFilterRack` applies each filter
+through several layers of dispatch: the widget checks its enable box,
+:meth:`~QVideo.lib.QVideoFilter.VideoFilter.__call__` conforms the
+pixel type, and only then do :meth:`~QVideo.lib.QVideoFilter.VideoFilter.add`
+and :meth:`~QVideo.lib.QVideoFilter.VideoFilter.get` do the work.
+:func:`compile_stages` replaces each run of consecutive stateless
+stages with one generated function that calls ``add`` and ``get``
+directly, inlining the pixel-type checks that the stages need.
+
+The generated code calls the filters themselves, so it produces
+exactly the frames of the unfused pipeline and sees parameter changes
+immediately.  Only a change in the order or enable state of the stages
+requires recompilation.  Stages that accumulate state across frames,
+run in a background thread, or customize how they are called remain
+boundaries between fused runs and are called as usual.
+'''
+from collections.abc import Callable, Sequence
+from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.QVideoFilter import VideoFilter, QVideoFilter
+from QVideo.lib.videotypes import Image, DTYPES, rescale
+
+
+__all__ = ['fusible', 'compile_stages']
+
+
+Stage = Callable[[Image], Image | None]
+
+
+def fusible(widget: QVideoFilter) -> bool:
+    '''Return ``True`` if *widget* can join a fused run.
+
+    Eligible stages are stateless, as shown by a
+    :meth:`~QVideo.lib.QVideoFilter.VideoFilter.to_code` fragment,
+    synchronous, and called through the standard ``__call__`` of both
+    the widget and its filter.
+    '''
+    vfilter = widget.filter
+    return (type(widget).__call__ is QVideoFilter.__call__ and
+            type(vfilter).__call__ is VideoFilter.__call__ and
+            not isinstance(vfilter, AsyncVideoFilter) and
+            vfilter.to_code() is not None)
+
+
+def _fuse(filters: Sequence[VideoFilter],
+          name: str) -> tuple[Stage, list[str]]:
+    '''Return a function applying *filters* in order, and its source.'''
+    namespace: dict[str, object] = {'_rescale': rescale}
+    lines = [f'def {name}(image):']
+    for n, vfilter in enumerate(filters):
+        lines.append(f'    # {type(vfilter).__name__}')
+        namespace[f'_filter{n}'] = vfilter
+        if tuple(vfilter.dtypes) != DTYPES:
+            namespace[f'_dtypes{n}'] = vfilter.dtypes
+            lines += [f'    if image.dtype not in _dtypes{n}:',
+                      f'        image = _rescale(image, _dtypes{n}[0])']
+        lines += [f'    _filter{n}.applyPending()',
+                  f'    _filter{n}.add(image)',
+                  f'    image = _filter{n}.get()']
+    lines.append('    return image')
+    exec(compile('\n'.join(lines), f'<fused {name}>', 'exec'), namespace)
+    function = namespace[name]
+    function.filters = tuple(filters)
+    return function, lines
+
+
+def compile_stages(
+        widgets: Sequence[QVideoFilter]) -> tuple[list[Stage], str]:
+    '''Compile the enabled *widgets* into a list of callables.
+
+    Disabled widgets are omitted.  Runs of consecutive :func:`fusible`
+    widgets are replaced by generated functions; other widgets are
+    kept as they are.
+
+    Parameters
+    ----------
+    widgets : Sequence[QVideoFilter]
+        Pipeline stages in order.
+
+    Returns
+    -------
+    stages : list[callable]
+        Callables to apply to each frame in order.  Generated
+        functions list the filters they apply in a ``filters``
+        attribute.
+    source : str
+        Source of the generated functions, with a comment for each
+        stage that is called directly.
+    '''
+    stages: list[Stage] = []
+    source: list[str] = []
+    run: list[VideoFilter] = []
+
+    def flush() -> None:
+        if run:
+            function, lines = _fuse(run, f'fused{len(stages)}')
+            stages.append(function)
+            source.extend(lines + [''])
+            run.clear()
+
+    for widget in widgets:
+        if not widget.isChecked():
+            continue
+        if fusible(widget):
+            run.append(widget.filter)
+            continue
+        flush()
+        stages.append(widget)
+        source.extend([f'# {type(widget.filter).__name__} '
+                       f'(called directly)', ''])
+    flush()
+    return stages, '\n'.join(source)
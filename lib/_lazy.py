@@ -0,0 +1,73 @@
+'''Lazy attribute resolution for QVideo packages.
+
+Package ``__init__`` modules declare a static table that maps each
+exported name to the submodule defining it and call :func:`attach`.
+Nothing is imported until a name is first used, so a script that
+needs only :class:`~QVideo.lib.QCamera.QCamera` does not pay for the
+widgets, filters and plotting libraries of the rest of the package::
+
+    _EXPORTS = {'QCamera': '.QCamera', 'profiler': '.instrumentation'}
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+    __all__ = list(_EXPORTS)
+'''
+from types import ModuleType
+import importlib
+import sys
+
+
+__all__ = ['attach']
+
+
+class _LazyPackage(ModuleType):
+
+    '''Package whose exported names shadow same-named submodules.
+
+    Importing a submodule binds it as an attribute of its package.  In
+    QVideo most classes live in a submodule of the same name, so
+    ``import QVideo.lib.QCamera`` anywhere in the program would
+    otherwise replace the exported class ``QVideo.lib.QCamera`` with the
+    module that defines it.  Such bindings are skipped; the submodule
+    remains available from :data:`sys.modules`.
+    '''
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if (isinstance(value, ModuleType) and
+                name in self.__dict__.get('_exports', ())):
+            return
+        super().__setattr__(name, value)
+
+
+def attach(package: str, exports: dict[str, str]) -> tuple:
+    '''Resolve the exports of *package* on first use.
+
+    Parameters
+    ----------
+    package : str
+        ``__name__`` of the package.
+    exports : dict[str, str]
+        Exported name and the module, relative to *package*, that
+        defines it.
+
+    Returns
+    -------
+    tuple
+        ``(__getattr__, __dir__)`` for the package namespace.
+    '''
+    module = sys.modules[package]
+    module.__class__ = _LazyPackage
+    module.__dict__['_exports'] = exports
+
+    def __getattr__(name: str) -> object:
+        try:
+            source = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}') from None
+        value = getattr(importlib.import_module(source, package), name)
+        module.__dict__[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module.__dict__) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,153 @@
+'''Run filter stages concurrently, one thread per stage.
+
+Applied serially, a chain of expensive filters runs no faster than the
+sum of their costs.  :class:`StagePipeline` gives each stage its own
+thread and connects consecutive stages with bounded queues, so that
+while one stage works on a frame the previous stage can already work
+on the next.  Throughput approaches that of the slowest stage, at the
+cost of a latency of one frame per stage.
+
+Each stage sees every frame that enters the pipeline, in order, so
+filters that accumulate state across frames behave as they do in a
+serial pipeline.  Frames are dropped only on entry, when the first
+queue is full; between stages, a stage waits for room in the next
+queue.  Each stage holds its own :attr:`Stage.lock` while it
+processes a frame, so that parameter changes to its filters take
+effect between frames without stalling the other stages.
+'''
+import logging
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from QVideo.lib.videotypes import Image
+
+
+__all__ = ['Stage', 'StagePipeline']
+
+logger = logging.getLogger(__name__)
+
+
+_STOP = object()
+
+
+class Stage:
+
+    '''One stage of a :class:`StagePipeline` and its input queue.
+
+    Parameters
+    ----------
+    function : callable
+        Applied to each frame in the stage's thread.
+    name : str
+        Label reported with :meth:`StagePipeline.depths`.
+    maxsize : int
+        Capacity of the input queue [frames].
+    '''
+
+    def __init__(self, function: Callable[[Image], Image | None],
+                 name: str, maxsize: int) -> None:
+        self.function = function
+        self.name = name
+        self.lock = threading.RLock()
+        self.queue: queue.Queue = queue.Queue(maxsize)
+
+
+class StagePipeline:
+
+    '''Apply a sequence of callables to frames in concurrent threads.
+
+    Parameters
+    ----------
+    functions : Sequence[callable]
+        Stages in pipeline order.
+    names : Sequence[str]
+        Labels for the stages.
+    maxsize : int
+        Capacity of each inter-stage queue [frames].  Default: ``2``.
+    '''
+
+    def __init__(self,
+                 functions: Sequence[Callable[[Image], Image | None]],
+                 names: Sequence[str],
+                 maxsize: int = 2) -> None:
+        self.stages = [Stage(f, name, max(1, int(maxsize)))
+                       for f, name in zip(functions, names)]
+        self.dropped = 0
+        self._result: Image | None = None
+        self._threads = [
+            threading.Thread(target=self._run, args=(n,), daemon=True,
+                             name=f'QVideo-stage{n}')
+            for n in range(len(self.stages))]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, image: Image) -> bool:
+        '''Queue *image* for the first stage.
+
+        Returns ``False``, and counts the frame in :attr:`dropped`, if
+        the first queue is full.
+        '''
+        try:
+            self.stages[0].queue.put_nowait(image)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def result(self) -> Image | None:
+        '''Return the latest frame to leave the last stage, or ``None``.'''
+        return self._result
+
+    def depths(self) -> list[tuple[str, int]]:
+        '''Return the name of each stage and the frames waiting for it.'''
+        return [(stage.name, stage.queue.qsize()) for stage in self.stages]
+
+    def _run(self, n: int) -> None:
+        stage = self.stages[n]
+        following = self.stages[n + 1] if n + 1 < len(self.stages) else None
+        while True:
+            image = stage.queue.get()
+            if image is not _STOP:
+                try:
+                    with stage.lock:
+                        image = stage.function(image)
+                except Exception as error:
+                    logger.warning(f'{stage.name} failed: {error}')
+                    image = None
+                if image is None:
+                    continue
+            if following is not None:
+                following.queue.put(image)
+            elif image is not _STOP:
+                self._result = image
+            if image is _STOP:
+                return
+
+    def close(self, wait: bool = True) -> None:
+        '''Stop the threads.
+
+        Frames waiting for the first stage are discarded.  Frames that
+        have already passed it run through the remaining stages, so
+        that every stage sees the same sequence of frames.
+
+        Parameters
+        ----------
+        wait : bool
+            If ``True`` (default), return once the threads have
+            finished.  Otherwise return at once, and call :meth:`join`
+            before the stages are used elsewhere.
+        '''
+        first = self.stages[0].queue
+        while True:
+            try:
+                first.get_nowait()
+            except queue.Empty:
+                break
+        first.put(_STOP)
+        if wait:
+            self.join()
+
+    def join(self) -> None:
+        '''Wait for the threads to finish after :meth:`close`.'''
+        for thread in self._threads:
+            thread.join()
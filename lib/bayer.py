@@ -0,0 +1,109 @@
+'''Bayer color-filter patterns and deferred demosaicing.
+
+Color sensors sample one color at each pixel through a repeating
+2×2 color filter array.  Cameras that deliver the raw mosaic instead
+of interpolated RGB frames need one third of the bandwidth, and the
+mosaic can be recorded exactly as it left the sensor.  Demosaicing
+is then deferred to the display, which can afford to interpolate
+only the frames it actually shows.
+
+A pattern is named by the colors of the top-left 2×2 tile read in
+row order: ``'RGGB'``, ``'BGGR'``, ``'GRBG'`` or ``'GBRG'``.
+'''
+from functools import lru_cache
+from QVideo.lib.videotypes import Image, rescale
+import numpy as np
+import re
+
+
+__all__ = ['PATTERNS', 'bayer_pattern', 'demosaic']
+
+
+#: Supported Bayer patterns.
+PATTERNS: tuple[str, ...] = ('RGGB', 'BGGR', 'GRBG', 'GBRG')
+
+# OpenCV names Bayer conversions after the second row of the pattern.
+# Codes are looked up on first use so that importing this module does
+# not import OpenCV.
+_CODES = {'RGGB': 'COLOR_BayerBG2RGB',
+          'BGGR': 'COLOR_BayerRG2RGB',
+          'GRBG': 'COLOR_BayerGB2RGB',
+          'GBRG': 'COLOR_BayerGR2RGB'}
+
+_PFNC = re.compile(r'^Bayer(RG|BG|GR|GB)\d')
+_FIRST_ROW = {'RG': 'RGGB', 'BG': 'BGGR', 'GR': 'GRBG', 'GB': 'GBRG'}
+
+
+@lru_cache(maxsize=None)
+def bayer_pattern(pixelformat: str) -> str | None:
+    '''Return the Bayer pattern of a GenICam pixel format.
+
+    Parameters
+    ----------
+    pixelformat : str
+        PFNC pixel format name, e.g. ``'BayerRG8'`` or ``'BayerGB12p'``.
+
+    Returns
+    -------
+    str or None
+        Pattern such as ``'RGGB'``, or ``None`` if *pixelformat* is not
+        a Bayer format.
+    '''
+    match = _PFNC.match(pixelformat)
+    if match is None:
+        return None
+    return _FIRST_ROW[match.group(1)]
+
+
+def demosaic(mosaic: Image, pattern: str, half: bool = False) -> Image:
+    '''Interpolate an RGB frame from a raw Bayer mosaic.
+
+    Parameters
+    ----------
+    mosaic : Image
+        Two-dimensional raw frame.
+    pattern : str
+        Bayer pattern of *mosaic*, one of :data:`PATTERNS`.
+    half : bool
+        If ``True``, build each RGB pixel from one 2×2 tile of the
+        mosaic, averaging its two green sites.  The result has half
+        the width and height of *mosaic* and costs much less to
+        compute.  Default: ``False``.
+
+    Returns
+    -------
+    Image
+        RGB frame of shape ``(height, width, 3)`` with the pixel type
+        of *mosaic*.
+    '''
+    if pattern not in _CODES:
+        raise ValueError(f'unknown Bayer pattern {pattern!r}')
+    if half:
+        return _binned(mosaic, pattern)
+    import cv2
+    code = getattr(cv2, _CODES[pattern])
+    if mosaic.dtype in (np.uint8, np.uint16):
+        return cv2.cvtColor(mosaic, code)
+    # OpenCV interpolates only 8- and 16-bit mosaics.
+    rgb = cv2.cvtColor(rescale(mosaic, np.uint16), code)
+    return rescale(rgb, mosaic.dtype)
+
+
+def _binned(mosaic: Image, pattern: str) -> Image:
+    '''Return one RGB pixel for each 2×2 tile of *mosaic*.'''
+    h, w = mosaic.shape[0] // 2, mosaic.shape[1] // 2
+    sites = {}
+    for n, color in enumerate(pattern):
+        sites.setdefault(color, []).append(
+            mosaic[n // 2:2 * h:2, n % 2:2 * w:2])
+    rgb = np.empty((h, w, 3), mosaic.dtype)
+    rgb[..., 0] = sites['R'][0]
+    rgb[..., 2] = sites['B'][0]
+    if mosaic.dtype.kind == 'f':
+        np.add(*sites['G'], out=rgb[..., 1])
+        rgb[..., 1] *= 0.5
+    else:
+        green = np.add(*sites['G'], dtype=np.uint32)
+        green >>= 1
+        rgb[..., 1] = green
+    return rgb
@@ -0,0 +1,74 @@
+'''Drift-free frame pacing for synthetic camera backends.'''
+import time
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['FrameClock']
+
+
+class FrameClock:
+
+    '''Deadline scheduler that models a free-running sensor clock.
+
+    Frame *k* is due at ``start + k / fps``, where ``start`` is the time
+    of the first :meth:`tick`.  Deadlines are absolute, so the error of
+    each sleep does not accumulate and the long-run frame rate is exact.
+    A caller that falls behind does not catch up with a burst of frames:
+    :meth:`tick` returns the most recent due frame at once and the
+    frames in between are lost, leaving a gap in the frame index just
+    as a camera with a single-frame buffer would.
+
+    Parameters
+    ----------
+    fps : float
+        Frame rate [frames per second].  Values ``<= 0`` disable pacing:
+        :meth:`tick` returns immediately with consecutive indices.
+        Default: ``0``.
+    '''
+
+    def __init__(self, fps: float = 0.) -> None:
+        self._fps = 0.
+        self._next = 0
+        self._start = None
+        self.fps = fps
+
+    @property
+    def fps(self) -> float:
+        '''Frame rate [frames per second]; ``0`` if unpaced.'''
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: float) -> None:
+        self._fps = max(0., float(fps))
+        self._start = None
+
+    def reset(self) -> None:
+        '''Restart the schedule and the frame index from zero.'''
+        self._next = 0
+        self._start = None
+
+    def tick(self) -> tuple[int, int]:
+        '''Wait until the next frame is due.
+
+        Returns
+        -------
+        tuple[int, int]
+            ``(timestamp, index)``: the time at which the frame was due
+            [ns, :func:`time.perf_counter_ns`] and its frame index.
+        '''
+        now = time.perf_counter_ns()
+        if self._fps <= 0.:
+            index, stamp = self._next, now
+        else:
+            period = 1e9 / self._fps
+            if self._start is None:
+                self._start = now - self._next * period
+            latest = int((now - self._start) // period)
+            index = max(latest, self._next)
+            stamp = int(self._start + index * period)
+            if stamp > now:
+                time.sleep((stamp - now) * 1e-9)
+        self._next = index + 1
+        return stamp, index
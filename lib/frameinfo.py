@@ -0,0 +1,126 @@
+'''Lightweight per-frame metadata record.'''
+import threading
+import time
+import weakref
+
+
+__all__ = ['FrameInfo']
+
+
+#: Offset [ns] from :func:`time.perf_counter_ns` to the UNIX epoch,
+#: measured once at import so that monotonic capture times can be
+#: reported as wall-clock times without calling :func:`time.time`
+#: for every frame.
+_EPOCH_OFFSET_NS = time.time_ns() - time.perf_counter_ns()
+
+#: Records attached to frames, keyed by ``id(frame)``.  Each entry holds
+#: a weak reference to its frame, so that it is dropped with the frame
+#: and never matches another array that reuses the address.
+_attached: dict[int, tuple[weakref.ref, 'FrameInfo']] = {}
+_attachedLock = threading.RLock()
+
+
+class FrameInfo:
+
+    '''Capture metadata for one video frame.
+
+    Created by :class:`~QVideo.lib.QVideoSource.QVideoSource` in the
+    capture thread immediately after each frame is read, and emitted
+    with the frame through
+    :attr:`~QVideo.lib.QVideoSource.QVideoSource.newFrameInfo`.
+    Consumers in other threads can therefore use the capture time
+    rather than the time at which they happen to receive the frame.
+
+    Parameters
+    ----------
+    index : int
+        Sequence number of the frame since the source started.
+    timestamp : int
+        Capture time from :func:`time.perf_counter_ns` [ns].
+    hardwareTimestamp : int or None
+        Timestamp reported by the camera [ns], or ``None`` if the
+        backend does not provide one.  The epoch of hardware
+        timestamps is device-specific.
+    hardwareIndex : int or None
+        Frame counter reported by the camera, or ``None``.
+    dropped : int
+        Number of frames the camera reported as lost between the
+        previous frame and this one.  Gaps can only be detected for
+        backends that provide :attr:`hardwareIndex`.
+    bayer : str or None
+        Bayer pattern of a raw frame, such as ``'RGGB'``, or ``None``
+        for frames that need no demosaicing.
+    window : tuple[int, int, int, int] or None
+        Hardware window ``(x, y, w, h)`` of the sensor that the frame
+        covers, or ``None`` for a full-sensor frame.
+    binning : int
+        Factor by which the camera binned the frame.  Default: ``1``.
+
+    Consumers that receive only the frame, such as the filters of a
+    :class:`~QVideo.lib.QFilterRack.QFilterRack`, can look up the
+    record that was attached to it with :meth:`of`.
+    '''
+
+    __slots__ = ('index', 'timestamp', 'hardwareTimestamp',
+                 'hardwareIndex', 'dropped', 'bayer', 'window', 'binning')
+
+    def __init__(self,
+                 index: int,
+                 timestamp: int,
+                 hardwareTimestamp: int | None = None,
+                 hardwareIndex: int | None = None,
+                 dropped: int = 0,
+                 bayer: str | None = None,
+                 window: tuple[int, int, int, int] | None = None,
+                 binning: int = 1) -> None:
+        self.index = index
+        self.timestamp = timestamp
+        self.hardwareTimestamp = hardwareTimestamp
+        self.hardwareIndex = hardwareIndex
+        self.dropped = dropped
+        self.bayer = bayer
+        self.window = window
+        self.binning = binning
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}(index={self.index}, '
+                f'timestamp={self.timestamp}, '
+                f'hardwareTimestamp={self.hardwareTimestamp}, '
+                f'hardwareIndex={self.hardwareIndex}, '
+                f'dropped={self.dropped}, '
+                f'bayer={self.bayer!r}, '
+                f'window={self.window!r}, '
+                f'binning={self.binning})')
+
+    def epoch(self) -> float:
+        '''Return the capture time as seconds since the UNIX epoch.
+
+        Comparable with :func:`time.time`.
+        '''
+        return (self.timestamp + _EPOCH_OFFSET_NS) * 1e-9
+
+    def attach(self, frame: object) -> None:
+        '''Associate this record with *frame* for as long as it exists.
+
+        Replaces any record attached to *frame* before, as happens when
+        a pooled buffer is filled again.
+        '''
+        key = id(frame)
+
+        def release(ref: weakref.ref) -> None:
+            with _attachedLock:
+                if _attached.get(key, (None,))[0] is ref:
+                    del _attached[key]
+
+        ref = weakref.ref(frame, release)
+        with _attachedLock:
+            _attached[key] = (ref, self)
+
+    @staticmethod
+    def of(frame: object) -> 'FrameInfo | None':
+        '''Return the record attached to *frame*, or ``None``.'''
+        with _attachedLock:
+            entry = _attached.get(id(frame))
+        if entry is None or entry[0]() is not frame:
+            return None
+        return entry[1]
@@ -0,0 +1,144 @@
+'''Recycling pool of preallocated frame buffers.'''
+import sys
+import numpy as np
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['FramePool']
+
+
+def _baseline() -> int:
+    '''Reference count of a buffer held only by the pool's list.
+
+    Measured rather than hard-coded because the value reported by
+    :func:`sys.getrefcount` differs between Python versions.
+    '''
+    buffers = [np.empty(1)]
+    return sys.getrefcount(buffers[0])
+
+
+class FramePool:
+
+    '''Pool of reusable frame buffers for a single frame format.
+
+    Buffers are handed out by :meth:`acquire` and return to the pool
+    implicitly: a buffer is free again as soon as nothing outside the
+    pool holds a reference to it (or to a view of it).  Consumers of
+    :attr:`~QVideo.lib.QVideoSource.QVideoSource.newFrame` therefore
+    need no changes — a frame that is displayed, written and dropped
+    is recycled, while a frame that a consumer keeps (for example in a
+    ring buffer) is simply never reused.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of buffers the pool may allocate.
+        ``0`` disables pooling.  Default: ``8``.
+
+    Notes
+    -----
+    The pool is sized lazily by :meth:`configure`, normally with the
+    shape and dtype of the first frame delivered by the camera.
+    Changing the format discards every buffer; buffers still held by
+    consumers are unaffected because the pool only drops its own
+    references.
+    '''
+
+    _BASELINE = _baseline()
+
+    def __init__(self, size: int = 8) -> None:
+        self._size = max(0, int(size))
+        self._shape: tuple[int, ...] | None = None
+        self._dtype: np.dtype | None = None
+        self._buffers: list[np.ndarray] = []
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def size(self) -> int:
+        '''Maximum number of buffers the pool may allocate.'''
+        return self._size
+
+    @size.setter
+    def size(self, size: int) -> None:
+        self._size = max(0, int(size))
+        del self._buffers[self._size:]
+        self._next = 0
+
+    @property
+    def shape(self) -> tuple[int, ...] | None:
+        '''Shape of pooled buffers, or ``None`` before :meth:`configure`.'''
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype | None:
+        '''Data type of pooled buffers, or ``None`` before :meth:`configure`.'''
+        return self._dtype
+
+    def configure(self, shape: tuple[int, ...], dtype: np.dtype) -> None:
+        '''Set the buffer format, discarding buffers of any other format.
+
+        Cheap to call for every frame: nothing happens when the format
+        is unchanged.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            Array shape of each buffer.
+        dtype : numpy.dtype
+            Data type of each buffer.
+        '''
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        if shape == self._shape and dtype == self._dtype:
+            return
+        logger.debug(f'Pooling {shape} {dtype} frames')
+        self._shape = shape
+        self._dtype = dtype
+        self.clear()
+
+    def clear(self) -> None:
+        '''Release every pooled buffer.'''
+        self._buffers.clear()
+        self._next = 0
+
+    def _isFree(self, index: int) -> bool:
+        return sys.getrefcount(self._buffers[index]) <= self._BASELINE
+
+    def available(self) -> int:
+        '''Number of allocated buffers not currently held by consumers.'''
+        return sum(self._isFree(n) for n in range(len(self._buffers)))
+
+    def acquire(self) -> np.ndarray | None:
+        '''Return a buffer that no consumer is holding.
+
+        Buffers are searched in round-robin order so that the buffer
+        released longest ago is reused first.  A new buffer is
+        allocated when none is free and the pool has not reached
+        :attr:`size`.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            A free buffer, or ``None`` if the pool is unconfigured,
+            disabled, or exhausted.  Callers fall back to allocating
+            a fresh frame in that case.
+        '''
+        if self._shape is None or self._size == 0:
+            return None
+        count = len(self._buffers)
+        for n in range(count):
+            index = (self._next + n) % count
+            if self._isFree(index):
+                self._next = (index + 1) % count
+                return self._buffers[index]
+        if count < self._size:
+            buffer = np.empty(self._shape, self._dtype)
+            self._buffers.append(buffer)
+            self._next = 0
+            return buffer
+        return None
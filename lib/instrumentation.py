@@ -0,0 +1,275 @@
+'''Per-stage latency histograms for the capture and display pipeline.'''
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter_ns
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['LatencyHistogram', 'Profiler', 'profiler']
+
+
+class LatencyHistogram:
+
+    '''Fixed-size histogram of durations with logarithmic buckets.
+
+    Durations are recorded in nanoseconds into buckets whose width
+    grows with the duration: each power of two is divided into eight
+    buckets, so quantiles are resolved to within about 6% from 1 ns up
+    to :attr:`LIMIT`.  Recording is a few integer operations, and the
+    memory footprint does not depend on the number of samples.
+
+    Methods
+    -------
+    record(ns) -> None
+        Add one duration [ns].
+    percentile(p) -> float
+        Estimated *p*-th percentile [s].
+    summary() -> dict
+        Count, mean, p50, p95, p99 and max.
+    reset() -> None
+        Discard all samples.
+    '''
+
+    #: Largest duration resolved by the histogram [ns].  Longer
+    #: durations are counted in the last bucket.
+    LIMIT = 1 << 40
+
+    _SIZE = (LIMIT.bit_length() - 3) * 8
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        '''Discard all samples.'''
+        self._counts = [0] * self._SIZE
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    @classmethod
+    def _bucket(cls, ns: int) -> int:
+        bits = ns.bit_length()
+        if bits <= 4:
+            return ns
+        shift = bits - 4
+        return min(shift * 8 + (ns >> shift), cls._SIZE - 1)
+
+    @staticmethod
+    def _middle(bucket: int) -> float:
+        '''Midpoint of *bucket* [ns].'''
+        if bucket < 16:
+            return float(bucket)
+        shift = bucket // 8 - 1
+        mantissa = bucket % 8 + 8
+        return (mantissa + 0.5) * (1 << shift)
+
+    def record(self, ns: int) -> None:
+        '''Add one duration.
+
+        Parameters
+        ----------
+        ns : int
+            Duration [ns].  Negative values are counted as zero.
+        '''
+        ns = max(0, int(ns))
+        self._counts[self._bucket(ns)] += 1
+        self._count += 1
+        self._total += ns
+        if ns > self._max:
+            self._max = ns
+
+    @property
+    def count(self) -> int:
+        '''Number of recorded samples.'''
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        '''Mean duration [s].'''
+        return self._total / self._count * 1e-9 if self._count else 0.
+
+    @property
+    def max(self) -> float:
+        '''Longest duration recorded [s].'''
+        return self._max * 1e-9
+
+    def percentile(self, p: float) -> float:
+        '''Return the estimated *p*-th percentile [s].
+
+        Parameters
+        ----------
+        p : float
+            Percentile in the range [0, 100].
+        '''
+        if self._count == 0:
+            return 0.
+        rank = max(1., min(p, 100.) / 100. * self._count)
+        total = 0
+        for bucket, n in enumerate(self._counts):
+            total += n
+            if total >= rank:
+                return min(self._middle(bucket), self._max) * 1e-9
+        return self.max
+
+    def summary(self) -> dict[str, float | int]:
+        '''Return ``count``, ``mean``, ``p50``, ``p95``, ``p99`` and ``max``.
+
+        Times are in seconds.
+        '''
+        return dict(count=self.count,
+                    mean=self.mean,
+                    p50=self.percentile(50),
+                    p95=self.percentile(95),
+                    p99=self.percentile(99),
+                    max=self.max)
+
+
+class Profiler:
+
+    '''Registry of named :class:`LatencyHistogram` stages.
+
+    The pipeline's components record into the shared :data:`profiler`
+    instance when it is enabled.  Each component checks
+    :attr:`enabled` once per frame, so instrumentation costs nothing
+    measurable while it is switched off.
+
+    Notes
+    -----
+    The stages recorded by QVideo are:
+
+    ``camera.read``
+        :meth:`~QVideo.lib.QCamera.QCamera.read` in the capture thread.
+    ``source.emit``
+        Emitting ``newFrame`` and ``newFrameInfo``, including slots
+        called directly in the capture thread.
+    ``screen.delivery``
+        From capture to the frame's arrival in
+        :meth:`~QVideo.lib.QVideoScreen.QVideoScreen.setImage`.
+    ``filter.<Name>``
+        Each filter in a :class:`~QVideo.lib.QFilterBank.QFilterBank`
+        or :class:`~QVideo.lib.QFilterRack.QFilterRack`.
+    ``screen.setImage``
+        Uploading the filtered frame to the display.
+    ``writer.write``
+        Writing one frame in
+        :meth:`~QVideo.lib.QVideoWriter.QVideoWriter.write`.
+
+    Parameters
+    ----------
+    enabled : bool
+        Initial state.  Default: ``False``.
+
+    Examples
+    --------
+    >>> from QVideo.lib import profiler
+    >>> profiler.enabled = True
+    >>> # ... run the application ...
+    >>> print(profiler.report())
+    '''
+
+    #: Maximum number of frames with outstanding capture stamps.
+    STAMPS = 64
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = bool(enabled)
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._stamps: dict[int, int] = {}
+        self._lock = Lock()
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        '''Return the histogram for *stage*, creating it if needed.'''
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            histogram = self._histograms.setdefault(stage,
+                                                    LatencyHistogram())
+        return histogram
+
+    def stages(self) -> list[str]:
+        '''Names of the stages recorded so far.'''
+        return list(self._histograms)
+
+    def record(self, stage: str, ns: int) -> None:
+        '''Record a duration [ns] for *stage*.'''
+        self.histogram(stage).record(ns)
+
+    def timed(self, stage: str, func: Callable, *args, **kwargs) -> object:
+        '''Call *func*, record its duration and return its result.'''
+        start = perf_counter_ns()
+        result = func(*args, **kwargs)
+        self.histogram(stage).record(perf_counter_ns() - start)
+        return result
+
+    def apply(self, filters: Iterable[Callable], image: object) -> object:
+        '''Apply *filters* to *image* in order, timing each one.
+
+        Each filter is recorded as ``filter.<Name>``, where *Name* is
+        the class of the filter, or of the
+        :class:`~QVideo.lib.QVideoFilter.VideoFilter` wrapped by a
+        :class:`~QVideo.lib.QVideoFilter.QVideoFilter` widget.
+        '''
+        for videoFilter in filters:
+            name = type(getattr(videoFilter, 'filter', videoFilter)).__name__
+            start = perf_counter_ns()
+            image = videoFilter(image)
+            self.histogram(f'filter.{name}').record(perf_counter_ns() - start)
+        return image
+
+    @contextmanager
+    def measure(self, stage: str):
+        '''Context manager that records the duration of its block.'''
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.histogram(stage).record(perf_counter_ns() - start)
+
+    def stamp(self, frame: object, ns: int) -> None:
+        '''Remember the capture time [ns] of *frame*.
+
+        Used with :meth:`since` to measure latency between threads.
+        Only the most recent :attr:`STAMPS` frames are remembered.
+        '''
+        with self._lock:
+            self._stamps.pop(id(frame), None)
+            self._stamps[id(frame)] = ns
+            if len(self._stamps) > self.STAMPS:
+                del self._stamps[next(iter(self._stamps))]
+
+    def since(self, stage: str, frame: object) -> None:
+        '''Record the time since *frame* was stamped as *stage*.
+
+        Does nothing if *frame* was not stamped.
+        '''
+        with self._lock:
+            ns = self._stamps.get(id(frame))
+        if ns is not None:
+            self.histogram(stage).record(perf_counter_ns() - ns)
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        '''Return :meth:`LatencyHistogram.summary` for every stage.'''
+        return {stage: histogram.summary()
+                for stage, histogram in list(self._histograms.items())}
+
+    def report(self) -> str:
+        '''Return a table of stage statistics in milliseconds.'''
+        lines = [f'{"stage":<24}{"count":>8}'
+                 f'{"p50":>9}{"p95":>9}{"p99":>9}{"max":>9}']
+        for stage, s in self.stats().items():
+            lines.append(f'{stage:<24}{s["count"]:>8}'
+                         f'{1e3 * s["p50"]:>9.3f}{1e3 * s["p95"]:>9.3f}'
+                         f'{1e3 * s["p99"]:>9.3f}{1e3 * s["max"]:>9.3f}')
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        '''Discard all recorded samples.'''
+        with self._lock:
+            self._stamps.clear()
+        for histogram in list(self._histograms.values()):
+            histogram.reset()
+
+
+#: Shared profiler used by the QVideo pipeline components.
+profiler = Profiler()
@@ -0,0 +1,211 @@
+'''Packed pixel formats.
+
+Machine-vision cameras reach their highest frame rates when 10- and
+12-bit pixels are transmitted without padding to 16 bits.  Two
+families of packed formats are in common use:
+
+``Mono10p``, ``Mono12p``, ``BayerRG12p``, ...
+    PFNC packing: pixels form one continuous little-endian bit
+    stream, least significant bit first.  Four 10-bit pixels occupy
+    five bytes; two 12-bit pixels occupy three bytes.
+``Mono10Packed``, ``Mono12Packed``, ``BayerRG12Packed``, ...
+    GigE Vision packing: two pixels occupy three bytes.  The first
+    and third bytes hold the most significant bits of each pixel and
+    the middle byte holds the remaining low bits of both.
+
+:func:`unpack` expands packed data into ``uint16`` pixels with their
+native 10- or 12-bit values, as the corresponding unpacked format
+would deliver them.  :func:`pack` reverses the operation.  Both work
+on whole arrays with a handful of vectorized bit operations and can
+write into preallocated buffers.
+'''
+from numpy.typing import NDArray
+import numpy as np
+import re
+
+
+__all__ = ['is_packed', 'unpacked_format', 'bit_depth',
+           'packed_size', 'unpacked_size', 'unpack', 'pack']
+
+
+# Layout of one group of packed pixels.  Each entry
+# (pixel, byte, nbits, lo, at) states that bits [at, at + nbits) of
+# byte *byte* hold bits [lo, lo + nbits) of pixel *pixel*.
+_LAYOUTS = {
+    (10, 'p'): (4, 5, ((0, 0, 8, 0, 0), (0, 1, 2, 8, 0),
+                       (1, 1, 6, 0, 2), (1, 2, 4, 6, 0),
+                       (2, 2, 4, 0, 4), (2, 3, 6, 4, 0),
+                       (3, 3, 2, 0, 6), (3, 4, 8, 2, 0))),
+    (12, 'p'): (2, 3, ((0, 0, 8, 0, 0), (0, 1, 4, 8, 0),
+                       (1, 1, 4, 0, 4), (1, 2, 8, 4, 0))),
+    (10, 'Packed'): (2, 3, ((0, 0, 8, 2, 0), (0, 1, 2, 0, 0),
+                            (1, 2, 8, 2, 0), (1, 1, 2, 0, 4))),
+    (12, 'Packed'): (2, 3, ((0, 0, 8, 4, 0), (0, 1, 4, 0, 0),
+                            (1, 2, 8, 4, 0), (1, 1, 4, 0, 4))),
+}
+
+_FORMAT = re.compile(r'^(\w*?)(10|12)(p|Packed)$')
+
+
+def _match(pixelformat: str) -> re.Match:
+    match = _FORMAT.match(pixelformat)
+    if match is None:
+        raise ValueError(f'{pixelformat!r} is not a packed pixel format')
+    return match
+
+
+def _layout(pixelformat: str) -> tuple[int, int, tuple]:
+    '''Return pixels per group, bytes per group and bit layout.'''
+    match = _match(pixelformat)
+    return _LAYOUTS[int(match.group(2)), match.group(3)]
+
+
+def is_packed(pixelformat: str) -> bool:
+    '''Return ``True`` if *pixelformat* is a supported packed format.'''
+    return _FORMAT.match(pixelformat) is not None
+
+
+def unpacked_format(pixelformat: str) -> str:
+    '''Return the name of the unpacked counterpart of *pixelformat*.
+
+    For example, ``'Mono12'`` for ``'Mono12p'`` or ``'Mono12Packed'``.
+    Names of formats that are not packed are returned unchanged.
+    '''
+    match = _FORMAT.match(pixelformat)
+    return pixelformat if match is None else match.group(1) + match.group(2)
+
+
+def bit_depth(pixelformat: str) -> int:
+    '''Return the number of bits per pixel of a packed format.'''
+    return int(_match(pixelformat).group(2))
+
+
+def packed_size(npixels: int, pixelformat: str) -> int:
+    '''Return the number of bytes occupied by *npixels* packed pixels.'''
+    pixels, nbytes, _ = _layout(pixelformat)
+    return -(-npixels * nbytes // pixels)
+
+
+def unpacked_size(nbytes: int, pixelformat: str) -> int:
+    '''Return the number of whole pixels held by *nbytes* packed bytes.'''
+    pixels, size, _ = _layout(pixelformat)
+    return nbytes * pixels // size
+
+
+def _padded(data: np.ndarray, size: int) -> np.ndarray:
+    '''Return *data* extended with zeros to *size* elements.'''
+    if data.size == size:
+        return data
+    padded = np.zeros(size, data.dtype)
+    padded[:data.size] = data
+    return padded
+
+
+def unpack(data: NDArray[np.uint8],
+           pixelformat: str,
+           shape: tuple[int, ...],
+           out: NDArray[np.uint16] | None = None) -> NDArray[np.uint16]:
+    '''Expand packed pixel data into a ``uint16`` frame.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Packed bytes, of any shape.  Bytes beyond the last pixel are
+        ignored.
+    pixelformat : str
+        Packed format of *data*, e.g. ``'Mono12p'``.
+    shape : tuple[int, ...]
+        Shape of the unpacked frame.
+    out : numpy.ndarray, optional
+        Buffer to fill.  Used only if it is a contiguous ``uint16``
+        array of the requested shape; otherwise a new array is
+        allocated.
+
+    Returns
+    -------
+    numpy.ndarray
+        Unpacked frame; *out* itself when it could be used.
+    '''
+    pixels, nbytes, layout = _layout(pixelformat)
+    if (out is None or out.shape != tuple(shape) or
+            out.dtype != np.uint16 or not out.flags.c_contiguous):
+        out = np.empty(shape, np.uint16)
+    npixels = out.size
+    groups = -(-npixels // pixels)
+    raw = np.asarray(data, np.uint8).reshape(-1)
+    if raw.size < packed_size(npixels, pixelformat):
+        raise ValueError(f'{raw.size} bytes are too few for {npixels} '
+                         f'{pixelformat} pixels')
+    raw = _padded(raw[:groups * nbytes], groups * nbytes)
+    whole = npixels == groups * pixels
+    target = out if whole else np.empty(groups * pixels, np.uint16)
+    src = raw.reshape(groups, nbytes)
+    dst = target.reshape(groups, pixels)
+    scratch = np.empty(groups, np.uint16)
+    filled = set()
+    for pixel, byte, nbits, lo, at in layout:
+        field = np.right_shift(src[:, byte], at, dtype=np.uint16,
+                               out=scratch)
+        if nbits + at < 8:
+            field &= (1 << nbits) - 1
+        field <<= lo
+        if pixel in filled:
+            dst[:, pixel] |= field
+        else:
+            dst[:, pixel] = field
+            filled.add(pixel)
+    if not whole:
+        out.reshape(-1)[:] = target[:npixels]
+    return out
+
+
+def pack(frame: NDArray[np.uint16],
+         pixelformat: str,
+         out: NDArray[np.uint8] | None = None) -> NDArray[np.uint8]:
+    '''Pack the pixels of *frame* into *pixelformat*.
+
+    Pixel values must fit in the bit depth of *pixelformat*; higher
+    bits are discarded.
+
+    Parameters
+    ----------
+    frame : numpy.ndarray
+        Integer frame of any shape.
+    pixelformat : str
+        Packed format, e.g. ``'Mono12p'``.
+    out : numpy.ndarray, optional
+        Contiguous ``uint8`` buffer of :func:`packed_size` elements to
+        fill.  A new array is allocated if *out* does not fit.
+
+    Returns
+    -------
+    numpy.ndarray
+        One-dimensional array of packed bytes.
+    '''
+    pixels, nbytes, layout = _layout(pixelformat)
+    npixels = frame.size
+    size = packed_size(npixels, pixelformat)
+    if (out is None or out.shape != (size,) or
+            out.dtype != np.uint8 or not out.flags.c_contiguous):
+        out = np.empty(size, np.uint8)
+    groups = -(-npixels // pixels)
+    values = _padded(np.asarray(frame, np.uint16).reshape(-1),
+                     groups * pixels).reshape(groups, pixels)
+    whole = size == groups * nbytes
+    target = out if whole else np.empty(groups * nbytes, np.uint8)
+    dst = target.reshape(groups, nbytes)
+    scratch = np.empty(groups, np.uint16)
+    filled = set()
+    for pixel, byte, nbits, lo, at in layout:
+        field = np.right_shift(values[:, pixel], lo, out=scratch)
+        field &= (1 << nbits) - 1
+        field <<= at
+        if byte in filled:
+            np.bitwise_or(dst[:, byte], field, out=dst[:, byte],
+                          casting='unsafe')
+        else:
+            dst[:, byte] = field
+            filled.add(byte)
+    if not whole:
+        out[:] = target[:size]
+    return out
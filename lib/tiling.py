@@ -0,0 +1,205 @@
+'''Tile-parallel execution of spatially local filters.
+
+Neighborhood operations such as blurs and edge detectors compute each
+output pixel from a small window of input pixels.  A large frame can
+therefore be cut into tiles that are processed concurrently, provided
+that each tile carries a *halo* of neighboring rows at least as wide as
+the radius of the window.  OpenCV and NumPy release the GIL while they
+work, so the tiles run in parallel in ordinary threads.
+
+:class:`TileExecutor` cuts frames into horizontal bands, one per
+worker, so that every tile spans whole rows and is contiguous in
+memory.  The tiles are processed in a thread pool and their interiors
+are written into an output frame allocated once per call.  Because
+each tile sees every input pixel that its interior depends on, and
+tiles at the top and bottom of the frame see the true frame edge, the
+result is identical to processing the whole frame at once.
+
+Filters declare the radius they need as
+:attr:`~QVideo.lib.QVideoFilter.VideoFilter.halo` and pass their
+per-frame computation to :func:`tiled`.
+
+Threads that already run in parallel with their siblings, such as the
+workers of :class:`~QVideo.lib.PooledVideoFilter.PooledVideoFilter`
+and the tile threads themselves, call :func:`mark_pool_worker` when
+they start.  Frames are processed whole in those threads, so that the
+number of busy threads stays near the number of cores rather than
+growing with the product of the pool sizes.
+'''
+import math
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from QVideo.lib.videotypes import Image
+import numpy as np
+
+
+__all__ = ['TileExecutor', 'tiled', 'gaussian_radius', 'mark_pool_worker']
+
+
+_local = threading.local()
+
+
+def mark_pool_worker() -> None:
+    '''Process frames whole in the calling thread.
+
+    Intended as the ``initializer`` of thread pools whose workers
+    already run concurrently.
+    '''
+    _local.worker = True
+
+
+def gaussian_radius(sigma: float) -> int:
+    '''Return the radius of the kernel OpenCV uses for a Gaussian blur.
+
+    Applies to blurs with automatic kernel size, ``ksize=(0, 0)``,
+    for which OpenCV truncates the kernel at four standard deviations
+    or fewer.
+
+    Parameters
+    ----------
+    sigma : float
+        Standard deviation of the Gaussian [pixels].
+    '''
+    return math.ceil(4. * sigma) + 1
+
+
+class TileExecutor:
+
+    '''Apply local operations to frames in concurrent tiles.
+
+    Parameters
+    ----------
+    workers : int or None
+        Number of tiles per frame.  ``None`` (default) uses one per
+        core.  The calling thread processes one of the tiles, so the
+        pool holds one thread fewer.
+    min_pixels : int
+        Frames with fewer pixels are processed whole, because the cost
+        of dispatching tiles would exceed the gain.
+        Default: ``1 << 19``.
+    '''
+
+    #: Smallest tile height [rows], in units of the halo.
+    MIN_ROWS = 4
+
+    def __init__(self,
+                 workers: int | None = None,
+                 min_pixels: int = 1 << 19) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = max(1, int(workers))
+        self.min_pixels = int(min_pixels)
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        '''Number of tiles per frame.'''
+        return self._workers
+
+    def _tiles(self, rows: int, halo: int) -> list[tuple[int, int]]:
+        '''Return the first and last row of each tile's interior.'''
+        count = min(self._workers,
+                    rows // max(16, self.MIN_ROWS * halo))
+        edges = [rows * n // max(1, count) for n in range(count + 1)]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def apply(self,
+              function: Callable[[Image], Image],
+              image: Image,
+              halo: int) -> Image:
+        '''Return ``function(image)``, computed in concurrent tiles.
+
+        Parameters
+        ----------
+        function : callable
+            Local operation.  Must return a frame with the rows and
+            columns of its input, and may be called concurrently.
+        image : Image
+            Input frame.
+        halo : int
+            Radius of the neighborhood that determines each output
+            pixel of *function* [pixels].
+
+        Returns
+        -------
+        Image
+            The result of *function*, identical to calling it on
+            *image* directly.  Computed in the calling thread alone if
+            that thread is a pool worker.
+        '''
+        rows, columns = image.shape[:2]
+        tiles = self._tiles(rows, halo)
+        if (len(tiles) < 2 or rows * columns < self.min_pixels or
+                getattr(_local, 'worker', False)):
+            return function(image)
+        pool = self._pool
+        if pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        self._workers - 1,
+                        thread_name_prefix='QVideo-tile',
+                        initializer=mark_pool_worker)
+                pool = self._pool
+        output: list[Image] = []
+        lock = threading.Lock()
+
+        def run(top: int, bottom: int) -> None:
+            start = max(0, top - halo)
+            result = function(image[start:min(rows, bottom + halo)])
+            result = result[top - start:bottom - start]
+            with lock:
+                if not output:
+                    output.append(np.empty((rows, *result.shape[1:]),
+                                           result.dtype))
+            output[0][top:bottom] = result
+
+        futures = [pool.submit(run, *tile) for tile in tiles[1:]]
+        run(*tiles[0])
+        for future in futures:
+            future.result()
+        return output[0]
+
+    def shutdown(self) -> None:
+        '''Stop the worker threads.  They restart when next needed.'''
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+
+_executor: TileExecutor | None = None
+_executorLock = threading.Lock()
+
+
+def tiled(function: Callable[[Image], Image],
+          image: Image,
+          halo: int | None) -> Image:
+    '''Apply a local operation to *image* with the shared executor.
+
+    Parameters
+    ----------
+    function : callable
+        Local operation; see :meth:`TileExecutor.apply`.
+    image : Image
+        Input frame.
+    halo : int or None
+        Radius of the operation [pixels].  ``None`` calls *function*
+        on the whole frame.
+
+    Returns
+    -------
+    Image
+        ``function(image)``.
+    '''
+    global _executor
+    if halo is None:
+        return function(image)
+    if _executor is None:
+        with _executorLock:
+            if _executor is None:
+                _executor = TileExecutor()
+    return _executor.apply(function, image, halo)
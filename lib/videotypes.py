@@ -1,8 +1,82 @@
-'''Shared type aliases used across QVideo.'''
+'''Shared type aliases and pixel-type helpers used across QVideo.
+
+Frames travel through QVideo in their native pixel type.  Three types
+are supported end to end:
+
+``uint8``
+    Full scale is 255.  The common case for consumer cameras.
+``uint16``
+    Full scale is 65535.  Scientific cameras deliver 10-, 12- or
+    16-bit data in 16-bit containers.
+``float32``
+    Full scale is 1.  Produced by filters that compute ratios or
+    averages and want to keep the fractional part.
+
+Filter parameters that are intensities (thresholds, target means)
+are expressed on the familiar 8-bit scale and multiplied by
+``full_scale(dtype) / 255`` for other pixel types, so that a setting
+means the same fraction of full scale whatever the camera delivers.
+'''
 from typing import TypeAlias
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 import numpy as np
 
-Image: TypeAlias = NDArray[np.uint8]
 
-__all__ = ['Image']
+__all__ = ['Image', 'DTYPES', 'full_scale', 'saturate', 'rescale']
+
+
+Image: TypeAlias = NDArray[np.uint8] | NDArray[np.uint16] | NDArray[np.float32]
+
+#: Pixel types carried natively through the pipeline.
+DTYPES: tuple[type, ...] = (np.uint8, np.uint16, np.float32)
+
+
+def full_scale(dtype: DTypeLike) -> float:
+    '''Return the value of a full-scale pixel of type *dtype*.
+
+    Integer types saturate at their maximum value; floating-point
+    images are normalized so that full scale is ``1.0``.
+    '''
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'ui':
+        return float(np.iinfo(dtype).max)
+    return 1.
+
+
+def saturate(values: np.ndarray, dtype: DTypeLike) -> Image:
+    '''Convert *values* to *dtype*, clipping to the range of integer types.
+
+    Fractional parts are truncated, as by :meth:`numpy.ndarray.astype`.
+    Floating-point results are not clipped.
+    '''
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'ui':
+        info = np.iinfo(dtype)
+        values = np.clip(values, info.min, info.max)
+    return values.astype(dtype, copy=False)
+
+
+def rescale(image: Image, dtype: DTypeLike) -> Image:
+    '''Convert *image* to *dtype*, mapping full scale onto full scale.
+
+    Returns *image* itself when it already has type *dtype*.
+
+    Parameters
+    ----------
+    image : Image
+        Frame to convert.
+    dtype : numpy dtype
+        Target pixel type.
+
+    Returns
+    -------
+    Image
+        Converted frame.
+    '''
+    dtype = np.dtype(dtype)
+    if image.dtype == dtype:
+        return image
+    scale = full_scale(dtype) / full_scale(image.dtype)
+    if dtype.kind in 'ui':
+        return saturate(np.rint(image * np.float32(scale)), dtype)
+    return (image * np.float32(scale)).astype(dtype)
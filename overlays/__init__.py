@@ -1,6 +1,13 @@
 '''Graphical overlays for :class:`~QVideo.lib.QVideoScreen.QVideoScreen`.'''
+from QVideo.lib._lazy import attach
 
-from .trackpy import QTrackpyOverlay, QTrackpyWidget
-from .yolo import QYoloOverlay, QYoloWidget
 
-__all__ = ['QTrackpyOverlay', 'QTrackpyWidget', 'QYoloOverlay', 'QYoloWidget']
+_EXPORTS = {
+    'QTrackpyOverlay': '.trackpy',
+    'QTrackpyWidget': '.trackpy',
+    'QYoloOverlay': '.yolo',
+    'QYoloWidget': '.yolo',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+__all__ = list(_EXPORTS)
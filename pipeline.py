@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+
+'''Headless capture pipeline: camera → filters → writer, without a GUI.
+
+Run directly to stream a camera through a chain of video filters into
+a video file::
+
+    python -m QVideo.pipeline [-b|-c|-f|-i|-m|-p|-v] [cameraID]
+                              [-o FILE] [-n FRAMES] [-t SECONDS]
+                              [--filter NAME[:key=value,...]] ...
+                              [--profile]
+
+Frames are captured by a :class:`~QVideo.lib.QVideoSource.QVideoSource`
+in its own thread and processed by the filters and the writer in a
+second thread.  The two are coupled by a
+:class:`~QVideo.lib.QFrameMailbox.QFrameMailbox`, so a slow filter or
+disk cannot stall capture: when the processing thread falls behind,
+the oldest unprocessed frames are discarded and counted.  Throughput
+and drop statistics are printed when the pipeline stops, either after
+the requested number of frames or seconds, or on ``Ctrl+C``.
+
+Filters are named by their class in :mod:`QVideo.filters`, optionally
+followed by constructor arguments::
+
+    python -m QVideo.pipeline -c -o out.avi -t 10 \\
+        --filter GammaFilter:gamma=0.8 --filter Median
+
+If no camera flag is given, a noise camera is used.
+'''
+
+from argparse import ArgumentParser
+from collections.abc import Sequence
+from time import perf_counter
+from qtpy import QtCore
+from QVideo.lib.QFrameMailbox import QFrameMailbox
+from QVideo.lib.QVideoFilter import VideoFilter
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.QVideoWriter import QVideoWriter
+from QVideo.lib.frameinfo import FrameInfo
+from QVideo.lib.instrumentation import profiler
+from QVideo.lib.videotypes import Image
+import numpy as np
+import ast
+import signal
+import sys
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['Pipeline', 'main']
+
+
+class _Worker(QtCore.QObject):
+
+    '''Applies the filters and the writer in the processing thread.'''
+
+    finished = QtCore.Signal()
+
+    def __init__(self,
+                 filters: Sequence[VideoFilter],
+                 writer: QVideoWriter | None,
+                 nframes: int | None) -> None:
+        super().__init__()
+        self.filters = list(filters)
+        self.writer = writer
+        self.nframes = nframes
+        self.processed = 0
+
+    @QtCore.Slot(np.ndarray, object)
+    def process(self, frame: Image, info: FrameInfo) -> None:
+        if self.nframes is not None and self.processed >= self.nframes:
+            return
+        profiled = profiler.enabled
+        for videoFilter in self.filters:
+            if profiled:
+                stage = f'filter.{type(videoFilter).__name__}'
+                frame = profiler.timed(stage, videoFilter, frame)
+            else:
+                frame = videoFilter(frame)
+            if frame is None:
+                return
+        self.processed += 1
+        if self.writer is not None:
+            self.writer.writeInfo(frame, info)
+        if self.processed == self.nframes:
+            self.finished.emit()
+
+
+class Pipeline(QtCore.QObject):
+
+    '''Stream frames from a video source through filters to a writer.
+
+    The source captures in its own thread.  Filters and the writer run
+    in a dedicated processing thread fed by a
+    :class:`~QVideo.lib.QFrameMailbox.QFrameMailbox` that holds at most
+    *slots* frames, so processing never blocks capture and memory use
+    is bounded.  Frames that the processing thread could not take up
+    in time are counted in :meth:`stats`.
+
+    Parameters
+    ----------
+    source : QVideoSource
+        Source of frames.  The pipeline starts and stops it.
+    filters : Sequence[VideoFilter]
+        Filters applied in order to every frame.  A filter that returns
+        ``None`` withholds the frame from the writer.  Default: none.
+    writer : QVideoWriter or None
+        Writer for the filtered frames.  Frames are written with their
+        capture metadata through
+        :meth:`~QVideo.lib.QVideoWriter.QVideoWriter.writeInfo`.
+        Default: ``None``.
+    slots : int
+        Capacity of the mailbox between capture and processing.
+        Default: ``4``.
+    nframes : int or None
+        Stop after this many frames have been processed.  ``None``
+        runs until :meth:`stop` is called or the writer finishes.
+        Default: ``None``.
+    parent : QObject or None
+        Parent object.
+
+    Signals
+    -------
+    finished()
+        Emitted once the pipeline has stopped and released its
+        resources.
+
+    Examples
+    --------
+    >>> source = QNoiseSource()
+    >>> pipeline = Pipeline(source, [GammaFilter(0.8)], nframes=100)
+    >>> pipeline.finished.connect(app.quit)
+    >>> pipeline.start()
+    >>> app.exec()
+    >>> print(pipeline.report())
+    '''
+
+    #: Emitted when the pipeline has stopped.
+    finished = QtCore.Signal()
+
+    def __init__(self,
+                 source: QVideoSource,
+                 filters: Sequence[VideoFilter] = (),
+                 writer: QVideoWriter | None = None,
+                 slots: int = 4,
+                 nframes: int | None = None,
+                 parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._source = source
+        self._writer = writer
+        self._running = False
+        self._started = None
+        self._elapsed = 0.
+        self._overwritten = 0
+        self._thread = QtCore.QThread(self)
+        self._mailbox = QFrameMailbox(source, slots, info=True)
+        self._worker = _Worker(filters, writer, nframes)
+        self._mailbox.newFrameInfo.connect(self._worker.process)
+        self._worker.finished.connect(self.stop)
+        for obj in (self._mailbox, self._worker, writer):
+            if obj is not None:
+                obj.moveToThread(self._thread)
+        if writer is not None:
+            writer.finished.connect(self.stop)
+
+    @property
+    def source(self) -> QVideoSource:
+        '''The video source feeding the pipeline.'''
+        return self._source
+
+    @property
+    def filters(self) -> list[VideoFilter]:
+        '''Filters applied to each frame, in order.'''
+        return self._worker.filters
+
+    @property
+    def writer(self) -> QVideoWriter | None:
+        '''The writer for filtered frames, or ``None``.'''
+        return self._writer
+
+    def isRunning(self) -> bool:
+        '''Return ``True`` between :meth:`start` and :meth:`stop`.'''
+        return self._running
+
+    @QtCore.Slot()
+    def start(self) -> 'Pipeline':
+        '''Start the processing thread and the source.
+
+        Returns
+        -------
+        Pipeline
+            ``self``, to allow chaining.
+        '''
+        if self._running:
+            return self
+        self._running = True
+        self._thread.start()
+        self._started = perf_counter()
+        if not self._source.isRunning():
+            self._source.start()
+        return self
+
+    @QtCore.Slot()
+    def stop(self) -> None:
+        '''Stop capture and processing and release the writer and filters.
+
+        Frames still waiting in the mailbox are discarded and counted
+        as overwritten.  Safe to call more than once.
+        '''
+        if not self._running:
+            return
+        self._running = False
+        self._source.stop()
+        self._source.wait()
+        self._thread.quit()
+        self._thread.wait()
+        self._elapsed = perf_counter() - self._started
+        self._overwritten = (self._mailbox.overwritten +
+                             len(self._mailbox.take()))
+        self._mailbox.close()
+        if self._writer is not None:
+            self._writer.close()
+        for videoFilter in self.filters:
+            videoFilter.shutdown()
+        logger.debug('pipeline stopped')
+        self.finished.emit()
+
+    def stats(self) -> dict[str, float | int]:
+        '''Return throughput and drop statistics.
+
+        Returns
+        -------
+        dict
+            ``elapsed``
+                Running time [s].
+            ``processed``
+                Frames that passed through every filter.
+            ``written``
+                Frames written by the writer.
+            ``overwritten``
+                Frames discarded because processing fell behind.
+            ``dropped``
+                Frames the camera reported as lost.
+            ``fps``
+                Processed frames per second.
+        '''
+        if self._running:
+            elapsed = perf_counter() - self._started
+            overwritten = self._mailbox.overwritten
+        else:
+            elapsed, overwritten = self._elapsed, self._overwritten
+        processed = self._worker.processed
+        return dict(elapsed=elapsed,
+                    processed=processed,
+                    written=(0 if self._writer is None else
+                             self._writer.framenumber),
+                    overwritten=overwritten,
+                    dropped=self._source.dropped,
+                    fps=processed / elapsed if elapsed > 0 else 0.)
+
+    def report(self) -> str:
+        '''Return a human-readable summary of :meth:`stats`.'''
+        s = self.stats()
+        return (f'elapsed:     {s["elapsed"]:.3f} s\n'
+                f'processed:   {s["processed"]} frames '
+                f'({s["fps"]:.1f} fps)\n'
+                f'written:     {s["written"]} frames\n'
+                f'overwritten: {s["overwritten"]} frames\n'
+                f'dropped:     {s["dropped"]} frames')
+
+
+def _makeFilter(spec: str) -> VideoFilter:
+    '''Build a filter from ``NAME[:key=value,...]``.
+
+    *NAME* is a :class:`~QVideo.lib.QVideoFilter.VideoFilter` subclass
+    exported by :mod:`QVideo.filters`.  Values are parsed as Python
+    literals where possible and passed as strings otherwise.
+
+    Raises
+    ------
+    ValueError
+        If *NAME* is not a video filter or an option is malformed.
+    '''
+    import QVideo.filters as filters
+    name, _, options = spec.partition(':')
+    cls = getattr(filters, name.strip(), None)
+    if not (isinstance(cls, type) and issubclass(cls, VideoFilter)):
+        raise ValueError(f'Unknown filter {name!r}')
+    kwargs = {}
+    for option in filter(None, options.split(',')):
+        key, sep, value = option.partition('=')
+        if not (sep and key.strip()):
+            raise ValueError(f'Malformed option {option!r} for {name}')
+        try:
+            kwargs[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            kwargs[key.strip()] = value.strip()
+    return cls(**kwargs)
+
+
+def _makeWriter(filename: str, fps: float,
+                nframes: int | None) -> QVideoWriter:
+    '''Return a writer for *filename*, selected by its extension.'''
+    from pathlib import Path
+    from QVideo.dvr import QDVRWidget
+    suffix = Path(filename).suffix.lower()
+    if suffix not in QDVRWidget.Writer:
+        raise ValueError(f'Unsupported file format {suffix!r}. '
+                         f'Available: {sorted(QDVRWidget.Writer)}')
+    writer = QDVRWidget.Writer[suffix]
+    return writer(filename, fps=fps, nframes=nframes or sys.maxsize)
+
+
+def main(argv: Sequence[str] | None = None) -> int:  # pragma: no cover
+    '''Run the headless pipeline from the command line.'''
+    from QVideo.lib.chooser import camera_parser, _CAMERAS
+    from QVideo.lib._camera import _open
+
+    parser = ArgumentParser(prog='python -m QVideo.pipeline',
+                            description='Headless video capture pipeline')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='output video file; the extension selects '
+                        'the format')
+    parser.add_argument('-n', '--frames', type=int, metavar='N',
+                        help='stop after N frames')
+    parser.add_argument('-t', '--duration', type=float, metavar='SECONDS',
+                        help='stop after SECONDS')
+    parser.add_argument('--filter', dest='filters', action='append',
+                        default=[], metavar='NAME[:key=value,...]',
+                        help='apply a filter from QVideo.filters; '
+                        'may be repeated')
+    parser.add_argument('--slots', type=int, default=4,
+                        help='frames buffered between capture and '
+                        'processing (default: %(default)d)')
+    parser.add_argument('--profile', action='store_true',
+                        help='report per-stage latency statistics')
+    args = camera_parser(parser).parse_args(argv)
+    profiler.enabled = args.profile
+
+    try:
+        filters = [_makeFilter(spec) for spec in args.filters]
+    except (ValueError, TypeError) as ex:
+        parser.error(str(ex))
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    model = next((key for key in _CAMERAS if getattr(args, key)), 'noise')
+    camera = _open(model, args.cameraID)
+    if camera is None:
+        return 1
+    source = QVideoSource(camera)
+    writer = None
+    if args.output:
+        try:
+            writer = _makeWriter(args.output, source.fps, args.frames)
+        except ValueError as ex:
+            parser.error(str(ex))
+    pipeline = Pipeline(source, filters, writer,
+                        slots=args.slots, nframes=args.frames)
+    pipeline.finished.connect(app.quit)
+
+    # Python signal handlers only run between bytecodes, so wake the
+    # interpreter periodically while Qt's event loop is idle.
+    signal.signal(signal.SIGINT, lambda *_: pipeline.stop())
+    wake = QtCore.QTimer()
+    wake.timeout.connect(lambda: None)
+    wake.start(200)
+    if args.duration is not None:
+        QtCore.QTimer.singleShot(int(1000 * args.duration), pipeline.stop)
+
+    pipeline.start()
+    app.exec()
+    print(pipeline.report())
+    if args.profile:
+        print(profiler.report())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,15 @@ exists puts Qt into a state where the subsequent QApplication() call aborts
 with SIGABRT.  Creating the application here (the first thing pytest runs)
 guarantees every test module sees an existing instance via
 QApplication.instance() and never calls the constructor a second time.
+
+Hardware probes cache their results on disk.  The cache is disabled for
+the test session so that mocked devices never reach the user's cache;
+tests of the cache point QVIDEO_CACHE_DIR at a temporary directory.
 """
+import os
 import sys
 from qtpy import QtWidgets
 
+os.environ['QVIDEO_CACHE_DIR'] = ''
+
 _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
@@ -0,0 +1,85 @@
+'''Unit tests for lib/bayer.py.'''
+import unittest
+import numpy as np
+from QVideo.lib.bayer import PATTERNS, bayer_pattern, demosaic
+
+
+_COLORS = dict(R=200, G=100, B=30)
+
+
+def make_mosaic(pattern, dtype=np.uint8, shape=(8, 8)):
+    '''Return a mosaic of a uniform color sampled through *pattern*.'''
+    mosaic = np.empty(shape, dtype)
+    for n, color in enumerate(pattern):
+        mosaic[n // 2::2, n % 2::2] = _COLORS[color]
+    return mosaic
+
+
+class TestBayerPattern(unittest.TestCase):
+
+    def test_pixel_formats(self):
+        self.assertEqual(bayer_pattern('BayerRG8'), 'RGGB')
+        self.assertEqual(bayer_pattern('BayerBG10'), 'BGGR')
+        self.assertEqual(bayer_pattern('BayerGR12p'), 'GRBG')
+        self.assertEqual(bayer_pattern('BayerGB16'), 'GBRG')
+
+    def test_other_formats_are_none(self):
+        for name in ('Mono8', 'RGB8', 'BGR8', 'YUV422_8'):
+            self.assertIsNone(bayer_pattern(name))
+
+
+class TestDemosaic(unittest.TestCase):
+
+    def test_every_pattern_recovers_color(self):
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                rgb = demosaic(make_mosaic(pattern), pattern)
+                self.assertEqual(rgb.shape, (8, 8, 3))
+                np.testing.assert_array_equal(rgb[3, 3], [200, 100, 30])
+
+    def test_keeps_16_bits(self):
+        rgb = demosaic(make_mosaic('RGGB', np.uint16), 'RGGB')
+        self.assertEqual(rgb.dtype, np.uint16)
+        np.testing.assert_array_equal(rgb[3, 3], [200, 100, 30])
+
+    def test_float(self):
+        mosaic = make_mosaic('GBRG', np.float32) / np.float32(255)
+        rgb = demosaic(mosaic, 'GBRG')
+        self.assertEqual(rgb.dtype, np.float32)
+        np.testing.assert_allclose(rgb[3, 3], np.array([200, 100, 30]) / 255,
+                                   atol=1e-4)
+
+    def test_unknown_pattern_raises(self):
+        with self.assertRaises(ValueError):
+            demosaic(make_mosaic('RGGB'), 'RGBW')
+
+
+class TestHalfResolution(unittest.TestCase):
+
+    def test_every_pattern_recovers_color(self):
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                rgb = demosaic(make_mosaic(pattern), pattern, half=True)
+                self.assertEqual(rgb.shape, (4, 4, 3))
+                np.testing.assert_array_equal(rgb[0, 0], [200, 100, 30])
+
+    def test_greens_are_averaged(self):
+        mosaic = make_mosaic('RGGB', np.uint8)
+        mosaic[0, 1], mosaic[1, 0] = 255, 254
+        rgb = demosaic(mosaic, 'RGGB', half=True)
+        self.assertEqual(rgb[0, 0, 1], 254)
+
+    def test_odd_dimensions_are_truncated(self):
+        rgb = demosaic(make_mosaic('BGGR', shape=(7, 9)), 'BGGR', half=True)
+        self.assertEqual(rgb.shape, (3, 4, 3))
+
+    def test_pixel_types_are_kept(self):
+        for dtype in (np.uint8, np.uint16, np.float32):
+            with self.subTest(dtype=dtype):
+                rgb = demosaic(make_mosaic('RGGB', dtype), 'RGGB', half=True)
+                self.assertEqual(rgb.dtype, dtype)
+                np.testing.assert_array_equal(rgb[1, 1], [200, 100, 30])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
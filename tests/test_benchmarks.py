@@ -0,0 +1,160 @@
+'''Unit tests for the benchmark suite.'''
+import unittest
+from unittest.mock import patch
+import numpy as np
+from qtpy import QtWidgets
+from QVideo.benchmarks import (available_filters, benchmark_filter,
+                               benchmark_throughput, benchmark_drops,
+                               locate_spots, score, benchmark_detection,
+                               import_time, metadata, compare)
+from QVideo.benchmarks.imports import _breakdown
+from QVideo.benchmarks.filters import benchmark_filters, _frames
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestFilters(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = _frames(32, 24, 'uint8', False, nframes=2)
+
+    def test_available_filters(self):
+        names = available_filters()
+        self.assertIn('Median', names)
+        self.assertNotIn('QFilterBank', names)
+
+    def test_benchmark_filter(self):
+        result = benchmark_filter('Median', self.frames,
+                                  min_time=0., min_calls=3)
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['calls'], 3)
+        self.assertGreater(result['median'], 0.)
+        self.assertGreater(result['fps'], 0.)
+
+    def test_benchmark_async_filter(self):
+        result = benchmark_filter('SmoothingFilter', self.frames,
+                                  min_time=0., min_calls=2)
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['calls'], 2)
+
+    def test_benchmark_filter_records_error(self):
+        frames = np.zeros((2, 24, 32), np.float32)
+        with patch('QVideo.filters.Median.__call__',
+                   side_effect=ValueError('bad\ndetail')):
+            result = benchmark_filter('Median', frames, min_time=0.)
+        self.assertEqual(result['error'], 'ValueError: bad')
+        self.assertIsNone(result['median'])
+
+    def test_benchmark_filters_records(self):
+        records = benchmark_filters(['Median'], resolutions=((32, 24),),
+                                    dtypes=('uint8',), min_time=0.)
+        self.assertEqual(len(records), 2)
+        self.assertEqual({r['color'] for r in records}, {False, True})
+        self.assertTrue(all(r['benchmark'] == 'filter' for r in records))
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_throughput(self):
+        record = benchmark_throughput(64, 48, duration=0.2)
+        self.assertEqual(record['benchmark'], 'throughput')
+        self.assertGreater(record['captured'], 0)
+        self.assertEqual(record['written'], 0)
+        self.assertEqual(record['dropped'], 0)
+
+    def test_drops(self):
+        record = benchmark_drops(100., 64, 48, duration=0.2)
+        self.assertEqual(record['fps'], 100.)
+        self.assertLess(record['capture_fps'], 150.)
+
+    def test_color_frames_are_raw_mosaics(self):
+        record = benchmark_throughput(64, 48, color=True, duration=0.2)
+        self.assertGreater(record['displayed'], 0)
+
+
+class TestDetection(unittest.TestCase):
+
+    def test_score_perfect(self):
+        truth = np.array([[1., 1.], [10., 10.]])
+        result = score(truth[::-1], truth)
+        self.assertEqual(result['matched'], 2)
+        self.assertEqual(result['precision'], 1.)
+        self.assertEqual(result['recall'], 1.)
+        self.assertEqual(result['rms'], 0.)
+
+    def test_score_each_truth_matched_once(self):
+        truth = np.array([[0., 0.]])
+        result = score(np.array([[0.5, 0.], [1., 0.], [9., 9.]]), truth)
+        self.assertEqual(result['matched'], 1)
+        self.assertAlmostEqual(result['precision'], 1. / 3.)
+        self.assertAlmostEqual(result['rms'], 0.5)
+
+    def test_score_empty(self):
+        result = score(np.empty((0, 2)), np.array([[1., 1.]]))
+        self.assertEqual(result['recall'], 0.)
+        self.assertIsNone(result['rms'])
+
+    def test_locate_spots(self):
+        image = np.zeros((20, 30), np.uint8)
+        image[4:7, 9:12] = 200
+        np.testing.assert_allclose(locate_spots(image), [[10., 5.]])
+
+    def test_benchmark_detection(self):
+        record = benchmark_detection(nframes=5, nparticles=5)
+        self.assertEqual(record['benchmark'], 'detection')
+        self.assertEqual(record['name'], 'locate_spots')
+        self.assertEqual(record['frames'], 5)
+        self.assertGreater(record['recall'], 0.5)
+        self.assertLess(record['rms'], 1.)
+
+
+class TestImports(unittest.TestCase):
+
+    def test_breakdown(self):
+        report = ('import time: self [us] | cumulative | imported package\n'
+                  'import time:       150 |        200 |   json.decoder\n'
+                  'import time:      1000 |       1200 | json\n')
+        self.assertEqual(_breakdown(report),
+                         [('json.decoder', 150 / 1e6, 200 / 1e6),
+                          ('json', 1000 / 1e6, 1200 / 1e6)])
+
+    def test_import_time(self):
+        record = import_time('import json', repeat=1, top=2)
+        self.assertEqual(record['benchmark'], 'imports')
+        self.assertGreater(record['seconds'], 0.)
+        self.assertGreater(record['modules'], 0)
+        self.assertLessEqual(len(record['slowest']), 2)
+
+
+class TestResults(unittest.TestCase):
+
+    def record(self, median):
+        return dict(benchmark='filter', name='Median', width=640,
+                    height=480, dtype='uint8', color=False, median=median)
+
+    def test_metadata(self):
+        meta = metadata()
+        for key in ('time', 'commit', 'qvideo', 'python', 'numpy', 'qt'):
+            self.assertIn(key, meta)
+
+    def test_compare_status(self):
+        for median, status in ((1.2, 'regression'),
+                               (0.8, 'improvement'),
+                               (1.05, 'same')):
+            rows = compare([self.record(1.)], [self.record(median)])
+            self.assertEqual(rows[0]['status'], status)
+
+    def test_compare_higher_is_better(self):
+        old = dict(benchmark='throughput', width=640, height=480,
+                   dtype='uint8', color=False, writer=None, capture_fps=100.)
+        new = dict(old, capture_fps=50.)
+        self.assertEqual(compare([old], [new])[0]['status'], 'regression')
+
+    def test_compare_skips_unmatched_and_failed(self):
+        self.assertEqual(compare([], [self.record(1.)]), [])
+        self.assertEqual(compare([self.record(None)], [self.record(1.)]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+'''Unit tests for BinningFilter and QBinningFilter.'''
+import unittest
+import numpy as np
+from qtpy import QtWidgets
+from QVideo.filters.binning import BinningFilter, QBinningFilter
+from QVideo.lib.frameinfo import FrameInfo
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+_GRAY = np.arange(36, dtype=np.uint8).reshape(6, 6)
+
+
+def make_filter(**kwargs) -> BinningFilter:
+    return BinningFilter(**kwargs)
+
+
+def make_widget() -> QBinningFilter:
+    return QBinningFilter(parent=None)
+
+
+def reference(image, n, reduce):
+    h, w = image.shape[0] // n, image.shape[1] // n
+    blocks = image[:h * n, :w * n].reshape(h, n, w, n, *image.shape[2:])
+    return reduce(blocks.astype(np.float64), axis=(1, 3))
+
+
+class TestBinningFilterProperties(unittest.TestCase):
+
+    def test_defaults(self):
+        f = make_filter()
+        self.assertEqual((f.factor, f.mode), (2, 'mean'))
+
+    def test_factor_at_least_one(self):
+        f = make_filter(factor=0)
+        self.assertEqual(f.factor, 1)
+
+    def test_invalid_mode_raises(self):
+        with self.assertRaises(ValueError):
+            make_filter(mode='median')
+
+
+class TestBinningFilterModes(unittest.TestCase):
+
+    def test_mean(self):
+        result = make_filter(factor=2)(_GRAY)
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(
+            result, np.floor(reference(_GRAY, 2, np.mean) + 0.5))
+
+    def test_sum_saturates(self):
+        image = np.full((4, 4), 200, dtype=np.uint8)
+        result = make_filter(factor=2, mode='sum')(image)
+        np.testing.assert_array_equal(result, np.full((2, 2), 255))
+
+    def test_sum_uint16(self):
+        image = np.full((4, 4), 1000, dtype=np.uint16)
+        result = make_filter(factor=2, mode='sum')(image)
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, np.full((2, 2), 4000))
+
+    def test_mean_float(self):
+        image = np.linspace(0, 1, 64, dtype=np.float32).reshape(8, 8)
+        result = make_filter(factor=4)(image)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, reference(image, 4, np.mean),
+                                   rtol=1e-6)
+
+    def test_decimate_is_a_view(self):
+        result = make_filter(factor=3, mode='decimate')(_GRAY)
+        np.testing.assert_array_equal(result, _GRAY[::3, ::3])
+        self.assertTrue(np.shares_memory(result, _GRAY))
+
+    def test_partial_blocks_dropped(self):
+        image = np.zeros((7, 9, 3), dtype=np.uint8)
+        self.assertEqual(make_filter(factor=2)(image).shape, (3, 4, 3))
+
+    def test_factor_one_passes_through(self):
+        self.assertIs(make_filter(factor=1)(_GRAY), _GRAY)
+
+    def test_result_not_overwritten_by_next_frame(self):
+        f = make_filter(factor=2, mode='sum')
+        first = f(_GRAY)
+        expected = first.copy()
+        f(np.zeros_like(_GRAY))
+        np.testing.assert_array_equal(first, expected)
+
+
+class TestBinningFilterHardware(unittest.TestCase):
+
+    def binned(self, shape, binning):
+        image = np.zeros(shape, dtype=np.uint8)
+        FrameInfo(0, 0, binning=binning).attach(image)
+        return image
+
+    def test_remaining_factor_applied(self):
+        f = make_filter(factor=4)
+        self.assertEqual(f(self.binned((4, 4), 2)).shape, (2, 2))
+
+    def test_unbinned_frame_binned_fully(self):
+        f = make_filter(factor=4)
+        f(self.binned((4, 4), 2))
+        self.assertEqual(f(self.binned((8, 8), 1)).shape, (2, 2))
+
+    def test_binned_frame_in_flight_after_reset(self):
+        f = make_filter(factor=4)
+        f(self.binned((8, 8), 1))
+        self.assertEqual(f(self.binned((4, 4), 2)).shape, (2, 2))
+
+    def test_untagged_frame_binned_fully(self):
+        f = make_filter(factor=4)
+        self.assertEqual(f(np.zeros((8, 8), dtype=np.uint8)).shape, (2, 2))
+
+
+class TestBinningFilterToCode(unittest.TestCase):
+
+    def run_code(self, f, image):
+        namespace = {'np': np, 'image': image}
+        exec('\n'.join(f.to_code().lines), namespace)
+        return namespace['image']
+
+    def test_sum_matches_filter(self):
+        f = make_filter(factor=2, mode='sum')
+        np.testing.assert_array_equal(self.run_code(f, _GRAY), f(_GRAY))
+
+    def test_mean_matches_filter(self):
+        image = np.array([[0, 1], [0, 1]], dtype=np.uint8)
+        f = make_filter(factor=2)
+        np.testing.assert_array_equal(self.run_code(f, image), f(image))
+        np.testing.assert_array_equal(self.run_code(f, _GRAY), f(_GRAY))
+
+    def test_mean_rounds_half_up(self):
+        image = np.array([[2, 3], [2, 3], [4, 5], [4, 5]], dtype=np.uint8)
+        f = make_filter(factor=2)
+        np.testing.assert_array_equal(self.run_code(f, image), [[3], [5]])
+
+    def test_sum_uint16_matches_filter(self):
+        image = np.full((4, 4), 30000, dtype=np.uint16)
+        f = make_filter(factor=2, mode='sum')
+        np.testing.assert_array_equal(self.run_code(f, image), f(image))
+
+    def test_imports_numpy(self):
+        self.assertIn('import numpy as np', make_filter().to_code().imports)
+
+    def test_decimate_matches_filter(self):
+        f = make_filter(factor=4, mode='decimate')
+        np.testing.assert_array_equal(self.run_code(f, _GRAY), f(_GRAY))
+
+    def test_mean_preserves_dtype(self):
+        image = np.full((4, 4), 0.5, dtype=np.float32)
+        result = self.run_code(make_filter(factor=2), image)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, 0.5)
+
+
+class TestQBinningFilter(unittest.TestCase):
+
+    def test_display_metadata(self):
+        self.assertEqual(QBinningFilter.display_name, 'Binning')
+        self.assertEqual(QBinningFilter.display_category, 'Preprocessing')
+
+    def test_set_mode(self):
+        widget = make_widget()
+        widget._modeBox.setCurrentText('Decimate')
+        self.assertEqual(widget.filter.mode, 'decimate')
+
+    def test_set_factor(self):
+        widget = make_widget()
+        widget._setFactor(4)
+        self.assertEqual(widget.filter.factor, 4)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,96 @@
+'''Unit tests for lib/_cache.py.'''
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from QVideo.lib import _cache
+
+
+class TestCacheFile(unittest.TestCase):
+
+    def test_directory_from_environment(self):
+        with patch.dict('os.environ', {'QVIDEO_CACHE_DIR': '/some/where'}):
+            path = _cache.cache_file('cameras')
+        self.assertEqual(path, Path('/some/where') / 'cameras.json')
+
+    def test_empty_variable_disables_cache(self):
+        with patch.dict('os.environ', {'QVIDEO_CACHE_DIR': ''}):
+            self.assertIsNone(_cache.cache_file('cameras'))
+
+    @unittest.skipIf(os.name == 'nt', 'XDG layout')
+    def test_default_in_user_cache_directory(self):
+        with patch.dict('os.environ', {'XDG_CACHE_HOME': '/xdg'}):
+            del os.environ['QVIDEO_CACHE_DIR']
+            path = _cache.cache_file('opencv')
+        self.assertEqual(path, Path('/xdg') / 'QVideo' / 'opencv.json')
+
+
+class TestLoadUpdate(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        env = patch.dict('os.environ', {'QVIDEO_CACHE_DIR': self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_missing_cache_is_empty(self):
+        self.assertEqual(_cache.load('cameras'), {})
+
+    def test_round_trip(self):
+        _cache.update('cameras', {'a': {'ok': True}})
+        self.assertEqual(_cache.load('cameras'), {'a': {'ok': True}})
+
+    def test_update_merges_entries(self):
+        _cache.update('cameras', {'a': 1, 'b': 2})
+        _cache.update('cameras', {'b': 3, 'c': 4})
+        self.assertEqual(_cache.load('cameras'), {'a': 1, 'b': 3, 'c': 4})
+
+    def test_caches_are_separate(self):
+        _cache.update('cameras', {'a': 1})
+        self.assertEqual(_cache.load('opencv'), {})
+
+    def test_corrupt_cache_is_empty(self):
+        with open(_cache.cache_file('cameras'), 'w') as f:
+            f.write('not json')
+        self.assertEqual(_cache.load('cameras'), {})
+        _cache.update('cameras', {'a': 1})
+        self.assertEqual(_cache.load('cameras'), {'a': 1})
+
+    def test_non_dict_cache_is_empty(self):
+        with open(_cache.cache_file('cameras'), 'w') as f:
+            f.write('[1, 2]')
+        self.assertEqual(_cache.load('cameras'), {})
+
+    def test_creates_directory(self):
+        root = os.path.join(self.tmp.name, 'nested')
+        with patch.dict('os.environ', {'QVIDEO_CACHE_DIR': root}):
+            _cache.update('cameras', {'a': 1})
+        self.assertTrue(os.path.exists(os.path.join(root, 'cameras.json')))
+
+    def test_unwritable_cache_is_ignored(self):
+        with patch('os.replace', side_effect=OSError('read-only')):
+            _cache.update('cameras', {'a': 1})
+        self.assertEqual(_cache.load('cameras'), {})
+
+    def test_disabled_cache_writes_nothing(self):
+        with patch.dict('os.environ', {'QVIDEO_CACHE_DIR': ''}):
+            _cache.update('cameras', {'a': 1})
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_concurrent_updates_are_all_kept(self):
+        threads = [threading.Thread(target=_cache.update,
+                                    args=('cameras', {str(n): n}))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(_cache.load('cameras')), 8)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,5 +1,10 @@
 '''Unit tests for lib/_camera.py.'''
 import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 import numpy as np
@@ -141,8 +146,9 @@ class TestCameraProxy(unittest.TestCase):
         fail_cam = make_mock_noise_camera(open_ok=False)
         good_cam = make_mock_noise_camera(open_ok=True)
         proxy = _CameraProxy([('basler', 0), ('noise', 0)])
-        side_effects = [fail_cam, good_cam]
-        with patch('QVideo.lib._camera._open', side_effect=side_effects):
+        cameras = {'basler': fail_cam, 'noise': good_cam}
+        with patch('QVideo.lib._camera._open',
+                   side_effect=lambda key, camera_id: cameras[key]):
             proxy._ensure_open()
         self.assertEqual(
             object.__getattribute__(proxy, '_selected_key'), 'noise'
@@ -198,6 +204,231 @@ class TestCameraFactory(unittest.TestCase):
         self.assertIs(LibCamera, Camera)
 
 
+class TestEnsureQApp(unittest.TestCase):
+
+    def test_created_application_is_kept(self):
+        created = MagicMock()
+        with patch('qtpy.QtWidgets.QApplication') as mock_app, \
+                patch.object(camera_module, '_qapp', None):
+            mock_app.instance.return_value = None
+            mock_app.return_value = created
+            camera_module._ensure_qapp()
+            self.assertIs(camera_module._qapp, created)
+
+    def test_existing_application_is_reused(self):
+        with patch('qtpy.QtWidgets.QApplication') as mock_app:
+            mock_app.instance.return_value = app
+            camera_module._ensure_qapp()
+        mock_app.assert_not_called()
+
+
+class _CacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cameras.json')
+        env = patch.dict('os.environ', {'QVIDEO_CACHE_DIR': self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def opener(self, working=('noise',), delay=0.):
+        '''Return a mock _open that succeeds for the *working* backends.'''
+        def _open(key, camera_id=0):
+            time.sleep(delay)
+            return make_mock_noise_camera(open_ok=key in working)
+        return MagicMock(side_effect=_open)
+
+
+class TestProbeCache(_CacheTestCase):
+
+    def test_store_and_load_round_trip(self):
+        camera_module._store({('basler', 0): False, ('noise', 1): True})
+        entries = camera_module._load_cache()
+        self.assertFalse(camera_module._cached(entries, ('basler', 0)))
+        self.assertTrue(camera_module._cached(entries, ('noise', 1)))
+
+    def test_unknown_candidate_is_none(self):
+        camera_module._store({('noise', 0): True})
+        entries = camera_module._load_cache()
+        self.assertIsNone(camera_module._cached(entries, ('noise', 1)))
+
+    def test_expired_entry_is_none(self):
+        stale = time.time() - camera_module._CACHE_TTL - 1.
+        with open(self.path, 'w') as f:
+            json.dump({'noise:0': {'ok': True, 'time': stale}}, f)
+        entries = camera_module._load_cache()
+        self.assertIsNone(camera_module._cached(entries, ('noise', 0)))
+
+    def test_corrupt_file_is_ignored(self):
+        with open(self.path, 'w') as f:
+            f.write('not json')
+        self.assertEqual(camera_module._load_cache(), {})
+        camera_module._store({('noise', 0): True})
+        self.assertIn('noise:0', camera_module._load_cache())
+
+    def test_disabled_cache_reads_empty(self):
+        with patch.dict('os.environ', {'QVIDEO_CACHE_DIR': ''}):
+            camera_module._store({('noise', 0): True})
+            self.assertEqual(camera_module._load_cache(), {})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_working_candidates_caches_results(self):
+        candidates = [('basler', 0), ('noise', 0)]
+        with patch.object(camera_module, '_open', self.opener()):
+            working = camera_module._working_candidates(candidates)
+        self.assertEqual(working, [('noise', 0)])
+        entries = camera_module._load_cache()
+        self.assertFalse(camera_module._cached(entries, ('basler', 0)))
+        self.assertTrue(camera_module._cached(entries, ('noise', 0)))
+
+    def test_cache_hit_skips_probing(self):
+        camera_module._store({('basler', 0): False, ('noise', 0): True})
+        opener = self.opener()
+        with patch.object(camera_module, '_open', opener):
+            working = camera_module._working_candidates(
+                [('basler', 0), ('noise', 0)])
+        self.assertEqual(working, [('noise', 0)])
+        opener.assert_not_called()
+
+    def test_refresh_ignores_cache(self):
+        camera_module._store({('basler', 0): False, ('noise', 0): True})
+        opener = self.opener(working=('basler', 'noise'))
+        with patch.object(camera_module, '_open', opener):
+            working = camera_module._working_candidates(
+                [('basler', 0), ('noise', 0)], refresh=True)
+        self.assertEqual(working, [('basler', 0), ('noise', 0)])
+        self.assertEqual(opener.call_count, 2)
+
+    def test_first_stops_at_known_camera(self):
+        camera_module._store({('opencv', 0): True})
+        opener = self.opener()
+        with patch.object(camera_module, '_open', opener):
+            working = camera_module._working_candidates(
+                [('opencv', 0), ('noise', 0)], first=True)
+        self.assertEqual(working, [('opencv', 0)])
+        opener.assert_not_called()
+
+
+class TestParallelProbe(_CacheTestCase):
+
+    def test_probes_run_concurrently(self):
+        candidates = [('basler', 0), ('flir', 0), ('noise', 0)]
+        start = time.monotonic()
+        with patch.object(camera_module, '_open', self.opener(delay=0.3)):
+            working = camera_module._working_candidates(candidates)
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(working, [('noise', 0)])
+
+    def test_probe_closes_camera(self):
+        cam = make_mock_noise_camera()
+        with patch.object(camera_module, '_open', return_value=cam):
+            camera_module._probe_cameras([('noise', 0)])
+        cam.close.assert_called_once()
+
+    def test_probe_runs_in_worker_thread(self):
+        threads = []
+
+        def _open(key, camera_id=0):
+            threads.append(threading.current_thread())
+            return make_mock_noise_camera()
+
+        with patch.object(camera_module, '_open', side_effect=_open):
+            camera_module._probe_cameras([('noise', 0)])
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_slow_backend_times_out(self):
+        timeouts = {'basler': 0.05, 'noise': 5.}
+
+        def _open(key, camera_id=0):
+            if key == 'basler':
+                time.sleep(0.5)
+            return make_mock_noise_camera()
+
+        start = time.monotonic()
+        with patch.dict(camera_module._PROBE_TIMEOUT, timeouts), \
+                patch.object(camera_module, '_open', side_effect=_open), \
+                self.assertLogs(camera_module.logger, 'WARNING') as logs:
+            working = camera_module._working_candidates(
+                [('basler', 0), ('noise', 0)])
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(working, [('noise', 0)])
+        self.assertIn('Basler', logs.output[0])
+        entries = camera_module._load_cache()
+        self.assertIsNone(camera_module._cached(entries, ('basler', 0)))
+
+    def test_first_does_not_wait_for_later_probes(self):
+        def _open(key, camera_id=0):
+            if key == 'noise':
+                time.sleep(0.5)
+            return make_mock_noise_camera()
+
+        start = time.monotonic()
+        with patch.object(camera_module, '_open', side_effect=_open):
+            working = camera_module._working_candidates(
+                [('basler', 0), ('noise', 0)], first=True)
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(working, [('basler', 0)])
+        entries = camera_module._load_cache()
+        self.assertIsNone(camera_module._cached(entries, ('noise', 0)))
+
+    def test_first_waits_for_higher_priority_probes(self):
+        def _open(key, camera_id=0):
+            if key == 'basler':
+                time.sleep(0.2)
+            return make_mock_noise_camera(open_ok=key == 'noise')
+
+        with patch.object(camera_module, '_open', side_effect=_open):
+            working = camera_module._working_candidates(
+                [('basler', 0), ('noise', 0)], first=True)
+        self.assertEqual(working, [('noise', 0)])
+
+    def test_probe_exception_is_failure(self):
+        with patch.object(camera_module, '_check',
+                          side_effect=RuntimeError('boom')):
+            results = camera_module._probe_cameras([('noise', 0)])
+        self.assertEqual(results, {('noise', 0): False})
+
+
+class TestCachedEnsureOpen(_CacheTestCase):
+
+    def test_cached_camera_opens_without_probing(self):
+        camera_module._store({('basler', 0): False,
+                              ('opencv', 0): False,
+                              ('noise', 0): True})
+        opener = self.opener()
+        proxy = _CameraProxy([('basler', 0), ('opencv', 0), ('noise', 0)])
+        with patch.object(camera_module, '_open', opener):
+            proxy._ensure_open()
+        opener.assert_called_once_with('noise', 0)
+        self.assertEqual(
+            object.__getattribute__(proxy, '_selected_key'), 'noise')
+
+    def test_stale_positive_falls_back(self):
+        camera_module._store({('opencv', 0): True})
+        proxy = _CameraProxy([('opencv', 0), ('noise', 0)])
+        with patch.object(camera_module, '_open', self.opener()):
+            proxy._ensure_open()
+        self.assertEqual(
+            object.__getattribute__(proxy, '_selected_key'), 'noise')
+        entries = camera_module._load_cache()
+        self.assertFalse(camera_module._cached(entries, ('opencv', 0)))
+
+    def test_explicit_model_ignores_negative_entry(self):
+        camera_module._store({('noise', 0): False})
+        opener = self.opener()
+        with patch.object(camera_module, '_open', opener):
+            proxy = Camera('noise')
+            proxy._ensure_open()
+        opener.assert_called_once_with('noise', 0)
+        entries = camera_module._load_cache()
+        self.assertTrue(camera_module._cached(entries, ('noise', 0)))
+
+    def test_refresh_forwarded_to_proxy(self):
+        proxy = Camera('noise', refresh=True)
+        self.assertTrue(object.__getattribute__(proxy, '_refresh'))
+
+
 class TestLiveView(unittest.TestCase):
 
     def _make_proxy(self):
@@ -315,9 +546,9 @@ class TestLiveView(unittest.TestCase):
 
         original_imencode = cv2.imencode
 
-        def capture_imencode(ext, f):
+        def capture_imencode(ext, f, *params):
             encoded.append(f.copy())
-            return original_imencode(ext, f)
+            return original_imencode(ext, f, *params)
 
         with patch('QVideo.lib._camera._open', return_value=cam), \
              patch('ipywidgets.Image'), \
@@ -344,9 +575,9 @@ class TestLiveView(unittest.TestCase):
 
         original_imencode = cv2.imencode
 
-        def capture_imencode(ext, f):
+        def capture_imencode(ext, f, *params):
             encoded.append(f.copy())
-            return original_imencode(ext, f)
+            return original_imencode(ext, f, *params)
 
         with patch('QVideo.lib._camera._open', return_value=cam), \
              patch('ipywidgets.Image'), \
@@ -358,6 +589,206 @@ class TestLiveView(unittest.TestCase):
         self.assertTrue(len(encoded) > 0)
         self.assertEqual(encoded[0][0, 0], 128)
 
+    def test_live_view_logs_failure(self):
+        proxy, cam = self._make_proxy()
+        loops = []
+
+        def _capture(coro):
+            loops.append(coro)
+            return MagicMock()
+
+        with patch('QVideo.lib._camera._open', return_value=cam), \
+             patch('ipywidgets.Image'), \
+             patch('IPython.display.display'), \
+             patch('asyncio.ensure_future', side_effect=_capture):
+            proxy.live_view()
+        with patch('QVideo.lib._camera._render',
+                   side_effect=RuntimeError('broken')), \
+             self.assertLogs('QVideo.lib._camera', level='ERROR') as logs:
+            asyncio.run(loops[0])
+        self.assertIn('broken', logs.output[0])
+
+    def test_live_view_cancellation_propagates(self):
+        proxy, cam = self._make_proxy()
+        loops = []
+
+        def _capture(coro):
+            loops.append(coro)
+            return MagicMock()
+
+        with patch('QVideo.lib._camera._open', return_value=cam), \
+             patch('ipywidgets.Image'), \
+             patch('IPython.display.display'), \
+             patch('asyncio.ensure_future', side_effect=_capture):
+            proxy.live_view()
+
+        async def _cancel():
+            task = asyncio.ensure_future(loops[0])
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with self.assertNoLogs('QVideo.lib._camera', level='ERROR'):
+            asyncio.run(_cancel())
+
+
+class TestLiveViewEncoding(unittest.TestCase):
+
+    def test_wide_frames_downscaled(self):
+        frame = np.zeros((480, 1280, 3), dtype=np.uint8)
+        thumbnail = camera_module._thumbnail(frame, 640)
+        self.assertEqual(thumbnail.shape, (240, 640, 3))
+
+    def test_narrow_frames_kept(self):
+        frame = np.zeros((48, 64), dtype=np.uint8)
+        self.assertIs(camera_module._thumbnail(frame, 640), frame)
+
+    def test_full_resolution_without_width(self):
+        frame = np.zeros((480, 1280), dtype=np.uint8)
+        self.assertEqual(camera_module._thumbnail(frame, None).shape,
+                         (480, 1280))
+
+    def test_16_bit_frames_encoded(self):
+        frame = np.full((8, 8), 65535, dtype=np.uint16)
+        thumbnail = camera_module._thumbnail(frame, 640)
+        self.assertEqual(thumbnail.dtype, np.uint8)
+        self.assertEqual(camera_module._jpeg(thumbnail, 80)[:2],
+                         b'\xff\xd8')
+
+    def test_unchanged_frame_not_encoded(self):
+        frame = np.zeros((8, 8), dtype=np.uint8)
+        previous, data = camera_module._render(frame, 640, 80, None)
+        self.assertIsNotNone(data)
+        _, data = camera_module._render(frame.copy(), 640, 80, previous)
+        self.assertIsNone(data)
+
+    def test_lower_quality_is_smaller(self):
+        frame = np.random.default_rng(0).integers(
+            0, 256, (64, 64), dtype=np.uint8)
+        self.assertLess(len(camera_module._jpeg(frame, 40)),
+                        len(camera_module._jpeg(frame, 90)))
+
+
+class TestLiveViewLoop(unittest.TestCase):
+
+    def test_feed_updates_widget_until_stopped(self):
+        index = iter(range(10 ** 6))
+        cam = make_mock_noise_camera()
+        cam.saferead.side_effect = lambda: (
+            True, np.full((4, 4), next(index) % 256, dtype=np.uint8))
+        with patch('QVideo.lib._camera._open', return_value=cam):
+            proxy = Camera('noise')
+            proxy._ensure_open()
+        widget = MagicMock()
+        sent = []
+        type(widget).value = property(lambda w: None,
+                                      lambda w, v: sent.append(v))
+
+        async def run():
+            with patch('ipywidgets.Image', return_value=widget), \
+                 patch('IPython.display.display'):
+                live = proxy.live_view(fps=100.)
+            await asyncio.sleep(0.2)
+            live.stop()
+            await asyncio.sleep(0.02)
+            return len(sent)
+
+        count = asyncio.run(run())
+        self.assertGreater(count, 2)
+        self.assertEqual(len(sent), count)
+
+
+class TestLiveViewQuality(unittest.TestCase):
+
+    def test_slow_frames_lower_quality(self):
+        quality = camera_module._Quality(0.1)
+        quality.update(0.08)
+        self.assertEqual(quality.value, 75)
+
+    def test_fast_frames_raise_quality(self):
+        quality = camera_module._Quality(0.1)
+        quality.update(0.01)
+        self.assertEqual(quality.value, 85)
+
+    def test_quality_bounded(self):
+        quality = camera_module._Quality(0.1)
+        for _ in range(20):
+            quality.update(1.)
+        self.assertEqual(quality.value, quality.LOWEST)
+        for _ in range(20):
+            quality.update(0.)
+        self.assertEqual(quality.value, quality.HIGHEST)
+
+    def test_slow_frames_slow_the_feed(self):
+        quality = camera_module._Quality(0.1)
+        self.assertEqual(quality.update(0.02), 0.)
+        self.assertAlmostEqual(quality.update(0.2), 0.15)
+
+
+class TestFrames(unittest.TestCase):
+
+    def _make_proxy(self, read=None):
+        cam = make_mock_noise_camera()
+        if read is not None:
+            cam.saferead.side_effect = read
+        with patch('QVideo.lib._camera._open', return_value=cam):
+            proxy = Camera('noise')
+            proxy._ensure_open()
+        return proxy, cam
+
+    def _collect(self, proxy, count, delay=0., **kwargs):
+        async def consume():
+            frames = []
+            async for frame in proxy.frames(**kwargs):
+                frames.append(frame)
+                if len(frames) == count:
+                    break
+                await asyncio.sleep(delay)
+            return frames
+        return asyncio.run(consume())
+
+    def _counter(self, delay=0.):
+        index = iter(range(10 ** 6))
+
+        def read():
+            time.sleep(delay)
+            return True, np.full((2, 2), next(index))
+        return read
+
+    def test_yields_frames(self):
+        proxy, _ = self._make_proxy()
+        frames = self._collect(proxy, 3)
+        self.assertEqual(len(frames), 3)
+        np.testing.assert_array_equal(frames[0], _FRAME)
+
+    def test_slow_consumer_gets_recent_frames(self):
+        proxy, _ = self._make_proxy(self._counter(0.002))
+        frames = self._collect(proxy, 3, delay=0.05, maxsize=1)
+        indices = [int(f[0, 0]) for f in frames]
+        self.assertEqual(indices, sorted(indices))
+        self.assertGreater(indices[-1] - indices[0], 2)
+
+    def test_max_fps_limits_rate(self):
+        proxy, _ = self._make_proxy(self._counter())
+        start = time.monotonic()
+        frames = self._collect(proxy, 5, max_fps=50.)
+        self.assertGreaterEqual(time.monotonic() - start, 0.07)
+        self.assertEqual([int(f[0, 0]) for f in frames], [0, 1, 2, 3, 4])
+
+    def test_read_failure_raises(self):
+        proxy, _ = self._make_proxy(lambda: (False, None))
+        with self.assertRaises(RuntimeError):
+            self._collect(proxy, 1)
+
+    def test_capture_stops_after_break(self):
+        proxy, cam = self._make_proxy(self._counter(0.001))
+        self._collect(proxy, 2)
+        time.sleep(0.02)
+        calls = cam.saferead.call_count
+        time.sleep(0.02)
+        self.assertEqual(cam.saferead.call_count, calls)
+
 
 class TestJupyterChooser(unittest.TestCase):
 
@@ -120,6 +120,12 @@ class TestCircleTransformFilterProcess(unittest.TestCase):
         self.assertEqual(int(result.max()), 255)
 
 
+    def test_16_bit_heat_map_keeps_type(self):
+        f = make_filter(window=5)
+        result = f.process(_FRAME.astype(np.uint16) * 257)
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertEqual(result.max(), 65535)
+
 class TestCircleTransformFilterKernel(unittest.TestCase):
 
     def test_process_consistent_for_same_shape(self):
@@ -7,6 +7,7 @@ import numpy as np
 from qtpy import QtWidgets
 
 from QVideo.dvr.QCircularBuffer import QCircularBuffer
+from QVideo.lib.frameinfo import FrameInfo
 
 _module = sys.modules['QVideo.dvr.QCircularBuffer']
 
@@ -124,6 +125,13 @@ class TestAppend(unittest.TestCase):
             buf.append(frame)
         self.assertEqual(len(buf), 5)
 
+    def test_append_info_uses_capture_time(self):
+        buf = QCircularBuffer()
+        info = FrameInfo(0, 2_000_000_000)
+        buf.appendInfo(make_frame(), info)
+        ts, _ = buf._buffer[0]
+        self.assertEqual(ts, info.epoch())
+
 
 class TestSaveEmpty(unittest.TestCase):
 
@@ -6,6 +6,8 @@ from qtpy import QtWidgets, QtCore
 
 from QVideo.dvr.QCircularBuffer import QCircularBuffer
 from QVideo.dvr.QCircularDVRWidget import QCircularDVRWidget
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.frameinfo import FrameInfo
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -95,6 +97,18 @@ class TestSourceProperty(unittest.TestCase):
         widget.source = source
         self.assertEqual(widget._buffer.fps, 24.)  # unchanged default
 
+    def test_video_source_delivers_frame_info(self):
+        camera = MagicMock()
+        camera.fps = 30.
+        source = QVideoSource(camera)
+        widget = QCircularDVRWidget(source)
+        source.newFrameInfo.emit(np.zeros((4, 4), np.uint8),
+                                 FrameInfo(0, 1_000_000_000))
+        self.assertEqual(len(widget.buffer), 1)
+        self.assertEqual(widget.buffer._buffer[0][0],
+                         FrameInfo(0, 1_000_000_000).epoch())
+        widget.source = None
+
 
 class TestDurationSpinbox(unittest.TestCase):
 
@@ -151,6 +151,21 @@ class TestDarkFrameFilterGet(unittest.TestCase):
         self.assertEqual(f.get().dtype, np.uint8)
 
 
+    def test_subtracts_16_bit_frames_natively(self):
+        f = make_filter(nFrames=1)
+        _capture(f, np.full(_SHAPE, 1000, dtype=np.uint16))
+        f.add(np.full(_SHAPE, 41000, dtype=np.uint16))
+        result = f.get()
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, 40000)
+
+    def test_get_dtype_mismatch_returns_raw(self):
+        f = make_filter(nFrames=1)
+        _capture(f, _DARK)
+        frame = np.full(_SHAPE, 1000, dtype=np.uint16)
+        f.add(frame)
+        self.assertIs(f.get(), frame)
+
 class TestDarkFrameFilterReset(unittest.TestCase):
 
     def test_reset_clears_dark(self):
@@ -86,6 +86,13 @@ class TestDoGFilter(unittest.TestCase):
         self.assertIn('DoG', code.comment)
 
 
+    def test_16_bit_response_keeps_type(self):
+        frame = np.zeros((32, 32), dtype=np.uint16)
+        frame[16, 16] = 60000
+        result = self.f(frame)
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertGreater(int(result.max()), 255)
+
 class TestQDoGFilter(unittest.TestCase):
 
     def setUp(self):
@@ -107,6 +107,14 @@ class TestEdgeFilter(unittest.TestCase):
         mock_canny.assert_called_once()
 
 
+    def test_16_bit_frames_are_converted_to_8_bits(self):
+        f = make_filter()
+        frame = np.zeros((8, 8), dtype=np.uint16)
+        frame[:, 4:] = 65535
+        result = f(frame)
+        self.assertEqual(result.dtype, np.uint8)
+        self.assertEqual(result.max(), 255)
+
 class TestQEdgeFilter(unittest.TestCase):
 
     def test_filter_is_edge_filter(self):
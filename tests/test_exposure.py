@@ -168,6 +168,28 @@ class TestExposureFilterProcess(unittest.TestCase):
         self.assertEqual(result.dtype, np.uint8)
 
 
+    def test_methods_keep_16_bit_frames(self):
+        frame = np.random.randint(0, 65536, (64, 64), dtype=np.uint16)
+        for method in ExposureFilter.METHODS:
+            self.f.method = method
+            for image in (frame, np.dstack([frame] * 3)):
+                result = self.f.process(image)
+                self.assertEqual(result.dtype, np.uint16)
+                self.assertEqual(result.shape, image.shape)
+
+    def test_methods_keep_float_frames(self):
+        frame = np.random.rand(64, 64).astype(np.float32)
+        for method in ExposureFilter.METHODS:
+            self.f.method = method
+            result = self.f.process(frame)
+            self.assertEqual(result.dtype, np.float32)
+            self.assertLessEqual(result.max(), 1.)
+
+    def test_log_curve_is_independent_of_bit_depth(self):
+        result8 = self.f.process(_GRAY)
+        result16 = self.f.process(_GRAY.astype(np.uint16) * 257)
+        np.testing.assert_allclose(result16 / 257., result8, atol=1)
+
 class TestExposureFilterToCode(unittest.TestCase):
 
     def setUp(self):
@@ -178,6 +178,16 @@ class TestFlatFieldFilterGet(unittest.TestCase):
         self.assertEqual(f.get().dtype, np.uint8)
 
 
+    def test_corrects_16_bit_frames_natively(self):
+        flat = np.full(_SHAPE, 10000, dtype=np.uint16)
+        flat[0, 0] = 20000
+        f = make_filter(nFrames=1)
+        _capture(f, flat)
+        f.add(np.full(_SHAPE, 30000, dtype=np.uint16))
+        result = f.get()
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertGreater(int(result[1, 1]), 255)
+
 class TestFlatFieldFilterReset(unittest.TestCase):
 
     def test_reset_clears_flat(self):
@@ -222,6 +222,15 @@ class TestForegroundEstimatorProcess(unittest.TestCase):
 # QForegroundEstimator
 # ---------------------------------------------------------------------------
 
+    def test_16_bit_frame_is_modelled_on_8_bit_scale(self):
+        mock_bgs = _mock_bgs(np.full((4, 4), 128., dtype=np.float32))
+        with patch('cv2.createBackgroundSubtractorMOG2', return_value=mock_bgs):
+            f = ForegroundEstimator(mean=128.)
+        result = f.process(np.full((4, 4), 128 * 257, dtype=np.uint16))
+        np.testing.assert_allclose(mock_bgs.apply.call_args[0][0], 128.)
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_allclose(result, 128 * 257, atol=1)
+
 class TestQForegroundEstimator(unittest.TestCase):
 
     def test_filter_is_foreground_estimator(self):
@@ -0,0 +1,89 @@
+'''Unit tests for FrameClock.'''
+import unittest
+from unittest.mock import patch
+from QVideo.lib.frameclock import FrameClock
+
+
+class _Time:
+    '''Controllable replacement for perf_counter_ns and sleep.'''
+
+    def __init__(self) -> None:
+        self.now = 1_000_000_000
+        self.sleeps = []
+
+    def perf_counter_ns(self) -> int:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += int(seconds * 1e9)
+
+
+class TestFrameClock(unittest.TestCase):
+
+    def setUp(self):
+        self.time = _Time()
+        patcher = patch('QVideo.lib.frameclock.time', self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unpaced(self):
+        clock = FrameClock()
+        self.assertEqual(clock.fps, 0.)
+        stamps = [clock.tick() for _ in range(3)]
+        self.assertEqual([s[1] for s in stamps], [0, 1, 2])
+        self.assertEqual(self.time.sleeps, [])
+
+    def test_negative_fps_is_unpaced(self):
+        self.assertEqual(FrameClock(-5).fps, 0.)
+
+    def test_first_tick_does_not_wait(self):
+        clock = FrameClock(100.)
+        self.assertEqual(clock.tick(), (self.time.now, 0))
+        self.assertEqual(self.time.sleeps, [])
+
+    def test_waits_for_deadline(self):
+        clock = FrameClock(100.)
+        start, _ = clock.tick()
+        stamp, index = clock.tick()
+        self.assertEqual(index, 1)
+        self.assertEqual(stamp, start + 10_000_000)
+        self.assertAlmostEqual(self.time.sleeps[0], 0.01)
+
+    def test_deadlines_do_not_drift(self):
+        clock = FrameClock(100.)
+        start, _ = clock.tick()
+        for _ in range(10):
+            self.time.now += 3_000_000
+            stamp, index = clock.tick()
+        self.assertEqual(index, 10)
+        self.assertEqual(stamp, start + 100_000_000)
+
+    def test_late_caller_skips_frames(self):
+        clock = FrameClock(100.)
+        clock.tick()
+        self.time.now += 35_000_000
+        stamp, index = clock.tick()
+        self.assertEqual(index, 3)
+        self.assertEqual(self.time.sleeps, [])
+        self.assertEqual(clock.tick()[1], 4)
+
+    def test_fps_change_keeps_index(self):
+        clock = FrameClock(100.)
+        clock.tick()
+        clock.tick()
+        clock.fps = 10.
+        self.assertEqual(clock.tick()[1], 2)
+        self.assertEqual(clock.tick()[1], 3)
+        self.assertAlmostEqual(self.time.sleeps[-1], 0.1)
+
+    def test_reset(self):
+        clock = FrameClock(100.)
+        clock.tick()
+        clock.tick()
+        clock.reset()
+        self.assertEqual(clock.tick()[1], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
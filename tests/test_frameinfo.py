@@ -0,0 +1,88 @@
+'''Unit tests for FrameInfo.'''
+import unittest
+import time
+import numpy as np
+from QVideo.lib.frameinfo import FrameInfo
+
+
+class TestInit(unittest.TestCase):
+
+    def test_fields(self):
+        info = FrameInfo(3, 1000, 2000, 17, 1, 'RGGB')
+        self.assertEqual(info.index, 3)
+        self.assertEqual(info.timestamp, 1000)
+        self.assertEqual(info.hardwareTimestamp, 2000)
+        self.assertEqual(info.hardwareIndex, 17)
+        self.assertEqual(info.dropped, 1)
+        self.assertEqual(info.bayer, 'RGGB')
+
+    def test_defaults(self):
+        info = FrameInfo(0, 0)
+        self.assertIsNone(info.hardwareTimestamp)
+        self.assertIsNone(info.hardwareIndex)
+        self.assertEqual(info.dropped, 0)
+        self.assertIsNone(info.bayer)
+        self.assertIsNone(info.window)
+        self.assertEqual(info.binning, 1)
+
+    def test_has_no_instance_dict(self):
+        info = FrameInfo(0, 0)
+        self.assertFalse(hasattr(info, '__dict__'))
+        with self.assertRaises(AttributeError):
+            info.extra = 1
+
+    def test_repr(self):
+        self.assertIn('index=5', repr(FrameInfo(5, 0)))
+
+    def test_repr_includes_window(self):
+        info = FrameInfo(0, 0, window=(1, 2, 3, 4))
+        self.assertIn('window=(1, 2, 3, 4)', repr(info))
+
+    def test_repr_includes_binning(self):
+        self.assertIn('binning=2', repr(FrameInfo(0, 0, binning=2)))
+
+
+class TestAttach(unittest.TestCase):
+
+    def test_of_returns_attached_record(self):
+        frame = np.zeros((4, 4), np.uint8)
+        info = FrameInfo(0, 0, window=(0, 0, 4, 4))
+        info.attach(frame)
+        self.assertIs(FrameInfo.of(frame), info)
+
+    def test_of_untagged_frame_is_none(self):
+        self.assertIsNone(FrameInfo.of(np.zeros((4, 4), np.uint8)))
+
+    def test_reattach_replaces_record(self):
+        frame = np.zeros((4, 4), np.uint8)
+        FrameInfo(0, 0).attach(frame)
+        info = FrameInfo(1, 0)
+        info.attach(frame)
+        self.assertIs(FrameInfo.of(frame), info)
+
+    def test_record_not_inherited_by_views(self):
+        frame = np.zeros((4, 4), np.uint8)
+        FrameInfo(0, 0).attach(frame)
+        self.assertIsNone(FrameInfo.of(frame[1:]))
+
+    def test_record_released_with_frame(self):
+        from QVideo.lib import frameinfo
+        frame = np.zeros((4, 4), np.uint8)
+        key = id(frame)
+        FrameInfo(0, 0).attach(frame)
+        del frame
+        self.assertNotIn(key, frameinfo._attached)
+
+
+class TestEpoch(unittest.TestCase):
+
+    def test_epoch_matches_wall_clock(self):
+        info = FrameInfo(0, time.perf_counter_ns())
+        self.assertAlmostEqual(info.epoch(), time.time(), delta=0.1)
+
+    def test_epoch_is_monotonic_in_timestamp(self):
+        self.assertLess(FrameInfo(0, 0).epoch(), FrameInfo(1, 1000).epoch())
+
+
+if __name__ == '__main__':
+    unittest.main()
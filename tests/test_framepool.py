@@ -0,0 +1,125 @@
+'''Unit tests for FramePool.'''
+import unittest
+import numpy as np
+from QVideo.lib.framepool import FramePool
+
+
+def make_pool(size=4, shape=(4, 6), dtype=np.uint8) -> FramePool:
+    pool = FramePool(size)
+    pool.configure(shape, dtype)
+    return pool
+
+
+class TestInit(unittest.TestCase):
+
+    def test_default_size(self):
+        self.assertEqual(FramePool().size, 8)
+
+    def test_negative_size_clamped(self):
+        self.assertEqual(FramePool(-3).size, 0)
+
+    def test_initially_unconfigured(self):
+        pool = FramePool()
+        self.assertIsNone(pool.shape)
+        self.assertIsNone(pool.dtype)
+        self.assertEqual(len(pool), 0)
+
+
+class TestConfigure(unittest.TestCase):
+
+    def test_sets_shape_and_dtype(self):
+        pool = make_pool(shape=(3, 5, 3), dtype=np.uint16)
+        self.assertEqual(pool.shape, (3, 5, 3))
+        self.assertEqual(pool.dtype, np.uint16)
+
+    def test_same_format_keeps_buffers(self):
+        pool = make_pool()
+        buffer = pool.acquire()
+        pool.configure((4, 6), np.uint8)
+        self.assertEqual(len(pool), 1)
+        del buffer
+
+    def test_new_format_discards_buffers(self):
+        pool = make_pool()
+        pool.acquire()
+        pool.configure((8, 8), np.uint8)
+        self.assertEqual(len(pool), 0)
+
+    def test_new_format_does_not_touch_held_buffer(self):
+        pool = make_pool()
+        held = pool.acquire()
+        held[:] = 7
+        pool.configure((8, 8), np.uint8)
+        self.assertTrue(np.all(held == 7))
+
+
+class TestAcquire(unittest.TestCase):
+
+    def test_unconfigured_returns_none(self):
+        self.assertIsNone(FramePool().acquire())
+
+    def test_disabled_returns_none(self):
+        self.assertIsNone(make_pool(size=0).acquire())
+
+    def test_buffer_matches_format(self):
+        buffer = make_pool(shape=(2, 3), dtype=np.uint16).acquire()
+        self.assertEqual(buffer.shape, (2, 3))
+        self.assertEqual(buffer.dtype, np.uint16)
+
+    def test_released_buffer_is_reused(self):
+        pool = make_pool()
+        first = pool.acquire()
+        address = first.ctypes.data
+        del first
+        second = pool.acquire()
+        self.assertEqual(second.ctypes.data, address)
+        self.assertEqual(len(pool), 1)
+
+    def test_held_buffer_is_not_reused(self):
+        pool = make_pool()
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+        self.assertEqual(len(pool), 2)
+
+    def test_view_keeps_buffer_held(self):
+        pool = make_pool()
+        first = pool.acquire()
+        view = first[1:, 2:]
+        del first
+        second = pool.acquire()
+        self.assertFalse(np.shares_memory(view, second))
+
+    def test_exhausted_returns_none(self):
+        pool = make_pool(size=2)
+        held = [pool.acquire(), pool.acquire()]
+        self.assertIsNone(pool.acquire())
+        self.assertEqual(len(held), 2)
+
+    def test_available_counts_free_buffers(self):
+        pool = make_pool()
+        held = pool.acquire()
+        released = pool.acquire()
+        del released
+        self.assertEqual(pool.available(), 1)
+        self.assertIsNotNone(held)
+
+
+class TestSize(unittest.TestCase):
+
+    def test_shrinking_drops_buffers(self):
+        pool = make_pool(size=4)
+        held = [pool.acquire() for _ in range(3)]
+        pool.size = 1
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(len(held), 3)
+
+    def test_clear(self):
+        pool = make_pool()
+        pool.acquire()
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
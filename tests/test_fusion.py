@@ -0,0 +1,110 @@
+'''Unit tests for lib/_fusion.py.'''
+import unittest
+import numpy as np
+from unittest.mock import patch
+from qtpy import QtWidgets
+from QVideo.lib._fusion import fusible, compile_stages
+from QVideo.lib.QVideoFilter import QVideoFilter, VideoFilter
+from QVideo.filters import (QRGBFilter, QGammaFilter, QEdgeFilter,
+                            QMoMean, QSmoothingFilter)
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+_FRAME = np.random.default_rng(0).integers(
+    0, 65536, (32, 32, 3)).astype(np.uint16)
+
+
+def make_widgets(*classes, checked=True):
+    widgets = [cls() for cls in classes]
+    for widget in widgets:
+        widget.setChecked(checked)
+    return widgets
+
+
+def run(stages, image):
+    for stage in stages:
+        image = stage(image)
+    return image
+
+
+class TestFusible(unittest.TestCase):
+
+    def test_stateless_filter_is_fusible(self):
+        self.assertTrue(fusible(QRGBFilter()))
+
+    def test_stateful_filter_is_not_fusible(self):
+        self.assertFalse(fusible(QMoMean()))
+
+    def test_async_filter_is_not_fusible(self):
+        widget = QSmoothingFilter()
+        self.addCleanup(widget.filter.shutdown)
+        self.assertFalse(fusible(widget))
+
+    def test_custom_call_is_not_fusible(self):
+        class Custom(VideoFilter):
+            def __call__(self, data):
+                return data
+
+            def to_code(self):
+                return QRGBFilter().filter.to_code()
+
+        self.assertFalse(fusible(QVideoFilter(None, 'custom', Custom())))
+
+
+class TestCompileStages(unittest.TestCase):
+
+    def test_fused_stage_applies_deferred_assignments(self):
+        widgets = make_widgets(QRGBFilter, QGammaFilter)
+        stages, _ = compile_stages(widgets)
+        gamma = widgets[1].filter
+        with patch.object(gamma, 'applyPending') as apply:
+            run(stages, _FRAME)
+        apply.assert_called_once()
+
+    def test_consecutive_stateless_filters_fused(self):
+        widgets = make_widgets(QRGBFilter, QGammaFilter, QEdgeFilter)
+        stages, source = compile_stages(widgets)
+        self.assertEqual(len(stages), 1)
+        self.assertEqual(source.count('def fused'), 1)
+        for name in ('RGBFilter', 'GammaFilter', 'EdgeFilter'):
+            self.assertIn(name, source)
+
+    def test_fused_result_matches_unfused(self):
+        widgets = make_widgets(QRGBFilter, QGammaFilter, QEdgeFilter)
+        widgets[1].filter.gamma = 0.5
+        stages, _ = compile_stages(widgets)
+        expected = run(widgets, _FRAME)
+        np.testing.assert_array_equal(run(stages, _FRAME), expected)
+
+    def test_pixel_type_conformed_only_where_needed(self):
+        widgets = make_widgets(QGammaFilter, QEdgeFilter)
+        _, source = compile_stages(widgets)
+        self.assertEqual(source.count('_rescale'), 1)
+
+    def test_stateful_filter_is_boundary(self):
+        widgets = make_widgets(QRGBFilter, QMoMean, QGammaFilter)
+        stages, source = compile_stages(widgets)
+        self.assertEqual(len(stages), 3)
+        self.assertIs(stages[1], widgets[1])
+        self.assertIn('MoMean (called directly)', source)
+
+    def test_disabled_filters_omitted(self):
+        widgets = make_widgets(QRGBFilter, QGammaFilter)
+        widgets[0].setChecked(False)
+        stages, source = compile_stages(widgets)
+        self.assertEqual(len(stages), 1)
+        self.assertNotIn('RGBFilter', source)
+
+    def test_parameters_read_live(self):
+        widgets = make_widgets(QRGBFilter)
+        stages, _ = compile_stages(widgets)
+        widgets[0].filter.channel = 2
+        np.testing.assert_array_equal(run(stages, _FRAME), _FRAME[..., 2])
+
+    def test_empty_pipeline(self):
+        self.assertEqual(compile_stages([]), ([], ''))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
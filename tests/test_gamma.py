@@ -89,6 +89,20 @@ class TestGammaFilter(unittest.TestCase):
         self.assertIn('gamma', code.comment)
 
 
+    def test_16_bit_frames_keep_type(self):
+        self.f.gamma = 0.5
+        frame = np.array([[0, 16384, 65535]], dtype=np.uint16)
+        result = self.f(frame)
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_allclose(result, [[0, 32767, 65535]], atol=1)
+
+    def test_float_frames_keep_type(self):
+        self.f.gamma = 2.0
+        frame = np.array([[0., 0.5, 1.]], dtype=np.float32)
+        result = self.f(frame)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, [[0., 0.25, 1.]])
+
 class TestQGammaFilter(unittest.TestCase):
 
     def setUp(self):
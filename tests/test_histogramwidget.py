@@ -1,5 +1,6 @@
 '''Unit tests for QHistogramWidget.'''
 import unittest
+import numpy as np
 from qtpy import QtWidgets
 import pyqtgraph as pg
 from QVideo.lib.QHistogramWidget import QHistogramWidget
@@ -59,5 +60,16 @@ class TestQHistogramWidgetScreen(unittest.TestCase):
         self.assertIs(self.widget.item.imageItem(), other.image)
 
 
+    def test_handles_start_at_full_range_of_frame(self):
+        self.screen.setImage(np.zeros((8, 8), dtype=np.uint16))
+        self.widget.screen = self.screen
+        self.assertEqual(tuple(self.widget.getLevels()), (0, 65535))
+        self.assertIsNone(self.screen.levels)
+
+    def test_moving_handles_sets_screen_levels(self):
+        self.widget.screen = self.screen
+        self.widget.setLevels(10, 200)
+        self.assertEqual(self.screen.levels, (10., 200.))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,145 @@
+'''Unit tests for LatencyHistogram and Profiler.'''
+import unittest
+from unittest.mock import MagicMock
+from QVideo.lib.instrumentation import LatencyHistogram, Profiler, profiler
+
+
+class _Increment:
+
+    def __call__(self, value):
+        return value + 1
+
+
+class TestBuckets(unittest.TestCase):
+
+    def test_small_values_are_exact(self):
+        for ns in range(16):
+            self.assertEqual(LatencyHistogram._bucket(ns), ns)
+            self.assertEqual(LatencyHistogram._middle(ns), ns)
+
+    def test_buckets_are_monotonic(self):
+        buckets = [LatencyHistogram._bucket(ns) for ns in range(1, 5000)]
+        self.assertEqual(buckets, sorted(buckets))
+
+    def test_middle_lies_in_bucket(self):
+        for ns in (17, 100, 12_345, 987_654_321):
+            bucket = LatencyHistogram._bucket(ns)
+            middle = LatencyHistogram._middle(bucket)
+            self.assertEqual(LatencyHistogram._bucket(int(middle)), bucket)
+            self.assertLess(abs(middle - ns) / ns, 1 / 16 + 1e-9)
+
+    def test_overflow_is_clamped(self):
+        bucket = LatencyHistogram._bucket(LatencyHistogram.LIMIT * 4)
+        self.assertEqual(bucket, LatencyHistogram._SIZE - 1)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_empty(self):
+        h = LatencyHistogram()
+        self.assertEqual(h.count, 0)
+        self.assertEqual(h.mean, 0.)
+        self.assertEqual(h.percentile(50), 0.)
+
+    def test_count_mean_max(self):
+        h = LatencyHistogram()
+        for ns in (1000, 2000, 3000):
+            h.record(ns)
+        self.assertEqual(h.count, 3)
+        self.assertAlmostEqual(h.mean, 2e-6)
+        self.assertAlmostEqual(h.max, 3e-6)
+
+    def test_percentiles(self):
+        h = LatencyHistogram()
+        for ms in range(1, 101):
+            h.record(ms * 1_000_000)
+        self.assertAlmostEqual(h.percentile(50), 50e-3, delta=4e-3)
+        self.assertAlmostEqual(h.percentile(99), 99e-3, delta=7e-3)
+        self.assertLessEqual(h.percentile(100), h.max)
+
+    def test_negative_counts_as_zero(self):
+        h = LatencyHistogram()
+        h.record(-5)
+        self.assertEqual(h.max, 0.)
+
+    def test_summary_keys(self):
+        h = LatencyHistogram()
+        h.record(10)
+        self.assertEqual(set(h.summary()),
+                         {'count', 'mean', 'p50', 'p95', 'p99', 'max'})
+
+    def test_reset(self):
+        h = LatencyHistogram()
+        h.record(10)
+        h.reset()
+        self.assertEqual(h.count, 0)
+        self.assertEqual(h.max, 0.)
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        self.assertFalse(Profiler().enabled)
+
+    def test_shared_instance(self):
+        self.assertIsInstance(profiler, Profiler)
+
+    def test_record_creates_stage(self):
+        p = Profiler()
+        p.record('stage', 100)
+        self.assertEqual(p.stages(), ['stage'])
+        self.assertEqual(p.stats()['stage']['count'], 1)
+
+    def test_timed_returns_result(self):
+        p = Profiler()
+        self.assertEqual(p.timed('add', lambda a, b=0: a + b, 1, b=2), 3)
+        self.assertEqual(p.histogram('add').count, 1)
+
+    def test_measure(self):
+        p = Profiler()
+        with p.measure('block'):
+            pass
+        self.assertEqual(p.histogram('block').count, 1)
+
+    def test_apply_times_each_filter(self):
+        p = Profiler()
+        widget = MagicMock(return_value=2)
+        widget.filter = _Increment()
+        self.assertEqual(p.apply([_Increment(), widget], 0), 2)
+        widget.assert_called_once_with(1)
+        self.assertEqual(p.histogram('filter._Increment').count, 2)
+
+    def test_since_requires_stamp(self):
+        p = Profiler()
+        frame = object()
+        p.since('latency', frame)
+        self.assertEqual(p.stages(), [])
+        p.stamp(frame, 0)
+        p.since('latency', frame)
+        self.assertEqual(p.histogram('latency').count, 1)
+
+    def test_stamps_are_bounded(self):
+        p = Profiler()
+        frames = [object() for _ in range(p.STAMPS + 10)]
+        for frame in frames:
+            p.stamp(frame, 0)
+        self.assertEqual(len(p._stamps), p.STAMPS)
+        p.since('latency', frames[0])
+        self.assertEqual(p.stages(), [])
+
+    def test_report_lists_stages(self):
+        p = Profiler()
+        p.record('camera.read', 1_000_000)
+        report = p.report()
+        self.assertIn('camera.read', report)
+        self.assertIn('p99', report)
+
+    def test_reset_keeps_stages(self):
+        p = Profiler()
+        p.record('stage', 100)
+        p.reset()
+        self.assertEqual(p.histogram('stage').count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ import unittest
 import numpy as np
 from unittest.mock import patch
 import cv2
-from qtpy import QtWidgets
+from qtpy import QtCore, QtWidgets
 from QVideo.filters.laplacian import LaplacianFilter, QLaplacianFilter
 
 
@@ -112,6 +112,13 @@ class TestLaplacianFilterGet(unittest.TestCase):
         self.assertEqual(lap_input.ndim, 2)
 
 
+    def test_16_bit_edges_keep_type(self):
+        frame = np.zeros((8, 8), dtype=np.uint16)
+        frame[:, 4:] = 10000
+        result = make_filter()(frame)
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertGreater(int(result.max()), 255)
+
 class TestQLaplacianFilterInit(unittest.TestCase):
 
     def test_filter_is_laplacian_filter(self):
@@ -133,6 +140,14 @@ class TestQLaplacianFilterSetKsize(unittest.TestCase):
         w._setKsize(4)
         self.assertEqual(w._ksizeBox.value() % 2, 1)
 
+    def test_pending_ksize_keeps_spinbox(self):
+        w = make_widget()
+        with QtCore.QSignalBlocker(w._ksizeBox):
+            w._ksizeBox.setValue(4)
+        with patch.object(w.filter, 'isPending', return_value=True):
+            w._setKsize(4)
+        self.assertEqual(w._ksizeBox.value(), 4)
+
 
 class TestQLaplacianFilterSetSigma(unittest.TestCase):
 
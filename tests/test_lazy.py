@@ -0,0 +1,109 @@
+'''Unit tests for lazy package exports.'''
+import subprocess
+import sys
+import types
+import unittest
+from unittest.mock import patch
+from QVideo.lib._lazy import attach
+
+
+def loaded_after(statement: str, modules: tuple[str, ...]) -> list[str]:
+    '''Return the *modules* present after *statement* in a new process.'''
+    code = (f'import sys\n{statement}\n'
+            f'print(*[m for m in {modules!r} if m in sys.modules])')
+    result = subprocess.run([sys.executable, '-c', code],
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+HEAVY = ('scipy', 'pyqtgraph', 'QVideo.filters.circletransform',
+         'QVideo.lib.QVideoScreen', 'QVideo.lib.QCameraTree')
+
+
+class TestAttach(unittest.TestCase):
+
+    def setUp(self):
+        self.package = types.ModuleType('_lazytest')
+        self.source = types.ModuleType('_lazytest.source')
+        self.source.Thing = object()
+        modules = {'_lazytest': self.package,
+                   '_lazytest.source': self.source}
+        patcher = patch.dict(sys.modules, modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.package.__getattr__, self.package.__dir__ = attach(
+            '_lazytest', {'Thing': '.source', 'source': '.source'})
+
+    def test_resolves_export(self):
+        self.assertIs(self.package.Thing, self.source.Thing)
+
+    def test_caches_export(self):
+        self.package.Thing
+        self.assertIn('Thing', vars(self.package))
+
+    def test_from_import(self):
+        from _lazytest import Thing
+        self.assertIs(Thing, self.source.Thing)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            self.package.Missing
+
+    def test_dir_lists_exports(self):
+        self.assertIn('Thing', dir(self.package))
+
+    def test_submodule_does_not_shadow_export(self):
+        setattr(self.package, 'Thing', self.source)
+        self.assertIs(self.package.Thing, self.source.Thing)
+
+    def test_other_attributes_are_set(self):
+        self.package.other = self.source
+        self.assertIs(self.package.other, self.source)
+
+
+class TestPackageExports(unittest.TestCase):
+
+    def test_lib_names_resolve(self):
+        import QVideo.lib as lib
+        for name in ('QCamera', 'QVideoSource', 'FrameInfo', 'profiler'):
+            with self.subTest(name=name):
+                self.assertFalse(isinstance(getattr(lib, name),
+                                            types.ModuleType))
+
+    def test_same_named_submodule_keeps_class(self):
+        import QVideo.lib.QCamera
+        from QVideo.lib import QCamera
+        self.assertIsInstance(QCamera, type)
+
+    def test_all_exports_resolve(self):
+        import QVideo.filters
+        import QVideo.lib
+        import QVideo.cameras.Noise
+        for package in (QVideo.lib, QVideo.filters, QVideo.cameras.Noise):
+            for name in package.__all__:
+                with self.subTest(package=package.__name__, name=name):
+                    self.assertIsNotNone(getattr(package, name))
+
+    def test_version(self):
+        import QVideo
+        self.assertIsInstance(QVideo.__version__, str)
+
+
+class TestColdImport(unittest.TestCase):
+
+    def test_import_qvideo_is_light(self):
+        self.assertEqual(loaded_after('import QVideo', HEAVY), [])
+
+    def test_headless_camera_is_light(self):
+        statement = ('from QVideo.lib import QCamera, QVideoSource\n'
+                     'from QVideo.cameras.Noise import QNoiseCamera')
+        self.assertEqual(loaded_after(statement, HEAVY), [])
+
+    def test_screen_does_not_load_filters(self):
+        self.assertEqual(
+            loaded_after('from QVideo.lib import QVideoScreen',
+                         ('scipy', 'QVideo.filters.circletransform')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,6 +66,13 @@ class TestMoMeanGet(unittest.TestCase):
         np.testing.assert_array_equal(f.get(), _A)
 
 
+    def test_get_keeps_16_bit_frames(self):
+        f = make_filter()
+        f.add(np.full(_SHAPE, 40000, dtype=np.uint16))
+        result = f.get()
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, 40000)
+
 class TestMoMeanAdd(unittest.TestCase):
 
     def test_add_updates_estimate(self):
@@ -90,6 +90,23 @@ class TestNormalize(unittest.TestCase):
         np.testing.assert_array_equal(result, np.full(_SHAPE, 100, dtype=np.uint8))
 
 
+    def test_scaled_16_bit_frame_keeps_type(self):
+        f = make_normalize(scale=True, mean=100.)
+        frame = np.full(_SHAPE, 30000, dtype=np.uint16)
+        for _ in range(3):
+            f.add(frame)
+        result = f.get()
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, 100 * 257)
+
+    def test_unscaled_result_is_float_ratio(self):
+        f = make_normalize(scale=False)
+        for _ in range(3):
+            f.add(_FRAME)
+        result = f.get()
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, 1.)
+
 class TestSmoothNormalize(unittest.TestCase):
 
     def test_inherits_momedian(self):
@@ -0,0 +1,125 @@
+'''Unit tests for lib/packing.py.'''
+import unittest
+import numpy as np
+from QVideo.lib.packing import (is_packed, unpacked_format, bit_depth,
+                                packed_size, unpacked_size, unpack, pack)
+
+
+def bitstream(values, bits):
+    '''Reference PFNC packing: a little-endian stream of *bits*-bit values.'''
+    stream = 0
+    for n, value in enumerate(values):
+        stream |= int(value) << (n * bits)
+    nbytes = -(-len(values) * bits // 8)
+    return np.frombuffer(stream.to_bytes(nbytes, 'little'), np.uint8)
+
+
+class TestFormats(unittest.TestCase):
+
+    def test_is_packed(self):
+        for name in ('Mono10p', 'Mono12p', 'Mono12Packed', 'BayerRG12p'):
+            self.assertTrue(is_packed(name), name)
+        for name in ('Mono8', 'Mono12', 'RGB8', 'Mono16'):
+            self.assertFalse(is_packed(name), name)
+
+    def test_unpacked_format(self):
+        self.assertEqual(unpacked_format('Mono12p'), 'Mono12')
+        self.assertEqual(unpacked_format('BayerGB10Packed'), 'BayerGB10')
+        self.assertEqual(unpacked_format('Mono8'), 'Mono8')
+
+    def test_bit_depth(self):
+        self.assertEqual(bit_depth('Mono10p'), 10)
+        self.assertEqual(bit_depth('Mono12Packed'), 12)
+
+    def test_packed_size(self):
+        self.assertEqual(packed_size(4, 'Mono10p'), 5)
+        self.assertEqual(packed_size(2, 'Mono12p'), 3)
+        self.assertEqual(packed_size(3, 'Mono12p'), 5)
+
+    def test_unpacked_size(self):
+        self.assertEqual(unpacked_size(5, 'Mono10p'), 4)
+        self.assertEqual(unpacked_size(3, 'Mono10Packed'), 2)
+        self.assertEqual(unpacked_size(12, 'Mono12p'), 8)
+
+    def test_unknown_format_raises(self):
+        with self.assertRaises(ValueError):
+            unpack(np.zeros(3, np.uint8), 'Mono8', (3,))
+
+
+class TestPFNC(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_matches_reference_bitstream(self):
+        for bits in (10, 12):
+            values = self.rng.integers(0, 1 << bits, 64, dtype=np.uint16)
+            with self.subTest(bits=bits):
+                packed = bitstream(values, bits)
+                np.testing.assert_array_equal(
+                    pack(values, f'Mono{bits}p'), packed)
+                np.testing.assert_array_equal(
+                    unpack(packed, f'Mono{bits}p', (64,)), values)
+
+    def test_partial_group(self):
+        values = self.rng.integers(0, 1024, 7, dtype=np.uint16)
+        packed = pack(values, 'Mono10p')
+        np.testing.assert_array_equal(packed, bitstream(values, 10))
+        np.testing.assert_array_equal(unpack(packed, 'Mono10p', (7,)),
+                                      values)
+
+
+class TestGigEVision(unittest.TestCase):
+
+    def test_mono12packed(self):
+        packed = np.array([0xAB, 0x3C, 0x12], np.uint8)
+        np.testing.assert_array_equal(unpack(packed, 'Mono12Packed', (2,)),
+                                      [0xABC, 0x123])
+
+    def test_mono10packed(self):
+        packed = np.array([0xFF, 0x13, 0x00], np.uint8)
+        np.testing.assert_array_equal(unpack(packed, 'Mono10Packed', (2,)),
+                                      [0x3FF, 0x001])
+
+    def test_round_trip(self):
+        rng = np.random.default_rng(1)
+        for name, bits in (('Mono10Packed', 10), ('Mono12Packed', 12)):
+            values = rng.integers(0, 1 << bits, (6, 8), dtype=np.uint16)
+            with self.subTest(name=name):
+                np.testing.assert_array_equal(
+                    unpack(pack(values, name), name, values.shape), values)
+
+
+class TestBuffers(unittest.TestCase):
+
+    def test_unpack_fills_out(self):
+        frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+        out = np.empty((6, 8), np.uint16)
+        result = unpack(pack(frame, 'Mono12p'), 'Mono12p', (6, 8), out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, frame)
+
+    def test_unpack_allocates_for_mismatched_out(self):
+        frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+        out = np.empty((6, 8), np.uint8)
+        result = unpack(pack(frame, 'Mono12p'), 'Mono12p', (6, 8), out)
+        self.assertIsNot(result, out)
+        self.assertEqual(result.dtype, np.uint16)
+
+    def test_pack_fills_out(self):
+        frame = np.arange(8, dtype=np.uint16)
+        out = np.empty(packed_size(8, 'Mono10p'), np.uint8)
+        self.assertIs(pack(frame, 'Mono10p', out), out)
+
+    def test_trailing_bytes_are_ignored(self):
+        frame = np.arange(4, dtype=np.uint16)
+        data = np.concatenate([pack(frame, 'Mono12p'), [0xFF, 0xFF]])
+        np.testing.assert_array_equal(unpack(data, 'Mono12p', (4,)), frame)
+
+    def test_short_data_raises(self):
+        with self.assertRaises(ValueError):
+            unpack(np.zeros(4, np.uint8), 'Mono12p', (4,))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,163 @@
+'''Unit tests for the headless Pipeline.'''
+import unittest
+from qtpy import QtWidgets, QtTest
+from QVideo.pipeline import Pipeline, _makeFilter, _makeWriter
+from QVideo.lib.QVideoFilter import VideoFilter
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.QVideoWriter import QVideoWriter
+from QVideo.cameras.Noise._camera import QNoiseCamera
+from QVideo.filters import GammaFilter, SmoothingFilter
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class _Writer(QVideoWriter):
+    '''In-memory writer that records frames and their metadata.'''
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__('memory', *args, **kwargs)
+        self.frames = []
+        self.infos = []
+        self.closed = False
+        self._open = False
+
+    def open(self, frame) -> bool:
+        self._open = True
+        return True
+
+    def isOpen(self) -> bool:
+        return self._open
+
+    def _write(self, frame) -> None:
+        self.frames.append(frame)
+        self.infos.append(self.info)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Decimate(VideoFilter):
+    '''Passes every other frame.'''
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+        self.shut = False
+
+    def get(self):
+        self.count += 1
+        return self.data if self.count % 2 else None
+
+    def shutdown(self) -> None:
+        self.shut = True
+
+
+def make_source() -> QVideoSource:
+    camera = QNoiseCamera()
+    camera.width, camera.height = 32, 24
+    camera._fps = 1000.
+    return QVideoSource(camera)
+
+
+def run(pipeline: Pipeline, timeout: int = 5000) -> None:
+    spy = QtTest.QSignalSpy(pipeline.finished)
+    pipeline.start()
+    if not spy.wait(timeout):
+        pipeline.stop()
+
+
+class TestMakeFilter(unittest.TestCase):
+
+    def test_name_only(self):
+        self.assertIsInstance(_makeFilter('GammaFilter'), GammaFilter)
+
+    def test_options(self):
+        videoFilter = _makeFilter('GammaFilter:gamma=0.5')
+        self.assertEqual(videoFilter.gamma, 0.5)
+
+    def test_string_option(self):
+        videoFilter = _makeFilter('SmoothingFilter:width=5,method=median')
+        self.addCleanup(videoFilter.shutdown)
+        self.assertIsInstance(videoFilter, SmoothingFilter)
+        self.assertEqual(videoFilter.method, 'median')
+
+    def test_unknown_filter_raises(self):
+        with self.assertRaises(ValueError):
+            _makeFilter('NoSuchFilter')
+
+    def test_widget_is_rejected(self):
+        with self.assertRaises(ValueError):
+            _makeFilter('QGammaFilter')
+
+    def test_malformed_option_raises(self):
+        with self.assertRaises(ValueError):
+            _makeFilter('GammaFilter:0.5')
+
+
+class TestMakeWriter(unittest.TestCase):
+
+    def test_unsupported_suffix_raises(self):
+        with self.assertRaises(ValueError):
+            _makeWriter('out.xyz', 30., None)
+
+    def test_writer_by_suffix(self):
+        writer = _makeWriter('out.avi', 30., 10)
+        self.assertEqual(writer.target, 10)
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_processes_requested_frames(self):
+        writer = _Writer()
+        pipeline = Pipeline(make_source(), [GammaFilter(0.5)], writer,
+                            nframes=10)
+        run(pipeline)
+        self.assertFalse(pipeline.isRunning())
+        self.assertEqual(pipeline.stats()['processed'], 10)
+        self.assertTrue(writer.closed)
+        self.assertEqual(pipeline.stats()['written'], len(writer.frames))
+
+    def test_writer_receives_metadata(self):
+        writer = _Writer()
+        run(Pipeline(make_source(), writer=writer, nframes=5))
+        self.assertTrue(writer.infos)
+        indices = [info.index for info in writer.infos]
+        self.assertEqual(indices, sorted(indices))
+
+    def test_none_results_are_not_written(self):
+        writer = _Writer()
+        decimate = _Decimate()
+        pipeline = Pipeline(make_source(), [decimate], writer, nframes=6)
+        run(pipeline)
+        self.assertGreaterEqual(decimate.count, 11)
+        self.assertTrue(decimate.shut)
+
+    def test_stop_without_writer(self):
+        pipeline = Pipeline(make_source())
+        pipeline.start()
+        QtTest.QTest.qWait(100)
+        pipeline.stop()
+        stats = pipeline.stats()
+        self.assertFalse(pipeline.source.isRunning())
+        self.assertEqual(stats['written'], 0)
+        self.assertGreater(stats['elapsed'], 0)
+
+    def test_stop_is_idempotent(self):
+        pipeline = Pipeline(make_source())
+        spy = QtTest.QSignalSpy(pipeline.finished)
+        pipeline.start()
+        pipeline.stop()
+        pipeline.stop()
+        self.assertEqual(len(spy), 1)
+
+    def test_report(self):
+        pipeline = Pipeline(make_source(), nframes=3)
+        run(pipeline)
+        report = pipeline.report()
+        for key in ('processed', 'written', 'overwritten', 'dropped'):
+            self.assertIn(key, report)
+
+
+if __name__ == '__main__':
+    unittest.main()
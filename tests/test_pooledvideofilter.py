@@ -0,0 +1,204 @@
+'''Unit tests for PooledVideoFilter.'''
+import threading
+import time
+import unittest
+import numpy as np
+from qtpy import QtWidgets
+from QVideo.lib.AsyncVideoFilter import AsyncVideoFilter
+from QVideo.lib.PooledVideoFilter import PooledVideoFilter
+import QVideo.lib.tiling as tiling
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def frame(value):
+    return np.full((4, 4), value, dtype=np.uint8)
+
+
+class _Gated(PooledVideoFilter):
+    '''Filter whose frames finish only when released by the test.'''
+
+    def __init__(self, **kwargs):
+        self.gates = {}
+        super().__init__(**kwargs)
+
+    def process(self, image):
+        self.gates.setdefault(int(image[0, 0]),
+                              threading.Event()).wait(1.)
+        return image + 100
+
+    def release(self, *values):
+        for value in values:
+            self.gates.setdefault(value, threading.Event()).set()
+
+
+def make_filter(**kwargs) -> _Gated:
+    return _Gated(**kwargs)
+
+
+def settle(f, value):
+    '''Wait until the pending future for *value* has finished.'''
+    deadline = time.monotonic() + 1.
+    for sequence, _, future in list(f._pending):
+        if sequence == value:
+            while not future.done() and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+
+class TestPooledVideoFilterInit(unittest.TestCase):
+
+    def test_is_async_filter(self):
+        f = make_filter(workers=2)
+        self.addCleanup(f.shutdown)
+        self.assertIsInstance(f, AsyncVideoFilter)
+
+    def test_workers_at_least_one(self):
+        f = make_filter(workers=0)
+        self.addCleanup(f.shutdown)
+        self.assertEqual(f.workers, 1)
+
+    def test_invalid_policy_raises(self):
+        with self.assertRaises(ValueError):
+            PooledVideoFilter(policy='block')
+
+    def test_no_qthread(self):
+        f = make_filter(workers=2)
+        self.addCleanup(f.shutdown)
+        self.assertFalse(hasattr(f, '_thread'))
+
+
+class TestPooledVideoFilterOrder(unittest.TestCase):
+
+    def setUp(self):
+        self.filter = make_filter(workers=2)
+        self.addCleanup(self.filter.shutdown)
+        self.addCleanup(self.filter.release, 0, 1, 2, 3)
+
+    def test_passthrough_before_first_result(self):
+        f = self.filter
+        self.assertEqual(f(frame(0))[0, 0], 0)
+
+    def test_later_frame_waits_for_earlier(self):
+        f = self.filter
+        f.add(frame(0))
+        f.add(frame(1))
+        f.release(1)
+        settle(f, 1)
+        self.assertEqual(f.get()[0, 0], 1)
+        f.release(0)
+        settle(f, 0)
+        self.assertEqual(f.get()[0, 0], 101)
+
+    def test_staleness_counts_newer_frames(self):
+        f = self.filter
+        f.add(frame(0))
+        f.add(frame(1))
+        f.release(0)
+        settle(f, 0)
+        f.get()
+        self.assertEqual(f.staleness, 1)
+        self.assertGreater(f.age, 0.)
+
+
+class TestPooledVideoFilterPolicy(unittest.TestCase):
+
+    def test_drop_when_workers_busy(self):
+        f = make_filter(workers=2)
+        self.addCleanup(f.shutdown)
+        self.addCleanup(f.release, 0, 1, 2)
+        for n in range(3):
+            f.add(frame(n))
+        self.assertEqual(f.dropped, 1)
+        self.assertEqual(len(f._pending), 2)
+
+    def test_drop_returns_latest_in_order(self):
+        f = make_filter(workers=2)
+        self.addCleanup(f.shutdown)
+        f.add(frame(0))
+        f.add(frame(1))
+        f.release(0, 1)
+        settle(f, 0)
+        settle(f, 1)
+        self.assertEqual(f.get()[0, 0], 101)
+        self.assertEqual(f.staleness, 0)
+
+    def test_queue_keeps_every_frame(self):
+        f = make_filter(workers=1, policy='queue')
+        self.addCleanup(f.shutdown)
+        self.addCleanup(f.release, 0, 1, 2)
+        f.add(frame(0))
+        f.add(frame(1))
+        self.assertEqual(f.dropped, 0)
+        self.assertEqual(len(f._pending), 2)
+
+    def test_queue_steps_through_results(self):
+        f = make_filter(workers=2, policy='queue')
+        self.addCleanup(f.shutdown)
+        f.add(frame(0))
+        f.add(frame(1))
+        f.release(0, 1)
+        settle(f, 0)
+        settle(f, 1)
+        self.assertEqual(f.get()[0, 0], 100)
+        self.assertEqual(f.get()[0, 0], 101)
+
+    def test_queue_waits_at_backlog(self):
+        f = make_filter(workers=1, policy='queue')
+        self.addCleanup(f.shutdown)
+        f.add(frame(0))
+        f.add(frame(1))
+        timer = threading.Timer(0.05, f.release, (0,))
+        timer.start()
+        f.release(1)
+        f.add(frame(2))
+        self.assertTrue(f._pending[0][2].done())
+        f.release(2)
+
+
+class TestPooledVideoFilterLifecycle(unittest.TestCase):
+
+    def test_failed_frame_is_skipped(self):
+        class Failing(PooledVideoFilter):
+            def process(self, image):
+                raise ValueError('bad frame')
+
+        f = Failing(workers=1)
+        self.addCleanup(f.shutdown)
+        f.add(frame(0))
+        f._pending[0][2].exception()
+        with self.assertLogs('QVideo.lib.PooledVideoFilter', 'WARNING'):
+            result = f.get()
+        self.assertEqual(result[0, 0], 0)
+
+    def test_changing_workers_restarts_pool(self):
+        f = make_filter(workers=1)
+        self.addCleanup(f.shutdown)
+        pool = f._pool
+        f.workers = 2
+        self.assertIsNot(f._pool, pool)
+        self.assertEqual(f._pool._max_workers, 2)
+
+    def test_workers_do_not_tile(self):
+        f = make_filter(workers=2)
+        self.addCleanup(f.shutdown)
+        marked = f._pool.submit(
+            lambda: getattr(tiling._local, 'worker', False)).result(1.)
+        self.assertTrue(marked)
+
+    def test_single_worker_may_tile(self):
+        f = make_filter(workers=1)
+        self.addCleanup(f.shutdown)
+        marked = f._pool.submit(
+            lambda: getattr(tiling._local, 'worker', False)).result(1.)
+        self.assertFalse(marked)
+
+    def test_shutdown_stops_pool(self):
+        f = make_filter(workers=1)
+        f.shutdown()
+        with self.assertRaises(RuntimeError):
+            f._pool.submit(print)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
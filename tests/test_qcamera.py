@@ -414,6 +414,91 @@ class TestRead(unittest.TestCase):
             cam.saferead()
             self.assertTrue(mock_read.called)
 
+    def test_read_into_defaults_to_read(self):
+        cam = make_camera()
+        out = np.empty((480, 640), dtype=np.uint8)
+        with patch.object(cam, 'read', wraps=cam.read) as mock_read:
+            ok, frame = cam.read_into(out)
+            self.assertTrue(mock_read.called)
+        self.assertTrue(ok)
+        self.assertIsNot(frame, out)
+
+    def test_saferead_into_calls_read_into(self):
+        cam = make_camera()
+        out = np.empty((480, 640), dtype=np.uint8)
+        with patch.object(cam, 'read_into',
+                          wraps=cam.read_into) as mock_read_into:
+            cam.saferead_into(out)
+            mock_read_into.assert_called_once_with(out)
+
+    def test_frame_metadata_defaults_to_none(self):
+        cam = make_camera()
+        cam.read()
+        self.assertEqual(cam.frameMetadata(), (None, None))
+
+    def test_hardware_roi_not_supported_by_default(self):
+        cam = make_camera()
+        self.assertIsNone(cam.applyROI(0, 0, 64, 64))
+        cam.resetROI()
+
+    def test_queued_roi_sets_window(self):
+        cam = make_camera()
+        with patch.object(cam, 'applyROI',
+                          return_value=(0, 0, 64, 32)) as apply:
+            cam.queueROI((1, 2, 3, 4))
+        apply.assert_called_once_with(1, 2, 3, 4)
+        self.assertEqual(cam.window, (0, 0, 64, 32))
+
+    def test_queued_roi_reset(self):
+        cam = make_camera()
+        with patch.object(cam, 'applyROI', return_value=(0, 0, 64, 32)):
+            cam.queueROI((1, 2, 3, 4))
+        with patch.object(cam, 'resetROI') as reset:
+            cam.queueROI(None)
+        reset.assert_called_once()
+        self.assertIsNone(cam.window)
+
+    def test_window_none_without_hardware_roi(self):
+        cam = make_camera()
+        cam.queueROI((0, 0, 64, 64))
+        self.assertIsNone(cam.window)
+
+    def test_hardware_binning_not_supported_by_default(self):
+        cam = make_camera()
+        self.assertIsNone(cam.applyBinning(2))
+        cam.resetBinning()
+
+    def test_queued_binning_sets_binning(self):
+        cam = make_camera()
+        with patch.object(cam, 'applyBinning', return_value=2) as apply:
+            cam.queueBinning((4, 'sum'))
+        apply.assert_called_once_with(4, 'sum')
+        self.assertEqual(cam.binning, 2)
+
+    def test_queued_binning_reset(self):
+        cam = make_camera()
+        with patch.object(cam, 'applyBinning', return_value=2):
+            cam.queueBinning((2, 'mean'))
+        with patch.object(cam, 'resetBinning') as reset:
+            cam.queueBinning(None)
+        reset.assert_called_once()
+        self.assertEqual(cam.binning, 1)
+
+    def test_binning_one_without_hardware_binning(self):
+        cam = make_camera()
+        cam.queueBinning((2, 'mean'))
+        self.assertEqual(cam.binning, 1)
+
+    def test_queued_binning_waits_for_capture_loop(self):
+        cam = make_camera()
+        cam.queueing = True
+        with patch.object(cam, 'applyBinning', return_value=2) as apply:
+            cam.queueBinning((2, 'mean'))
+            cam.queueBinning((4, 'mean'))
+            apply.assert_not_called()
+            self.assertEqual(cam.applyPending(), 1)
+        apply.assert_called_once_with(4, 'mean')
+
 
 class TestExecute(unittest.TestCase):
 
@@ -428,5 +513,98 @@ class TestExecute(unittest.TestCase):
             cam.execute('nonexistent')
 
 
+
+class TestQueue(unittest.TestCase):
+
+    def queueing_camera(self):
+        cam = make_camera()
+        cam.queueing = True
+        return cam
+
+    def test_queueing_disabled_by_default(self):
+        self.assertFalse(make_camera().queueing)
+
+    def test_applies_immediately_when_not_queueing(self):
+        cam = make_camera()
+        future = cam.queueSet('width', 320)
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 320)
+        self.assertEqual(cam.width, 320)
+
+    def test_queued_set_is_deferred(self):
+        cam = self.queueing_camera()
+        future = cam.queueSet('width', 320)
+        self.assertFalse(future.done())
+        self.assertEqual(cam.width, 640)
+        self.assertTrue(cam.hasPending())
+
+    def test_apply_pending_applies_set(self):
+        cam = self.queueing_camera()
+        future = cam.queueSet('width', 320)
+        self.assertEqual(cam.applyPending(), 1)
+        self.assertEqual(cam.width, 320)
+        self.assertEqual(future.result(timeout=0), 320)
+        self.assertFalse(cam.hasPending())
+
+    def test_repeated_sets_are_coalesced(self):
+        cam = self.queueing_camera()
+        futures = [cam.queueSet('width', w) for w in (100, 200, 300)]
+        with patch.object(cam, 'set', wraps=cam.set) as mock_set:
+            self.assertEqual(cam.applyPending(), 1)
+        mock_set.assert_called_once_with('width', 300)
+        self.assertEqual([f.result(timeout=0) for f in futures],
+                         [300, 300, 300])
+
+    def test_commands_applied_in_order(self):
+        cam = self.queueing_camera()
+        cam.queueSet('width', 320)
+        cam.queueExecute('calibrate')
+        cam.queueSet('height', 240)
+        with patch.object(cam, 'set', wraps=cam.set) as mock_set:
+            self.assertEqual(cam.applyPending(), 3)
+        self.assertEqual([c.args[0] for c in mock_set.call_args_list],
+                         ['width', 'height'])
+        self.assertTrue(cam._method_called)
+
+    def test_executes_are_not_coalesced(self):
+        cam = self.queueing_camera()
+        cam.queueExecute('calibrate')
+        cam.queueExecute('calibrate')
+        self.assertEqual(cam.applyPending(), 2)
+
+    def test_queue_get(self):
+        cam = self.queueing_camera()
+        future = cam.queueGet('fps')
+        cam.applyPending()
+        self.assertEqual(future.result(timeout=0), 30.)
+
+    def test_command_finished_emitted(self):
+        cam = self.queueing_camera()
+        spy = QtTest.QSignalSpy(cam.commandFinished)
+        cam.queueSet('width', 320)
+        cam.applyPending()
+        self.assertEqual(len(spy), 1)
+        self.assertEqual(list(spy[0]), ['width', 320])
+
+    def test_cancelled_command_is_skipped(self):
+        cam = self.queueing_camera()
+        future = cam.queueSet('width', 320)
+        future.cancel()
+        cam.applyPending()
+        self.assertEqual(cam.width, 640)
+
+    def test_failure_sets_exception(self):
+        cam = self.queueing_camera()
+        cam.registerProperty('bad', getter=lambda: 0,
+                             setter=lambda v: 1 / 0, ptype=int)
+        future = cam.queueSet('bad', 1)
+        with self.assertLogs('QVideo.lib.QCamera', level='WARNING'):
+            cam.applyPending()
+        self.assertIsInstance(future.exception(timeout=0), ZeroDivisionError)
+
+    def test_apply_pending_with_empty_queue(self):
+        self.assertEqual(make_camera().applyPending(), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 '''Unit tests for QCameraTree.'''
 import unittest
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 from qtpy import QtGui, QtWidgets
 from QVideo.lib.QCameraTree import QCameraTree
 from QVideo.cameras.Noise._camera import QNoiseCamera, QNoiseSource
@@ -139,6 +139,52 @@ class TestQCameraTreeSync(unittest.TestCase):
         tree._parameters['width'].setValue(320)
 
 
+class TestQCameraTreeQueuedSync(unittest.TestCase):
+
+    def make_running_tree(self):
+        cam = make_camera()
+        tree = make_tree(source=make_source(cam))
+        cam.queueing = True
+        patcher = patch.object(tree.source, 'isRunning', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return cam, tree
+
+    def test_change_is_queued_while_running(self):
+        cam, tree = self.make_running_tree()
+        with patch.object(cam, 'set') as mock_set:
+            tree._parameters['width'].setValue(320)
+        mock_set.assert_not_called()
+        self.assertTrue(cam.hasPending())
+
+    def test_tree_keeps_value_until_applied(self):
+        cam, tree = self.make_running_tree()
+        tree._parameters['width'].setValue(320)
+        self.assertEqual(tree.get('width'), 320)
+        self.assertEqual(cam.width, 640)
+
+    def test_tree_refreshed_when_applied(self):
+        cam, tree = self.make_running_tree()
+        tree._parameters['blacklevel'].setValue(500)
+        cam.applyPending()
+        self.assertEqual(tree.get('blacklevel'), cam.blacklevel)
+
+    def test_only_reported_key_updated(self):
+        cam, tree = self.make_running_tree()
+        tree._parameters['blacklevel'].setValue(500)
+        with patch.object(type(cam), 'settings',
+                          new_callable=PropertyMock) as settings:
+            cam.applyPending()
+        self.assertFalse(settings.called)
+        self.assertEqual(tree.get('blacklevel'), cam.blacklevel)
+
+    def test_execute_result_ignored(self):
+        cam, tree = self.make_running_tree()
+        with patch.object(tree, 'set') as mock_set:
+            tree._commandFinished('blacklevel', None)
+        mock_set.assert_not_called()
+
+
 class TestQCameraTreeDefaultDescriptionNone(unittest.TestCase):
 
     def test_skips_properties_with_none_getter(self):
@@ -4,6 +4,7 @@ import numpy as np
 from unittest.mock import patch, MagicMock
 from qtpy import QtCore, QtGui, QtWidgets, QtTest
 from QVideo.dvr.QDVRWidget import QDVRWidget, _h5py_available
+from QVideo.lib.QVideoSource import QVideoSource
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -241,6 +242,20 @@ class TestQDVRWidgetRecord(unittest.TestCase):
             widget.record()
         mock_stop.assert_called_once()
 
+    def test_record_video_source_uses_frame_info(self):
+        widget = make_widget(source=QVideoSource(MagicMock()))
+        widget._writer = MockWriter()
+        widget._writer.writeInfo = MagicMock()
+        signal, slot = widget._recordingConnection()
+        self.assertIs(slot, widget._writer.writeInfo)
+        self.assertEqual(signal, widget.source.newFrameInfo)
+
+    def test_record_plain_source_uses_new_frame(self):
+        widget, source = make_widget_with_source()
+        widget._writer = MockWriter()
+        signal, slot = widget._recordingConnection()
+        self.assertEqual(slot, widget._writer.write)
+
 
 class TestQDVRWidgetPlay(unittest.TestCase):
 
@@ -5,6 +5,7 @@ from unittest.mock import patch
 from qtpy import QtCore, QtWidgets
 from QVideo.lib.QFilterBank import QFilterBank
 from QVideo.lib.QVideoFilter import QVideoFilter, VideoFilter
+from QVideo.lib.instrumentation import profiler
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -143,6 +144,46 @@ class TestQFilterBank(unittest.TestCase):
             bank.registerByName('QRGBFilter')
         self.assertEqual(len(bank.filters), 2)
 
+    def test_register_shares_lock(self):
+        bank = make_bank()
+        f = make_filter()
+        bank.register(f)
+        self.assertIs(f.filter.lock, bank.lock)
+
+    def test_deregister_releases_lock(self):
+        bank = make_bank()
+        f = make_filter()
+        bank.register(f)
+        bank.deregister(f)
+        self.assertIsNone(f.filter.lock)
+
+    def test_call_holds_lock(self):
+        bank = make_bank()
+        held = []
+
+        class Probe(VideoFilter):
+            def add(self, data):
+                held.append(bank.lock._is_owned())
+                super().add(data)
+
+        f = QVideoFilter(None, 'Probe', Probe())
+        f.setChecked(True)
+        bank.register(f)
+        bank(_FRAME)
+        self.assertEqual(held, [True])
+
+    def test_call_records_filter_stages_when_profiling(self):
+        bank = make_bank()
+        bank.register(make_filter())
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            result = bank(_FRAME)
+        finally:
+            profiler.enabled = False
+        np.testing.assert_array_equal(result, _FRAME)
+        self.assertEqual(profiler.histogram('filter.VideoFilter').count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
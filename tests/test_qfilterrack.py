@@ -1,11 +1,14 @@
 '''Unit tests for QFilterRack.'''
+import time
 import unittest
 import numpy as np
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from qtpy import QtCore, QtWidgets
 from QVideo.lib.QFilterRack import QFilterRack, _FilterSlot, _FilterPicker
-from QVideo.lib.QVideoFilter import QVideoFilter, VideoFilter
-from QVideo.filters import QSmoothingFilter, QEdgeFilter
+from QVideo.lib.QVideoFilter import FilterCode, QVideoFilter, VideoFilter
+from QVideo.lib.instrumentation import profiler
+from QVideo.filters import (QSmoothingFilter, QEdgeFilter, QROIFilter,
+                            QBinningFilter, QRGBFilter, QGammaFilter)
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -21,6 +24,21 @@ def make_filter(title='Test') -> QVideoFilter:
     return QVideoFilter(None, title, VideoFilter())
 
 
+class _Offset(VideoFilter):
+    '''Stateless filter that adds a constant.'''
+
+    def __init__(self, offset):
+        super().__init__()
+        self.offset = offset
+
+    def add(self, data):
+        self.data = data + self.offset
+
+    def to_code(self):
+        return FilterCode(imports=frozenset(),
+                          lines=[f'image = image + {self.offset}'])
+
+
 class TestQFilterRackInit(unittest.TestCase):
 
     def test_is_qwidget(self):
@@ -199,6 +217,187 @@ class TestQFilterRackCall(unittest.TestCase):
         rack(_FRAME)
         self.assertEqual(log, [])
 
+    def test_call_records_filter_stages_when_profiling(self):
+        rack = make_rack()
+        f = make_filter()
+        f.setChecked(True)
+        rack.add(f)
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            result = rack(_FRAME)
+        finally:
+            profiler.enabled = False
+        np.testing.assert_array_equal(result, _FRAME)
+        self.assertEqual(profiler.histogram('filter.VideoFilter').count, 1)
+
+
+class TestQFilterRackFused(unittest.TestCase):
+
+    def setUp(self):
+        self.rack = make_rack()
+        self.rgb = QRGBFilter(None)
+        self.rgb.setChecked(True)
+        self.rack.add(self.rgb)
+        self.frame = np.arange(48, dtype=np.uint8).reshape(4, 4, 3)
+
+    def test_fused_by_default(self):
+        self.assertTrue(self.rack.fused)
+        self.assertIn('RGBFilter', self.rack.fusedSource)
+
+    def test_fused_result_matches_unfused(self):
+        fused = self.rack(self.frame)
+        self.rack.fused = False
+        np.testing.assert_array_equal(fused, self.rack(self.frame))
+
+    def test_recompiled_when_filter_disabled(self):
+        self.rack(self.frame)
+        self.rgb.setChecked(False)
+        np.testing.assert_array_equal(self.rack(self.frame), self.frame)
+        self.assertNotIn('RGBFilter', self.rack.fusedSource)
+
+    def test_recompiled_when_filter_added(self):
+        self.rack(self.frame)
+        gamma = QGammaFilter(None)
+        gamma.setChecked(True)
+        self.rack.add(gamma)
+        self.assertIn('GammaFilter', self.rack.fusedSource)
+
+    def test_not_recompiled_for_same_layout(self):
+        with patch('QVideo.lib.QFilterRack.compile_stages',
+                   return_value=([], '')) as compiled:
+            self.rack(self.frame)
+            self.rack(self.frame)
+        compiled.assert_called_once()
+
+
+class TestQFilterRackHardwareROI(unittest.TestCase):
+
+    def setUp(self):
+        self.camera = MagicMock()
+        self.rack = make_rack()
+        self.rack.ROI_DELAY = 0.
+        self.rack.camera = self.camera
+        self.roi = QROIFilter(None)
+        self.roi.setChecked(True)
+        self.roi.filter.w, self.roi.filter.h = 2, 2
+        self.rack.add(self.roi)
+
+    def test_disabled_by_default(self):
+        self.rack(_FRAME)
+        self.assertFalse(self.rack.hardwareROI)
+        self.camera.queueROI.assert_not_called()
+
+    def test_leading_roi_is_queued_for_camera(self):
+        self.rack.hardwareROI = True
+        self.rack(_FRAME)
+        self.camera.queueROI.assert_called_once_with((0, 0, 2, 2))
+        self.camera.applyROI.assert_not_called()
+
+    def test_unchanged_roi_is_pushed_once(self):
+        self.rack.hardwareROI = True
+        self.rack(_FRAME)
+        self.rack(_FRAME)
+        self.assertEqual(self.camera.queueROI.call_count, 1)
+
+    def test_changed_roi_is_pushed_again(self):
+        self.rack.hardwareROI = True
+        self.rack(_FRAME)
+        self.roi.filter.x = 1
+        self.rack(_FRAME)
+        self.camera.queueROI.assert_called_with((1, 0, 2, 2))
+
+    def test_changing_roi_is_debounced(self):
+        self.rack.ROI_DELAY = 10.
+        self.rack.hardwareROI = True
+        for x in range(4):
+            self.roi.filter.x = x
+            self.rack(_FRAME)
+        self.camera.queueROI.assert_not_called()
+
+    def test_steady_roi_is_pushed_after_delay(self):
+        self.rack.ROI_DELAY = 0.25
+        self.rack.hardwareROI = True
+        with patch('QVideo.lib.QFilterRack.time.monotonic',
+                   side_effect=[0., 0.1, 0.3]):
+            self.rack(_FRAME)
+            self.rack(_FRAME)
+            self.camera.queueROI.assert_not_called()
+            self.rack(_FRAME)
+        self.camera.queueROI.assert_called_once_with((0, 0, 2, 2))
+
+    def test_roi_after_other_stage_stays_in_software(self):
+        self.rack.hardwareROI = True
+        other = make_filter()
+        other.setChecked(True)
+        self.rack.add(other)
+        self.rack._slots.insertWidget(0, self.rack._slots.itemAt(1).widget())
+        self.rack(_FRAME)
+        self.camera.queueROI.assert_not_called()
+
+    def test_unchecking_roi_restores_full_frames(self):
+        self.rack.hardwareROI = True
+        self.rack(_FRAME)
+        self.roi.setChecked(False)
+        self.rack(_FRAME)
+        self.camera.queueROI.assert_called_with(None)
+        self.camera.resetROI.assert_not_called()
+
+    def test_disabling_restores_full_frames(self):
+        self.rack.hardwareROI = True
+        self.rack(_FRAME)
+        self.rack.hardwareROI = False
+        self.camera.queueROI.assert_called_with(None)
+
+    def test_release_without_push_leaves_camera_alone(self):
+        self.rack.hardwareROI = True
+        self.rack.hardwareROI = False
+        self.camera.queueROI.assert_not_called()
+
+    def test_untagged_frames_are_cropped_in_software(self):
+        self.rack.hardwareROI = True
+        result = self.rack(_FRAME)
+        self.assertEqual(result.shape, (2, 2))
+
+
+class TestQFilterRackHardwareBinning(unittest.TestCase):
+
+    def setUp(self):
+        self.camera = MagicMock()
+        self.rack = make_rack()
+        self.rack.camera = self.camera
+        self.binning = QBinningFilter(None)
+        self.binning.setChecked(True)
+        self.binning.filter.factor = 4
+        self.rack.add(self.binning)
+        self.rack.hardwareBinning = True
+
+    def test_leading_binning_is_queued_for_camera(self):
+        self.rack(_FRAME)
+        self.camera.queueBinning.assert_called_once_with((4, 'mean'))
+        self.camera.applyBinning.assert_not_called()
+
+    def test_unchanged_binning_is_queued_once(self):
+        self.rack(_FRAME)
+        self.rack(_FRAME)
+        self.assertEqual(self.camera.queueBinning.call_count, 1)
+
+    def test_changed_mode_is_queued_again(self):
+        self.rack(_FRAME)
+        self.binning.filter.mode = 'sum'
+        self.rack(_FRAME)
+        self.camera.queueBinning.assert_called_with((4, 'sum'))
+
+    def test_untagged_frames_binned_in_software(self):
+        frame = np.zeros((8, 8), dtype=np.uint8)
+        self.assertEqual(self.rack(frame).shape, (2, 2))
+
+    def test_disabling_restores_unbinned_frames(self):
+        self.rack(_FRAME)
+        self.rack.hardwareBinning = False
+        self.camera.queueBinning.assert_called_with(None)
+        self.camera.resetBinning.assert_not_called()
+
 
 class TestQFilterRackRemove(unittest.TestCase):
 
@@ -227,6 +426,158 @@ class TestQFilterRackRemove(unittest.TestCase):
         self.assertEqual(rack.filters, [f1, f3])
 
 
+    def test_remove_slot_releases_lock(self):
+        rack = make_rack()
+        f = make_filter()
+        rack.add(f)
+        rack._removeSlot(rack._slotAt(0))
+        self.assertIsNone(f.filter.lock)
+
+
+class TestQFilterRackLock(unittest.TestCase):
+
+    def test_add_shares_lock(self):
+        rack = make_rack()
+        f = make_filter()
+        rack.add(f)
+        self.assertIs(f.filter.lock, rack.lock)
+
+    def test_call_holds_lock(self):
+        rack = make_rack()
+        held = []
+
+        class Probe(VideoFilter):
+            def add(self, data):
+                held.append(rack.lock._is_owned())
+                super().add(data)
+
+        f = QVideoFilter(None, 'Probe', Probe())
+        f.setChecked(True)
+        rack.add(f)
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(held, [True])
+
+
+class TestQFilterRackPipelined(unittest.TestCase):
+
+    def make_rack(self, *offsets):
+        rack = make_rack()
+        rack.pipelined = True
+        self.addCleanup(setattr, rack, 'pipelined', False)
+        self.filters = []
+        for offset in offsets:
+            f = QVideoFilter(None, 'Offset', _Offset(offset))
+            f.setChecked(True)
+            rack.add(f)
+            self.filters.append(f.filter)
+        return rack
+
+    def drain(self, rack, image):
+        deadline = time.monotonic() + 1.
+        while (result := rack(image)) is image:
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.001)
+        return result
+
+    def test_not_pipelined_by_default(self):
+        self.assertFalse(make_rack().pipelined)
+
+    def test_result_matches_serial_rack(self):
+        rack = self.make_rack(1, 2)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        np.testing.assert_array_equal(self.drain(rack, image), image + 3)
+
+    def test_returns_input_until_first_result(self):
+        rack = self.make_rack(1)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        with patch.object(rack, '_startPipeline') as start:
+            start.return_value.result.return_value = None
+            self.assertIs(rack(image), image)
+
+    def test_filters_use_stage_locks(self):
+        rack = self.make_rack(1, 2)
+        self.drain(rack, np.zeros((4, 4), dtype=np.uint8))
+        lock = rack._pipeline.stages[0].lock
+        self.assertEqual([f.lock for f in self.filters], [lock, lock])
+
+    def test_unpipelined_restores_rack_lock(self):
+        rack = self.make_rack(1)
+        self.drain(rack, np.zeros((4, 4), dtype=np.uint8))
+        rack.pipelined = False
+        self.assertIsNone(rack._pipeline)
+        self.assertIs(self.filters[0].lock, rack.lock)
+
+    def test_unfused_stages_run_filters_not_widgets(self):
+        rack = self.make_rack(1, 2)
+        rack.fused = False
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        functions = [stage.function for stage in rack._pipeline.stages]
+        self.assertEqual(functions, self.filters)
+
+    def test_stop_does_not_wait_under_lock(self):
+        rack = self.make_rack(1)
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        pipeline = rack._pipeline
+        joined = []
+        with patch.object(pipeline, 'join',
+                          side_effect=lambda: joined.append(
+                              rack.lock._is_owned())):
+            rack.pipelined = False
+            self.assertEqual(joined, [])
+            rack(np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(len(joined), 1)
+        pipeline._threads[0].join(1.)
+
+    def test_fused_stages_share_a_thread(self):
+        rack = self.make_rack(1, 2)
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(rack.queueDepths[0][0], '_Offset+_Offset')
+
+    def test_unfused_stages_have_a_thread_each(self):
+        rack = self.make_rack(1, 2)
+        rack.fused = False
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual([name for name, _ in rack.queueDepths],
+                         ['_Offset', '_Offset'])
+
+    def test_queue_depths_empty_when_serial(self):
+        self.assertEqual(make_rack().queueDepths, [])
+
+    def test_layout_change_restarts_pipeline(self):
+        rack = self.make_rack(1)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        rack(image)
+        first = rack._pipeline
+        rack.add(make_filter())
+        rack.filters[-1].setChecked(True)
+        rack(image)
+        self.assertIsNot(rack._pipeline, first)
+
+    def test_remove_slot_stops_pipeline(self):
+        rack = self.make_rack(1)
+        rack(np.zeros((4, 4), dtype=np.uint8))
+        rack._removeSlot(rack._slotAt(0))
+        self.assertIsNone(rack._pipeline)
+
+    def test_queue_size_at_least_one(self):
+        rack = make_rack()
+        rack.queueSize = 0
+        self.assertEqual(rack.queueSize, 1)
+
+    def test_profiling_runs_serially(self):
+        rack = self.make_rack(1)
+        image = np.zeros((4, 4), dtype=np.uint8)
+        rack(image)
+        profiler.enabled = True
+        try:
+            result = rack(image)
+        finally:
+            profiler.enabled = False
+        self.assertIsNone(rack._pipeline)
+        np.testing.assert_array_equal(result, image + 1)
+
+
 class TestQFilterRackMoveSlot(unittest.TestCase):
 
     def test_move_slot_no_target_does_not_raise(self):
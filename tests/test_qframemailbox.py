@@ -0,0 +1,246 @@
+'''Unit tests for QFrameMailbox.'''
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+from qtpy import QtCore, QtWidgets, QtTest
+from QVideo.lib.QFrameMailbox import QFrameMailbox
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.frameinfo import FrameInfo
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class _Source(QtCore.QObject):
+    '''Minimal stand-in for QVideoSource.'''
+
+    newFrame = QtCore.Signal(np.ndarray)
+    newFrameInfo = QtCore.Signal(np.ndarray, object)
+    shapeChanged = QtCore.Signal(QtCore.QSize)
+
+    shape = QtCore.QSize(4, 3)
+    fps = 25.
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full((3, 4), value, dtype=np.uint8)
+
+
+def make_mailbox(slots=1):
+    source = _Source()
+    return source, QFrameMailbox(source, slots)
+
+
+class TestInit(unittest.TestCase):
+
+    def test_default_slots(self):
+        _, mailbox = make_mailbox()
+        self.assertEqual(mailbox.slots, 1)
+
+    def test_slots_clamped(self):
+        _, mailbox = make_mailbox(slots=0)
+        self.assertEqual(mailbox.slots, 1)
+
+    def test_mirrors_source(self):
+        source, mailbox = make_mailbox()
+        self.assertIs(mailbox.source, source)
+        self.assertEqual(mailbox.shape, QtCore.QSize(4, 3))
+        self.assertEqual(mailbox.fps, 25.)
+
+    def test_shape_changed_is_forwarded(self):
+        source, mailbox = make_mailbox()
+        spy = QtTest.QSignalSpy(mailbox.shapeChanged)
+        source.shapeChanged.emit(QtCore.QSize(8, 6))
+        self.assertEqual(len(spy), 1)
+
+
+class TestDelivery(unittest.TestCase):
+
+    def test_delivery_is_deferred(self):
+        source, mailbox = make_mailbox()
+        spy = QtTest.QSignalSpy(mailbox.newFrame)
+        source.newFrame.emit(frame(1))
+        self.assertEqual(len(spy), 0)
+        app.processEvents()
+        self.assertEqual(len(spy), 1)
+
+    def test_single_slot_delivers_latest(self):
+        source, mailbox = make_mailbox()
+        received = []
+        mailbox.newFrame.connect(received.append)
+        for n in range(5):
+            source.newFrame.emit(frame(n))
+        app.processEvents()
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0, 0], 4)
+        self.assertEqual(mailbox.overwritten, 4)
+        self.assertEqual(mailbox.delivered, 1)
+
+    def test_multiple_slots_deliver_in_order(self):
+        source, mailbox = make_mailbox(slots=3)
+        received = []
+        mailbox.newFrame.connect(received.append)
+        for n in range(5):
+            source.newFrame.emit(frame(n))
+        app.processEvents()
+        self.assertEqual([f[0, 0] for f in received], [2, 3, 4])
+        self.assertEqual(mailbox.overwritten, 2)
+
+    def test_no_overwrite_when_consumer_keeps_up(self):
+        source, mailbox = make_mailbox()
+        for n in range(3):
+            source.newFrame.emit(frame(n))
+            app.processEvents()
+        self.assertEqual(mailbox.overwritten, 0)
+        self.assertEqual(mailbox.delivered, 3)
+
+    def test_direct_consumer_sees_every_frame(self):
+        source, mailbox = make_mailbox()
+        direct = []
+        source.newFrame.connect(direct.append)
+        for n in range(5):
+            source.newFrame.emit(frame(n))
+        app.processEvents()
+        self.assertEqual(len(direct), 5)
+        self.assertEqual(mailbox.delivered, 1)
+
+    def test_consumers_have_independent_counters(self):
+        source = _Source()
+        fast = QFrameMailbox(source, slots=8)
+        slow = QFrameMailbox(source, slots=1)
+        for n in range(4):
+            source.newFrame.emit(frame(n))
+        app.processEvents()
+        self.assertEqual(fast.overwritten, 0)
+        self.assertEqual(slow.overwritten, 3)
+
+
+class TestTake(unittest.TestCase):
+
+    def test_take_returns_held_frames(self):
+        source, mailbox = make_mailbox(slots=2)
+        source.newFrame.emit(frame(1))
+        source.newFrame.emit(frame(2))
+        frames = mailbox.take()
+        self.assertEqual([f[0, 0] for f in frames], [1, 2])
+
+    def test_take_empties_mailbox(self):
+        source, mailbox = make_mailbox()
+        source.newFrame.emit(frame(1))
+        mailbox.take()
+        self.assertEqual(mailbox.take(), [])
+
+    def test_pending_delivery_after_take_is_harmless(self):
+        source, mailbox = make_mailbox()
+        spy = QtTest.QSignalSpy(mailbox.newFrame)
+        source.newFrame.emit(frame(1))
+        mailbox.take()
+        app.processEvents()
+        self.assertEqual(len(spy), 0)
+
+
+class TestInfo(unittest.TestCase):
+
+    def make_mailbox(self, slots=1):
+        source = _Source()
+        return source, QFrameMailbox(source, slots, info=True)
+
+    def test_delivers_metadata(self):
+        source, mailbox = self.make_mailbox()
+        received = []
+        mailbox.newFrameInfo.connect(lambda f, i: received.append(i))
+        info = FrameInfo(3, 100)
+        source.newFrameInfo.emit(frame(1), info)
+        app.processEvents()
+        self.assertEqual(received, [info])
+
+    def test_newframe_still_emitted(self):
+        source, mailbox = self.make_mailbox()
+        spy = QtTest.QSignalSpy(mailbox.newFrame)
+        source.newFrameInfo.emit(frame(1), FrameInfo(0, 0))
+        app.processEvents()
+        self.assertEqual(len(spy), 1)
+
+    def test_ignores_newframe(self):
+        source, mailbox = self.make_mailbox()
+        source.newFrame.emit(frame(1))
+        self.assertEqual(mailbox.take(), [])
+
+    def test_take_info_returns_pairs(self):
+        source, mailbox = self.make_mailbox(slots=2)
+        info = FrameInfo(0, 0)
+        source.newFrameInfo.emit(frame(5), info)
+        [(image, received)] = mailbox.takeInfo()
+        self.assertEqual(image[0, 0], 5)
+        self.assertIs(received, info)
+
+    def test_plain_mailbox_has_no_metadata(self):
+        source, mailbox = make_mailbox()
+        spy = QtTest.QSignalSpy(mailbox.newFrameInfo)
+        source.newFrame.emit(frame(1))
+        app.processEvents()
+        self.assertEqual(len(spy), 0)
+
+    def test_close_disconnects(self):
+        source, mailbox = self.make_mailbox()
+        mailbox.close()
+        source.newFrameInfo.emit(frame(1), FrameInfo(0, 0))
+        self.assertEqual(mailbox.takeInfo(), [])
+
+
+class TestResetClose(unittest.TestCase):
+
+    def test_reset_zeroes_counters(self):
+        source, mailbox = make_mailbox()
+        source.newFrame.emit(frame(1))
+        source.newFrame.emit(frame(2))
+        app.processEvents()
+        mailbox.reset()
+        self.assertEqual(mailbox.overwritten, 0)
+        self.assertEqual(mailbox.delivered, 0)
+
+    def test_close_disconnects(self):
+        source, mailbox = make_mailbox()
+        mailbox.close()
+        source.newFrame.emit(frame(1))
+        self.assertEqual(mailbox.take(), [])
+
+    def test_close_is_idempotent(self):
+        _, mailbox = make_mailbox()
+        mailbox.close()
+        mailbox.close()
+
+
+class TestQVideoSourceMailbox(unittest.TestCase):
+
+    def make_source(self):
+        camera = MagicMock()
+        camera.shape = QtCore.QSize(4, 3)
+        camera.fps = 30.
+        return QVideoSource(camera)
+
+    def test_returns_mailbox(self):
+        source = self.make_source()
+        mailbox = source.mailbox()
+        self.assertIsInstance(mailbox, QFrameMailbox)
+        self.assertIs(mailbox.source, source)
+
+    def test_slots_forwarded(self):
+        mailbox = self.make_source().mailbox(slots=4)
+        self.assertEqual(mailbox.slots, 4)
+
+    def test_info_forwarded(self):
+        source = self.make_source()
+        mailbox = source.mailbox(info=True)
+        source.newFrameInfo.emit(frame(2), FrameInfo(0, 0))
+        self.assertEqual(len(mailbox.takeInfo()), 1)
+
+    def test_receives_source_frames(self):
+        source = self.make_source()
+        mailbox = source.mailbox()
+        source.newFrame.emit(frame(7))
+        self.assertEqual(mailbox.take()[0][0, 0], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ import subprocess
 import sys
 import unittest
 import numpy as np
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from qtpy import QtWidgets, QtTest
 
 
@@ -83,6 +83,7 @@ for _name, _mod in [('harvesters',      _mock_harvesters),
 
 from QVideo.cameras.Genicam._camera import QGenicamCamera, QGenicamSource
 from QVideo.lib.QCamera import QCamera
+from QVideo.lib.packing import pack
 # Retrieve the module object directly — the `import ... as` form resolves
 # through attribute access and lands on the class (shadowed by __init__.py).
 _cam_module = sys.modules['QVideo.cameras.Genicam._camera']
@@ -187,6 +188,19 @@ def _make_feature(ftype, name='Prop', mode=_EAccessMode.RW, **kw):
     return f
 
 
+def _make_pixel_format(current, formats):
+    '''Return a PixelFormat enumeration offering *formats*.'''
+    feature = _make_feature(_IEnumeration, name='PixelFormat')
+    entries = []
+    for name in formats:
+        entry = MagicMock()
+        entry.symbolic = name
+        entries.append(entry)
+    feature.entries = entries
+    feature.to_string.return_value = current
+    return feature
+
+
 # ---------------------------------------------------------------------------
 # TestInit
 # ---------------------------------------------------------------------------
@@ -541,10 +555,340 @@ class TestRead(unittest.TestCase):
         self.assertIsNone(frame)
 
 
+class TestReadInto(unittest.TestCase):
+
+    def test_fills_matching_buffer(self):
+        cam, _, _ = make_camera()
+        out = np.ones((480, 640), dtype=np.uint8)
+        ok, frame = cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIs(frame, out)
+        self.assertFalse(out.any())
+
+    def test_allocates_for_mismatched_shape(self):
+        cam, _, _ = make_camera()
+        out = np.ones((240, 320), dtype=np.uint8)
+        ok, frame = cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIsNot(frame, out)
+        self.assertEqual(frame.shape, (480, 640))
+
+    def test_allocates_for_mismatched_dtype(self):
+        cam, _, _ = make_camera()
+        out = np.ones((480, 640), dtype=np.uint16)
+        _, frame = cam.read_into(out)
+        self.assertIsNot(frame, out)
+        self.assertEqual(frame.dtype, np.uint8)
+
+    def test_returns_false_none_on_timeout(self):
+        device = _make_device()
+        device.fetch.return_value.__enter__.side_effect = _TimeoutException
+        cam, _, _ = make_camera(device=device)
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            ok, frame = cam.read_into(np.ones((480, 640), dtype=np.uint8))
+        self.assertFalse(ok)
+        self.assertIsNone(frame)
+
+
+class TestFrameMetadata(unittest.TestCase):
+
+    def test_none_before_read(self):
+        cam, _, _ = make_camera()
+        self.assertEqual(cam.frameMetadata(), (None, None))
+
+    def test_buffer_timestamp_and_frame_id(self):
+        device = _make_device()
+        buf = device.fetch.return_value.__enter__.return_value
+        buf.timestamp_ns = 123456789
+        buf.frame_id = 42
+        cam, _, _ = make_camera(device=device)
+        cam.read()
+        self.assertEqual(cam.frameMetadata(), (123456789, 42))
+
+    def test_unavailable_values_are_none(self):
+        device = _make_device()
+        buf = device.fetch.return_value.__enter__.return_value
+        type(buf).timestamp_ns = PropertyMock(side_effect=RuntimeError)
+        cam, _, _ = make_camera(device=device)
+        cam.read()
+        self.assertEqual(cam.frameMetadata(), (None, None))
+
+
+class TestRawBayer(unittest.TestCase):
+
+    def test_no_pattern_by_default(self):
+        cam, _, _ = make_camera()
+        cam.read()
+        self.assertIsNone(cam.bayer)
+
+    def test_pattern_from_delivered_format(self):
+        device = _make_device()
+        buf = device.fetch.return_value.__enter__.return_value
+        buf.payload.components[0].data_format = 'BayerGR8'
+        cam, _, _ = make_camera(device=device)
+        _, frame = cam.read()
+        self.assertEqual(cam.bayer, 'GRBG')
+        self.assertEqual(frame.shape, (480, 640))
+
+    def test_raw_reflects_pixel_format(self):
+        feature = _make_pixel_format('BayerRG8', ['RGB8', 'BayerRG8'])
+        cam, _, _ = make_camera_with_node(feature)
+        self.assertTrue(cam.raw)
+
+    def test_raw_selects_bayer_format_of_same_depth(self):
+        feature = _make_pixel_format(
+            'RGB8', ['RGB8', 'BayerRG12', 'BayerRG8'])
+        cam, _, _ = make_camera_with_node(feature)
+        cam.raw = True
+        feature.from_string.assert_called_once_with('BayerRG8')
+
+    def test_color_selects_rgb_format(self):
+        feature = _make_pixel_format(
+            'BayerRG8', ['Mono8', 'BayerRG8', 'RGB8'])
+        cam, _, _ = make_camera_with_node(feature)
+        cam.raw = False
+        feature.from_string.assert_called_once_with('RGB8')
+
+    def test_raw_constructor_argument(self):
+        feature = _make_pixel_format('RGB8', ['RGB8', 'BayerBG8'])
+        device = _make_device()
+        root = MagicMock(spec=_ICategory)
+        root.features = [feature]
+        device.remote_device.node_map.get_node.return_value = root
+        harvester = MagicMock()
+        harvester.create.return_value = device
+        with patch.object(_cam_module, 'Harvester', return_value=harvester):
+            _ConcreteCamera(raw=True)
+        feature.from_string.assert_called_once_with('BayerBG8')
+
+    def test_monochrome_camera_warns(self):
+        feature = _make_pixel_format('Mono8', ['Mono8', 'Mono12'])
+        cam, _, _ = make_camera_with_node(feature)
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            cam.raw = True
+        feature.from_string.assert_not_called()
+
+
+class TestPackedFormats(unittest.TestCase):
+
+    def packed_device(self, frame, name='Mono12p'):
+        device = _make_device()
+        image = device.fetch.return_value.__enter__.return_value \
+            .payload.components[0]
+        image.height, image.width = frame.shape
+        image.data_format = name
+        image.data = pack(frame, name)
+        return device
+
+    def test_packed_payload_is_unpacked(self):
+        frame = np.arange(48, dtype=np.uint16).reshape(6, 8) * 80
+        cam, _, _ = make_camera(device=self.packed_device(frame))
+        _, result = cam.read()
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, frame)
+
+    def test_packed_payload_unpacked_into_buffer(self):
+        frame = np.arange(48, dtype=np.uint16).reshape(6, 8)
+        cam, _, _ = make_camera(device=self.packed_device(frame, 'Mono10p'))
+        out = np.empty((6, 8), np.uint16)
+        ok, result = cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, frame)
+
+    def test_packed_reflects_pixel_format(self):
+        feature = _make_pixel_format('Mono12p', ['Mono12', 'Mono12p'])
+        cam, _, _ = make_camera_with_node(feature)
+        self.assertTrue(cam.packed)
+
+    def test_packed_prefers_pfnc_counterpart(self):
+        feature = _make_pixel_format(
+            'Mono12', ['Mono8', 'Mono12', 'Mono12Packed', 'Mono12p'])
+        cam, _, _ = make_camera_with_node(feature)
+        cam.packed = True
+        feature.from_string.assert_called_once_with('Mono12p')
+
+    def test_packed_from_8_bits_selects_deepest(self):
+        feature = _make_pixel_format(
+            'Mono8', ['Mono8', 'Mono10p', 'Mono12p', 'BayerRG12p'])
+        cam, _, _ = make_camera_with_node(feature)
+        cam.packed = True
+        feature.from_string.assert_called_once_with('Mono12p')
+
+    def test_unpacked_selects_counterpart(self):
+        feature = _make_pixel_format(
+            'Mono10p', ['Mono8', 'Mono10', 'Mono10p'])
+        cam, _, _ = make_camera_with_node(feature)
+        cam.packed = False
+        feature.from_string.assert_called_once_with('Mono10')
+
+    def test_no_packed_format_warns(self):
+        feature = _make_pixel_format('Mono8', ['Mono8', 'RGB8'])
+        cam, _, _ = make_camera_with_node(feature)
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            cam.packed = True
+        feature.from_string.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # TestSet
 # ---------------------------------------------------------------------------
 
+class _Integer(_IInteger):
+    '''Integer feature whose maximum depends on other features.'''
+
+    def __init__(self, name, value, min, inc, maximum):
+        self.node = MagicMock()
+        self.node.name = name
+        self.node.get_access_mode.return_value = _EAccessMode.RW
+        self.value, self.min, self.inc = value, min, inc
+        self._maximum = maximum
+
+    @property
+    def max(self):
+        return self._maximum()
+
+
+def _make_roi_camera(sensor=(1920, 1080)):
+    '''Return (camera, device, nodes) for a sensor with ROI features.
+
+    Offsets step by 8 pixels and sizes by 16 pixels from a minimum of
+    64, as for many machine-vision sensors.
+    '''
+    nodes = {}
+    for offset, size, full in (('OffsetX', 'Width', sensor[0]),
+                               ('OffsetY', 'Height', sensor[1])):
+        nodes[offset] = _Integer(
+            offset, 0, 0, 8,
+            lambda s=size, f=full: f - nodes[s].value)
+        nodes[size] = _Integer(
+            size, full, 64, 16,
+            lambda o=offset, f=full: f - nodes[o].value)
+    cam, _, device = make_camera()
+    device.remote_device.node_map.get_node.side_effect = nodes.get
+    device.reset_mock()
+    return cam, device, nodes
+
+
+class TestHardwareROI(unittest.TestCase):
+
+    def test_window_contains_roi_with_aligned_features(self):
+        cam, _, nodes = _make_roi_camera()
+        x, y, w, h = cam.applyROI(101, 53, 200, 100)
+        self.assertEqual((x, y, w, h), (96, 48, 208, 112))
+        self.assertEqual(x % 8, 0)
+        self.assertEqual((w - 64) % 16, 0)
+        self.assertLessEqual(x, 101)
+        self.assertGreaterEqual(x + w, 301)
+        self.assertEqual(nodes['Width'].value, 208)
+
+    def test_window_shifted_at_sensor_edge(self):
+        cam, _, _ = _make_roi_camera()
+        x, _, w, _ = cam.applyROI(1850, 0, 70, 64)
+        self.assertLessEqual(x + w, 1920)
+        self.assertLessEqual(x, 1850)
+
+    def test_small_roi_grows_to_minimum_size(self):
+        cam, _, _ = _make_roi_camera()
+        self.assertEqual(cam.applyROI(16, 16, 4, 4), (16, 16, 64, 64))
+
+    def test_acquisition_restarted_once(self):
+        cam, device, _ = _make_roi_camera()
+        cam.applyROI(0, 0, 640, 480)
+        device.stop.assert_called_once()
+        device.start.assert_called_once()
+
+    def test_shape_changed_emitted(self):
+        cam, _, _ = _make_roi_camera()
+        spy = QtTest.QSignalSpy(cam.shapeChanged)
+        cam.applyROI(0, 0, 640, 480)
+        self.assertEqual(len(spy), 1)
+
+    def test_reset_restores_full_sensor(self):
+        cam, _, nodes = _make_roi_camera()
+        cam.applyROI(101, 53, 200, 100)
+        cam.resetROI()
+        self.assertEqual([nodes[n].value for n in
+                          ('OffsetX', 'OffsetY', 'Width', 'Height')],
+                         [0, 0, 1920, 1080])
+
+    def test_missing_features_not_supported(self):
+        cam, _, device = make_camera()
+        device.remote_device.node_map.has_node.return_value = False
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            self.assertIsNone(cam.applyROI(0, 0, 64, 64))
+
+
+def _make_binning_camera(modes=('Sum', 'Average'), maximum=4):
+    '''Return (camera, device, nodes) for a camera that bins 1, 2 or 4.'''
+    nodes = {}
+    for name in ('BinningHorizontal', 'BinningVertical'):
+        nodes[name] = _Integer(name, 1, 1, 1, lambda: maximum)
+        mode = _make_feature(_IEnumeration, name=f'{name}Mode')
+        mode.entries = [MagicMock(symbolic=m) for m in modes]
+        nodes[f'{name}Mode'] = mode
+    for name, full in (('Width', 1920), ('Height', 1080)):
+        nodes[name] = _Integer(
+            name, full, 64, 16,
+            lambda f=full: f // nodes['BinningHorizontal'].value)
+    cam, _, device = make_camera()
+    device.remote_device.node_map.has_node.side_effect = nodes.__contains__
+    device.remote_device.node_map.get_node.side_effect = nodes.get
+    device.reset_mock()
+    return cam, device, nodes
+
+
+class TestHardwareBinning(unittest.TestCase):
+
+    def test_supported_factor_applied(self):
+        cam, _, nodes = _make_binning_camera()
+        self.assertEqual(cam.applyBinning(2), 2)
+        self.assertEqual(nodes['BinningVertical'].value, 2)
+        nodes['BinningHorizontalMode'].from_string.assert_called_with(
+            'Average')
+
+    def test_largest_supported_divisor_applied(self):
+        cam, _, nodes = _make_binning_camera(maximum=2)
+        self.assertEqual(cam.applyBinning(8, 'sum'), 2)
+        nodes['BinningVerticalMode'].from_string.assert_called_with('Sum')
+
+    def test_full_frame_kept_after_binning(self):
+        cam, _, nodes = _make_binning_camera()
+        cam.applyBinning(2)
+        self.assertEqual(nodes['Width'].value, 960)
+        cam.resetBinning()
+        self.assertEqual(nodes['Width'].value, 1920)
+
+    def test_unsupported_mode_not_applied(self):
+        cam, device, _ = _make_binning_camera(modes=('Sum',))
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            self.assertIsNone(cam.applyBinning(2, 'mean'))
+        device.stop.assert_not_called()
+
+    def test_decimation_requires_decimation_features(self):
+        cam, _, _ = _make_binning_camera()
+        with self.assertLogs('QVideo.cameras.Genicam._camera',
+                             level='WARNING'):
+            self.assertIsNone(cam.applyBinning(2, 'decimate'))
+
+
+class TestWindow(unittest.TestCase):
+
+    def test_unconstrained_window_is_the_region(self):
+        self.assertEqual(_cam_module._window(5, 10, 0, 100, 1, 1, 1),
+                         (5, 10))
+
+    def test_unreachable_region_uses_full_axis(self):
+        # Offsets step by 64, so no 64-wide window contains [60, 70).
+        self.assertEqual(_cam_module._window(60, 10, 0, 100, 64, 64, 36),
+                         (0, 100))
+
+
 class TestSet(unittest.TestCase):
 
     def test_set_boolean_feature(self):
@@ -30,6 +30,7 @@ def make_mock_file(frames=None, fps=30.):
     images.__getitem__ = MagicMock(side_effect=lambda k: datasets[k])
 
     file = MagicMock()
+    file.attrs = {}
     file.__getitem__ = MagicMock(side_effect=lambda k: images if k == 'images' else None)
     return file, keys, frames
 
@@ -108,6 +109,16 @@ class TestQHDF5ReaderInit(unittest.TestCase):
         self.assertEqual(reader.height, _FRAME.shape[0])  # shape[0] is height
 
 
+    def test_no_bayer_pattern_by_default(self):
+        self.assertIsNone(make_reader().bayer)
+
+    def test_bayer_pattern_from_attribute(self):
+        mock_file, _, _ = make_mock_file()
+        mock_file.attrs = {'Bayer': 'GBRG'}
+        with patch('h5py.File', return_value=mock_file):
+            reader = QHDF5Reader('test.h5')
+        self.assertEqual(reader.bayer, 'GBRG')
+
     def test_keys_sorted_by_timestamp(self):
         '''Keys must be in temporal order regardless of HDF5 insertion order.'''
         frames = [_FRAME.copy() for _ in range(3)]
@@ -1,9 +1,13 @@
 '''Unit tests for QHDF5Writer.'''
+import os
+import tempfile
 import unittest
 import numpy as np
 from unittest.mock import patch, MagicMock
 from qtpy import QtWidgets
 from QVideo.dvr.QHDF5Writer import QHDF5Writer
+from QVideo.dvr.QHDF5Reader import QHDF5Reader
+from QVideo.lib.frameinfo import FrameInfo
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -73,6 +77,14 @@ class TestQHDF5WriterOpen(unittest.TestCase):
         key, _ = mock_file.attrs.__setitem__.call_args[0]
         self.assertEqual(key, 'Timestamp')
 
+    def test_open_records_bayer_pattern(self):
+        writer = make_writer()
+        writer.info = FrameInfo(0, 0, bayer='BGGR')
+        mock_file, _ = make_mock_h5file()
+        with patch('h5py.File', return_value=mock_file):
+            writer.open(_FRAME)
+        mock_file.attrs.__setitem__.assert_any_call('Bayer', 'BGGR')
+
     def test_isopen_true_after_open(self):
         writer = make_writer()
         mock_file, _ = make_mock_h5file()
@@ -128,6 +140,105 @@ class TestQHDF5WriterInternalWrite(unittest.TestCase):
         keys = [call[0][0] for call in mock_group.create_dataset.call_args_list]
         self.assertEqual(len(set(keys)), 2)
 
+    def test_write_uses_capture_time_from_info(self):
+        writer = make_writer()
+        mock_file, mock_group = make_mock_h5file()
+        writer.info = FrameInfo(0, 1_000_000_000)
+        with patch('h5py.File', return_value=mock_file):
+            writer.open(_FRAME)
+        writer.info = FrameInfo(1, 1_250_000_000)
+        writer._write(_FRAME)
+        key = mock_group.create_dataset.call_args[0][0]
+        self.assertEqual(key, '0.250000000')
+
+
+class TestQHDF5WriterPacking(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.filename = os.path.join(tmp.name, 'packed.h5')
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 4096, (6, 8), dtype=np.uint16)
+
+    def record(self, frame, packing='Mono12p'):
+        writer = QHDF5Writer(self.filename, packing=packing)
+        writer.write(frame)
+        writer.write(frame)
+        writer.close()
+
+    def test_unknown_packing_raises(self):
+        with self.assertRaises(ValueError):
+            QHDF5Writer('test.h5', packing='Mono12')
+
+    def test_frames_are_stored_packed(self):
+        self.record(self.frame)
+        import h5py
+        with h5py.File(self.filename, 'r') as f:
+            self.assertEqual(f.attrs['PixelFormat'], 'Mono12p')
+            dataset = next(iter(f['images'].values()))
+            self.assertEqual(dataset.dtype, np.uint8)
+            self.assertEqual(dataset.shape, (6, 12))
+
+    def test_round_trip(self):
+        self.record(self.frame)
+        reader = QHDF5Reader(self.filename)
+        self.assertEqual((reader.width, reader.height), (8, 6))
+        ok, frame = reader.read()
+        reader.close()
+        self.assertTrue(ok)
+        np.testing.assert_array_equal(frame, self.frame)
+
+    def test_round_trip_all_formats(self):
+        for packing, bits in (('Mono10p', 10), ('Mono12p', 12),
+                              ('Mono10Packed', 10), ('Mono12Packed', 12)):
+            with self.subTest(packing=packing):
+                frame = self.frame.reshape(4, 12) >> (12 - bits)
+                self.record(frame, packing=packing)
+                reader = QHDF5Reader(self.filename)
+                self.assertEqual((reader.width, reader.height), (12, 4))
+                ok, result = reader.read()
+                reader.close()
+                self.assertTrue(ok)
+                np.testing.assert_array_equal(result, frame)
+                os.remove(self.filename)
+
+    def test_width_is_stored(self):
+        self.record(self.frame, packing='Mono10Packed')
+        import h5py
+        with h5py.File(self.filename, 'r') as f:
+            dataset = next(iter(f['images'].values()))
+            self.assertEqual(dataset.attrs['Width'], 8)
+
+    def test_width_inferred_without_attribute(self):
+        frame = self.frame >> 2
+        self.record(frame, packing='Mono10Packed')
+        import h5py
+        with h5py.File(self.filename, 'r+') as f:
+            for dataset in f['images'].values():
+                del dataset.attrs['Width']
+        reader = QHDF5Reader(self.filename)
+        _, result = reader.read()
+        reader.close()
+        np.testing.assert_array_equal(result, frame)
+
+    def test_unaligned_rows_are_stored_unpacked(self):
+        frame = self.frame[:, :6]
+        self.record(frame, packing='Mono10p')
+        reader = QHDF5Reader(self.filename)
+        _, result = reader.read()
+        reader.close()
+        np.testing.assert_array_equal(result, frame)
+
+    def test_8_bit_frames_are_stored_unpacked(self):
+        frame = np.arange(48, dtype=np.uint8).reshape(6, 8)
+        self.record(frame)
+        reader = QHDF5Reader(self.filename)
+        _, result = reader.read()
+        reader.close()
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(result, frame)
+
 
 class TestQHDF5WriterClose(unittest.TestCase):
 
@@ -238,11 +238,152 @@ class TestRead(unittest.TestCase):
         self.assertGreaterEqual(int(frame.min()), 50)
         self.assertLess(int(frame.max()), 150)
 
-    def test_read_sleeps_for_fps_interval(self):
+    def test_read_waits_for_next_frame(self):
         cam = make_camera()
         with patch('time.sleep') as mock_sleep:
             cam.read()
-        mock_sleep.assert_called_once_with(1. / cam.fps)
+            mock_sleep.assert_not_called()
+            cam.read()
+        mock_sleep.assert_called_once()
+        delay = mock_sleep.call_args[0][0]
+        self.assertGreater(delay, 0.)
+        self.assertLessEqual(delay, 1. / cam.fps)
+
+    def test_read_reports_frame_index(self):
+        cam = make_camera()
+        with patch('time.sleep'):
+            cam.read()
+            first = cam.frameMetadata()
+            cam.read()
+        self.assertEqual(first[1], 0)
+        self.assertGreater(cam.frameMetadata()[0], first[0])
+
+    def test_unpaced_read_does_not_sleep(self):
+        cam = make_camera(fps=0)
+        with patch('time.sleep') as mock_sleep:
+            for _ in range(3):
+                cam.read()
+        mock_sleep.assert_not_called()
+        self.assertEqual(cam.frameMetadata()[1], 2)
+
+
+class TestReadInto(unittest.TestCase):
+
+    def test_fills_buffer(self):
+        cam = make_camera()
+        out = np.zeros((cam.height, cam.width), dtype=np.uint8)
+        with patch('time.sleep'):
+            ok, frame = cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIs(frame, out)
+
+    def test_pixel_values_in_range(self):
+        cam = make_camera(blacklevel=50, whitelevel=150)
+        out = np.zeros((cam.height, cam.width), dtype=np.uint8)
+        with patch('time.sleep'):
+            cam.read_into(out)
+        self.assertGreaterEqual(int(out.min()), 50)
+        self.assertLess(int(out.max()), 150)
+
+    def test_mismatched_buffer_falls_back_to_read(self):
+        cam = make_camera()
+        out = np.zeros((10, 10), dtype=np.uint8)
+        with patch('time.sleep'):
+            ok, frame = cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIsNot(frame, out)
+        self.assertEqual(frame.shape, (cam.height, cam.width))
+
+    def test_read_into_when_closed_returns_false_none(self):
+        cam = make_camera()
+        cam.close()
+        ok, frame = cam.read_into(np.zeros((480, 640), dtype=np.uint8))
+        self.assertFalse(ok)
+        self.assertIsNone(frame)
+
+
+class TestFormat(unittest.TestCase):
+
+    def test_default_dtype(self):
+        cam = make_camera()
+        self.assertEqual(cam.dtype, np.uint8)
+        self.assertIsNone(cam.bayer)
+
+    def test_uint16_levels_in_high_byte(self):
+        cam = make_camera(dtype='uint16', blacklevel=50, whitelevel=150,
+                          fps=0)
+        _, frame = cam.read()
+        self.assertEqual(frame.dtype, np.uint16)
+        self.assertGreaterEqual(int(frame.min()), 50 * 256)
+        self.assertLess(int(frame.max()), 150 * 256)
+
+    def test_uint16_read_into(self):
+        cam = make_camera(dtype='uint16', fps=0)
+        out = np.zeros((cam.height, cam.width), np.uint16)
+        ok, frame = cam.read_into(out)
+        self.assertIs(frame, out)
+
+    def test_unsupported_dtype_raises(self):
+        with self.assertRaises(ValueError):
+            make_camera(dtype='float32')
+
+    def test_bayer_sites_scaled(self):
+        cam = make_camera(bayer='rggb', blacklevel=0, whitelevel=255,
+                          fps=0)
+        self.assertEqual(cam.bayer, 'RGGB')
+        _, frame = cam.read()
+        red = frame[0::2, 0::2].mean()
+        blue = frame[1::2, 1::2].mean()
+        self.assertGreater(red, 1.5 * blue)
+
+    def test_bayer_gains_cached_per_shape(self):
+        cam = make_camera(bayer='RGGB', fps=0)
+        cam.read()
+        gains = cam._gainMap
+        cam.read()
+        self.assertIs(cam._gainMap, gains)
+        cam.set('width', 321)
+        _, frame = cam.read()
+        self.assertEqual(cam._gainMap.shape, frame.shape)
+
+    def test_unknown_bayer_raises(self):
+        with self.assertRaises(ValueError):
+            make_camera(bayer='RGBW')
+
+
+class TestBank(unittest.TestCase):
+
+    def test_frames_repeat(self):
+        cam = make_camera(bank=2, fps=0)
+        frames = [cam.read()[1] for _ in range(3)]
+        np.testing.assert_array_equal(frames[0], frames[2])
+        self.assertFalse(np.array_equal(frames[0], frames[1]))
+
+    def test_read_returns_copy(self):
+        cam = make_camera(bank=1, fps=0)
+        _, frame = cam.read()
+        frame[:] = 0
+        self.assertTrue(cam.read()[1].any())
+
+    def test_read_into_copies_bank_frame(self):
+        cam = make_camera(bank=1, fps=0)
+        out = np.zeros((cam.height, cam.width), np.uint8)
+        cam.read_into(out)
+        np.testing.assert_array_equal(out, cam.read()[1])
+
+    def test_bank_follows_shape(self):
+        cam = make_camera(bank=2, fps=0)
+        cam.read()
+        cam.set('width', 32)
+        _, frame = cam.read()
+        self.assertEqual(frame.shape, (480, 32))
+
+    def test_bank_follows_levels(self):
+        cam = make_camera(bank=2, fps=0)
+        cam.read()
+        cam.set('whitelevel', 60)
+        _, frame = cam.read()
+        self.assertLess(int(frame.max()), 60)
 
 
 class TestQNoiseSource(unittest.TestCase):
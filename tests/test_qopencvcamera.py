@@ -183,6 +183,45 @@ class TestInitialize(unittest.TestCase):
                                          resolutions=[(640, 480)])
 
 
+class TestFormatCache(unittest.TestCase):
+
+    FORMATS = [(640, 480, 1., 30.), (1280, 720, 1., 15.)]
+
+    def _open(self, cached, width=1280, height=720):
+        self.addCleanup(patch.stopall)
+        module = 'QVideo.cameras.OpenCV._camera'
+        device = make_mock_device(width=width, height=height)
+        patch('cv2.VideoCapture', return_value=device).start()
+        patch(f'{module}.configure').start()
+        patch(f'{module}.device_identity',
+              return_value='usb:046d:0825:uvcvideo:0').start()
+        patch(f'{module}.cached_formats', return_value=cached).start()
+        self.probe = patch(f'{module}.probe_formats',
+                           return_value=self.FORMATS).start()
+        self.store = patch(f'{module}.cache_formats').start()
+        return QOpenCVCamera()
+
+    def test_cache_hit_skips_probing(self):
+        cam = self._open(cached=list(self.FORMATS))
+        self.probe.assert_not_called()
+        self.store.assert_not_called()
+        self.assertEqual(cam._formats, self.FORMATS)
+        self.assertIn('resolution', cam.properties)
+
+    def test_cache_miss_probes_and_stores(self):
+        cam = self._open(cached=None)
+        self.probe.assert_called_once()
+        self.store.assert_called_once_with('usb:046d:0825:uvcvideo:0',
+                                           self.FORMATS)
+        self.assertEqual(cam._formats, self.FORMATS)
+
+    def test_rejected_cached_format_probes_again(self):
+        cam = self._open(cached=[(1920, 1080, 1., 30.)])
+        self.probe.assert_called_once()
+        self.store.assert_called_once()
+        self.assertEqual(cam._formats, self.FORMATS)
+
+
 class TestDeinitialize(unittest.TestCase):
 
     def test_close_releases_device(self):
@@ -1,6 +1,11 @@
 '''Unit tests for QOpenCVDevices.'''
+import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import QVideo.cameras.OpenCV._devices as _devices_module
@@ -302,5 +307,224 @@ class TestProbeFormats(unittest.TestCase):
         mock_pf.assert_called_once_with(cap, res)
 
 
+def make_sysfs(root, index=0, usb=True, driver='uvcvideo'):
+    '''Build a fake /sys/class/video4linux tree under *root*.'''
+    root = Path(root)
+    device = root / 'devices' / 'usb1' / '1-2' / '1-2:1.0'
+    device.mkdir(parents=True)
+    (root / 'drivers' / driver).mkdir(parents=True)
+    (device / 'driver').symlink_to(root / 'drivers' / driver)
+    if usb:
+        (device.parent / 'idVendor').write_text('046d\n')
+        (device.parent / 'idProduct').write_text('0825\n')
+    node = root / 'class' / f'video{index}'
+    node.mkdir(parents=True)
+    (node / 'device').symlink_to(device)
+    (node / 'index').write_text(f'{index}\n')
+    return root / 'class'
+
+
+class TestDeviceIdentity(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_usb_camera(self):
+        sysfs = make_sysfs(self.tmp.name)
+        with patch.object(_devices_module, '_SYSFS', sysfs), \
+                patch('platform.system', return_value='Linux'):
+            identity = _devices_module.device_identity(0)
+        self.assertEqual(identity, 'usb:046d:0825:uvcvideo:0')
+
+    def test_non_usb_camera_uses_bus_device(self):
+        sysfs = make_sysfs(self.tmp.name, usb=False, driver='bcm2835')
+        with patch.object(_devices_module, '_SYSFS', sysfs), \
+                patch('platform.system', return_value='Linux'):
+            identity = _devices_module.device_identity(0)
+        self.assertEqual(identity, 'v4l2:1-2:1.0:bcm2835:0')
+
+    def test_missing_node_is_none(self):
+        sysfs = make_sysfs(self.tmp.name)
+        with patch.object(_devices_module, '_SYSFS', sysfs), \
+                patch('platform.system', return_value='Linux'):
+            self.assertIsNone(_devices_module.device_identity(3))
+
+    def test_non_linux_uses_qt_description(self):
+        devs = [make_mock_camera_device(b'uid-0', 'FaceTime HD', [])]
+        with patch.object(_devices_module, '_QMediaDevices',
+                          make_mock_qmediadevices(devs)), \
+                patch('platform.system', return_value='Darwin'):
+            identity = _devices_module.device_identity(0)
+        self.assertEqual(identity, 'Darwin:FaceTime HD')
+
+    def test_non_linux_without_qt_is_none(self):
+        with patch.object(_devices_module, '_QMediaDevices', None), \
+                patch('platform.system', return_value='Windows'):
+            self.assertIsNone(_devices_module.device_identity(0))
+
+
+class _CacheTestCase(unittest.TestCase):
+
+    IDENTITY = 'usb:046d:0825:uvcvideo:0'
+    FORMATS = [(640, 480, 1., 30.), (1280, 720, 1., 15.)]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        env = patch.dict('os.environ', {'QVIDEO_CACHE_DIR': self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def age(self, seconds):
+        '''Make every cached entry *seconds* old.'''
+        from QVideo.lib import _cache
+        entries = _cache.load('opencv')
+        for entry in entries.values():
+            entry['time'] = time.time() - seconds
+        _cache.update('opencv', entries)
+
+
+class TestFormatCache(_CacheTestCase):
+
+    def test_round_trip(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        self.assertEqual(_devices_module.cached_formats(self.IDENTITY),
+                         self.FORMATS)
+
+    def test_unknown_camera_is_none(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        self.assertIsNone(
+            _devices_module.cached_formats('usb:1234:5678:uvcvideo:0'))
+
+    def test_keyed_by_candidate_resolutions(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        self.assertIsNone(_devices_module.cached_formats(
+            self.IDENTITY, [(640, 480)]))
+
+    def test_expired_entry_is_none(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        self.age(_devices_module.FORMAT_TTL + 1.)
+        self.assertIsNone(_devices_module.cached_formats(self.IDENTITY))
+
+    def test_unidentified_camera_not_cached(self):
+        _devices_module.cache_formats(None, self.FORMATS)
+        self.assertIsNone(_devices_module.cached_formats(None))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_empty_result_not_cached(self):
+        _devices_module.cache_formats(self.IDENTITY, [])
+        self.assertIsNone(_devices_module.cached_formats(self.IDENTITY))
+
+
+class TestCachedFormats(_CacheTestCase):
+
+    def _formats(self):
+        with patch.object(_devices_module, '_QMediaDevices', None), \
+                patch.object(_devices_module, 'device_identity',
+                             return_value=self.IDENTITY):
+            return QOpenCVDevices.formats(0)
+
+    def test_probe_result_is_cached(self):
+        with patch.object(QOpenCVDevices, '_probe_formats',
+                          return_value=self.FORMATS):
+            self._formats()
+        self.assertEqual(_devices_module.cached_formats(self.IDENTITY),
+                         self.FORMATS)
+
+    def test_known_camera_is_not_probed(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        with patch.object(QOpenCVDevices, '_probe_formats') as mock_probe, \
+                patch.object(QOpenCVDevices, 'refresh') as mock_refresh:
+            result = self._formats()
+        self.assertEqual(result, self.FORMATS)
+        mock_probe.assert_not_called()
+        mock_refresh.assert_not_called()
+
+    def test_old_entry_not_probed(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        self.age(2 * 86400.)
+        with patch.object(QOpenCVDevices, '_probe_formats') as mock_probe, \
+                patch.object(QOpenCVDevices, 'refresh') as mock_refresh:
+            result = self._formats()
+        self.assertEqual(result, self.FORMATS)
+        mock_probe.assert_not_called()
+        mock_refresh.assert_not_called()
+
+
+class TestRefresh(_CacheTestCase):
+
+    def test_refresh_updates_cache(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS[:1])
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=self.IDENTITY), \
+                patch.object(QOpenCVDevices, '_probe_formats',
+                             return_value=self.FORMATS):
+            result = QOpenCVDevices.refresh(0)
+        self.assertEqual(result, self.FORMATS)
+        self.assertEqual(_devices_module.cached_formats(self.IDENTITY),
+                         self.FORMATS)
+
+    def test_refresh_runs_in_calling_thread(self):
+        threads = []
+
+        def probe(cameraID, resolutions):
+            threads.append(threading.current_thread())
+            return self.FORMATS
+
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=self.IDENTITY), \
+                patch.object(QOpenCVDevices, '_probe_formats',
+                             side_effect=probe):
+            QOpenCVDevices.refresh(0)
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_busy_camera_keeps_cache(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=self.IDENTITY), \
+                patch.object(QOpenCVDevices, '_probe_formats',
+                             return_value=[]):
+            self.assertIsNone(QOpenCVDevices.refresh(0))
+        self.assertEqual(_devices_module.cached_formats(self.IDENTITY),
+                         self.FORMATS)
+
+    def test_probe_error_keeps_cache(self):
+        _devices_module.cache_formats(self.IDENTITY, self.FORMATS)
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=self.IDENTITY), \
+                patch.object(QOpenCVDevices, '_probe_formats',
+                             side_effect=RuntimeError('busy')):
+            self.assertIsNone(QOpenCVDevices.refresh(0))
+        self.assertEqual(_devices_module.cached_formats(self.IDENTITY),
+                         self.FORMATS)
+        self.assertNotIn(self.IDENTITY, _devices_module._refreshing)
+
+    def test_unidentified_camera_not_refreshed(self):
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=None):
+            self.assertIsNone(QOpenCVDevices.refresh(0))
+
+    def test_one_refresh_at_a_time(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_probe(cameraID, resolutions):
+            started.set()
+            release.wait(5.)
+            return self.FORMATS
+
+        with patch.object(_devices_module, 'device_identity',
+                          return_value=self.IDENTITY), \
+                patch.object(QOpenCVDevices, '_probe_formats',
+                             side_effect=slow_probe):
+            thread = threading.Thread(target=QOpenCVDevices.refresh)
+            thread.start()
+            started.wait(5.)
+            self.assertIsNone(QOpenCVDevices.refresh(0))
+            release.set()
+            thread.join(5.)
+        self.assertNotIn(self.IDENTITY, _devices_module._refreshing)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,7 @@ import numpy as np
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from qtpy import QtWidgets
+import cv2
 from QVideo.dvr.QOpenCVReader import QOpenCVReader, QOpenCVSource
 
 
@@ -75,6 +76,15 @@ class TestQOpenCVReaderInit(unittest.TestCase):
         self.assertEqual(reader.framenumber, 0)
 
 
+    def test_16_bit_grayscale_file_read_without_conversion(self):
+        cap = make_mock_capture()
+        cap.get.side_effect = lambda prop: QOpenCVReader._GRAY16
+        with patch('cv2.VideoCapture', return_value=cap) as mock_cls:
+            QOpenCVReader('test.mkv')
+        self.assertEqual(mock_cls.call_count, 2)
+        self.assertEqual(mock_cls.call_args[0][2],
+                         [cv2.CAP_PROP_CONVERT_RGB, 0])
+
 class TestQOpenCVReaderRead(unittest.TestCase):
 
     def test_read_returns_true_on_success(self):
@@ -1,9 +1,12 @@
 '''Unit tests for QOpenCVWriter.'''
+import os
+import tempfile
 import unittest
 import numpy as np
 from unittest.mock import patch, MagicMock
 from qtpy import QtWidgets
 import cv2
+from QVideo.dvr.QOpenCVReader import QOpenCVReader
 from QVideo.dvr.QOpenCVWriter import QOpenCVWriter
 from QVideo.lib import QVideoWriter
 
@@ -228,6 +231,56 @@ class TestQOpenCVWriterInternalWrite(unittest.TestCase):
         mock_vw.write.assert_not_called()
 
 
+
+class TestQOpenCVWriterDepth(unittest.TestCase):
+
+    def test_16_bit_grayscale_opens_deep_writer(self):
+        w = make_writer('test.mkv')
+        frame = np.zeros((48, 64), dtype=np.uint16)
+        with patch('cv2.VideoWriter', return_value=make_mock_vw(True)) as mock_cls:
+            self.assertTrue(w.open(frame))
+        args = mock_cls.call_args[0]
+        self.assertEqual(args[1], cv2.CAP_FFMPEG)
+        self.assertEqual(args[-1], [cv2.VIDEOWRITER_PROP_DEPTH, cv2.CV_16U,
+                                    cv2.VIDEOWRITER_PROP_IS_COLOR, 0])
+
+    def test_16_bit_frames_written_unchanged(self):
+        w = make_writer('test.mkv')
+        frame = np.full((48, 64), 40000, dtype=np.uint16)
+        mock_vw = make_mock_vw(True)
+        with patch('cv2.VideoWriter', return_value=mock_vw):
+            w.open(frame)
+        w._write(frame)
+        self.assertIs(mock_vw.write.call_args[0][0], frame)
+
+    def test_other_frames_written_at_8_bits(self):
+        w = make_writer('test.mp4')
+        frame = np.full((48, 64), 65535, dtype=np.uint16)
+        mock_vw = make_mock_vw(True)
+        with patch('cv2.VideoWriter', return_value=mock_vw) as mock_cls:
+            with self.assertLogs('QVideo.dvr.QOpenCVWriter', level='WARNING'):
+                w.open(frame)
+            w._write(frame)
+        self.assertEqual(mock_cls.call_count, 1)
+        written = mock_vw.write.call_args[0][0]
+        self.assertEqual(written.dtype, np.uint8)
+        np.testing.assert_array_equal(written, 255)
+
+    def test_16_bit_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'deep.mkv')
+            frame = np.random.randint(0, 65536, (48, 64), dtype=np.uint16)
+            w = QOpenCVWriter(path, fps=30)
+            if not w.open(frame):
+                self.skipTest('FFV1 is not available')
+            w._write(frame)
+            w.close()
+            reader = QOpenCVReader(path)
+            ok, result = reader.read()
+            reader.close()
+        self.assertTrue(ok)
+        np.testing.assert_array_equal(result, frame)
+
 class TestQOpenCVWriterClose(unittest.TestCase):
 
     def test_close_releases_video_writer(self):
@@ -0,0 +1,264 @@
+'''Unit tests for QParticleCamera and QParticleSource.'''
+import threading
+import unittest
+import numpy as np
+from unittest.mock import patch
+from qtpy import QtWidgets, QtTest
+from QVideo.cameras.Particles._camera import QParticleCamera, QParticleSource
+from QVideo.filters.roi import ROIFilter
+from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.frameinfo import FrameInfo
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def make_camera(**kwargs) -> QParticleCamera:
+    '''Return an unpaced QParticleCamera.'''
+    kwargs.setdefault('fps', 0)
+    return QParticleCamera(**kwargs)
+
+
+def centroid(frame: np.ndarray, background: float) -> tuple[float, float]:
+    weight = frame.astype(float) - background
+    y, x = np.indices(frame.shape)
+    return (weight * x).sum() / weight.sum(), (weight * y).sum() / weight.sum()
+
+
+class TestInit(unittest.TestCase):
+
+    def test_opens_on_init(self):
+        self.assertTrue(make_camera().isOpen())
+
+    def test_defaults(self):
+        cam = make_camera()
+        self.assertEqual((cam.width, cam.height), (640, 480))
+        self.assertEqual(cam.nparticles, 20)
+        self.assertFalse(cam.hologram)
+        self.assertFalse(cam.color)
+
+    def test_default_fps(self):
+        cam = QParticleCamera()
+        self.assertAlmostEqual(cam.fps, 30.)
+
+    def test_all_properties_registered(self):
+        cam = make_camera()
+        for name in ('width', 'height', 'fps', 'color', 'nparticles',
+                     'sigma', 'hologram', 'diffusion', 'brightness',
+                     'noise'):
+            self.assertIn(name, cam.properties)
+
+    def test_clamped_arguments(self):
+        cam = make_camera(nparticles=-1, sigma=0, diffusion=-1, noise=-1)
+        self.assertEqual(cam.nparticles, 0)
+        self.assertEqual(cam.sigma, 0.5)
+        self.assertEqual(cam.diffusion, 0.)
+        self.assertEqual(cam.noise, 0.)
+
+
+class TestRead(unittest.TestCase):
+
+    def test_read_when_closed_returns_false_none(self):
+        cam = make_camera()
+        cam.close()
+        self.assertEqual(cam.read(), (False, None))
+
+    def test_frame_format(self):
+        cam = make_camera()
+        ok, frame = cam.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame.shape, (480, 640))
+        self.assertEqual(frame.dtype, np.uint8)
+
+    def test_read_into_fills_buffer(self):
+        cam = make_camera()
+        out = np.zeros((480, 640), np.uint8)
+        ok, frame = cam.read_into(out)
+        self.assertIs(frame, out)
+        self.assertTrue(out.any())
+
+    def test_read_into_mismatch_falls_back(self):
+        cam = make_camera()
+        ok, frame = cam.read_into(np.zeros((10, 10), np.uint8))
+        self.assertEqual(frame.shape, (480, 640))
+
+    def test_empty_scene_is_background(self):
+        cam = make_camera(nparticles=0, noise=0)
+        _, frame = cam.read()
+        self.assertTrue(np.all(frame == int(cam.BACKGROUND)))
+
+    def test_spot_centered_on_ground_truth(self):
+        cam = make_camera(nparticles=1, noise=0, diffusion=0)
+        cam._positions = np.array([[30.3, 20.7]])
+        _, frame = cam.read()
+        np.testing.assert_array_equal(cam.groundTruth(), [[30.3, 20.7]])
+        cx, cy = centroid(frame, cam.BACKGROUND)
+        self.assertAlmostEqual(cx, 30.3, delta=0.05)
+        self.assertAlmostEqual(cy, 20.7, delta=0.05)
+
+    def test_hologram_has_dark_rings(self):
+        cam = make_camera(nparticles=1, noise=0, hologram=True)
+        _, frame = cam.read()
+        self.assertLess(int(frame.min()), int(cam.BACKGROUND))
+        self.assertGreater(int(frame.max()), int(cam.BACKGROUND))
+
+    def test_paced_by_frame_clock(self):
+        cam = QParticleCamera(fps=50.)
+        with patch('time.sleep') as mock_sleep:
+            cam.read()
+            cam.read()
+        mock_sleep.assert_called_once()
+        self.assertEqual(cam.frameMetadata()[1], 1)
+
+
+class TestGroundTruth(unittest.TestCase):
+
+    def test_shape(self):
+        cam = make_camera(nparticles=7)
+        cam.read()
+        self.assertEqual(cam.groundTruth().shape, (7, 2))
+
+    def test_none_before_first_frame(self):
+        self.assertIsNone(make_camera().groundTruth())
+
+    def test_lookup_by_index(self):
+        cam = make_camera()
+        cam.read()
+        first = cam.groundTruth(0)
+        cam.read()
+        np.testing.assert_array_equal(cam.groundTruth(0), first)
+        self.assertFalse(np.array_equal(cam.groundTruth(1), first))
+        self.assertIsNone(cam.groundTruth(5))
+
+    def test_history_is_bounded(self):
+        cam = make_camera(nparticles=1)
+        for _ in range(cam.HISTORY + 1):
+            cam.read()
+        self.assertIsNone(cam.groundTruth(0))
+        self.assertIsNotNone(cam.groundTruth(1))
+
+    def test_lookup_while_capturing(self):
+        cam = make_camera(nparticles=1)
+        done = threading.Event()
+
+        def capture():
+            for _ in range(300):
+                cam.read()
+            done.set()
+
+        thread = threading.Thread(target=capture)
+        thread.start()
+        try:
+            while not done.is_set():
+                cam.groundTruth(-1)
+        finally:
+            thread.join()
+
+    def test_positions_stay_in_frame(self):
+        cam = make_camera(diffusion=50.)
+        for _ in range(10):
+            cam.read()
+        positions = cam.groundTruth()
+        self.assertTrue(np.all(positions >= 0))
+        self.assertTrue(np.all(positions < (640, 480)))
+
+    def test_no_diffusion_keeps_positions(self):
+        cam = make_camera(diffusion=0)
+        cam.read()
+        first = cam.groundTruth()
+        cam.read()
+        np.testing.assert_array_equal(cam.groundTruth(), first)
+
+    def test_reproducible(self):
+        frames = []
+        for _ in range(2):
+            cam = make_camera(seed=3)
+            cam.read()
+            frames.append(cam.read()[1])
+        np.testing.assert_array_equal(*frames)
+
+    def test_reopen_restarts_scene(self):
+        cam = make_camera()
+        cam.read()
+        first = cam.groundTruth()
+        cam.close()
+        cam.open()
+        cam.read()
+        np.testing.assert_array_equal(cam.groundTruth(), first)
+
+
+class TestProperties(unittest.TestCase):
+
+    def test_nparticles_grows_and_keeps_positions(self):
+        cam = make_camera(nparticles=3, diffusion=0)
+        cam.read()
+        first = cam.groundTruth()
+        cam.set('nparticles', 5)
+        cam.read()
+        positions = cam.groundTruth()
+        self.assertEqual(len(positions), 5)
+        np.testing.assert_array_equal(positions[:3], first)
+
+    def test_nparticles_shrinks(self):
+        cam = make_camera(nparticles=5)
+        cam.set('nparticles', 2)
+        cam.read()
+        self.assertEqual(len(cam.groundTruth()), 2)
+
+    def test_resize_emits_shape_changed_and_rescatters(self):
+        cam = make_camera()
+        spy = QtTest.QSignalSpy(cam.shapeChanged)
+        cam.set('width', 100)
+        cam.set('height', 50)
+        self.assertEqual(len(spy), 2)
+        _, frame = cam.read()
+        self.assertEqual(frame.shape, (50, 100))
+        self.assertTrue(np.all(cam.groundTruth() < (100, 50)))
+
+    def test_color_is_read_only(self):
+        cam = make_camera()
+        with self.assertLogs('QVideo.lib.QCamera', level='WARNING'):
+            cam.set('color', True)
+
+    def test_hologram_setter(self):
+        cam = make_camera()
+        cam.set('hologram', True)
+        self.assertTrue(cam.hologram)
+
+
+class TestQParticleSource(unittest.TestCase):
+
+    def test_creates_camera_when_none_given(self):
+        src = QParticleSource()
+        self.assertIsInstance(src.source, QParticleCamera)
+
+    def test_uses_provided_camera(self):
+        cam = make_camera()
+        self.assertIs(QParticleSource(camera=cam).source, cam)
+
+    def test_kwargs_forwarded_to_camera(self):
+        src = QParticleSource(nparticles=4)
+        self.assertEqual(src.source.nparticles, 4)
+
+
+class TestHardwareWindow(unittest.TestCase):
+
+    def test_render_cache_is_not_a_window(self):
+        cam = make_camera()
+        ok, frame = cam.read()
+        self.assertTrue(ok)
+        self.assertIsNone(cam.window)
+
+    def test_frame_passes_through_roi_filter(self):
+        cam = make_camera()
+        source = QVideoSource(cam)
+        ok, frame = cam.read()
+        info = source._frameInfo(0, True)
+        info.attach(frame)
+        self.assertIsNone(FrameInfo.of(frame).window)
+        result = ROIFilter(10, 10, 100, 80)(frame)
+        np.testing.assert_array_equal(result, frame[10:90, 10:110])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+'''Unit tests for QParticleTree.'''
+import unittest
+from qtpy import QtWidgets
+from QVideo.cameras.Particles._tree import QParticleTree
+from QVideo.cameras.Particles._camera import QParticleCamera
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestQParticleTreeInit(unittest.TestCase):
+
+    def test_creates_successfully(self):
+        tree = QParticleTree()
+        self.assertIsInstance(tree, QParticleTree)
+
+    def test_uses_provided_camera(self):
+        camera = QParticleCamera(nparticles=5)
+        tree = QParticleTree(camera=camera)
+        self.assertIs(tree.source.source, camera)
+
+    def test_color_parameter_is_disabled(self):
+        tree = QParticleTree()
+        color_param = tree._parameters.get('color')
+        self.assertIsNotNone(color_param)
+        self.assertFalse(color_param.opts.get('enabled', True))
+
+    def test_scene_parameters_present(self):
+        tree = QParticleTree()
+        for name in ('nparticles', 'sigma', 'hologram', 'diffusion',
+                     'brightness', 'noise'):
+            with self.subTest(name=name):
+                self.assertIn(name, tree._parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()
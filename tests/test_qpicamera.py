@@ -446,6 +446,41 @@ class TestRead(unittest.TestCase):
         self.assertIsNone(frame)
 
 
+class TestReadInto(unittest.TestCase):
+
+    def setUp(self):
+        self.cam, self.device = make_camera()
+
+    def tearDown(self):
+        self.cam.close()
+
+    def test_fills_matching_buffer(self):
+        _, reference = self.cam.read()
+        out = np.empty_like(reference)
+        ok, frame = self.cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIs(frame, out)
+        np.testing.assert_array_equal(out, reference)
+
+    def test_allocates_for_mismatched_buffer(self):
+        out = np.empty((4, 4), dtype=np.uint8)
+        ok, frame = self.cam.read_into(out)
+        self.assertTrue(ok)
+        self.assertIsNot(frame, out)
+
+    def test_releases_request(self):
+        _, reference = self.cam.read()
+        self.cam.read_into(np.empty_like(reference))
+        request = self.device.capture_request.return_value
+        request.release.assert_called()
+
+    def test_returns_false_when_closed(self):
+        self.cam.close()
+        ok, frame = self.cam.read_into(np.empty((4, 4), dtype=np.uint8))
+        self.assertFalse(ok)
+        self.assertIsNone(frame)
+
+
 class TestFrameRate(unittest.TestCase):
 
     def setUp(self):
@@ -625,6 +660,27 @@ class TestFocus(unittest.TestCase):
         self.assertEqual(self.cam.AfState, 0)
 
 
+class TestFrameMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.cam, self.device = make_camera()
+
+    def tearDown(self):
+        self.cam.close()
+
+    def test_sensor_timestamp_reported(self):
+        request = self.device.capture_request.return_value
+        request.get_metadata.return_value = {'SensorTimestamp': 987654321}
+        self.cam.read()
+        self.assertEqual(self.cam.frameMetadata(), (987654321, None))
+
+    def test_missing_sensor_timestamp(self):
+        request = self.device.capture_request.return_value
+        request.get_metadata.return_value = {}
+        self.cam.read()
+        self.assertEqual(self.cam.frameMetadata(), (None, None))
+
+
 class TestFocusAbsent(unittest.TestCase):
     '''Cameras without AfTrigger must not register focus properties.'''
 
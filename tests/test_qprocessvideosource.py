@@ -0,0 +1,194 @@
+'''Unit tests for QProcessCamera and QProcessVideoSource.'''
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+from multiprocessing.shared_memory import SharedMemory
+from qtpy import QtCore, QtWidgets, QtTest
+from QVideo.lib.QProcessVideoSource import (QProcessCamera,
+                                            QProcessVideoSource,
+                                            _command, _describe)
+from QVideo.cameras.Noise._camera import QNoiseCamera
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestDescribe(unittest.TestCase):
+
+    def test_lists_properties_and_methods(self):
+        description = _describe(QNoiseCamera())
+        self.assertEqual(description['name'], 'QNoiseCamera')
+        self.assertIn('width', description['properties'])
+        self.assertEqual(description['methods'], [])
+
+    def test_property_spec(self):
+        spec = _describe(QNoiseCamera())['properties']
+        self.assertIs(spec['width']['ptype'], int)
+        self.assertFalse(spec['width']['readonly'])
+        self.assertTrue(spec['color']['readonly'])
+
+    def test_callables_are_not_forwarded(self):
+        camera = QNoiseCamera()
+        camera.registerProperty('extra', getter=lambda: 1, setter=None,
+                                ptype=int, minimum=0, hook=print)
+        meta = _describe(camera)['properties']['extra']['meta']
+        self.assertEqual(meta, {'minimum': 0})
+
+
+class TestCommand(unittest.TestCase):
+
+    def test_set(self):
+        camera = QNoiseCamera()
+        self.assertEqual(_command(camera, ('set', 'width', 320)),
+                         ('ok', None))
+        self.assertEqual(camera.width, 320)
+
+    def test_get(self):
+        camera = QNoiseCamera()
+        self.assertEqual(_command(camera, ('get', 'height')), ('ok', 480))
+
+    def test_execute(self):
+        camera = MagicMock()
+        self.assertEqual(_command(camera, ('execute', 'go')), ('ok', None))
+        camera.execute.assert_called_once_with('go')
+
+    def test_error_is_reported(self):
+        camera = MagicMock()
+        camera.set.side_effect = RuntimeError('boom')
+        status, message = _command(camera, ('set', 'gain', 1))
+        self.assertEqual(status, 'error')
+        self.assertIn('boom', message)
+
+
+class TestProcessCamera(unittest.TestCase):
+    '''End-to-end tests against a QNoiseCamera in a child process.'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.camera = QProcessCamera(QNoiseCamera, slots=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.camera.close()
+
+    def test_is_open(self):
+        self.assertTrue(self.camera.isOpen())
+        self.assertTrue(self.camera.process.is_alive())
+
+    def test_registers_remote_properties(self):
+        self.assertIn('blacklevel', self.camera.properties)
+        self.assertEqual(self.camera.model_name, 'QNoiseCamera')
+
+    def test_read_only_property_stays_read_only(self):
+        with self.assertLogs('QVideo.lib.QCamera', level='WARNING'):
+            self.camera.set('color', True)
+
+    def test_get_is_proxied(self):
+        self.assertEqual(self.camera.get('whitelevel'), 128)
+
+    def test_read(self):
+        ok, frame = self.camera.read()
+        self.assertTrue(ok)
+        self.assertEqual(frame.dtype, np.uint8)
+        self.assertEqual(frame.ndim, 2)
+
+    def test_read_into(self):
+        ok, frame = self.camera.read()
+        out = np.empty_like(frame)
+        ok, frame = self.camera.read_into(out)
+        self.assertTrue(ok)
+        self.assertIs(frame, out)
+
+    def test_shape_change_reaches_parent(self):
+        spy = QtTest.QSignalSpy(self.camera.shapeChanged)
+        self.camera.set('width', 200)
+        for _ in range(self.camera.slots + 1):
+            ok, frame = self.camera.read()
+        self.assertEqual(frame.shape[1], 200)
+        self.assertGreaterEqual(len(spy), 1)
+        self.camera.set('width', 640)
+
+
+class TestProcessCameraBayer(unittest.TestCase):
+
+    def test_bayer_pattern_reaches_parent(self):
+        camera = QProcessCamera(QNoiseCamera, bayer='GBRG', slots=2)
+        self.addCleanup(camera.close)
+        self.assertIsNone(camera.bayer)
+        ok, _ = camera.read()
+        self.assertTrue(ok)
+        self.assertEqual(camera.bayer, 'GBRG')
+
+
+class TestProcessCameraFailure(unittest.TestCase):
+
+    def test_bad_arguments_fail_to_open(self):
+        with self.assertLogs('QVideo.lib.QProcessVideoSource',
+                             level='WARNING'):
+            camera = QProcessCamera(QNoiseCamera, nonsense=1)
+        self.assertFalse(camera.isOpen())
+        self.assertFalse(camera.process.is_alive())
+
+
+class TestProcessCameraDeath(unittest.TestCase):
+
+    def setUp(self):
+        self.camera = QProcessCamera(QNoiseCamera, slots=2)
+        self.addCleanup(self.camera.close)
+        ok, _ = self.camera.read()
+        self.assertTrue(ok)
+        self.ring = self.camera._memory.name
+
+    def kill(self):
+        self.camera.process.kill()
+        self.camera.process.join()
+
+    def test_dead_child_closes_camera(self):
+        self.kill()
+        with self.assertLogs('QVideo.lib.QProcessVideoSource',
+                             level='WARNING') as logs:
+            ok, frame = self.camera.read()
+        self.assertFalse(ok)
+        self.assertIsNone(frame)
+        self.assertFalse(self.camera.isOpen())
+        self.assertIn(str(self.camera.process.exitcode), logs.output[0])
+
+    def test_dead_child_ring_is_unlinked(self):
+        self.kill()
+        with self.assertLogs('QVideo.lib.QProcessVideoSource',
+                             level='WARNING'):
+            self.camera.read()
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=self.ring)
+
+    def test_source_stops_when_child_dies(self):
+        source = QProcessVideoSource(self.camera)
+        spy = QtTest.QSignalSpy(source.newFrame)
+        source.start()
+        self.assertTrue(spy.wait(10000))
+        with self.assertLogs('QVideo.lib.QProcessVideoSource',
+                             level='WARNING'):
+            self.kill()
+            self.assertTrue(source.wait(10000))
+        self.assertFalse(source.isRunning())
+        self.assertFalse(self.camera.isOpen())
+
+
+class TestProcessVideoSource(unittest.TestCase):
+
+    def test_streams_frames(self):
+        source = QProcessVideoSource(QNoiseCamera, slots=2)
+        self.assertIsInstance(source.source, QProcessCamera)
+        spy = QtTest.QSignalSpy(source.newFrame)
+        source.start()
+        deadline = QtCore.QDeadlineTimer(10000)
+        while len(spy) < 3 and not deadline.hasExpired():
+            spy.wait(100)
+        source.stop()
+        source.wait()
+        self.assertGreaterEqual(len(spy), 3)
+        self.assertFalse(source.source.process.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+'''Unit tests for QProfilerHUD.'''
+import unittest
+from qtpy import QtWidgets
+from QVideo.lib.QProfilerHUD import QProfilerHUD
+from QVideo.lib.instrumentation import Profiler
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class TestQProfilerHUD(unittest.TestCase):
+
+    def test_interval(self):
+        hud = QProfilerHUD(Profiler(), interval=250)
+        self.assertEqual(hud.interval, 250)
+        hud.interval = 100
+        self.assertEqual(hud.interval, 100)
+
+    def test_disabled_message(self):
+        hud = QProfilerHUD(Profiler())
+        hud.refresh()
+        self.assertIn('disabled', hud.textItem.toPlainText())
+
+    def test_waiting_message(self):
+        hud = QProfilerHUD(Profiler(enabled=True))
+        hud.refresh()
+        self.assertIn('waiting', hud.textItem.toPlainText())
+
+    def test_shows_report(self):
+        profiler = Profiler(enabled=True)
+        profiler.record('camera.read', 1_000_000)
+        hud = QProfilerHUD(profiler)
+        hud.refresh()
+        self.assertIn('camera.read', hud.textItem.toPlainText())
+
+    def test_start_stop(self):
+        hud = QProfilerHUD(Profiler())
+        hud.start()
+        self.assertTrue(hud._timer.isActive())
+        hud.stop()
+        self.assertFalse(hud._timer.isActive())
+
+
+if __name__ == '__main__':
+    unittest.main()
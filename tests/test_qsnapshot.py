@@ -6,7 +6,7 @@ import tempfile
 import os
 import numpy as np
 from qtpy import QtCore, QtWidgets, QtGui
-from QVideo.lib.QSnapshot import QSnapshot
+from QVideo.lib.QSnapshot import QSnapshot, _Fmt
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -199,7 +199,7 @@ class TestSave(unittest.TestCase):
 
     def test_unsupported_dtype_logs_warning(self):
         snap = make_snapshot()
-        frame = np.zeros((4, 6), dtype=np.uint16)
+        frame = np.zeros((4, 6), dtype=np.int32)
         with self.assertLogs('QVideo.lib.QSnapshot', level='WARNING'):
             snap._save(frame, '/tmp/unused.png')
 
@@ -226,6 +226,21 @@ class TestSave(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_saves_16bit_grayscale(self):
+        frame = np.arange(24, dtype=np.uint16).reshape(4, 6) * 2000
+        path = self._save_to_tmp(frame)
+        loaded = QtGui.QImage(path)
+        self.assertEqual(loaded.format(), _Fmt.Format_Grayscale16)
+        self.assertEqual(loaded.pixelColor(5, 3).rgba64().red(), 23 * 2000)
+        os.unlink(path)
+
+    def test_saves_float_frame_at_8_bits(self):
+        frame = np.full((4, 6, 3), 0.5, dtype=np.float32)
+        path = self._save_to_tmp(frame)
+        loaded = QtGui.QImage(path)
+        self.assertEqual(loaded.pixelColor(0, 0).red(), 128)
+        os.unlink(path)
+
     def test_grayscale_content_roundtrip(self):
         frame = np.arange(24, dtype=np.uint8).reshape(4, 6)
         path = self._save_to_tmp(frame)
@@ -1,11 +1,16 @@
 '''Unit tests for QVideoScreen.'''
+import gc
+import threading
 import unittest
+import weakref
 import numpy as np
 from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 from qtpy import QtCore, QtWidgets, QtTest
-from QVideo.lib.QVideoScreen import QVideoScreen
+from QVideo.lib.QVideoScreen import QVideoScreen, _FilterWorker
 from QVideo.lib.QFilterBank import QFilterBank
+from QVideo.lib.QFrameMailbox import QFrameMailbox
+from QVideo.lib.instrumentation import profiler
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -21,6 +26,15 @@ def make_mock_source(fps=30., width=640, height=480):
     return source
 
 
+class _FrameOwner(QtCore.QObject):
+    '''Minimal QObject source with real signals.'''
+
+    newFrame = QtCore.Signal(np.ndarray)
+    shapeChanged = QtCore.Signal(QtCore.QSize)
+    shape = QtCore.QSize(640, 480)
+    fps = 30.
+
+
 def _spy(screen, signal_name='newFrame'):
     return QtTest.QSignalSpy(getattr(screen, signal_name))
 
@@ -156,6 +170,17 @@ class TestSource(unittest.TestCase):
         except Exception as e:
             self.fail(f'Setting source to None raised {e}')
 
+    def test_accepts_frame_mailbox(self):
+        screen = make_screen()
+        owner = _FrameOwner()
+        mailbox = QFrameMailbox(owner)
+        screen.source = mailbox
+        received = _spy(screen)
+        for _ in range(3):
+            owner.newFrame.emit(_FRAME)
+        app.processEvents()
+        self.assertEqual(len(received), 1)
+        self.assertEqual(mailbox.overwritten, 2)
 
 class TestSetImage(unittest.TestCase):
 
@@ -218,6 +243,110 @@ class TestSetImage(unittest.TestCase):
 
 
 
+
+class TestDemosaic(unittest.TestCase):
+
+    def make_screen(self, bayer='RGGB'):
+        screen = make_screen()
+        source = make_mock_source()
+        source.bayer = bayer
+        screen.source = source
+        return screen
+
+    def mosaic(self):
+        mosaic = np.zeros((48, 64), dtype=np.uint8)
+        mosaic[0::2, 0::2] = 200
+        return mosaic
+
+    def test_raw_frames_are_demosaiced(self):
+        screen = self.make_screen()
+        received = []
+        screen.newFrame.connect(received.append)
+        screen.setImage(self.mosaic())
+        self.assertEqual(received[0].shape, (48, 64, 3))
+        np.testing.assert_array_equal(received[0][10, 10], [200, 0, 0])
+
+    def test_filters_see_color_frames(self):
+        screen = self.make_screen()
+        shapes = []
+        screen.filter = lambda image: shapes.append(image.shape) or image
+        screen.setImage(self.mosaic())
+        self.assertEqual(shapes, [(48, 64, 3)])
+
+    def test_frames_without_pattern_are_untouched(self):
+        screen = self.make_screen(bayer=None)
+        screen.setImage(self.mosaic())
+        self.assertEqual(screen.image.image.shape, (48, 64))
+
+    def test_source_without_pattern_attribute(self):
+        screen = make_screen()
+        screen.source = _FrameOwner()
+        screen.setImage(self.mosaic())
+        self.assertEqual(screen.image.image.shape, (48, 64))
+
+    def test_half_resolution_fills_view(self):
+        screen = self.make_screen()
+        screen.halfResolution = True
+        screen.setImage(self.mosaic())
+        self.assertEqual(screen.image.image.shape, (24, 32, 3))
+        self.assertEqual(screen.image.transform().m11(), 2.)
+
+    def test_full_resolution_restores_scale(self):
+        screen = self.make_screen()
+        screen.halfResolution = True
+        screen.setImage(self.mosaic())
+        screen._setready()
+        screen.halfResolution = False
+        screen.setImage(self.mosaic())
+        self.assertEqual(screen.image.transform().m11(), 1.)
+
+
+class TestLevels(unittest.TestCase):
+
+    def test_levels_none_by_default(self):
+        self.assertIsNone(make_screen().levels)
+
+    def test_16_bit_frames_span_full_range(self):
+        screen = make_screen()
+        screen.setImage(np.zeros((48, 64), dtype=np.uint16))
+        np.testing.assert_array_equal(screen.image.levels, [0, 65535])
+
+    def test_float_frames_span_unit_range(self):
+        screen = make_screen()
+        screen.setImage(np.zeros((48, 64), dtype=np.float32))
+        np.testing.assert_array_equal(screen.image.levels, [0, 1])
+
+    def test_8_bit_frame_clears_previous_levels(self):
+        screen = make_screen()
+        screen.setImage(np.zeros((48, 64), dtype=np.uint16))
+        screen._setready()
+        screen.setImage(np.zeros((48, 64), dtype=np.uint8))
+        self.assertIsNone(screen.image.levels)
+
+    def test_explicit_levels_apply_to_every_frame(self):
+        screen = make_screen()
+        screen.levels = (100, 4000)
+        screen.setImage(np.zeros((48, 64), dtype=np.uint16))
+        np.testing.assert_array_equal(screen.image.levels, [100, 4000])
+
+    def test_levels_must_increase(self):
+        screen = make_screen()
+        with self.assertRaises(ValueError):
+            screen.levels = (10, 10)
+
+    def test_autolevels_uses_displayed_frame(self):
+        screen = make_screen()
+        frame = np.tile(np.arange(1000, 2000, dtype=np.uint16), (10, 1))
+        screen.setImage(frame)
+        screen.autoLevels(0, 100)
+        self.assertEqual(screen.levels, (1000., 1999.))
+        np.testing.assert_array_equal(screen.image.levels, [1000, 1999])
+
+    def test_autolevels_without_frame_does_nothing(self):
+        screen = make_screen()
+        screen.autoLevels()
+        self.assertIsNone(screen.levels)
+
 class TestSetready(unittest.TestCase):
 
     def test_setready_restores_ready(self):
@@ -322,6 +451,16 @@ class TestResizeEvent(unittest.TestCase):
             screen.resizeEvent(MagicMock())
         mock_range.assert_not_called()
 
+    def test_close_with_shape_does_not_touch_deleted_view(self):
+        '''GraphicsView.close() clears the scene and then resizes the
+        viewport; resizeEvent must not use the deleted ViewBox.'''
+        screen = make_screen()
+        screen._videoShape = QtCore.QSize(640, 480)
+        screen.show()
+        with patch('sys.excepthook') as hook:
+            screen.close()
+        hook.assert_not_called()
+
 
 class TestFitToVideo(unittest.TestCase):
 
@@ -642,6 +781,108 @@ class TestNewFrame(unittest.TestCase):
         self.assertEqual(len(spy), 0)
 
 
+class TestThreaded(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = make_screen()
+        self.threads = []
+
+        def record(image):
+            self.threads.append(threading.get_ident())
+            return image
+
+        self.screen.filter = record
+
+    def tearDown(self):
+        self.screen.threaded = False
+
+    def test_not_threaded_by_default(self):
+        self.assertFalse(self.screen.threaded)
+
+    def test_threaded_starts_worker(self):
+        self.screen.threaded = True
+        self.assertTrue(self.screen._thread.isRunning())
+
+    def test_unthreaded_stops_worker(self):
+        self.screen.threaded = True
+        thread = self.screen._thread
+        self.screen.threaded = False
+        self.assertFalse(thread.isRunning())
+        self.assertIsNone(self.screen._worker)
+
+    def test_filters_run_in_worker_thread(self):
+        self.screen.threaded = True
+        spy = _spy(self.screen)
+        self.screen.setImage(_FRAME)
+        self.assertTrue(spy.wait(1000))
+        self.assertEqual(len(self.threads), 1)
+        self.assertNotEqual(self.threads[0], threading.get_ident())
+        np.testing.assert_array_equal(self.screen.image.image, _FRAME)
+
+    def test_setimage_does_not_filter_in_gui_thread(self):
+        self.screen.threaded = True
+        with patch.object(self.screen._worker, 'post') as post:
+            self.screen.setImage(_FRAME)
+        post.assert_called_once_with(_FRAME)
+        self.assertEqual(self.threads, [])
+
+    def test_deleting_threaded_screen_stops_worker(self):
+        screen = make_screen()
+        screen.threaded = True
+        thread = screen._thread
+        screen.close()
+        del screen
+        gc.collect()
+        self.assertTrue(thread.isFinished())
+
+    def test_stopping_disconnects_about_to_quit(self):
+        receivers = app.receivers(app.aboutToQuit)
+        self.screen.threaded = True
+        self.assertEqual(app.receivers(app.aboutToQuit), receivers + 1)
+        self.screen.threaded = False
+        self.assertEqual(app.receivers(app.aboutToQuit), receivers)
+
+    def test_deliver_after_stop_is_ignored(self):
+        self.screen.threaded = True
+        self.screen.threaded = False
+        self.screen._deliver()
+
+
+class TestFilterWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.screen = make_screen()
+        self.seen = []
+        self.screen.filter = lambda image: self.seen.append(image) or image
+        self.worker = _FilterWorker(weakref.ref(self.screen))
+
+    def test_latest_frame_wins(self):
+        first, second = _FRAME.copy(), _FRAME.copy()
+        self.worker.post(first)
+        self.worker.post(second)
+        app.processEvents()
+        self.assertEqual(len(self.seen), 1)
+        self.assertIs(self.seen[0], second)
+
+    def test_take_returns_latest_result(self):
+        first, second = _FRAME.copy(), _FRAME.copy()
+        self.worker._frame = first
+        self.worker._run()
+        self.worker._frame = second
+        self.worker._run()
+        image, scale = self.worker.take()
+        self.assertIs(image, second)
+        self.assertEqual(scale, 1)
+        self.assertIsNone(self.worker.take())
+
+    def test_finished_emitted_once_per_take(self):
+        spy = QtTest.QSignalSpy(self.worker.finished)
+        for _ in range(2):
+            self.worker._frame = _FRAME
+            self.worker._run()
+        self.assertEqual(len(spy), 1)
+
+
 class TestColormap(unittest.TestCase):
 
     def test_colormap_none_on_init(self):
@@ -730,5 +971,49 @@ class TestComposite(unittest.TestCase):
         self.assertFalse(screen._composite)
 
 
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.enabled = profiler.enabled
+        profiler.reset()
+
+    def tearDown(self):
+        profiler.enabled = self.enabled
+        profiler.reset()
+
+    def test_off_by_default(self):
+        self.assertFalse(make_screen().profiling)
+
+    def test_enabling_shows_hud(self):
+        screen = make_screen()
+        screen.profiling = True
+        self.assertTrue(profiler.enabled)
+        self.assertIn(screen._hud, screen.view.addedItems)
+
+    def test_disabling_removes_hud(self):
+        screen = make_screen()
+        screen.profiling = True
+        hud = screen._hud
+        screen.profiling = False
+        self.assertIsNone(screen._hud)
+        self.assertNotIn(hud, screen.view.addedItems)
+
+    def test_records_display_stages(self):
+        screen = make_screen()
+        profiler.enabled = True
+        profiler.stamp(_FRAME, 0)
+        screen.setImage(_FRAME)
+        stages = profiler.stages()
+        self.assertIn('screen.delivery', stages)
+        self.assertIn('screen.setImage', stages)
+
+    def test_nothing_recorded_when_disabled(self):
+        screen = make_screen()
+        profiler.enabled = False
+        screen.setImage(_FRAME)
+        counts = [s['count'] for s in profiler.stats().values()]
+        self.assertEqual(sum(counts), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
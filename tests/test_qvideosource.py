@@ -4,6 +4,9 @@ import numpy as np
 from unittest.mock import MagicMock, patch
 from qtpy import QtCore, QtWidgets, QtTest
 from QVideo.lib.QVideoSource import QVideoSource
+from QVideo.lib.QCamera import QCamera
+from QVideo.lib.frameinfo import FrameInfo
+from QVideo.lib.instrumentation import profiler
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -214,6 +217,13 @@ class TestRun(unittest.TestCase):
 
         self.assertFalse(vs._running)
 
+    def test_pool_not_used_without_read_into(self):
+        source, ref = one_shot_source(read_ok=True)
+        vs = make_vs(source)
+        ref[0] = vs
+        vs.run()
+        source.saferead_into.assert_not_called()
+
     def test_thread_stops_cleanly(self):
         '''Integration test: verify run() stops when stop() is called from
         another thread.'''
@@ -225,5 +235,249 @@ class TestRun(unittest.TestCase):
         self.assertTrue(finished)
 
 
+
+class _PooledCamera(QCamera):
+    '''Concrete camera that fills recycled buffers.'''
+
+    def __init__(self, nframes=3):
+        super().__init__()
+        self.nframes = nframes
+        self.buffers = []
+        self.source = None
+        self.open()
+
+    def _initialize(self):
+        return True
+
+    def _deinitialize(self):
+        pass
+
+    def _count(self):
+        self.nframes -= 1
+        if self.nframes <= 0:
+            self.source._running = False
+
+    def read(self):
+        self._count()
+        return True, np.zeros((4, 6), dtype=np.uint8)
+
+    def read_into(self, out):
+        self._count()
+        self.buffers.append(out.ctypes.data)
+        out[:] = 1
+        return True, out
+
+
+class TestPool(unittest.TestCase):
+
+    def make(self, nframes=3, poolsize=8):
+        camera = _PooledCamera(nframes)
+        vs = QVideoSource(camera, poolsize=poolsize)
+        camera.source = vs
+        return camera, vs
+
+    def test_default_pool_size(self):
+        _, vs = self.make()
+        self.assertEqual(vs.pool.size, 8)
+
+    def test_first_frame_configures_pool(self):
+        _, vs = self.make(nframes=1)
+        vs.run()
+        self.assertEqual(vs.pool.shape, (4, 6))
+        self.assertEqual(vs.pool.dtype, np.uint8)
+
+    def test_buffers_released_when_run_exits(self):
+        _, vs = self.make(nframes=3)
+        vs.run()
+        self.assertEqual(len(vs.pool), 0)
+
+    def test_subsequent_frames_use_pool(self):
+        camera, vs = self.make(nframes=4)
+        spy = QtTest.QSignalSpy(vs.newFrame)
+        vs.run()
+        self.assertEqual(len(camera.buffers), 3)
+        self.assertEqual(len(spy), 4)
+
+    def test_released_buffers_are_recycled(self):
+        camera, vs = self.make(nframes=6)
+        vs.run()
+        self.assertLess(len(set(camera.buffers)), len(camera.buffers))
+
+    def test_held_frames_are_not_overwritten(self):
+        camera, vs = self.make(nframes=5)
+        held = []
+        vs.newFrame.connect(held.append)
+        vs.run()
+        addresses = [frame.ctypes.data for frame in held]
+        self.assertEqual(len(set(addresses)), len(addresses))
+
+    def test_zero_size_disables_pool(self):
+        camera, vs = self.make(nframes=3, poolsize=0)
+        vs.run()
+        self.assertEqual(camera.buffers, [])
+
+
+
+class _StampedCamera(_PooledCamera):
+    '''Camera that reports hardware frame counters.'''
+
+    def __init__(self, indexes):
+        super().__init__(len(indexes))
+        self.indexes = list(indexes)
+
+    def read(self):
+        self._frameMetadata = (1000 * self.indexes[0], self.indexes.pop(0))
+        return super().read()
+
+
+class TestFrameInfo(unittest.TestCase):
+
+    def run_source(self, camera):
+        vs = QVideoSource(camera, poolsize=0)
+        camera.source = vs
+        received = []
+        vs.newFrameInfo.connect(lambda frame, info: received.append(info))
+        vs.run()
+        return vs, received
+
+    def test_emitted_for_each_frame(self):
+        _, infos = self.run_source(_PooledCamera(nframes=3))
+        self.assertEqual([info.index for info in infos], [0, 1, 2])
+
+    def test_timestamps_increase(self):
+        _, infos = self.run_source(_PooledCamera(nframes=3))
+        stamps = [info.timestamp for info in infos]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_no_hardware_metadata_by_default(self):
+        _, infos = self.run_source(_PooledCamera(nframes=1))
+        self.assertIsNone(infos[0].hardwareTimestamp)
+        self.assertIsNone(infos[0].hardwareIndex)
+
+    def test_hardware_metadata_forwarded(self):
+        _, infos = self.run_source(_StampedCamera([5, 6]))
+        self.assertEqual(infos[1].hardwareTimestamp, 6000)
+        self.assertEqual(infos[1].hardwareIndex, 6)
+
+    def test_gaps_are_counted(self):
+        vs, infos = self.run_source(_StampedCamera([1, 2, 5, 6, 9]))
+        self.assertEqual([info.dropped for info in infos], [0, 0, 2, 0, 2])
+        self.assertEqual(vs.dropped, 4)
+
+    def test_counter_reset_is_not_a_gap(self):
+        _, infos = self.run_source(_StampedCamera([7, 0, 1]))
+        self.assertEqual([info.dropped for info in infos], [0, 0, 0])
+
+    def test_bayer_pattern_forwarded(self):
+        camera = _PooledCamera(nframes=1)
+        camera._bayer = 'GRBG'
+        vs, infos = self.run_source(camera)
+        self.assertEqual(vs.bayer, 'GRBG')
+        self.assertEqual(infos[0].bayer, 'GRBG')
+
+    def test_window_forwarded_and_attached(self):
+        camera = _PooledCamera(nframes=1)
+        camera._hardwareWindow = (8, 4, 6, 4)
+        vs = QVideoSource(camera, poolsize=0)
+        camera.source = vs
+        received = []
+        vs.newFrameInfo.connect(
+            lambda frame, info: received.append((frame, info)))
+        vs.run()
+        frame, info = received[0]
+        self.assertEqual(info.window, (8, 4, 6, 4))
+        self.assertIs(FrameInfo.of(frame), info)
+
+    def test_binning_forwarded(self):
+        camera = _PooledCamera(nframes=1)
+        camera._hardwareBinning = 2
+        _, infos = self.run_source(camera)
+        self.assertEqual(infos[0].binning, 2)
+
+    def test_non_camera_source_gets_info(self):
+        source, ref = one_shot_source(read_ok=True)
+        vs = make_vs(source)
+        ref[0] = vs
+        spy = QtTest.QSignalSpy(vs.newFrameInfo)
+        vs.run()
+        self.assertEqual(len(spy), 1)
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        profiler.reset()
+        profiler.enabled = True
+
+    def tearDown(self):
+        profiler.enabled = False
+        profiler.reset()
+
+    def test_records_capture_stages(self):
+        vs = QVideoSource(_PooledCamera(nframes=3), poolsize=0)
+        vs.source.source = vs
+        received = []
+        vs.newFrameInfo.connect(lambda frame, info: received.append(info))
+        vs.run()
+        self.assertEqual(len(received), 3)
+        self.assertGreaterEqual(profiler.histogram('camera.read').count, 3)
+        self.assertEqual(profiler.histogram('source.emit').count, 3)
+
+    def test_frames_are_stamped_for_delivery(self):
+        source, ref = one_shot_source(read_ok=True)
+        vs = make_vs(source)
+        ref[0] = vs
+        frames = []
+        vs.newFrame.connect(frames.append)
+        vs.run()
+        profiler.since('delivery', frames[0])
+        self.assertEqual(profiler.histogram('delivery').count, 1)
+
+
+
+class TestCommandQueue(unittest.TestCase):
+
+    def make(self, nframes=3):
+        camera = _PooledCamera(nframes)
+        camera._gain = 0
+        camera.registerProperty('gain', ptype=int)
+        vs = QVideoSource(camera)
+        camera.source = vs
+        return camera, vs
+
+    def test_queued_commands_applied_between_frames(self):
+        camera, vs = self.make(nframes=3)
+        applied = []
+
+        def read():
+            if camera.nframes == 3:
+                future = camera.queueSet('gain', 5)
+                applied.append(future)
+            return _PooledCamera.read(camera)
+
+        camera.read = read
+        vs.run()
+        self.assertEqual(camera.gain, 5)
+        self.assertEqual(applied[0].result(timeout=0), 5)
+
+    def test_queueing_enabled_while_running(self):
+        camera, vs = self.make(nframes=1)
+        states = []
+        camera.read = lambda: (states.append(camera.queueing),
+                               _PooledCamera.read(camera))[1]
+        vs.run()
+        self.assertEqual(states, [True])
+        self.assertFalse(camera.queueing)
+
+    def test_pending_commands_applied_on_exit(self):
+        camera, vs = self.make(nframes=1)
+        futures = []
+        camera.read = lambda: (futures.append(camera.queueSet('gain', 7)),
+                               _PooledCamera.read(camera))[1]
+        vs.run()
+        self.assertTrue(futures[0].done())
+        self.assertEqual(camera.gain, 7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,8 @@ import unittest
 import numpy as np
 from qtpy import QtWidgets, QtTest
 from QVideo.lib.QVideoWriter import QVideoWriter
+from QVideo.lib.frameinfo import FrameInfo
+from QVideo.lib.instrumentation import profiler
 
 
 app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -196,6 +198,40 @@ class TestQVideoWriterWriteFrame(unittest.TestCase):
         np.testing.assert_array_equal(w._written[0], frame)
 
 
+class TestQVideoWriterProfiling(unittest.TestCase):
+
+    def test_write_is_timed_when_profiling(self):
+        w = _ConcreteWriter('out.avi')
+        w.write(_FRAME)
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            w.write(_FRAME)
+        finally:
+            profiler.enabled = False
+        self.assertEqual(len(w._written), 1)
+        self.assertEqual(profiler.histogram('writer.write').count, 1)
+
+
+class TestQVideoWriterWriteInfo(unittest.TestCase):
+
+    def test_info_is_none_initially(self):
+        self.assertIsNone(_ConcreteWriter('out.avi').info)
+
+    def test_write_info_stores_info(self):
+        writer = _ConcreteWriter('out.avi')
+        info = FrameInfo(0, 123)
+        writer.writeInfo(_FRAME, info)
+        self.assertIs(writer.info, info)
+
+    def test_write_info_writes_frame(self):
+        writer = _ConcreteWriter('out.avi')
+        writer.writeInfo(_FRAME, FrameInfo(0, 0))
+        writer.writeInfo(_FRAME, FrameInfo(1, 1))
+        self.assertEqual(len(writer._written), 1)
+        self.assertEqual(writer.framenumber, 1)
+
+
 class TestQVideoWriterAbstractBodies(unittest.TestCase):
     '''Exercise the abstract-method bodies reachable via super().'''
 
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 from qtpy import QtWidgets
 from QVideo.filters.roi import ROIFilter, QROIFilter
+from QVideo.lib.frameinfo import FrameInfo
 from QVideo.lib.QVideoFilter import QVideoFilter
 
 
@@ -140,6 +141,43 @@ class TestROIFilterClamp(unittest.TestCase):
         self.assertLessEqual(f.h, 4)
 
 
+def windowed(frame, window):
+    '''Return a copy of *frame* tagged as covering *window*.'''
+    frame = frame.copy()
+    FrameInfo(0, 0, window=window).attach(frame)
+    return frame
+
+
+class TestROIFilterWindow(unittest.TestCase):
+
+    def test_window_frame_cropped_relative_to_window(self):
+        f = make_filter(x=5, y=3, w=2, h=2)
+        window = windowed(_GRAY[2:5, 4:8], (4, 2, 4, 3))
+        np.testing.assert_array_equal(f(window), _GRAY[3:5, 5:7])
+
+    def test_full_frame_cropped_in_sensor_coordinates(self):
+        f = make_filter(x=5, y=3, w=2, h=2)
+        f(windowed(_GRAY[2:5, 4:8], (4, 2, 4, 3)))
+        np.testing.assert_array_equal(f(_GRAY), _GRAY[3:5, 5:7])
+
+    def test_same_size_window_at_new_offset(self):
+        f = make_filter(x=5, y=3, w=2, h=2)
+        old = windowed(_GRAY[2:5, 4:8], (4, 2, 4, 3))
+        new = windowed(_GRAY[3:6, 5:9], (5, 3, 4, 3))
+        np.testing.assert_array_equal(f(new), _GRAY[3:5, 5:7])
+        np.testing.assert_array_equal(f(old), _GRAY[3:5, 5:7])
+
+    def test_window_frame_does_not_clamp_roi(self):
+        f = make_filter(x=5, y=3, w=2, h=2)
+        f.add(windowed(_GRAY[2:5, 4:8], (4, 2, 4, 3)))
+        self.assertEqual((f.x, f.y, f.w, f.h), (5, 3, 2, 2))
+
+    def test_roi_outside_window_is_not_wrapped(self):
+        f = make_filter(x=1, y=1, w=2, h=2)
+        result = f(windowed(_GRAY[2:5, 4:8], (4, 2, 4, 3)))
+        np.testing.assert_array_equal(result, _GRAY[2:4, 4:6])
+
+
 class TestROIFilterCall(unittest.TestCase):
 
     def test_call_returns_cropped_frame(self):
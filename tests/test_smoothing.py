@@ -143,6 +143,13 @@ class TestSmoothingFilterProcess(unittest.TestCase):
 # QSmoothingFilter
 # ---------------------------------------------------------------------------
 
+    def test_wide_median_keeps_16_bit_frames(self):
+        f = make_filter(width=7, method='median')
+        frame = np.random.randint(0, 65536, (32, 32, 3), dtype=np.uint16)
+        result = f.process(frame)
+        self.assertEqual(result.dtype, np.uint16)
+        self.assertEqual(result.shape, frame.shape)
+
 class TestQSmoothingFilter(unittest.TestCase):
 
     def test_filter_is_smoothing_filter(self):
@@ -118,6 +118,15 @@ class TestSobelFilterGet(unittest.TestCase):
         self.assertEqual(first_input.ndim, 2)
 
 
+    def test_16_bit_edges_keep_type(self):
+        frame = np.zeros((8, 8), dtype=np.uint16)
+        frame[:, 4:] = 10000
+        for direction in SobelFilter.DIRECTIONS:
+            f = make_filter(direction=direction)
+            result = f(np.dstack([frame] * 3))
+            self.assertEqual(result.dtype, np.uint16)
+        self.assertGreater(int(make_filter()(frame).max()), 255)
+
 class TestQSobelFilterInit(unittest.TestCase):
 
     def test_filter_is_sobel_filter(self):
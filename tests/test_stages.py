@@ -0,0 +1,153 @@
+'''Unit tests for lib/_stages.py.'''
+import threading
+import time
+import unittest
+import numpy as np
+from QVideo.lib._stages import StagePipeline, _STOP
+
+
+def frame(value):
+    return np.full((2, 2), value, dtype=np.uint8)
+
+
+def wait_for(condition, timeout=1.):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+class Recorder:
+    '''Stage that records the frames it sees and adds an offset.'''
+
+    def __init__(self, offset=0, delay=0.):
+        self.offset = offset
+        self.delay = delay
+        self.seen = []
+        self.threads = set()
+
+    def __call__(self, image):
+        time.sleep(self.delay)
+        self.seen.append(int(image[0, 0]))
+        self.threads.add(threading.get_ident())
+        return image + self.offset
+
+
+def make_pipeline(*stages, maxsize=8):
+    pipeline = StagePipeline(stages, [f'stage{n}' for n in range(len(stages))],
+                             maxsize)
+    return pipeline
+
+
+class TestStagePipeline(unittest.TestCase):
+
+    def test_frames_pass_through_all_stages(self):
+        pipeline = make_pipeline(Recorder(1), Recorder(10))
+        self.addCleanup(pipeline.close)
+        pipeline.submit(frame(0))
+        self.assertTrue(wait_for(lambda: pipeline.result() is not None))
+        self.assertEqual(pipeline.result()[0, 0], 11)
+
+    def test_every_stage_sees_every_frame_in_order(self):
+        first, second = Recorder(), Recorder(delay=0.002)
+        pipeline = make_pipeline(first, second)
+        for n in range(5):
+            pipeline.submit(frame(n))
+        wait_for(lambda: len(second.seen) == 5)
+        pipeline.close()
+        self.assertEqual(first.seen, [0, 1, 2, 3, 4])
+        self.assertEqual(second.seen, first.seen)
+
+    def test_stages_run_in_separate_threads(self):
+        first, second = Recorder(), Recorder()
+        pipeline = make_pipeline(first, second)
+        pipeline.submit(frame(0))
+        wait_for(lambda: second.seen)
+        pipeline.close()
+        self.assertEqual(len(first.threads | second.threads), 2)
+        self.assertNotIn(threading.get_ident(), first.threads)
+
+    def test_full_first_queue_drops_frame(self):
+        release = threading.Event()
+        pipeline = make_pipeline(lambda image: release.wait() and image,
+                                 maxsize=1)
+        self.addCleanup(pipeline.close)
+        self.addCleanup(release.set)
+        pipeline.submit(frame(0))
+        wait_for(lambda: pipeline.stages[0].queue.empty())
+        self.assertTrue(pipeline.submit(frame(1)))
+        self.assertFalse(pipeline.submit(frame(2)))
+        self.assertEqual(pipeline.dropped, 1)
+
+    def test_depths_report_waiting_frames(self):
+        release = threading.Event()
+        pipeline = make_pipeline(lambda image: release.wait() and image)
+        self.addCleanup(pipeline.close)
+        self.addCleanup(release.set)
+        for n in range(3):
+            pipeline.submit(frame(n))
+        wait_for(lambda: pipeline.depths() == [('stage0', 2)])
+        self.assertEqual(pipeline.depths(), [('stage0', 2)])
+
+    def test_stage_holds_lock_while_processing(self):
+        pipeline = None
+        held = []
+
+        def probe(image):
+            held.append(pipeline.stages[0].lock._is_owned())
+            return image
+
+        pipeline = make_pipeline(probe)
+        pipeline.submit(frame(0))
+        wait_for(lambda: held)
+        pipeline.close()
+        self.assertEqual(held, [True])
+
+    def test_failing_stage_drops_frame(self):
+        def fail(image):
+            raise ValueError('bad frame')
+
+        second = Recorder()
+        pipeline = make_pipeline(fail, second)
+        with self.assertLogs('QVideo.lib._stages', 'WARNING'):
+            pipeline.submit(frame(0))
+            wait_for(lambda: pipeline.stages[0].queue.empty())
+            pipeline.close()
+        self.assertEqual(second.seen, [])
+
+    def test_close_discards_waiting_frames(self):
+        release = threading.Event()
+        second = Recorder()
+        pipeline = make_pipeline(lambda image: release.wait() and image,
+                                 second)
+        pipeline.submit(frame(0))
+        wait_for(lambda: pipeline.stages[0].queue.empty())
+        pipeline.submit(frame(1))
+        closer = threading.Thread(target=pipeline.close)
+        closer.start()
+        wait_for(lambda: list(pipeline.stages[0].queue.queue) == [_STOP])
+        release.set()
+        closer.join(1.)
+        self.assertEqual(second.seen, [0])
+
+    def test_close_without_waiting(self):
+        release = threading.Event()
+        pipeline = make_pipeline(lambda image: release.wait() and image)
+        pipeline.submit(frame(0))
+        wait_for(lambda: pipeline.stages[0].queue.empty())
+        pipeline.close(wait=False)
+        self.assertTrue(pipeline._threads[0].is_alive())
+        release.set()
+        pipeline.join()
+        self.assertFalse(pipeline._threads[0].is_alive())
+
+    def test_close_stops_threads(self):
+        pipeline = make_pipeline(Recorder(), Recorder())
+        pipeline.close()
+        self.assertFalse(any(t.is_alive() for t in pipeline._threads))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -179,6 +179,19 @@ class TestThresholdFilterGet(unittest.TestCase):
         self.assertIsInstance(result, np.ndarray)
 
 
+    def test_global_level_scales_with_bit_depth(self):
+        frame = np.array([[100 * 257, 200 * 257]], dtype=np.uint16)
+        result = make_filter(threshold=127)(frame)
+        self.assertEqual(result.dtype, np.uint16)
+        np.testing.assert_array_equal(result, [[0, 65535]])
+
+    def test_methods_keep_input_type(self):
+        frame = np.random.rand(32, 32).astype(np.float32)
+        for method in ThresholdFilter.METHODS:
+            result = make_filter(method=method)(frame)
+            self.assertEqual(result.dtype, np.float32)
+            self.assertTrue(set(np.unique(result)) <= {0., 1.})
+
 class TestQThresholdFilterInit(unittest.TestCase):
 
     def test_filter_is_threshold_filter(self):
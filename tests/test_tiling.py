@@ -0,0 +1,215 @@
+'''Unit tests for lib/tiling.py.'''
+import threading
+import unittest
+from unittest.mock import patch
+import numpy as np
+from qtpy import QtWidgets
+import QVideo.lib.tiling as tiling
+from QVideo.lib.tiling import TileExecutor, tiled, gaussian_radius
+from QVideo.lib.QVideoFilter import VideoFilter
+from QVideo.filters import (UnsharpFilter, LaplacianFilter, SobelFilter,
+                            DoGFilter, SmoothingFilter)
+
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+_RNG = np.random.default_rng(0)
+_FRAMES = {
+    'uint8': _RNG.integers(0, 256, (301, 257), dtype=np.uint8),
+    'color': _RNG.integers(0, 256, (300, 200, 3), dtype=np.uint8),
+    'uint16': _RNG.integers(0, 65536, (300, 211), dtype=np.uint16),
+    'float32': _RNG.random((333, 190), dtype=np.float32),
+}
+
+
+def make_executor(workers=4) -> TileExecutor:
+    return TileExecutor(workers=workers, min_pixels=0)
+
+
+class TestGaussianRadius(unittest.TestCase):
+
+    def test_covers_opencv_kernel(self):
+        for sigma in (0.1, 0.5, 1., 2., 3.3, 10.):
+            ksize = int(np.floor(sigma * 8 + 1.5)) | 1
+            self.assertGreaterEqual(gaussian_radius(sigma), ksize // 2)
+
+
+class TestTileExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = make_executor()
+        self.addCleanup(self.executor.shutdown)
+
+    def test_tiles_cover_rows(self):
+        tiles = self.executor._tiles(301, 2)
+        self.assertEqual(len(tiles), 4)
+        self.assertEqual(tiles[0][0], 0)
+        self.assertEqual(tiles[-1][1], 301)
+        for (_, bottom), (top, _) in zip(tiles, tiles[1:]):
+            self.assertEqual(bottom, top)
+
+    def test_tiles_overlap_by_halo(self):
+        shapes = []
+
+        def record(image):
+            shapes.append(image.shape[0])
+            return image
+
+        self.executor.apply(record, _FRAMES['uint8'], 5)
+        self.assertEqual(sorted(shapes), sorted([75 + 5, 75 + 10,
+                                                 75 + 10, 76 + 5]))
+
+    def test_tiles_run_concurrently(self):
+        threads = set()
+
+        def record(image):
+            threads.add(threading.get_ident())
+            return image
+
+        barrier = threading.Barrier(4, timeout=1.)
+
+        def wait(image):
+            barrier.wait()
+            return record(image)
+
+        self.executor.apply(wait, _FRAMES['uint8'], 1)
+        self.assertEqual(len(threads), 4)
+
+    def test_small_frames_processed_whole(self):
+        executor = TileExecutor(workers=4, min_pixels=10**6)
+        calls = []
+        executor.apply(lambda image: calls.append(image) or image,
+                       _FRAMES['uint8'], 1)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(executor._pool)
+
+    def test_large_halo_processed_whole(self):
+        calls = []
+        self.executor.apply(lambda image: calls.append(image) or image,
+                            _FRAMES['uint8'], 100)
+        self.assertEqual(len(calls), 1)
+
+    def test_output_preserves_channels_and_dtype(self):
+        result = self.executor.apply(lambda image: image[..., 0] * 2.,
+                                     _FRAMES['color'], 1)
+        self.assertEqual(result.shape, (300, 200))
+        self.assertEqual(result.dtype, np.float64)
+
+    def test_pool_created_once_under_contention(self):
+        barrier = threading.Barrier(8, timeout=1.)
+        pools = []
+
+        def apply():
+            barrier.wait()
+            self.executor.apply(np.copy, _FRAMES['uint8'], 1)
+            pools.append(self.executor._pool)
+
+        with patch.object(tiling, 'ThreadPoolExecutor',
+                          wraps=tiling.ThreadPoolExecutor) as created:
+            threads = [threading.Thread(target=apply) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(1.)
+        self.assertEqual(created.call_count, 1)
+        self.assertEqual(len(set(map(id, pools))), 1)
+
+    def test_tile_threads_do_not_tile_again(self):
+        calls = []
+
+        def nested(image):
+            return self.executor.apply(
+                lambda tile: calls.append(tile) or tile, image, 1)
+
+        self.executor.apply(nested, _FRAMES['uint8'], 1)
+        # The calling thread tiles its own band; the pool threads do not.
+        self.assertEqual(len(calls), 4 + 3)
+
+    def test_pool_workers_process_whole_frames(self):
+        calls = []
+
+        def work():
+            tiling.mark_pool_worker()
+            self.executor.apply(lambda image: calls.append(image) or image,
+                                _FRAMES['uint8'], 1)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join(1.)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(self.executor._pool)
+
+    def test_errors_propagate(self):
+        def fail(image):
+            raise ValueError('bad tile')
+
+        with self.assertRaises(ValueError):
+            self.executor.apply(fail, _FRAMES['uint8'], 1)
+
+
+class TestTiledFilters(unittest.TestCase):
+    '''Tiled results must equal whole-frame results exactly.'''
+
+    def setUp(self):
+        self.executor = make_executor(workers=5)
+        self.addCleanup(self.executor.shutdown)
+
+    def check(self, function, halo):
+        for name, image in _FRAMES.items():
+            with self.subTest(frame=name):
+                np.testing.assert_array_equal(
+                    self.executor.apply(function, image, halo),
+                    function(image))
+
+    def test_unsharp(self):
+        f = UnsharpFilter(radius=3.3)
+        self.check(f.process, f.halo)
+
+    def test_laplacian(self):
+        for f in (LaplacianFilter(ksize=5, sigma=1.5), LaplacianFilter(1)):
+            self.check(f.process, f.halo)
+
+    def test_sobel(self):
+        for f in (SobelFilter(ksize=7), SobelFilter('Horizontal', 1)):
+            self.check(f.process, f.halo)
+
+    def test_dog(self):
+        f = DoGFilter(low_sigma=1., high_sigma=4.)
+        self.check(f.process, f.halo)
+
+    def test_smoothing(self):
+        for method in SmoothingFilter.METHODS:
+            f = SmoothingFilter(width=9, method=method)
+            self.addCleanup(f.shutdown)
+            self.check(f._smooth, f.halo)
+
+
+class TestTiled(unittest.TestCase):
+
+    def test_halo_none_calls_function(self):
+        with patch.object(tiling, '_executor') as executor:
+            result = tiled(lambda image: image + 1, _FRAMES['uint8'], None)
+        executor.apply.assert_not_called()
+        self.assertEqual(result[0, 0], _FRAMES['uint8'][0, 0] + 1)
+
+    def test_uses_shared_executor(self):
+        with patch.object(tiling, '_executor') as executor:
+            tiled(np.copy, _FRAMES['uint8'], 3)
+        executor.apply.assert_called_once()
+
+    def test_videofilter_has_no_halo(self):
+        self.assertIsNone(VideoFilter().halo)
+
+    def test_local_filters_declare_halo(self):
+        self.assertEqual(SobelFilter(ksize=5).halo, 2)
+        self.assertEqual(LaplacianFilter(ksize=3, sigma=1.).halo,
+                         1 + gaussian_radius(1.))
+        self.assertEqual(DoGFilter(1., 3.).halo, gaussian_radius(3.))
+        self.assertEqual(UnsharpFilter(radius=2.).halo, gaussian_radius(2.))
+        f = SmoothingFilter(width=15)
+        self.addCleanup(f.shutdown)
+        self.assertEqual(f.halo, 7)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
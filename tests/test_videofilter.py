@@ -1,4 +1,5 @@
 '''Unit tests for VideoFilter and QVideoFilter.'''
+import threading
 import unittest
 import numpy as np
 from qtpy import QtWidgets
@@ -15,6 +16,21 @@ def make_filter() -> VideoFilter:
     return VideoFilter()
 
 
+class _ClampedFilter(VideoFilter):
+
+    def __init__(self):
+        super().__init__()
+        self.level = 0
+
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, level):
+        self._level = min(int(level), 10)
+
+
 def make_widget(checked=False) -> QVideoFilter:
     widget = QVideoFilter(None, 'Test', make_filter())
     widget.setChecked(checked)
@@ -77,6 +93,125 @@ class TestVideoFilter(unittest.TestCase):
         np.testing.assert_array_equal(result, np.zeros_like(_FRAME))
 
 
+class TestVideoFilterDtypes(unittest.TestCase):
+
+    def test_accepts_every_pipeline_type(self):
+        f = make_filter()
+        for dtype in (np.uint8, np.uint16, np.float32):
+            frame = np.ones((3, 4), dtype=dtype)
+            self.assertIs(f(frame), frame)
+
+    def test_conform_converts_to_preferred_type(self):
+        f = make_filter()
+        f.dtypes = (np.uint8,)
+        frame = np.full((3, 4), 65535, dtype=np.uint16)
+        result = f(frame)
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(result, 255)
+
+    def test_conform_leaves_accepted_type_alone(self):
+        f = make_filter()
+        f.dtypes = (np.uint8,)
+        self.assertIs(f.conform(_FRAME), _FRAME)
+
+
+class TestVideoFilterLock(unittest.TestCase):
+
+    def test_no_lock_by_default(self):
+        self.assertIsNone(make_filter().lock)
+
+    def test_locked_without_lock(self):
+        f = make_filter()
+        with f.locked():
+            f.data = _FRAME
+        self.assertIs(f.data, _FRAME)
+
+    def assign_while_locked(self, f, name, value):
+        '''Assign from another thread while this one holds the lock.'''
+        seen = []
+
+        def assign():
+            setattr(f, name, value)
+            seen.append((getattr(f, name, None), f.isPending(name)))
+
+        with f.lock:
+            thread = threading.Thread(target=assign)
+            thread.start()
+            thread.join(1.)
+            self.assertFalse(thread.is_alive())
+        return seen[0]
+
+    def test_assignment_does_not_wait_for_lock(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        seen, pending = self.assign_while_locked(f, 'data', _OTHER)
+        self.assertIsNone(seen)
+        self.assertTrue(pending)
+        self.assertIsNone(f.data)
+
+    def test_pending_only_for_assigning_thread(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        self.assign_while_locked(f, 'gain', 3)
+        self.assertFalse(f.isPending('gain'))
+
+    def test_deferred_assignment_applied_with_next_frame(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        self.assign_while_locked(f, 'gain', 3)
+        self.assertFalse(hasattr(f, 'gain'))
+        f(_FRAME)
+        self.assertEqual(f.gain, 3)
+        self.assertFalse(f.isPending('gain'))
+
+    def test_deferred_property_validated_when_applied(self):
+        f = _ClampedFilter()
+        f.lock = threading.RLock()
+        self.assign_while_locked(f, 'level', 99)
+        self.assertEqual(f.level, 0)
+        f.applyPending()
+        self.assertEqual(f.level, 10)
+
+    def test_assignment_applies_earlier_deferred(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        self.assign_while_locked(f, 'gain', 3)
+        f.offset = 1
+        self.assertEqual((f.gain, f.offset), (3, 1))
+
+    def test_locked_waits_for_lock(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        done = threading.Event()
+
+        def assign():
+            with f.locked():
+                f.data = _OTHER
+            done.set()
+
+        with f.lock:
+            thread = threading.Thread(target=assign)
+            thread.start()
+            self.assertFalse(done.wait(0.05))
+        thread.join(1.)
+        self.assertIs(f.data, _OTHER)
+
+    def test_assignment_reentrant_in_holding_thread(self):
+        f = make_filter()
+        f.lock = threading.RLock()
+        with f.locked():
+            f.data = _FRAME
+        self.assertIs(f.data, _FRAME)
+
+    def test_replacement_filter_inherits_lock(self):
+        widget = make_widget()
+        widget.filter.lock = threading.RLock()
+        replacement = make_filter()
+        lock = widget.filter.lock
+        widget.filter = replacement
+        self.assertIs(replacement.lock, lock)
+
+
 class TestQVideoFilter(unittest.TestCase):
 
     def test_is_qgroupbox(self):
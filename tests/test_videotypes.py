@@ -0,0 +1,63 @@
+'''Unit tests for lib/videotypes.py.'''
+import unittest
+import numpy as np
+from QVideo.lib.videotypes import DTYPES, full_scale, saturate, rescale
+
+
+class TestFullScale(unittest.TestCase):
+
+    def test_uint8(self):
+        self.assertEqual(full_scale(np.uint8), 255.)
+
+    def test_uint16(self):
+        self.assertEqual(full_scale(np.uint16), 65535.)
+
+    def test_float(self):
+        self.assertEqual(full_scale(np.float32), 1.)
+
+    def test_accepts_dtype_instances(self):
+        self.assertEqual(full_scale(np.dtype('uint16')), 65535.)
+
+    def test_supported_types(self):
+        self.assertEqual(DTYPES, (np.uint8, np.uint16, np.float32))
+
+
+class TestSaturate(unittest.TestCase):
+
+    def test_clips_to_integer_range(self):
+        result = saturate(np.array([-5., 10.7, 300.]), np.uint8)
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(result, [0, 10, 255])
+
+    def test_clips_to_16_bits(self):
+        result = saturate(np.array([70000.]), np.uint16)
+        np.testing.assert_array_equal(result, [65535])
+
+    def test_float_is_not_clipped(self):
+        result = saturate(np.array([-0.5, 2.]), np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, [-0.5, 2.])
+
+
+class TestRescale(unittest.TestCase):
+
+    def test_same_type_is_returned_unchanged(self):
+        image = np.zeros((2, 3), dtype=np.uint16)
+        self.assertIs(rescale(image, np.uint16), image)
+
+    def test_full_scale_maps_to_full_scale(self):
+        image = np.array([0, 255], dtype=np.uint8)
+        np.testing.assert_array_equal(rescale(image, np.uint16), [0, 65535])
+        np.testing.assert_array_equal(rescale(image, np.float32), [0., 1.])
+
+    def test_16_to_8_bits_rounds(self):
+        image = np.array([0, 257 * 100 + 100, 65535], dtype=np.uint16)
+        np.testing.assert_array_equal(rescale(image, np.uint8), [0, 100, 255])
+
+    def test_float_to_integer_saturates(self):
+        image = np.array([-0.1, 0.5, 1.5], dtype=np.float32)
+        np.testing.assert_array_equal(rescale(image, np.uint8), [0, 128, 255])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()